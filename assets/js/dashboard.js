@@ -230,6 +230,21 @@ document.addEventListener('DOMContentLoaded', async () => {
           window.location.href = `interview/${deptLower}/ai-report.html?sessionId=${interview.id}`;
         });
         recentReports.appendChild(card);
+
+        // Emotion heatmap strip: precomputed offline when available, else from the recorded expressions
+        if (typeof SmartMockVisualizations !== 'undefined') {
+          const timeline = (interview.expression_list || []).map(label =>
+            ({ type: String(label).charAt(0).toUpperCase() + String(label).slice(1) }));
+          SmartMockVisualizations.loadEmotionHeatmap(interview.id, timeline, interview.duration || timeline.length)
+            .then(heatmap => {
+              if (!heatmap.dataURL) return;
+              const strip = document.createElement('img');
+              strip.src = heatmap.dataURL;
+              strip.alt = 'Emotion timeline';
+              strip.style.cssText = 'width: 100%; height: 40px; border-radius: 6px; margin-top: 10px;';
+              card.insertBefore(strip, card.querySelector('button'));
+            });
+        }
       });
     } else {
       const emptyCard = document.createElement('div');
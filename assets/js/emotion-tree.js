@@ -0,0 +1,104 @@
+/**
+ * SmartMock Emotion Decision Tree
+ * Evaluates assets/js/emotion-tree.json, the decision tree compiled from
+ * emotion-rules.json by scripts/optimize_emotion_rules.py. It returns the same
+ * emotion as the linear first-match rule scan with fewer comparisons per frame.
+ * A tree compiled from other rules than the page loaded is rejected, so the
+ * page keeps scanning its rules until the tree is rebuilt.
+ *
+ * Usage:
+ *   const model = await EmotionTree.load('../../assets/js/emotion-tree.json', rulesText);
+ *   const emotion = EmotionTree.classify(model, computeFeatures(landmarks));
+ */
+
+/**
+ * Linear first-match scan, used when a frame lacks a feature the tree needs
+ * @param {Object} model - Parsed emotion-tree.json
+ * @param {Object} features - Feature values keyed by name
+ * @returns {string} Emotion label
+ */
+function classifyEmotionLinear(model, features) {
+  for (const rule of model.rules || []) {
+    let pass = true;
+    for (const [feat, expr] of Object.entries(rule.conditions || {})) {
+      const val = features[feat];
+      if (val == null) { pass = false; break; }
+      if ('>' in expr && !(val > expr['>'])) { pass = false; break; }
+      if ('>=' in expr && !(val >= expr['>='])) { pass = false; break; }
+      if ('<' in expr && !(val < expr['<'])) { pass = false; break; }
+      if ('<=' in expr && !(val <= expr['<='])) { pass = false; break; }
+      if ('between' in expr) {
+        const [min, max] = expr['between'];
+        if (!(val >= min && val <= max)) { pass = false; break; }
+      }
+    }
+    if (pass) return rule.emotion || model.fallback;
+  }
+  return model.fallback;
+}
+
+/**
+ * Classify one frame of features with the compiled decision tree
+ * @param {Object} model - Parsed emotion-tree.json
+ * @param {Object} features - Feature values keyed by name
+ * @returns {string} Emotion label
+ */
+function classifyEmotionTree(model, features) {
+  for (const feat of model.features) {
+    const val = features[feat];
+    if (val == null || val !== val) return classifyEmotionLinear(model, features);
+  }
+  let node = model.tree;
+  while (node.emotion === undefined) {
+    const val = features[node.feature];
+    const yes = node.op === '<' ? val < node.value : val <= node.value;
+    node = yes ? node.then : node.else;
+  }
+  return node.emotion;
+}
+
+/**
+ * Hash of a rules file, as stamped into the tree by optimize_emotion_rules.py
+ * @param {string} text - Rules file contents
+ * @returns {Promise<string|null>} First 16 hex digits of its SHA-256, or null without WebCrypto
+ */
+async function emotionRulesHash(text) {
+  if (typeof crypto === 'undefined' || !crypto.subtle) return null;
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+  return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('').slice(0, 16);
+}
+
+/**
+ * Fetch a compiled tree
+ * @param {string} url - Location of emotion-tree.json
+ * @param {string} [rulesText] - The rules file the page loaded; the tree must have been built from it
+ * @returns {Promise<Object|null>} Parsed model, or null if unavailable or stale
+ */
+async function loadEmotionTree(url, rulesText) {
+  try {
+    const resp = await fetch(url);
+    if (!resp.ok) return null;
+    const model = await resp.json();
+    if (rulesText != null) {
+      const hash = await emotionRulesHash(rulesText);
+      if (hash !== model.sourceHash) {
+        console.warn('Emotion tree was built from other rules; using the rule scan');
+        return null;
+      }
+    }
+    return model;
+  } catch (e) {
+    console.warn('Error loading emotion tree JSON', e);
+    return null;
+  }
+}
+
+// Export functions to global scope
+if (typeof window !== 'undefined') {
+  window.EmotionTree = {
+    load: loadEmotionTree,
+    sourceHash: emotionRulesHash,
+    classify: classifyEmotionTree,
+    classifyLinear: classifyEmotionLinear
+  };
+}
@@ -47,13 +47,14 @@
       return 'en'; // Default to English
     },
 
+    // <i18n-bundles> generated by scripts/split_i18n_bundles.py from config/i18n/*.json
     /**
-     * Load translations
+     * Load translations: English is inline, other locales are fetched once on demand
      */
-    loadTranslations() {
-      this.translations = {
-        en: {
-          // English (default)
+    loadTranslations(language = this.currentLanguage) {
+      const bundles = { es: 'es.0170e06198.json', fr: 'fr.ce31b562e1.json', hi: 'hi.0aebabb389.json', ta: 'ta.f00d4d653f.json', te: 'te.f3572b1556.json' };
+      if (!this.translations.en) {
+        this.translations.en = {
           dashboard: 'Dashboard',
           profile: 'Profile',
           leaderboard: 'Leaderboard',
@@ -123,130 +124,31 @@
           ok: 'OK',
           yes: 'Yes',
           no: 'No'
-        },
-        hi: {
-          // Hindi
-          dashboard: 'डैशबोर्ड',
-          profile: 'प्रोफ़ाइल',
-          leaderboard: 'लीडरबोर्ड',
-          certificates: 'प्रमाणपत्र',
-          startInterview: 'साक्षात्कार शुरू करें',
-          aiInterview: 'AI साक्षात्कार',
-          traditionalInterview: 'पारंपरिक साक्षात्कार',
-          score: 'स्कोर',
-          grade: 'ग्रेड',
-          interview: 'साक्षात्कार',
-          courses: 'पाठ्यक्रम',
-          welcome: 'स्वागत है',
-          logout: 'लॉग आउट',
-          settings: 'सेटिंग्स',
-          about: 'के बारे में',
-          contact: 'संपर्क करें',
-          help: 'मदद',
-          loading: 'लोड हो रहा है...',
-          error: 'त्रुटि',
-          success: 'सफलता',
-          save: 'सहेजें',
-          cancel: 'रद्द करें',
-          delete: 'हटाएं',
-          edit: 'संपादित करें',
-          view: 'देखें',
-          download: 'डाउनलोड',
-          share: 'शेयर करें',
-          search: 'खोजें',
-          filter: 'फ़िल्टर',
-          sort: 'क्रमबद्ध करें',
-          name: 'नाम',
-          email: 'ईमेल',
-          password: 'पासवर्ड',
-          signIn: 'साइन इन करें',
-          signUp: 'साइन अप करें',
-          department: 'विभाग',
-          rank: 'रैंक',
-          level: 'स्तर'
-        },
-        te: {
-          // Telugu
-          dashboard: 'డాష్‌బోర్డ్',
-          profile: 'ప్రొఫైల్',
-          leaderboard: 'లీడర్‌బోర్డ్',
-          certificates: 'సర్టిఫికెట్లు',
-          startInterview: 'ఇంటర్వ్యూ ప్రారంభించండి',
-          aiInterview: 'AI ఇంటర్వ్యూ',
-          score: 'స్కోర్',
-          grade: 'గ్రేడ్',
-          interview: 'ఇంటర్వ్యూ',
-          courses: 'కోర్సులు',
-          welcome: 'స్వాగతం',
-          logout: 'లాగ్ అవుట్',
-          settings: 'సెట్టింగ్‌లు',
-          loading: 'లోడ్ అవుతోంది...',
-          save: 'సేవ్ చేయండి',
-          cancel: 'రద్దు చేయండి',
-          department: 'విభాగం'
-        },
-        ta: {
-          // Tamil
-          dashboard: 'டாஷ்போர்டு',
-          profile: 'சுயவிவரம்',
-          leaderboard: 'தலைவர் பலகை',
-          certificates: 'சான்றிதழ்கள்',
-          startInterview: 'நேர்காணலைத் தொடங்கவும்',
-          aiInterview: 'AI நேர்காணல்',
-          score: 'மதிப்பெண்',
-          grade: 'தரம்',
-          interview: 'நேர்காணல்',
-          courses: 'படிப்புகள்',
-          welcome: 'வரவேற்கிறோம்',
-          logout: 'வெளியேறு',
-          settings: 'அமைப்புகள்',
-          loading: 'ஏற்றுகிறது...',
-          save: 'சேமி',
-          cancel: 'ரத்து செய்',
-          department: 'துறை'
-        },
-        es: {
-          // Spanish
-          dashboard: 'Tablero',
-          profile: 'Perfil',
-          leaderboard: 'Tabla de Clasificación',
-          certificates: 'Certificados',
-          startInterview: 'Iniciar Entrevista',
-          aiInterview: 'Entrevista con IA',
-          score: 'Puntuación',
-          grade: 'Calificación',
-          interview: 'Entrevista',
-          courses: 'Cursos',
-          welcome: 'Bienvenido',
-          logout: 'Cerrar Sesión',
-          settings: 'Configuración',
-          loading: 'Cargando...',
-          save: 'Guardar',
-          cancel: 'Cancelar',
-          department: 'Departamento'
-        },
-        fr: {
-          // French
-          dashboard: 'Tableau de Bord',
-          profile: 'Profil',
-          leaderboard: 'Classement',
-          certificates: 'Certificats',
-          startInterview: 'Commencer l\'Entretien',
-          aiInterview: 'Entretien IA',
-          score: 'Score',
-          grade: 'Note',
-          interview: 'Entretien',
-          courses: 'Cours',
-          welcome: 'Bienvenue',
-          logout: 'Déconnexion',
-          settings: 'Paramètres',
-          loading: 'Chargement...',
-          save: 'Enregistrer',
-          cancel: 'Annuler',
-          department: 'Département'
-        }
-      };
+        };
+      }
+      if (this.translations[language] || !bundles[language]) {
+        return Promise.resolve(this.translations[language] || this.translations.en);
+      }
+      this.pendingBundles = this.pendingBundles || {};
+      if (!this.pendingBundles[language]) {
+        const script = document.querySelector('script[src*="i18n-accessibility"]');
+        const url = new URL(`../i18n/${bundles[language]}`, script ? script.src : location.href);
+        this.pendingBundles[language] = fetch(url)
+          .then(response => (response.ok ? response.json() : Promise.reject(new Error(response.status))))
+          .then(table => {
+            this.translations[language] = table;
+            if (language === this.currentLanguage) this.updatePageContent();
+            return table;
+          })
+          .catch(error => {
+            console.warn(`Translations for ${language} unavailable, using English:`, error);
+            delete this.pendingBundles[language];
+            return this.translations.en;
+          });
+      }
+      return this.pendingBundles[language];
     },
+    // </i18n-bundles>
 
     /**
      * Get translation
@@ -275,6 +177,7 @@
 
       this.currentLanguage = langCode;
       localStorage.setItem('smartmock_language', langCode);
+      this.loadTranslations(langCode);
       this.updatePageContent();
       console.log(`Language changed to: ${langCode}`);
       return true;
@@ -1,4 +1,10 @@
-// CS Report Page - Advanced Comprehensive Report Generation with Performance Optimization
+// Shared Report Page - Advanced Comprehensive Report Generation with Performance Optimization
+// Generated by scripts/build_report_engine.py. Department values come from the
+// page's <script type="application/json" id="report-config"> (config/reports/<dept>.json).
+const REPORT_CONFIG = Object.assign({ department: 'cs', label: 'CS' }, (() => {
+  const el = document.getElementById('report-config');
+  try { return el ? JSON.parse(el.textContent) : {}; } catch (e) { return {}; }
+})());
 // Configuration
 const CONFIG = {
   CACHE_ENABLED: true,
@@ -65,7 +71,7 @@ const performance = {
 };
 
 document.addEventListener('DOMContentLoaded', async () => {
-  console.log('CS Report page initialized');
+  console.log(`${REPORT_CONFIG.label} Report page initialized`);
   performance.start('total-load');
   
   // Check authentication
@@ -152,7 +158,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
     // Initialize AI Tutor and render its section
     if (typeof AITutor !== 'undefined') {
-      const tutor = AITutor.init('cs');
+      const tutor = AITutor.init(REPORT_CONFIG.department);
       renderAITutor(tutor, safeAIInterviews, safeCoursesData);
     }
     
@@ -900,7 +906,7 @@ function renderAITutor(tutor, aiInterviews, coursesData) {
   const container = document.getElementById('ai-tutor-container');
   if (!container) return;
 
-  const tutorInfo = tutor.getTutorInfo('cs');
+  const tutorInfo = tutor.getTutorInfo(REPORT_CONFIG.department);
   let recommendations = [];
 
   // Analyze AI interviews for weak spots
@@ -913,7 +919,7 @@ function renderAITutor(tutor, aiInterviews, coursesData) {
           type: 'interview',
           title: `Practice Topic: ${topic}`,
           description: `Your scores in '${topic}' interviews are lower. Let's work on that!`,
-          action: () => tutor.suggestResources(topic, 'cs')
+          action: () => tutor.suggestResources(topic, REPORT_CONFIG.department)
         });
       });
     }
@@ -993,7 +999,7 @@ async function exportReportPDF() {
     const element = document.getElementById('report-content');
     const opt = {
       margin: 10,
-      filename: `CS_Report_${new Date().toISOString().split('T')[0]}.pdf`,
+      filename: `${REPORT_CONFIG.label}_Report_${new Date().toISOString().split('T')[0]}.pdf`,
       image: { type: 'jpeg', quality: 0.98 },
       html2canvas: { 
         scale: 2,
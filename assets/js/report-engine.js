@@ -1,4 +1,10 @@
-// EC Report Page - Advanced Comprehensive Report Generation with Performance Optimization
+// Shared Report Page - Advanced Comprehensive Report Generation with Performance Optimization
+// Generated by scripts/build_report_engine.py. Department values come from the
+// page's <script type="application/json" id="report-config"> (config/reports/<dept>.json).
+const REPORT_CONFIG = Object.assign({ department: 'cs', label: 'CS' }, (() => {
+  const el = document.getElementById('report-config');
+  try { return el ? JSON.parse(el.textContent) : {}; } catch (e) { return {}; }
+})());
 // Configuration
 const CONFIG = {
   CACHE_ENABLED: true,
@@ -56,7 +62,7 @@ const performance = {
   end(name) {
     if (this.marks[name]) {
       const duration = Date.now() - this.marks[name];
-      console.log(`💀 ${name}: ${duration}ms`);
+      console.log(`⏱️ ${name}: ${duration}ms`);
       delete this.marks[name];
       return duration;
     }
@@ -65,7 +71,7 @@ const performance = {
 };
 
 document.addEventListener('DOMContentLoaded', async () => {
-  console.log('EC Report page initialized');
+  console.log(`${REPORT_CONFIG.label} Report page initialized`);
   performance.start('total-load');
   
   // Check authentication
@@ -152,7 +158,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
     // Initialize AI Tutor and render its section
     if (typeof AITutor !== 'undefined') {
-      const tutor = AITutor.init('ec');
+      const tutor = AITutor.init(REPORT_CONFIG.department);
       renderAITutor(tutor, safeAIInterviews, safeCoursesData);
     }
     
@@ -169,11 +175,11 @@ document.addEventListener('DOMContentLoaded', async () => {
     console.error('Error loading report:', error);
     loadingState.style.display = 'none';
     errorState.style.display = 'block';
-    errorState.innerHTML = '
+    errorState.innerHTML = `
       <p style="color: #dc3545; font-size: 18px;">⚠️ Failed to load report data</p>
       <p style="color: #666; font-size: 14px; margin: 10px 0;">${error.message}</p>
       <button class="btn" onclick="location.reload()">Retry</button>
-    ';
+    `;
   }
 });
 
@@ -555,8 +561,8 @@ function renderAIInterviews(interviews) {
         </div>
         
         <p style="color: #666; font-size: 14px; margin-bottom: 15px;">
-          👨 ${sessionDate} • 
-          <span style="color: ${completed ? '#28a745' : '#ffc107'};
+          📅 ${sessionDate} • 
+          <span style="color: ${completed ? '#28a745' : '#ffc107'};">
             ${questionsAsked}/${totalQuestions} Questions ${completed ? 'Completed' : 'Answered'}
           </span>
         </p>
@@ -571,8 +577,8 @@ function renderAIInterviews(interviews) {
                   .sort((a, b) => b[1] - a[1])
                   .slice(0, 3)
                   .map(([emotion, count]) => {
-                    const emoji = emotion === 'confident' ? '🦾' : emotion === 'happy' ? '😊' : 
-                                  emotion === 'nervous' ? '😫' : emotion === 'sad' ? '😔' : '😐';
+                    const emoji = emotion === 'confident' ? '💪' : emotion === 'happy' ? '😊' : 
+                                  emotion === 'nervous' ? '😰' : emotion === 'sad' ? '😔' : '😐';
                     return `<div style="margin: 5px 0;">${emoji} <strong>${capitalize(emotion)}:</strong> ${count}x</div>`;
                   }).join('')}
               </div>
@@ -584,7 +590,7 @@ function renderAIInterviews(interviews) {
 
           <!-- WPM -->
           <div style="background: #f8f9fa; padding: 15px; border-radius: 8px;">
-            <h5 style="margin: 0 0 10px; color: #333;">✨ Speaking Speed</h5>
+            <h5 style="margin: 0 0 10px; color: #333;">⚡ Speaking Speed</h5>
             <div style="font-size: 32px; font-weight: 700; color: var(--primary);">${Math.round(wpm)}</div>
             <div style="font-size: 12px; color: #666; margin-top: 5px;">Words Per Minute</div>
             <div style="font-size: 11px; color: #888; margin-top: 5px;">
@@ -594,7 +600,7 @@ function renderAIInterviews(interviews) {
 
           <!-- Technical Knowledge -->
           <div style="background: #f8f9fa; padding: 15px; border-radius: 8px;">
-            <h5 style="margin: 0 0 10px; color: #333;">🍊 Performance</h5>
+            <h5 style="margin: 0 0 10px; color: #333;">🎯 Performance</h5>
             <div style="font-size: 32px; font-weight: 700; color: ${overallScore >= 70 ? '#28a745' : overallScore >= 50 ? '#ffc107' : '#dc3545'};">
               ${overallScore.toFixed(0)}%
             </div>
@@ -619,7 +625,7 @@ function renderAIInterviews(interviews) {
         <div style="margin-top: 15px;">
           <details>
             <summary style="cursor: pointer; font-weight: 600; padding: 10px; background: #f8f9fa; border-radius: 5px;">
-              📚 Question-by-Question Feedback (${interview.feedback_list.length} answers)
+              📋 Question-by-Question Feedback (${interview.feedback_list.length} answers)
             </summary>
             <div style="max-height: 300px; overflow-y: auto; margin-top: 10px;">
               ${interview.feedback_list.map((fb, i) => {
@@ -651,7 +657,7 @@ function renderAIInterviews(interviews) {
 
         <div style="margin-top: 15px; text-align: right;">
           <button class="btn" style="font-size: 14px; padding: 8px 20px;" onclick="viewDetailedReport('${interview.sessionId || interview.timestamp}')">
-            🏙️ View Detailed Report
+            📊 View Detailed Report
           </button>
         </div>
       </div>
@@ -660,18 +666,16 @@ function renderAIInterviews(interviews) {
 }
 
 // Helper functions
-function capitalize(str) {
-  if (!str) return '';
-  return str.charAt(0).toUpperCase() + str.slice(1);
-}
+
 
 function getEmotionEmoji(emotion) {
   const emojis = {
-    confident: '🦾',
+    confident: '💪',
     happy: '😊',
+    nervous: '😰',
     sad: '😔',
     neutral: '😐',
-    surprised: '😱'
+    surprised: '😲'
   };
   return emojis[emotion] || '😐';
 }
@@ -745,7 +749,7 @@ function renderCourseProgress(coursesData) {
       <div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(300px, 1fr)); gap: 15px;">
         ${coursesData.completed.map(course => `
           <div style="background: #d4edda; border: 2px solid #28a745; border-radius: 8px; padding: 15px;">
-            <h5 style="margin: 0 0 10px; color: #155724;">🌱 ${course.courseName || course.courseId}</h5>
+            <h5 style="margin: 0 0 10px; color: #155724;">📚 ${course.courseName || course.courseId}</h5>
             <div style="font-size: 14px; color: #155724;">
               <div style="margin: 5px 0;">✅ Status: Completed</div>
               ${course.completedDate ? `<div style="margin: 5px 0;">📅 ${new Date(course.completedDate).toLocaleDateString()}</div>` : ''}
@@ -771,7 +775,7 @@ function renderCourseProgress(coursesData) {
           const progress = coursesData.progress[course.courseId] || 0;
           return `
             <div style="background: #fff3cd; border: 2px solid #ffc107; border-radius: 8px; padding: 15px;">
-              <h5 style="margin: 0 0 10px; color: #856404;">�쎩 ${course.courseName || course.courseId}</h5>
+              <h5 style="margin: 0 0 10px; color: #856404;">📖 ${course.courseName || course.courseId}</h5>
               <div style="font-size: 14px; color: #856404;">
                 <div style="margin: 5px 0;">⏳ Status: In Progress</div>
                 ${course.enrolledDate ? `<div style="margin: 5px 0;">📅 Enrolled: ${new Date(course.enrolledDate).toLocaleDateString()}</div>` : ''}
@@ -809,10 +813,10 @@ function renderCertificates(certificates) {
 
         return `
           <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 10px; padding: 20px; position: relative; overflow: hidden;">
-            <div style="position: absolute; top: -20px; right: -20px; font-size: 100px; opacity: 0.1;">🎖️</div>
+            <div style="position: absolute; top: -20px; right: -20px; font-size: 100px; opacity: 0.1;">🏆</div>
             <h4 style="margin: 0 0 10px; position: relative; z-index: 1;">${cert.courseName}</h4>
             <div style="position: relative; z-index: 1; font-size: 14px; opacity: 0.9;">
-              <div style="margin: 8px 0;">💾 ID: ${cert.certificateId}</div>
+              <div style="margin: 8px 0;">📜 ID: ${cert.certificateId}</div>
               <div style="margin: 8px 0;">📅 Issued: ${issueDate}</div>
               <div style="margin: 8px 0;">✅ Status: Verified</div>
             </div>
@@ -865,7 +869,7 @@ function renderOverallFeedback(aiInterviews, traditionalInterviews, coursesData)
 
   container.innerHTML = `
     <div style="margin-bottom: 20px;">
-      <h4 style="margin: 0 0 15px;">�첨 Performance Summary</h4>
+      <h4 style="margin: 0 0 15px;">📊 Performance Summary</h4>
       <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px;">
         <div>
           <div style="font-size: 14px; color: #666;">Total Interviews</div>
@@ -892,7 +896,8 @@ function renderOverallFeedback(aiInterviews, traditionalInterviews, coursesData)
       <h4 style="margin: 0 0 15px;">💡 Recommendations</h4>
       ${recommendations.length > 0 
         ? recommendations.map(rec => `<div style="padding: 10px; background: white; border-left: 4px solid var(--primary); margin: 10px 0; border-radius: 4px;">${rec}</div>`).join('')
-        : '<p style="padding: 10px; background: white; border-radius: 4px;">Keep practicing and learning! Take more interviews to get personalized recommendations.</p>'}
+        : '<div style="padding: 10px; background: white; border-radius: 4px;">Keep practicing and learning! Take more interviews to get personalized recommendations.</div>'
+      }
     </div>
   `;
 }
@@ -901,7 +906,7 @@ function renderAITutor(tutor, aiInterviews, coursesData) {
   const container = document.getElementById('ai-tutor-container');
   if (!container) return;
 
-  const tutorInfo = tutor.getTutorInfo('ec');
+  const tutorInfo = tutor.getTutorInfo(REPORT_CONFIG.department);
   let recommendations = [];
 
   // Analyze AI interviews for weak spots
@@ -914,7 +919,7 @@ function renderAITutor(tutor, aiInterviews, coursesData) {
           type: 'interview',
           title: `Practice Topic: ${topic}`,
           description: `Your scores in '${topic}' interviews are lower. Let's work on that!`,
-          action: () => tutor.suggestResources(topic, 'ec')
+          action: () => tutor.suggestResources(topic, REPORT_CONFIG.department)
         });
       });
     }
@@ -981,16 +986,7 @@ function capitalize(str) {
   return str.charAt(0).toUpperCase() + str.slice(1);
 }
 
-function viewDetailedReport(sessionId) {
-  // Store sessionId in localStorage for the detail page
-  localStorage.setItem('selected_interview_session', sessionId);
-  
-  // For now, show an alert with the session details
-  // In production, this would navigate to a detailed report page
-  alert(`View detailed report for session: ${sessionId}\n\nThis feature will show:\n- Complete Q&A transcript\n- Detailed emotion timeline\n- WPM per question\n- Score breakdown\n- Improvement suggestions`);
-  
-  // Future: window.location.href = `ai-report-detail.html?session=${sessionId}`;
-}
+
 
 async function exportReportPDF() {
   try {
@@ -1003,7 +999,7 @@ async function exportReportPDF() {
     const element = document.getElementById('report-content');
     const opt = {
       margin: 10,
-      filename: `EC_Report_${new Date().toISOString().split('T')[0]}.pdf`,
+      filename: `${REPORT_CONFIG.label}_Report_${new Date().toISOString().split('T')[0]}.pdf`,
       image: { type: 'jpeg', quality: 0.98 },
       html2canvas: { 
         scale: 2,
@@ -1047,12 +1043,12 @@ function calculateTrends(interviews) {
   
   // Calculate trend (improving/declining/stable)
   const recentScores = scores.slice(0, Math.min(3, scores.length));
-  const olderScores = scores.slice(0, Math.min(3, scores.length));
+  const olderScores = scores.slice(Math.min(3, scores.length));
   
   if (olderScores.length === 0) return 'insufficient-data';
   
   const recentAvg = recentScores.reduce((a, b) => a + b, 0) / recentScores.length;
-  const olderAvg = olderScores.reduce((a, b) => a + b, 0) / olderScores.length;
+  const olderAvg = olderScores.length > 0 ? olderScores.reduce((a, b) => a + b, 0) / olderScores.length : 0;
   
   const diff = recentAvg - olderAvg;
   
@@ -83,7 +83,8 @@
       alpha: true 
     });
     this.renderer.setSize(this.container.clientWidth, this.container.clientHeight);
-    this.renderer.setPixelRatio(window.devicePixelRatio);
+    // options.maxPixelRatio caps the backing store on high-density screens
+    this.renderer.setPixelRatio(Math.min(window.devicePixelRatio || 1, this.options.maxPixelRatio || Infinity));
 
     // Handle resize
     window.addEventListener('resize', () => this.onWindowResize());
@@ -246,12 +247,35 @@
   }
 
   startAnimation() {
-    const animate = () => {
+    // options.maxFps skips frames so the scene renders at most that often
+    const frameTime = this.options.maxFps ? 1000 / this.options.maxFps : 0;
+    let last = -Infinity;
+    const animate = (now) => {
       this.animationId = requestAnimationFrame(animate);
+      if (now - last < frameTime - 1) return;
+      last = now;
       this.update();
       this.renderer.render(this.scene, this.camera);
     };
-    animate();
+    animate(performance.now());
+  }
+
+  // Stop rendering (e.g. while off-screen or in a background tab); resume() restarts it
+  pause() {
+    if (this.animationId) {
+      cancelAnimationFrame(this.animationId);
+      this.animationId = null;
+    }
+    if (this.blinkInterval) {
+      clearInterval(this.blinkInterval);
+      this.blinkInterval = null;
+    }
+  }
+
+  resume() {
+    if (this.animationId || !this.renderer) return;
+    this.startAnimation();
+    this.startBlinking();
   }
 
   update() {
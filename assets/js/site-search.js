@@ -0,0 +1,128 @@
+/**
+ * SmartMock Site Search
+ * Queries the static index scripts/build_search_index.py writes to assets/search/:
+ * the manifest and document list load on first use, term shards on demand
+ * Version: 1.0
+ */
+
+(function() {
+  'use strict';
+
+  const TOKEN_RE = /[\p{L}\p{N}]+/gu;
+  const script = document.currentScript;
+  const ROOT = script && script.src ? script.src.replace(/assets\/js\/site-search\.js(\?.*)?$/, '') : '/';
+
+  const SiteSearch = {
+    root: ROOT,
+    ready: null,
+    manifest: null,
+    docs: null,
+    shards: {},
+    stopwords: new Set(),
+
+    /**
+     * Same tokens as tokenize() in build_search_index.py
+     */
+    tokenize(text) {
+      const words = String(text).normalize('NFKC').toLowerCase().match(TOKEN_RE) || [];
+      return words
+        .filter(t => t.length > 1 && !this.stopwords.has(t))
+        .map(t => (t.length > 3 && t.endsWith('s') && !t.endsWith('ss') ? t.slice(0, -1) : t));
+    },
+
+    async fetchJSON(name) {
+      const response = await fetch(`${this.root}assets/search/${name}`);
+      if (!response.ok) throw new Error(`Search index unavailable (${response.status})`);
+      return response.json();
+    },
+
+    /**
+     * Load the manifest and document list once
+     */
+    async init() {
+      if (!this.ready) {
+        this.ready = (async () => {
+          this.manifest = await this.fetchJSON('search-manifest.json');
+          this.stopwords = new Set(this.manifest.stopwords);
+          this.docs = await this.fetchJSON(this.manifest.docs);
+        })();
+        this.ready.catch(() => { this.ready = null; });
+      }
+      return this.ready;
+    },
+
+    shard(term) {
+      const prefix = term.slice(0, this.manifest.prefixLength);
+      const file = this.manifest.shards[prefix];
+      if (!file) return Promise.resolve({});
+      if (!this.shards[prefix]) {
+        this.shards[prefix] = this.fetchJSON(file).catch(error => {
+          delete this.shards[prefix];
+          throw error;
+        });
+      }
+      return this.shards[prefix];
+    },
+
+    /**
+     * {doc: weight} of every posting list the terms match (best weight per doc)
+     */
+    collect(lists) {
+      const weights = new Map();
+      for (const postings of lists) {
+        if (!postings) continue;
+        for (let i = 0; i < postings.length; i += 2) {
+          weights.set(postings[i], Math.max(weights.get(postings[i]) || 0, postings[i + 1]));
+        }
+      }
+      return weights;
+    },
+
+    /**
+     * Documents containing every query word; the last word also matches as a
+     * prefix while it is being typed
+     */
+    async search(query, limit = 10) {
+      await this.init();
+      const text = String(query);
+      const words = text.normalize('NFKC').toLowerCase().match(TOKEN_RE) || [];
+      const typing = words.length && !/[\s\p{P}]$/u.test(text) ? words.pop() : null;
+      const groups = [];
+
+      for (const token of this.tokenize(words.join(' '))) {
+        const shard = await this.shard(token);
+        groups.push(this.collect([shard[token]]));
+      }
+      if (typing && typing.length >= this.manifest.prefixLength) {
+        const folded = this.tokenize(typing)[0];
+        const shard = await this.shard(typing);
+        const lists = Object.keys(shard).filter(term => term.startsWith(typing)).map(term => shard[term]);
+        if (folded && folded !== typing) lists.push((await this.shard(folded))[folded]);
+        groups.push(this.collect(lists));
+      }
+      if (!groups.length) return [];
+
+      const total = this.manifest.documents;
+      let scores = null;
+      for (const weights of groups) {
+        const idf = Math.log(1 + total / Math.max(weights.size, 1));
+        const next = new Map();
+        for (const [doc, weight] of weights) {
+          if (scores === null || scores.has(doc)) next.set(doc, (scores ? scores.get(doc) : 0) + weight * idf);
+        }
+        scores = next;
+      }
+
+      return [...scores.entries()]
+        .filter(([doc]) => this.docs[doc])
+        .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+        .slice(0, limit)
+        .map(([doc, score]) => {
+          const [url, title, type, snippet] = this.docs[doc];
+          return { url: this.root + url, title, type, snippet, score };
+        });
+    }
+  };
+
+  window.SiteSearch = SiteSearch;
+})();
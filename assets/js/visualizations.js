@@ -7,6 +7,20 @@
 (function() {
   'use strict';
 
+  // Emotion color mapping
+  const EMOTION_COLORS = {
+    'Happy': '#00FF88',
+    'Confident': '#6C63FF',
+    'Neutral': '#FFB800',
+    'Nervous': '#FF8C00',
+    'Confused': '#FF3366',
+    'default': '#888888'
+  };
+
+  // Where scripts/emotion_analytics.py summaries are published (index.json + one file per session)
+  const SUMMARY_BASE = 'analytics/emotions';
+  const summaryIndexes = {};
+
   const Visualizations = {
     /**
      * Generate Emotion Heatmap Timeline
@@ -16,6 +30,85 @@
         return { error: 'No emotion data available' };
       }
 
+      const spikes = this.identifySpikes(emotions);
+      const canvas = this.drawEmotionHeatmap(
+        this.heatmapSegments(emotions),
+        spikes.map(spike => spike.index),
+        duration
+      );
+
+      return {
+        canvas,
+        dataURL: canvas.toDataURL('image/png'),
+        spikes,
+        emotionDistribution: this.calculateEmotionDistribution(emotions)
+      };
+    },
+
+    /**
+     * Render a heatmap precomputed offline by scripts/emotion_analytics.py
+     */
+    createPrecomputedHeatmap(summary) {
+      if (!summary || !summary.bins || summary.bins.color.length === 0) {
+        return { error: 'No emotion data available' };
+      }
+
+      const palette = summary.bins.palette;
+      const segments = summary.bins.color.map((colorIndex, i) => ({
+        color: palette[colorIndex],
+        alpha: summary.bins.alpha[i]
+      }));
+      const canvas = this.drawEmotionHeatmap(
+        segments,
+        summary.spikes.map(spike => spike.bin),
+        summary.duration
+      );
+
+      return {
+        canvas,
+        dataURL: canvas.toDataURL('image/png'),
+        spikes: summary.spikes,
+        emotionDistribution: summary.distribution
+      };
+    },
+
+    /**
+     * Heatmap for one session: the precomputed summary when one was published,
+     * otherwise built client-side from the raw timeline
+     */
+    async loadEmotionHeatmap(sessionId, emotions, duration, summaryBase = SUMMARY_BASE) {
+      try {
+        if (!(summaryBase in summaryIndexes)) {
+          summaryIndexes[summaryBase] = fetch(`${summaryBase}/index.json`)
+            .then(resp => (resp.ok ? resp.json() : {}))
+            .catch(() => ({}));
+        }
+        const entry = (await summaryIndexes[summaryBase])[sessionId];
+        if (entry) {
+          const resp = await fetch(`${summaryBase}/${entry.file}`);
+          const heatmap = resp.ok ? this.createPrecomputedHeatmap(await resp.json()) : null;
+          if (heatmap && !heatmap.error) return heatmap;
+        }
+      } catch (error) {
+        console.warn('Precomputed emotion summary unavailable:', error);
+      }
+      return this.createEmotionHeatmap(emotions, duration);
+    },
+
+    /**
+     * Colour and opacity of every heatmap segment (one per emotion sample)
+     */
+    heatmapSegments(emotions) {
+      return emotions.map(emotion => ({
+        color: EMOTION_COLORS[emotion.type] || EMOTION_COLORS.default,
+        alpha: emotion.confidence || 0.5
+      }));
+    },
+
+    /**
+     * Draw heatmap segments, spike markers, timeline and legend on a canvas
+     */
+    drawEmotionHeatmap(segments, spikeIndices, duration) {
       const canvas = document.createElement('canvas');
       canvas.width = 800;
       canvas.height = 200;
@@ -26,26 +119,14 @@
       ctx.fillRect(0, 0, canvas.width, canvas.height);
 
       // Calculate time segments
-      const segmentWidth = canvas.width / emotions.length;
-
-      // Emotion color mapping
-      const emotionColors = {
-        'Happy': '#00FF88',
-        'Confident': '#6C63FF',
-        'Neutral': '#FFB800',
-        'Nervous': '#FF8C00',
-        'Confused': '#FF3366',
-        'default': '#888888'
-      };
+      const segmentWidth = canvas.width / segments.length;
 
       // Draw emotion bars
-      emotions.forEach((emotion, index) => {
+      segments.forEach((segment, index) => {
         const x = index * segmentWidth;
-        const color = emotionColors[emotion.type] || emotionColors.default;
-        const intensity = emotion.confidence || 0.5;
 
-        ctx.fillStyle = color;
-        ctx.globalAlpha = intensity;
+        ctx.fillStyle = segment.color;
+        ctx.globalAlpha = segment.alpha;
         ctx.fillRect(x, 0, segmentWidth, canvas.height);
         ctx.globalAlpha = 1;
       });
@@ -53,19 +134,17 @@
       // Draw spikes (high nervousness or confusion)
       ctx.strokeStyle = '#FF3366';
       ctx.lineWidth = 3;
-      emotions.forEach((emotion, index) => {
-        if ((emotion.type === 'Nervous' || emotion.type === 'Confused') && emotion.confidence > 0.7) {
-          const x = index * segmentWidth + segmentWidth / 2;
-          ctx.beginPath();
-          ctx.moveTo(x, canvas.height);
-          ctx.lineTo(x, canvas.height - 50);
-          ctx.stroke();
-
-          // Draw warning icon
-          ctx.fillStyle = '#FF3366';
-          ctx.font = 'bold 20px Arial';
-          ctx.fillText('⚠️', x - 10, canvas.height - 60);
-        }
+      spikeIndices.forEach(index => {
+        const x = index * segmentWidth + segmentWidth / 2;
+        ctx.beginPath();
+        ctx.moveTo(x, canvas.height);
+        ctx.lineTo(x, canvas.height - 50);
+        ctx.stroke();
+
+        // Draw warning icon
+        ctx.fillStyle = '#FF3366';
+        ctx.font = 'bold 20px Arial';
+        ctx.fillText('⚠️', x - 10, canvas.height - 60);
       });
 
       // Draw timeline markers
@@ -83,9 +162,9 @@
       const legendY = 20;
       let yOffset = 0;
 
-      Object.keys(emotionColors).forEach(emotion => {
+      Object.keys(EMOTION_COLORS).forEach(emotion => {
         if (emotion !== 'default') {
-          ctx.fillStyle = emotionColors[emotion];
+          ctx.fillStyle = EMOTION_COLORS[emotion];
           ctx.fillRect(legendX, legendY + yOffset, 20, 20);
           ctx.fillStyle = '#FFFFFF';
           ctx.font = '14px Arial';
@@ -94,12 +173,7 @@
         }
       });
 
-      return {
-        canvas,
-        dataURL: canvas.toDataURL('image/png'),
-        spikes: this.identifySpikes(emotions),
-        emotionDistribution: this.calculateEmotionDistribution(emotions)
-      };
+      return canvas;
     },
 
     /**
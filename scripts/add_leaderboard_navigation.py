@@ -7,7 +7,7 @@ import os
 import re
 
 # Root directory
-root_dir = r"c:\Users\omran\project\copy of prosmart"
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Files to update (excluding index.html and loading.html which don't have main navigation)
 files_to_update = [
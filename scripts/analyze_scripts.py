@@ -0,0 +1,478 @@
+"""
+Script Necessity Analyzer
+- Maps the globals each local script defines: top-level function, class,
+  var/let/const declarations and window./globalThis./self. assignments
+  (e.g. SmartMockI18n and SmartMockA11y from i18n-accessibility.js)
+- Maps the globals each page references from its inline scripts, inline
+  event handlers and the other scripts it keeps, and reports the local
+  scripts a page loads but never uses. A script counts as used when a
+  global it defines is referenced, and as needed regardless when it does
+  work as it loads (registers listeners, touches the DOM, calls anything
+  beyond console/Math/JSON/Object helpers)
+- Flags load-order violations: a script that runs code referencing a
+  global on load (outside any function that waits to be called) before
+  the script defining it has run; typeof-guarded ones are reported too,
+  since the guarded code is then silently skipped
+- With --fix, removes the unused scripts from the pages (or, with --defer,
+  marks them defer instead); removed scripts no longer count towards the
+  classes a page can match, so the purged stylesheets are then rebuilt
+  (scripts/purge_css.py)
+
+Usage:
+    python scripts/analyze_scripts.py                        # report every page
+    python scripts/analyze_scripts.py interview/cs/ai-interview.html
+    python scripts/analyze_scripts.py --fix                  # drop unused scripts
+    python scripts/analyze_scripts.py --fix --defer          # defer them instead
+"""
+
+import argparse
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+import purge_css
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+PAGE_GLOBS = ('*.html', 'interview/*/*.html', 'recruiter/*.html')
+
+GLOBAL_OBJECTS = {'window', 'globalThis', 'self'}
+KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'with', 'return', 'typeof', 'new', 'delete', 'void', 'in',
+            'of', 'instanceof', 'do', 'else', 'case', 'throw', 'await', 'yield', 'function', 'class', 'const',
+            'let', 'var', 'this', 'super', 'import', 'export', 'try', 'finally', 'default', 'break', 'continue'}
+# Calls a script may make on load without doing anything observable
+PURE_CALLS = {'console', 'Math', 'JSON', 'Object', 'Array', 'Number', 'String', 'Symbol', 'Date', 'Promise',
+              'Map', 'Set', 'WeakMap', 'WeakSet', 'RegExp', 'Error', 'parseInt', 'parseFloat', 'Boolean'}
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+
+
+class Scan:
+    """What one script defines and references: names with the line-level context of each use"""
+
+    def __init__(self):
+        self.defines = set()
+        self.references = {}        # name -> {'eager': bool, 'guarded': bool}
+        self.side_effects = False
+
+    def reference(self, name, eager, guarded):
+        ref = self.references.setdefault(name, {'eager': False, 'guarded': False})
+        ref['eager'] |= eager
+        ref['guarded'] |= guarded
+
+
+def tokens(source):
+    """(kind, text) tokens with comments, strings and regex literals skipped; template literal code is kept"""
+    out = []
+    i, n = 0, len(source)
+    templates = []              # brace depth at each open ${ ... } inside a template literal
+    depth = 0
+    while i < n:
+        c = source[i]
+        if c.isspace():
+            i += 1
+        elif source.startswith('//', i):
+            i = source.find('\n', i)
+            i = n if i < 0 else i
+        elif source.startswith('/*', i):
+            i = source.find('*/', i + 2)
+            i = n if i < 0 else i + 2
+        elif c in '"\'':
+            i += 1
+            while i < n and source[i] != c and source[i] != '\n':
+                i += 2 if source[i] == '\\' else 1
+            i += 1
+            out.append(('str', ''))
+        elif c == '`' or (c == '}' and templates and templates[-1] == depth):
+            if c == '}':
+                templates.pop()
+            i += 1
+            while i < n and source[i] != '`':
+                if source[i] == '\\':
+                    i += 2
+                elif source.startswith('${', i):
+                    templates.append(depth)
+                    i += 2
+                    break
+                else:
+                    i += 1
+            else:
+                i += 1
+                out.append(('str', ''))
+        elif c == '/' and (not out or out[-1][1] in REGEX_PRECEDERS or out[-1][1] in KEYWORDS):
+            i += 1
+            in_class = False
+            while i < n and source[i] != '\n':
+                if source[i] == '\\':
+                    i += 1
+                elif source[i] == '[':
+                    in_class = True
+                elif source[i] == ']':
+                    in_class = False
+                elif source[i] == '/' and not in_class:
+                    break
+                i += 1
+            i += 1
+            while i < n and source[i].isalpha():
+                i += 1
+            out.append(('str', ''))
+        elif c.isalpha() or c in '_$':
+            j = i
+            while j < n and (source[j].isalnum() or source[j] in '_$'):
+                j += 1
+            out.append(('name', source[i:j]))
+            i = j
+        elif c.isdigit():
+            j = i
+            while j < n and (source[j].isalnum() or source[j] in '._'):
+                j += 1
+            out.append(('num', source[i:j]))
+            i = j
+        else:
+            if source.startswith('=>', i):
+                out.append(('op', '=>'))
+                i += 2
+                continue
+            if c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+            out.append(('op', c))
+            i += 1
+    return out
+
+
+def scan(source):
+    """Definitions, references and load-time side effects of one script"""
+    result = Scan()
+    toks = tokens(source)
+    declared = {text for prev, (kind, text) in zip([('op', ';')] + toks, toks)
+                if kind == 'name' and prev[1] in ('var', 'let', 'const', 'function', 'class')}
+    declared |= _bindings(toks)
+    # Each open brace records whether code inside it runs on load: function bodies wait to be
+    # called, unless the function is invoked right away
+    eager_stack = []
+    opens = []                  # index of every open '('
+    params = set()              # indexes of the ')' closing a parameter list
+    for k, (kind, text) in enumerate(toks):
+        eager = all(eager_stack)
+        if kind == 'op':
+            if text == '(':
+                opens.append(k)
+            elif text == ')' and opens:
+                if _starts_params(toks, opens.pop()):
+                    params.add(k)
+            elif text == '{':
+                prev = toks[k - 1][1] if k else ';'
+                body = prev == '=>' or (prev == ')' and k - 1 in params)
+                eager_stack.append(not body or _invoked(toks, k))
+            elif text == '}' and eager_stack:
+                eager_stack.pop()
+            continue
+        if kind != 'name':
+            continue
+        prev = toks[k - 1][1] if k else ';'
+        nxt = toks[k + 1][1] if k + 1 < len(toks) else ';'
+        assigned = nxt == '=' and (k + 2 >= len(toks) or toks[k + 2][1] not in ('=', '>'))
+        top_level = not eager_stack
+        if prev == '.':
+            owner = toks[k - 2][1] if k >= 2 else ''
+            if owner in GLOBAL_OBJECTS:
+                if assigned:
+                    result.defines.add(text)
+                else:
+                    result.reference(text, eager, False)
+            elif nxt == '(' and eager and _call_root(toks, k) not in PURE_CALLS:
+                result.side_effects = True
+            continue
+        if prev in ('function', 'class', 'var', 'let', 'const'):
+            if top_level:
+                result.defines.add(text)
+            continue
+        if text in KEYWORDS or (nxt == ':' and prev in ('{', ',')):
+            continue
+        if nxt == '(' and _starts_params(toks, k + 1):
+            continue                        # a method name
+        if nxt == '(' and eager and text not in PURE_CALLS:
+            result.side_effects = True
+        if assigned and top_level:
+            result.defines.add(text)        # implicit global
+        if text not in declared or text in result.defines:
+            result.reference(text, eager, prev == 'typeof')
+    return result
+
+
+def _bindings(toks):
+    """Local names bound by parameter lists, catch clauses and destructuring declarations"""
+    names = set()
+    for k, (kind, text) in enumerate(toks):
+        close = -1
+        if kind == 'name' and toks[k + 1:k + 2] == [('op', '=>')]:
+            names.add(text)                 # x => ...
+        elif text == '(':
+            end = _closing(toks, k)
+            arrow = toks[end + 1:end + 2] == [('op', '=>')]
+            if arrow or _starts_params(toks, k) or (k and toks[k - 1][1] == 'catch'):
+                close = end
+        elif text in ('{', '[') and k and toks[k - 1][1] in ('var', 'let', 'const'):
+            close = _matching(toks, k)
+        for j in range(k + 1, close):
+            if (toks[j][0] == 'name' and toks[j - 1][1] in ('(', ',', '{', '[', '.')
+                    and toks[j + 1][1] in (',', ')', '=', '}', ']')):
+                names.add(toks[j][1])
+    return names
+
+
+def _matching(toks, open_index):
+    pair = {'{': '}', '[': ']'}[toks[open_index][1]]
+    depth = 0
+    for k in range(open_index, len(toks)):
+        if toks[k][1] == toks[open_index][1]:
+            depth += 1
+        elif toks[k][1] == pair:
+            depth -= 1
+            if depth == 0:
+                return k
+    return -1
+
+
+def _closing(toks, open_index):
+    depth = 0
+    for k in range(open_index, len(toks)):
+        if toks[k][1] == '(':
+            depth += 1
+        elif toks[k][1] == ')':
+            depth -= 1
+            if depth == 0:
+                return k
+    return -1
+
+
+def _starts_params(toks, open_index):
+    """True when the '(' at open_index opens a parameter list rather than a call"""
+    before = toks[open_index - 1][1] if open_index >= 1 else ';'
+    if before == 'function':
+        return True
+    if open_index < 1 or toks[open_index - 1][0] != 'name' or before in KEYWORDS:
+        return False
+    ahead = toks[open_index - 2][1] if open_index >= 2 else ';'
+    if ahead in ('function', 'async', 'get', 'set', 'static'):
+        return True
+    # a shorthand method 'name(...) {' in a class or object body
+    close = _closing(toks, open_index)
+    return (ahead in ('{', '}', ',', ';') and 0 <= close < len(toks) - 1 and toks[close + 1][1] == '{')
+
+
+def _invoked(toks, brace_index):
+    """True when the function whose body opens at brace_index is called right away"""
+    depth = 0
+    for k in range(brace_index, len(toks)):
+        if toks[k][1] == '{':
+            depth += 1
+        elif toks[k][1] == '}':
+            depth -= 1
+            if depth == 0:
+                rest = [t[1] for t in toks[k + 1:k + 3]]
+                return rest[:1] == ['('] or rest == [')', '(']
+    return False
+
+
+def _call_root(toks, k):
+    while k >= 2 and toks[k - 1][1] == '.' and toks[k - 2][0] == 'name':
+        k -= 2
+    return toks[k][1]
+
+
+class PageScripts(HTMLParser):
+    """The scripts of a page in document order, and the code in its inline event handlers"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.scripts = []           # dicts: src (or None), code, defer, async, module
+        self.handlers = []
+        self.current = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        for name, value in attrs.items():
+            if name.startswith('on') and value:
+                self.handlers.append(value)
+            elif name == 'href' and value and value.lower().startswith('javascript:'):
+                self.handlers.append(value[len('javascript:'):])
+        if tag == 'script':
+            kind = (attrs.get('type') or 'text/javascript').lower()
+            if kind not in ('text/javascript', 'application/javascript', 'module'):
+                return
+            self.current = {'src': attrs.get('src'), 'code': '', 'defer': 'defer' in attrs,
+                            'async': 'async' in attrs, 'module': kind == 'module', 'line': self.getpos()[0]}
+            self.scripts.append(self.current)
+
+    def handle_endtag(self, tag):
+        if tag == 'script':
+            self.current = None
+
+    def handle_data(self, data):
+        if self.current is not None and not self.current['src']:
+            self.current['code'] += data
+
+
+def local_script(page, src):
+    """The site file a script src points at, or None for external and missing scripts"""
+    if not src or re.match(r'^(?:[a-z]+:)?//', src, re.I):
+        return None
+    path = (page.parent / src.split('?')[0].split('#')[0]).resolve()
+    try:
+        path.relative_to(BASE_DIR.resolve())
+    except ValueError:
+        return None
+    return path if path.is_file() else None
+
+
+_SCANS = {}
+
+
+def scan_file(path):
+    stamp = path.stat().st_mtime_ns
+    cached = _SCANS.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = _SCANS[path] = (stamp, scan(path.read_text(encoding='utf-8', errors='replace')))
+    return cached[1]
+
+
+def run_order(scripts):
+    """Execution slot per script: classic in document order, then defer/module ones; async is unordered"""
+    slots = []
+    for i, script in enumerate(scripts):
+        if script['async']:
+            slots.append(None)
+        elif script['src'] and (script['defer'] or script['module']) or script['module']:
+            slots.append(len(scripts) + i)
+        else:
+            slots.append(i)
+    return slots
+
+
+def analyze(page):
+    """{'unused': [src], 'violations': [(user, name, definer, guarded)], 'scripts': n} for one page"""
+    parser = PageScripts()
+    parser.feed(page.read_text(encoding='utf-8', errors='replace'))
+    parser.close()
+    scripts = parser.scripts
+    scans = []
+    for script in scripts:
+        path = local_script(page, script['src']) if script['src'] else None
+        scans.append(scan_file(path) if path else scan(script['code']) if not script['src'] else None)
+
+    handler_refs = set()
+    for code in parser.handlers:
+        handler_refs |= set(scan(code).references)
+
+    # Scripts that must stay: inline ones, external ones we cannot see, and local ones doing work on load
+    needed = {i for i, result in enumerate(scans) if result is None or not scripts[i]['src']
+              or result.side_effects or not result.defines}
+    changed = True
+    while changed:
+        changed = False
+        referenced = set(handler_refs)
+        for i in needed:
+            if scans[i] is not None:
+                referenced |= set(scans[i].references) - scans[i].defines
+        for i, result in enumerate(scans):
+            if i not in needed and result.defines & referenced:
+                needed.add(i)
+                changed = True
+    unused = [scripts[i]['src'] for i in range(len(scripts)) if i not in needed]
+
+    slots = run_order(scripts)
+    definers = {}
+    for i, result in enumerate(scans):
+        if result is not None:
+            for name in result.defines:
+                definers.setdefault(name, []).append(i)
+    violations = []
+    for i, result in enumerate(scans):
+        if result is None or i not in needed:
+            continue
+        for name, ref in sorted(result.references.items()):
+            if not ref['eager'] or name in result.defines or name not in definers:
+                continue
+            before = [d for d in definers[name] if d != i and slots[d] is not None and slots[i] is not None
+                      and slots[d] < slots[i]]
+            if not before:
+                definer = definers[name][0]
+                if definer != i:
+                    violations.append((_label(scripts[i]), name, _label(scripts[definer]), ref['guarded']))
+    return {'unused': unused, 'violations': violations, 'scripts': len(scripts)}
+
+
+def _label(script):
+    return script['src'] or f"inline script (line {script['line']})"
+
+
+def fix_page(page, unused, defer=False):
+    """Remove (or defer) the unused script tags; returns True if the page changed"""
+    content = page.read_text(encoding='utf-8')
+    new_content = content
+    for src in unused:
+        tag = re.compile(r'(\n?[ \t]*)<script\b([^>]*)\bsrc="' + re.escape(src) + r'"([^>]*)></script>')
+        if defer:
+            new_content = tag.sub(lambda m: m.group(0) if re.search(r'\bdefer\b', m.group(2) + m.group(3))
+                                  else f'{m.group(1)}<script{m.group(2)}src="{src}"{m.group(3)} defer></script>',
+                                  new_content)
+        else:
+            new_content = tag.sub('', new_content)
+    if new_content == content:
+        return False
+    page.write_text(new_content, encoding='utf-8')
+    return True
+
+
+def site_pages():
+    pages = set()
+    for pattern in PAGE_GLOBS:
+        pages.update(path for path in BASE_DIR.glob(pattern) if path.is_file())
+    return sorted(pages)
+
+
+def main():
+    """Report (and optionally fix) unused scripts and load-order violations"""
+    parser = argparse.ArgumentParser(description='Find scripts pages load but never use')
+    parser.add_argument('pages', nargs='*', help='pages to analyze (default: every site page)')
+    parser.add_argument('--fix', action='store_true', help='remove the unused scripts from the pages')
+    parser.add_argument('--defer', action='store_true', help='with --fix: add defer instead of removing')
+    args = parser.parse_args()
+    if args.defer and not args.fix:
+        parser.error('--defer only applies with --fix')
+
+    pages = [Path(page).resolve() for page in args.pages] or site_pages()
+    print(f"🔎 Script necessity: {len(pages)} page(s)")
+    print("=" * 60)
+    total_unused = total_violations = fixed = 0
+    for page in pages:
+        report = analyze(page)
+        if not report['unused'] and not report['violations']:
+            continue
+        print(f"📄 {page.relative_to(BASE_DIR).as_posix()} ({report['scripts']} scripts)")
+        for src in report['unused']:
+            print(f"   🗑️  unused: {src}")
+        for user, name, definer, guarded in report['violations']:
+            note = ' (typeof-guarded: silently skipped)' if guarded else ''
+            print(f"   ⚠️  {user} uses {name} before {definer} defines it{note}")
+        total_unused += len(report['unused'])
+        total_violations += len(report['violations'])
+        if args.fix and report['unused'] and fix_page(page, report['unused'], args.defer):
+            fixed += 1
+
+    print("=" * 60)
+    print(f"🗑️  {total_unused} unused script load(s), ⚠️  {total_violations} load-order violation(s)")
+    if args.fix:
+        print(f"✅ {'Deferred' if args.defer else 'Removed'} unused scripts on {fixed} page(s)")
+        if fixed and not args.defer:
+            print()
+            purge_css.rebuild()
+    elif total_violations:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
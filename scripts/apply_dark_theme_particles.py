@@ -3,20 +3,39 @@ Apply Dark Black Theme + Purple Particles + Background 3D Robot + Glass UI + Ham
 
 Extends previous script: now injects (idempotently) the following into every HTML page:
   1. Dark theme & glass morphism CSS (with a marker id="dark-theme-injected")
-  2. Particles container (120 purple particles) if missing
-  3. Background robot container + canvas if missing
-  4. Three.js CDN + robot-interviewer.js (only if not already present)
-  5. Background robot initialization (guarded by meta id="bg-robot-initialized")
-  6. Hamburger overlay menu (guarded by meta id="hamburger-overlay-initialized")
+  2. Particles container + renderer in the mode the page's class asks for
+     (config/page-classes.json): "canvas" draws a per-class particle budget on one
+     <canvas> (scaled to the viewport and devicePixelRatio, paused while the tab is
+     hidden or under prefers-reduced-motion), "dom" creates 120 animated divs,
+     "none" removes the injected particles
+  3. Background robot container + canvas if missing, carrying the page class's robot
+     settings: "webgl" pages load three.js and robot-interviewer.js after the first
+     paint (frame rate and devicePixelRatio capped, rendering paused off-screen and in
+     background tabs), "poster" pages and low-end devices show a static poster image,
+     "none" removes the robot. three.js comes from the copy scripts/vendor_cdn_libs.py
+     vendored, with its integrity hash, once assets/vendor/manifest.json lists it
+  4. Background robot loader (guarded by meta id="bg-robot-initialized"); eager
+     initialisers and the three.js / robot-interviewer.js tags only they needed are removed
+  5. Hamburger overlay menu (guarded by meta id="hamburger-overlay-initialized")
 
 Idempotent logic prevents duplicate insertion if pages were manually patched earlier.
-Pages previously processed will be skipped only if BOTH meta markers are detected.
+Pages previously processed will be skipped only if BOTH meta markers are detected;
+the particle and robot modes are still brought in line with the page class on those pages.
 """
 
 import os
 import re
 from pathlib import Path
 
+import vendor_cdn_libs
+from page_classes import relative_page, setting
+
+PARTICLE_MODES = ('canvas', 'dom', 'none')
+DEFAULT_PARTICLES = {'mode': 'dom', 'budget': 120}
+ROBOT_MODES = ('webgl', 'poster', 'none')
+DEFAULT_ROBOT = {'mode': 'webgl', 'poster': 'assets/images/robot-poster.svg', 'maxFps': 30, 'maxPixelRatio': 1.5}
+THREE_URL = 'https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js'
+
 # Dark theme + glass & layering CSS to inject
 DARK_THEME_CSS = """    <style id="dark-theme-injected">
       /* Dark Black Theme with Purple Particles */
@@ -136,7 +155,9 @@ DARK_THEME_CSS = """    <style id="dark-theme-injected">
 
 # Containers HTML fragments
 PARTICLES_ONLY_HTML = '\n    <!-- Floating Particles (auto injected) -->\n    <div class="particles-container" id="particlesContainer"></div>\n'
+PARTICLES_CONTAINER = re.compile(r'<div class="particles-container" id="particlesContainer"[^>]*>')
 ROBOT_CONTAINER_HTML = '\n    <!-- Background Robot Container -->\n    <div id="bg-robot-container"><canvas id="bg-robot-canvas"></canvas></div>\n'
+ROBOT_CONTAINER = re.compile(r'<div id="bg-robot-container"[^>]*>')
 
 # Particles JavaScript (idempotent generation guarded by container existence)
 PARTICLES_JS = """
@@ -177,23 +198,165 @@ PARTICLES_JS = """
       }
     </script>"""
 
-# Background robot + hamburger overlay initialization
-ROBOT_INIT_JS = """
-    <!-- Background Robot + Hamburger Init -->
+# Canvas particle renderer: one <canvas> instead of a div, a layer and an animation per particle
+PARTICLES_CANVAS_JS = """
+    <!-- Particle Canvas Renderer -->
+    <script>
+      (function () {
+        const container = document.getElementById('particlesContainer');
+        if (!container || container.querySelector('canvas')) return;
+        const canvas = document.createElement('canvas');
+        const ctx = canvas.getContext('2d');
+        if (!ctx) return;
+        canvas.style.cssText = 'display:block;width:100%;height:100%';
+        container.appendChild(canvas);
+        const budget = parseInt(container.dataset.particleBudget, 10) || 80;
+        const reduced = window.matchMedia ? window.matchMedia('(prefers-reduced-motion: reduce)') : null;
+
+        // The glow is drawn once; each particle is then a single drawImage instead of a box-shadow
+        const sprite = document.createElement('canvas');
+        sprite.width = sprite.height = 32;
+        const glow = sprite.getContext('2d');
+        const gradient = glow.createRadialGradient(16, 16, 0, 16, 16, 16);
+        gradient.addColorStop(0, 'rgba(216, 180, 254, 1)');
+        gradient.addColorStop(0.2, 'rgba(168, 85, 247, 1)');
+        gradient.addColorStop(0.45, 'rgba(168, 85, 247, 0.35)');
+        gradient.addColorStop(1, 'rgba(168, 85, 247, 0)');
+        glow.fillStyle = gradient;
+        glow.fillRect(0, 0, 32, 32);
+
+        const particles = [];
+        let width = 0, height = 0, frame = 0, last = 0;
+
+        function spawn(anyAge) {
+          const duration = 12 + Math.random() * 13;
+          return { x: Math.random(), size: 2 + Math.random() * 4, drift: (Math.random() - 0.5) * 150,
+                   duration: duration, age: anyAge ? Math.random() * duration : 0 };
+        }
+
+        function resize() {
+          const ratio = Math.min(window.devicePixelRatio || 1, 2);
+          width = window.innerWidth;
+          height = window.innerHeight;
+          canvas.width = Math.round(width * ratio);
+          canvas.height = Math.round(height * ratio);
+          ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+          // The budget is for a 1920x1080 viewport; smaller screens get proportionally fewer
+          const count = Math.max(10, Math.round(budget * Math.min(1, (width * height) / (1920 * 1080))));
+          while (particles.length < count) particles.push(spawn(true));
+          particles.length = count;
+        }
+
+        function draw(dt) {
+          ctx.clearRect(0, 0, width, height);
+          for (const p of particles) {
+            p.age += dt;
+            if (p.age >= p.duration) Object.assign(p, spawn(false));
+            const t = p.age / p.duration;
+            const size = p.size * t * 3;
+            if (size < 0.5) continue;
+            ctx.globalAlpha = t < 0.1 ? t / 0.1 : t > 0.9 ? (1 - t) / 0.1 : 1;
+            ctx.drawImage(sprite, p.x * width + p.drift * t - size / 2, height * (1 - 1.2 * t) - size / 2, size, size);
+          }
+          ctx.globalAlpha = 1;
+        }
+
+        function tick(now) {
+          draw(last ? Math.min((now - last) / 1000, 0.1) : 0);
+          last = now;
+          frame = requestAnimationFrame(tick);
+        }
+
+        function update() {
+          const run = !document.hidden && !(reduced && reduced.matches);
+          if (run && !frame) {
+            last = 0;
+            frame = requestAnimationFrame(tick);
+          } else if (!run) {
+            if (frame) cancelAnimationFrame(frame);
+            frame = 0;
+            draw(0);
+          }
+        }
+
+        resize();
+        window.addEventListener('resize', function () { resize(); if (!frame) draw(0); });
+        document.addEventListener('visibilitychange', update);
+        if (reduced && reduced.addEventListener) reduced.addEventListener('change', update);
+        else if (reduced && reduced.addListener) reduced.addListener(update);
+        update();
+      })();
+    </script>"""
+
+# Injected particle scripts of either mode (including older copies of the generation script)
+PARTICLE_BLOCK = re.compile(r'\n?[ \t]*<!-- Particle (?:Generation Script|Canvas Renderer) -->\s*<script>.*?</script>', re.S)
+
+# Background robot loader: three.js and robot-interviewer.js are fetched after the first paint,
+# and only on devices that can afford a WebGL scene; the rest get the class's poster image
+ROBOT_LOADER_JS = """
+    <!-- Background Robot Loader -->
     <script>
-      (function initBgRobot(){
-        if (document.getElementById('bg-robot-initialized')) return; // idempotent
-        const flag = document.createElement('meta'); flag.id='bg-robot-initialized'; document.head.appendChild(flag);
-        function start(){
-          if (typeof THREE === 'undefined' || typeof window.RobotInterviewer === 'undefined') return setTimeout(start, 120);
-          try {
-            window.bgRobotGlobal = new window.RobotInterviewer('bg-robot-container', THREE, { canvasId:'bg-robot-canvas', trackCursor:true });
-            window.bgRobotGlobal.setState('neutral');
-            console.log('✅ Global background robot initialized');
-          } catch(e){ console.error('❌ Global robot failed:', e); }
+      (function () {
+        const container = document.getElementById('bg-robot-container');
+        if (!container || document.getElementById('bg-robot-initialized')) return; // idempotent
+        const flag = document.createElement('meta'); flag.id = 'bg-robot-initialized'; document.head.appendChild(flag);
+        const data = container.dataset;
+        function showPoster() {
+          if (data.robotPoster) container.style.background = `url("${data.robotPoster}") center / min(60vmin, 520px) no-repeat`;
         }
-        start();
+        const connection = navigator.connection || {};
+        const lowEnd = (navigator.hardwareConcurrency || 4) <= 2 || (navigator.deviceMemory || 4) <= 2
+          || connection.saveData || /(^|-)2g$/.test(connection.effectiveType || '')
+          || (window.matchMedia && window.matchMedia('(prefers-reduced-motion: reduce)').matches);
+        if (data.robot === 'poster' || lowEnd || !window.WebGLRenderingContext) return showPoster();
+
+        function load(ready, src, integrity) {
+          return ready() ? Promise.resolve() : new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.crossOrigin = 'anonymous';
+            if (integrity) script.integrity = integrity;
+            script.src = src; script.onload = resolve; script.onerror = reject;
+            document.head.appendChild(script);
+          });
+        }
+        function start() {
+          load(() => typeof THREE !== 'undefined', data.robotThreeSrc, data.robotThreeIntegrity)
+            .then(() => load(() => typeof window.RobotInterviewer !== 'undefined', data.robotScript))
+            .then(() => {
+              const robot = window.bgRobotGlobal = new window.RobotInterviewer('bg-robot-container', THREE, {
+                canvasId: 'bg-robot-canvas', trackCursor: true,
+                maxFps: Number(data.robotMaxFps) || 30, maxPixelRatio: Number(data.robotMaxDpr) || 1.5
+              });
+              robot.setState('neutral');
+              // Render only while the robot is on screen and the tab is visible
+              let onScreen = true;
+              const sync = () => (onScreen && !document.hidden ? robot.resume() : robot.pause());
+              if ('IntersectionObserver' in window) {
+                new IntersectionObserver(entries => { onScreen = entries[0].isIntersecting; sync(); }).observe(container);
+              }
+              document.addEventListener('visibilitychange', sync);
+              console.log('✅ Global background robot initialized');
+            })
+            .catch(e => { console.error('❌ Global robot failed:', e); showPoster(); });
+        }
+        // After the first paint, once the browser is idle
+        const later = () => (window.requestIdleCallback ? requestIdleCallback(start, { timeout: 2000 }) : setTimeout(start, 200));
+        if (document.readyState === 'complete') later(); else window.addEventListener('load', later, { once: true });
       })();
+    </script>"""
+
+# Eager background-robot initialisers of earlier versions (and hand-patched pages), the
+# library tags they needed and loader copies; replaced by ROBOT_LOADER_JS
+EAGER_ROBOT_INIT = re.compile(r'(?:[ \t]*// Initialize Background Robot\n)?[ \t]*\(function initBgRobot\(\)\s*\{')
+ROBOT_LIB_TAG = re.compile(r'\n?[ \t]*(?:<!-- Three\.js \+ Robot Interviewer -->\s*)?'
+                           r'<script src="[^"]*(?:three\.min\.js|robot-interviewer\.js)"></script>')
+ROBOT_LOADER_BLOCK = re.compile(r'\n?[ \t]*<!-- Background Robot Loader -->\s*<script>.*?</script>', re.S)
+EMPTY_SCRIPT = re.compile(r'\n?[ \t]*<script>\s*</script>')
+
+# Hamburger overlay initialization
+HAMBURGER_INIT_JS = """
+    <!-- Hamburger Overlay Init -->
+    <script>
       (function initHamburger(){
         if (document.getElementById('hamburger-overlay-initialized')) return;
         const flag = document.createElement('meta'); flag.id='hamburger-overlay-initialized'; document.head.appendChild(flag);
@@ -218,11 +381,142 @@ ROBOT_INIT_JS = """
       })();
     </script>"""
 
-def process_html_file(filepath):
+def particle_settings(filepath):
+  """The particle mode and budget for a page, from its class in config/page-classes.json"""
+  particles = dict(DEFAULT_PARTICLES, **(setting(filepath, 'particles') or {}))
+  if particles['mode'] not in PARTICLE_MODES:
+    raise ValueError(f"unknown particle mode {particles['mode']!r} for {filepath}")
+  return particles
+
+
+def robot_settings(filepath):
+  """How a page gets its background robot, from its class in config/page-classes.json"""
+  robot = dict(DEFAULT_ROBOT, **(setting(filepath, 'robot') or {}))
+  if robot['mode'] not in ROBOT_MODES:
+    raise ValueError(f"unknown robot mode {robot['mode']!r} for {filepath}")
+  return robot
+
+
+def three_source():
+  """(src, integrity) of three.js for the robot loader: the vendored copy (site-relative path) when
+  scripts/vendor_cdn_libs.py installed one, else the CDN URL without an integrity hash"""
+  config = vendor_cdn_libs.load_config(vendor_cdn_libs.CONFIG_PATH)
+  manifest = vendor_cdn_libs.load_manifest(vendor_cdn_libs.BASE_DIR / config.get('vendorDir', 'assets/vendor'))
+  for entry in manifest['libraries']:
+    if THREE_URL in entry['urls']:
+      return entry['path'], entry['integrity']
+  return THREE_URL, None
+
+
+def asset_prefix(filepath):
+  """'../' per directory between the page and the site root ('' for pages outside the repo)"""
+  page = relative_page(filepath)
+  return '' if Path(page).is_absolute() else '../' * page.count('/')
+
+
+def strip_eager_robot(content):
+  """Remove every `(function initBgRobot(){ ... })();` statement and the <script> blocks it leaves empty"""
+  while True:
+    match = EAGER_ROBOT_INIT.search(content)
+    if not match:
+      break
+    depth = 0
+    for end in range(match.end() - 1, len(content)):
+      depth += {'{': 1, '}': -1}.get(content[end], 0)
+      if depth == 0:
+        break
+    call = re.compile(r'\)\(\);?[ \t]*\n?').match(content, end + 1)
+    if depth or not call:
+      raise ValueError('unbalanced background robot initialiser')
+    content = content[:match.start()] + content[call.end():]
+  return EMPTY_SCRIPT.sub('', content)
+
+
+def apply_robot(content, robot, prefix='', three=(THREE_URL, None)):
+  """Replace eager background-robot code with ROBOT_LOADER_JS configured for the page (idempotent).
+
+  `three` is the (src, integrity) the loader fetches three.js from (see three_source); a
+  site-relative src is prefixed like the page's other assets. The three.js and
+  robot-interviewer.js tags stay on pages that use them for something else (the AI interview
+  rooms render their interviewer with them).
+  """
+  blocks = list(ROBOT_LOADER_BLOCK.finditer(content))
+  if blocks:
+    # the first loader is kept in place (and refreshed), copies are dropped
+    first = blocks[0]
+    content = (content[:first.start()] + '\0'
+               + ''.join(content[a.end():b.start()] for a, b in zip(blocks, blocks[1:] + [None]) if b)
+               + content[blocks[-1].end():])
+  content = strip_eager_robot(content)
+  if not re.search(r'new (?:window\.)?RobotInterviewer\(|THREE\.[A-Z]', content):
+    content = ROBOT_LIB_TAG.sub('', content)
+
+  if robot['mode'] == 'none':
+    content = content.replace('\0', '')
+    return re.sub(r'\n?[ \t]*(?:<!-- Background Robot Container -->\s*)?' + ROBOT_CONTAINER.pattern
+                  + r'\s*<canvas id="bg-robot-canvas"></canvas>\s*</div>', '', content)
+
+  if '\0' in content:
+    content = content.replace('\0', ROBOT_LOADER_JS)
+  elif '</body>' in content:
+    content = content.replace('</body>', f'{ROBOT_LOADER_JS}\n  </body>', 1)
+  three_src, three_integrity = three
+  if not re.match(r'^[a-z]+:', three_src):
+    three_src = prefix + three_src
+  tag = (f'<div id="bg-robot-container" data-robot="{robot["mode"]}" data-robot-poster="{prefix}{robot["poster"]}"'
+         f' data-robot-script="{prefix}assets/js/robot-interviewer.js" data-robot-max-fps="{robot["maxFps"]}"'
+         f' data-robot-max-dpr="{robot["maxPixelRatio"]}" data-robot-three-src="{three_src}"'
+         + (f' data-robot-three-integrity="{three_integrity}"' if three_integrity else '') + '>')
+  if ROBOT_CONTAINER.search(content):
+    return ROBOT_CONTAINER.sub(tag, content, count=1)
+  body_match = re.search(r'<body[^>]*>', content)
+  if body_match:
+    fragment = ROBOT_CONTAINER_HTML.replace('<div id="bg-robot-container">', tag)
+    content = content.replace(body_match.group(0), body_match.group(0) + fragment, 1)
+  return content
+
+
+def apply_particles(content, mode, budget):
+  """Bring the injected particles of a page to the given mode (idempotent).
+
+  Pages with a particles container but no injected script run their own particle
+  code and are left alone.
+  """
+  blocks = list(PARTICLE_BLOCK.finditer(content))
+  container = PARTICLES_CONTAINER.search(content)
+  if container and not blocks:
+    return content
+
+  script = {'canvas': PARTICLES_CANVAS_JS, 'dom': PARTICLES_JS, 'none': ''}[mode]
+  if blocks:
+    # the first injected script becomes the wanted one, copies are dropped
+    first = blocks[0]
+    content = (content[:first.start()] + script
+               + ''.join(content[a.end():b.start()] for a, b in zip(blocks, blocks[1:] + [None]) if b)
+               + content[blocks[-1].end():])
+  elif mode != 'none' and '</body>' in content:
+    content = content.replace('</body>', f'{script}\n  </body>', 1)
+
+  if mode == 'none':
+    return re.sub(r'\n?[ \t]*(?:<!-- Floating Particles \(auto injected\) -->\s*)?'
+                  + PARTICLES_CONTAINER.pattern + r'</div>', '', content)
+  tag = '<div class="particles-container" id="particlesContainer"'
+  tag += f' data-particle-budget="{budget}">' if mode == 'canvas' else '>'
+  if container:
+    return PARTICLES_CONTAINER.sub(tag, content)
+  body_match = re.search(r'<body[^>]*>', content)
+  if body_match:
+    fragment = PARTICLES_ONLY_HTML.replace('<div class="particles-container" id="particlesContainer">', tag)
+    content = content.replace(body_match.group(0), body_match.group(0) + fragment, 1)
+  return content
+
+
+def process_html_file(filepath, particles=None, robot=None):
   """Process a single HTML file (idempotent injections)."""
   try:
     with open(filepath, 'r', encoding='utf-8') as f:
       content = f.read()
+    original = content
 
     filepath_str = str(filepath).lower()
     # Skip test/robot specific sandbox files
@@ -230,57 +524,26 @@ def process_html_file(filepath):
       print(f"⏭️  Skipped (test/robot file): {filepath}")
       return False
 
-    # If already has both meta markers, assume fully processed
-    if 'bg-robot-initialized' in content and 'hamburger-overlay-initialized' in content:
-      print(f"⏭️  Skipped (already fully processed): {filepath}")
-      return False
+    particles = particles or particle_settings(filepath)
+    robot = robot or robot_settings(filepath)
+
+    # If already has both meta markers, assume fully processed (only the particle mode is updated)
+    if 'bg-robot-initialized' not in content or 'hamburger-overlay-initialized' not in content:
+      # 1. Inject CSS if not present
+      if 'dark-theme-injected' not in content and '</head>' in content:
+        content = content.replace('</head>', f'{DARK_THEME_CSS}\n  </head>', 1)
+
+    # 2-4. Background robot container + lazy loader in the page class's mode (also on processed pages)
+    content = apply_robot(content, robot, asset_prefix(filepath), three_source())
+
+    # 5. Particles container + renderer in the page class's mode
+    content = apply_particles(content, particles['mode'], particles['budget'])
+
+    # 6. Inject the hamburger init if not present
+    if 'hamburger-overlay-initialized' not in content and 'initHamburger' not in content and '</body>' in content:
+      content = content.replace('</body>', f'{HAMBURGER_INIT_JS}\n  </body>', 1)
 
-    modified = False
-
-    # 1. Inject CSS if not present
-    if 'dark-theme-injected' not in content and '</head>' in content:
-      content = content.replace('</head>', f'{DARK_THEME_CSS}\n  </head>', 1)
-      modified = True
-
-    # 2. Inject containers (particles + robot) right after <body...>
-    body_match = re.search(r'<body[^>]*>', content)
-    if body_match:
-      body_tag = body_match.group(0)
-      insertion = body_tag
-      added_any = False
-      if 'particles-container' not in content:
-        insertion += PARTICLES_ONLY_HTML
-        added_any = True
-      if 'bg-robot-container' not in content:
-        insertion += ROBOT_CONTAINER_HTML
-        added_any = True
-      if added_any:
-        content = content.replace(body_tag, insertion, 1)
-        modified = True
-
-    # 3. Ensure external libs (Three.js + robot) are present before </body>
-    if '</body>' in content:
-      libs_needed = False
-      if 'three.min.js' not in content:
-        content = content.replace('</body>', '<script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>\n</body>', 1)
-        libs_needed = True
-      if 'robot-interviewer.js' not in content:
-        content = content.replace('</body>', '<script src="assets/js/robot-interviewer.js"></script>\n</body>', 1)
-        libs_needed = True
-      if libs_needed:
-        modified = True
-
-    # 4. Inject particle generation script if not already (search for key marker)
-    if 'Particle Generation Script' not in content and '</body>' in content:
-      content = content.replace('</body>', f'{PARTICLES_JS}\n  </body>', 1)
-      modified = True
-
-    # 5. Inject robot + hamburger init if not present
-    if 'Global background robot initialized' not in content and 'bg-robot-initialized' not in content and '</body>' in content:
-      content = content.replace('</body>', f'{ROBOT_INIT_JS}\n  </body>', 1)
-      modified = True
-
-    if modified:
+    if content != original:
       with open(filepath, 'w', encoding='utf-8') as f:
         f.write(content)
       print(f"✅ Updated: {filepath}")
@@ -295,7 +558,7 @@ def process_html_file(filepath):
 
 def main():
   """Discover and process all relevant HTML files in the workspace."""
-  root_dir = Path(r"C:\Users\omran\smartmock")
+  root_dir = Path(__file__).parent.parent
 
   html_files = []
 
@@ -333,7 +596,7 @@ def main():
   print("\n✨ COMPLETE!")
   print(f"✅ Updated: {updated_count} files")
   print(f"⏭️  Skipped: {skipped_count} files")
-  print("\n🎨 Dark theme, particles, background robot & overlay menu applied!")
+  print("\n🎨 Dark theme, particles (per page class), background robot & overlay menu applied!")
   print("🤖 Global robot & menu layers added idempotently.")
 
 if __name__ == "__main__":
@@ -161,130 +161,82 @@ ROBOT_BACKGROUND_HTML = """
       <canvas id="bg-robot-canvas"></canvas>
     </div>"""
 
-# Parallax JavaScript
-PARALLAX_JS = """
-    <!-- Particle Generation Script -->
-    <script>
-      // Create 120 floating purple particles
-      if (document.getElementById('particlesContainer')) {
-        const particlesContainer = document.getElementById('particlesContainer');
-        const particleCount = 120;
-
-        for (let i = 0; i < particleCount; i++) {
-          const particle = document.createElement('div');
-          particle.classList.add('particle');
-          
-          const size = 2 + Math.random() * 4;
-          particle.style.width = `${size}px`;
-          particle.style.height = `${size}px`;
-          
-          const leftPos = Math.random() * 100;
-          particle.style.left = `${leftPos}%`;
-          
-          const duration = 12 + Math.random() * 13;
-          particle.style.animationDuration = `${duration}s`;
-          
-          const delay = Math.random() * 10;
-          particle.style.animationDelay = `${delay}s`;
-          
-          const drift = (Math.random() - 0.5) * 150;
-          particle.style.setProperty('--drift', `${drift}px`);
-          
-          particlesContainer.appendChild(particle);
-        }
-      }
-    </script>
-    
-    <!-- Three.js + Robot Interviewer -->
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
-    <script src="assets/js/robot-interviewer.js"></script>
-    <script>
-      // Initialize Background Robot
-      (function initBgRobot(){
-        if (typeof THREE === 'undefined' || typeof window.RobotInterviewer === 'undefined') {
-          return setTimeout(initBgRobot, 100);
-        }
-        try {
-          window.bgRobot = new window.RobotInterviewer('bg-robot-container', THREE, {
-            canvasId: 'bg-robot-canvas',
-            trackCursor: true
-          });
-          window.bgRobot.setState('neutral');
-          console.log('✅ Background robot initialized');
-        } catch (e) {
-          console.error('❌ Failed to init background robot:', e);
-        }
-      })();
-      
-      // Advanced Parallax and Depth Effect
-      let targetX = 0, targetY = 0;
-      let currentX = 0, currentY = 0;
-      
-      document.addEventListener('mousemove', (e) => {
-        const x = e.clientX / window.innerWidth;
-        const y = e.clientY / window.innerHeight;
-        targetX = (x - 0.5);
-        targetY = (y - 0.5);
-      });
-      
-      function animateParallax() {
-        currentX += (targetX - currentX) * 0.1;
-        currentY += (targetY - currentY) * 0.1;
-        
-        const container = document.getElementById('bg-robot-container');
-        if (container) {
-          const moveX1 = currentX * 80;
-          const moveY1 = currentY * 80;
-          const rotateY1 = currentX * 20;
-          const rotateX1 = -currentY * 20;
-          const scale1 = 1 + (Math.abs(currentX) + Math.abs(currentY)) * 0.05;
-          
-          container.style.transform = `
-            perspective(2000px) 
-            translateX(${moveX1}px) 
-            translateY(${moveY1}px) 
-            translateZ(-100px)
-            rotateX(${rotateX1}deg) 
-            rotateY(${rotateY1}deg)
-            scale(${scale1})
-          `;
+# Parallax loop: eases the background layers towards the pointer and stops requesting
+# frames once they settle, so an idle or hidden page does no per-frame work
+PARALLAX_LOOP = """
+      // Idle-aware Parallax: eases towards the pointer, then sleeps until it moves again
+      (function () {
+        if (window.matchMedia && window.matchMedia('(prefers-reduced-motion: reduce)').matches) {
+          return;
         }
-        
+        const robot = document.getElementById('bg-robot-container');
         const particles = document.getElementById('particlesContainer');
-        if (particles) {
-          const moveX2 = currentX * 40;
-          const moveY2 = currentY * 40;
-          particles.style.transform = `
-            translateX(${moveX2}px) 
-            translateY(${moveY2}px)
-            translateZ(50px)
-          `;
-        }
-        
-        const bodyBefore = document.body;
-        if (bodyBefore) {
-          const gradientX = 50 + currentX * 10;
-          const gradientY = 50 + currentY * 10;
-          bodyBefore.style.setProperty('--gradient-x', `${gradientX}%`);
-          bodyBefore.style.setProperty('--gradient-y', `${gradientY}%`);
+        let targetX = 0, targetY = 0;
+        let currentX = 0, currentY = 0;
+        let frame = 0;
+
+        function wake() {
+          if (!frame && !document.hidden) {
+            frame = requestAnimationFrame(animateParallax);
+          }
         }
-        
-        const main = document.querySelector('main');
-        if (main) {
-          const moveX4 = -currentX * 15;
-          const moveY4 = -currentY * 15;
-          main.style.transform = `
-            translateX(${moveX4}px) 
-            translateY(${moveY4}px)
-            translateZ(100px)
-          `;
+
+        function animateParallax() {
+          frame = 0;
+          currentX += (targetX - currentX) * 0.1;
+          currentY += (targetY - currentY) * 0.1;
+          const settled = Math.abs(targetX - currentX) < 0.0005 && Math.abs(targetY - currentY) < 0.0005;
+          if (settled) {
+            currentX = targetX;
+            currentY = targetY;
+          }
+
+          // Transforms only: the compositor moves these layers without layout or paint
+          if (robot) {
+            const scale = 1 + (Math.abs(currentX) + Math.abs(currentY)) * 0.05;
+            robot.style.transform = `perspective(2000px) translate3d(${currentX * 80}px, ${currentY * 80}px, -100px) ` +
+              `rotateX(${-currentY * 20}deg) rotateY(${currentX * 20}deg) scale(${scale})`;
+          }
+          if (particles) {
+            particles.style.transform = `translate3d(${currentX * 40}px, ${currentY * 40}px, 50px)`;
+          }
+
+          if (!settled) {
+            wake();
+          }
         }
-        
-        requestAnimationFrame(animateParallax);
-      }
-      
-      animateParallax();
-    </script>"""
+
+        document.addEventListener('pointermove', (e) => {
+          targetX = e.clientX / window.innerWidth - 0.5;
+          targetY = e.clientY / window.innerHeight - 0.5;
+          wake();
+        }, { passive: true });
+
+        document.addEventListener('visibilitychange', () => {
+          if (document.hidden) {
+            cancelAnimationFrame(frame);
+            frame = 0;
+          } else {
+            wake();
+          }
+        });
+
+        wake();
+      })();
+"""
+
+# Loop injected by earlier versions: ran every frame forever and transformed <main>
+LEGACY_PARALLAX_LOOP = re.compile(
+    r'[ \t]*// Advanced Parallax and Depth Effect\n.*?requestAnimationFrame\(animateParallax\);\n\s*\}\n'
+    r'(?:\s*//[^\n]*\n)?\s*animateParallax\(\);\n', re.S)
+
+# Parallax JavaScript (the background robot itself is loaded by apply_dark_theme_particles.py)
+PARALLAX_JS = """
+    <script>""" + PARALLAX_LOOP + """    </script>"""
+
+def upgrade_parallax_loop(content):
+    """Replace the legacy per-frame parallax loop with PARALLAX_LOOP"""
+    return LEGACY_PARALLAX_LOOP.sub(lambda match: PARALLAX_LOOP.lstrip('\n'), content)
 
 def process_html_file(file_path):
     """Add parallax UI to HTML file if not already present"""
@@ -292,10 +244,16 @@ def process_html_file(file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # Skip if already has parallax
+        # Pages with the old always-running loop get the idle-aware one; others are done
         if 'animateParallax' in content:
-            print(f"  ⏭️  Skipped (already has parallax): {file_path.name}")
-            return False
+            upgraded = upgrade_parallax_loop(content)
+            if upgraded == content:
+                print(f"  ⏭️  Skipped (already has parallax): {file_path.name}")
+                return False
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(upgraded)
+            print(f"  ✅ Upgraded parallax loop: {file_path.name}")
+            return True
         
         # Add CSS in head if not present
         if PARALLAX_CSS.strip() not in content:
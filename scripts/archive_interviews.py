@@ -0,0 +1,242 @@
+"""
+Time-Partitioned Interview Archive
+- Streams interview sessions ('interviews/*/*' by default) out of a Realtime
+  Database export (plain or .gz)
+- Dates each session the way the report pages sort them: createdAt, then
+  timestamp, then the Date.now() session id
+- Writes sessions older than --hot-days to per-month gzip NDJSON partitions
+  (archive-YYYY-MM-00001.ndjson.gz) plus a manifest and a uid -> months index
+- Writes the recent "hot" sessions as their own NDJSON shards, and multi-path
+  prune patches that null the archived sessions in the live tree, so
+  once('value') reads of interviews/${userId} shrink to recent history
+- Rehydrates one user's archived sessions as restore patches on request
+
+Undated sessions are never archived. Patch files apply with
+`firebase database:update / patch-0001.json`.
+
+Usage:
+    python scripts/archive_interviews.py export.json.gz --out interview-archive
+    python scripts/archive_interviews.py export.json.gz --out interview-archive --hot-days 30 --now 2025-01-01
+    python scripts/archive_interviews.py --rehydrate UID --archive interview-archive --out restore-UID
+"""
+
+import argparse
+import gzip
+import json
+import math
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from export_stream import ShardWriter, iter_typed, read_shards
+from rescore_interviews import PatchWriter
+
+HOT_DAYS = 90
+PATHS_PER_FILE = 100000
+MANIFEST_NAME = 'manifest.json'
+INDEX_NAME = 'users.json.gz'
+UNDATED = 'undated'
+
+
+def parse_time(value):
+    """UTC datetime of a createdAt/timestamp value (ISO string or epoch ms), or None"""
+    if isinstance(value, bool):
+        return None
+    try:
+        if isinstance(value, (int, float)):
+            if not math.isfinite(value):
+                return None
+            return datetime.fromtimestamp(value / 1000, timezone.utc)
+        if isinstance(value, str) and value:
+            parsed = datetime.fromisoformat(value)
+            return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return None
+    return None
+
+
+def session_time(session_id, record):
+    """When a session happened: createdAt || timestamp, else a Date.now() session id"""
+    for value in (record.get('createdAt'), record.get('timestamp')):
+        if value:
+            return parse_time(value)
+    if session_id.isdigit() and 12 <= len(session_id) <= 13:
+        return parse_time(int(session_id))
+    return None
+
+
+def partition_of(moment):
+    return moment.strftime('%Y-%m') if moment else UNDATED
+
+
+class Archiver:
+    """Routes each session to its month partition or to the hot set"""
+
+    def __init__(self, out_dir, cutoff, pattern, paths_per_file=PATHS_PER_FILE):
+        self.out_dir = out_dir
+        self.cutoff = cutoff
+        self.pattern = pattern
+        self.partitions = {}
+        self.months = {}              # uid -> months holding archived sessions
+        self.hot = ShardWriter(out_dir / 'hot', 'hot', compress=True)
+        self.prune = PatchWriter(out_dir / 'prune', paths_per_file)
+        self.stats = Counter()
+
+    def add(self, record):
+        uid, session_id = record.keys[0], record.keys[-1]
+        moment = session_time(session_id, record.value)
+        if moment is None or moment >= self.cutoff:
+            self.hot.write([record])
+            self.stats['hot' if moment else UNDATED] += 1
+            return
+        month = partition_of(moment)
+        partition = self.partitions.get(month)
+        if partition is None:
+            partition = self.partitions[month] = {
+                'writer': ShardWriter(self.out_dir / 'months', f'archive-{month}', compress=True),
+                'users': set(), 'first': moment, 'last': moment,
+            }
+        partition['writer'].write([record])
+        partition['users'].add(uid)
+        partition['first'] = min(partition['first'], moment)
+        partition['last'] = max(partition['last'], moment)
+        self.months.setdefault(uid, set()).add(month)
+        self.prune.add(record.path, None)
+        self.stats['archived'] += 1
+
+    def close(self):
+        self.hot.close()
+        self.prune.close()
+        for partition in self.partitions.values():
+            partition['writer'].close()
+
+    def manifest(self, export, skipped):
+        return {
+            'export': str(export),
+            'pattern': self.pattern,
+            'cutoff': self.cutoff.isoformat(),
+            'partitions': {
+                month: {
+                    'shards': [f"months/{s['file']}" for s in p['writer'].shards],
+                    'records': sum(s['records'] for s in p['writer'].shards),
+                    'users': len(p['users']),
+                    'first': p['first'].isoformat(),
+                    'last': p['last'].isoformat(),
+                }
+                for month, p in sorted(self.partitions.items())
+            },
+            'hot': {
+                'shards': [f"hot/{s['file']}" for s in self.hot.shards],
+                'records': self.stats['hot'] + self.stats[UNDATED],
+                'undated': self.stats[UNDATED],
+            },
+            'prunePatches': self.prune.files,
+            'index': INDEX_NAME,
+            'skipped': dict(skipped),
+        }
+
+
+def remove_previous(out_dir):
+    """Delete the partitions, hot shards and patches an earlier run listed"""
+    manifest_path = out_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return 0
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    names = [name for p in manifest.get('partitions', {}).values() for name in p['shards']]
+    names += manifest.get('hot', {}).get('shards', [])
+    names += [f'prune/patch-{n:04d}.json' for n in range(1, manifest.get('prunePatches', 0) + 1)]
+    removed = 0
+    for name in names:
+        path = out_dir / name
+        if path.exists():
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def build_archive(export, out_dir, cutoff, pattern='interviews/*/*', paths_per_file=PATHS_PER_FILE):
+    """Partition one export into out_dir; returns (manifest, stats)"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    removed = remove_previous(out_dir)
+    archiver = Archiver(out_dir, cutoff, pattern, paths_per_file)
+    skipped = Counter()
+    try:
+        for record in iter_typed(export, pattern, skipped):
+            archiver.add(record)
+    finally:
+        archiver.close()
+
+    with gzip.open(out_dir / INDEX_NAME, 'wt', encoding='utf-8') as f:
+        json.dump({uid: sorted(months) for uid, months in archiver.months.items()}, f, separators=(',', ':'))
+    manifest = archiver.manifest(export, skipped)
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    archiver.stats['removed'] = removed
+    return manifest, archiver.stats
+
+
+def rehydrate(archive_dir, uid, out_dir, paths_per_file=PATHS_PER_FILE):
+    """Write restore patches for every archived session of one user; returns the count"""
+    manifest = json.loads((archive_dir / MANIFEST_NAME).read_text(encoding='utf-8'))
+    with gzip.open(archive_dir / manifest['index'], 'rt', encoding='utf-8') as f:
+        months = json.load(f).get(uid, [])
+    writer = PatchWriter(out_dir, paths_per_file)
+    restored = 0
+    try:
+        for month in months:
+            shards = [archive_dir / name for name in manifest['partitions'][month]['shards']]
+            for record in read_shards(shards):
+                if record.keys[0] == uid:
+                    writer.add(record.path, record.value)
+                    restored += 1
+    finally:
+        writer.close()
+    return restored
+
+
+def parse_now(value):
+    moment = parse_time(value)
+    if moment is None:
+        raise argparse.ArgumentTypeError(f'not an ISO date: {value!r}')
+    return moment
+
+
+def main():
+    """Archive old interview sessions from an export, or rehydrate one user"""
+    parser = argparse.ArgumentParser(description='Partition old interview sessions into monthly archives')
+    parser.add_argument('export', nargs='?', help='Realtime Database export (.json or .json.gz)')
+    parser.add_argument('--path', default='interviews/*/*', help="session pattern (default 'interviews/*/*')")
+    parser.add_argument('--out', type=Path, default=Path('interview-archive'), help='output directory')
+    parser.add_argument('--hot-days', type=int, default=HOT_DAYS, help='sessions newer than this stay live')
+    parser.add_argument('--now', type=parse_now, help='reference time for --hot-days (default: now, UTC)')
+    parser.add_argument('--paths-per-file', type=int, default=PATHS_PER_FILE)
+    parser.add_argument('--rehydrate', metavar='UID', help="write restore patches for one user's archive")
+    parser.add_argument('--archive', type=Path, help='archive directory to rehydrate from')
+    args = parser.parse_args()
+
+    if args.rehydrate:
+        if args.archive is None:
+            parser.error('--rehydrate needs --archive')
+        restored = rehydrate(args.archive, args.rehydrate, args.out, args.paths_per_file)
+        print(f"♻️  {restored} archived session(s) of {args.rehydrate} -> {args.out}")
+        return
+    if args.export is None:
+        parser.error('an export is required unless --rehydrate is given')
+
+    cutoff = (args.now or datetime.now(timezone.utc)) - timedelta(days=args.hot_days)
+    print(f"🗄️  Archiving {args.path} older than {cutoff:%Y-%m-%d} from {args.export}")
+    print("=" * 60)
+    manifest, stats = build_archive(args.export, args.out, cutoff, args.path, args.paths_per_file)
+    for month, partition in manifest['partitions'].items():
+        print(f"   {month}: {partition['records']:,} sessions, {partition['users']:,} users")
+    print("=" * 60)
+    print(f"📦 Archived: {stats['archived']:,} sessions in {len(manifest['partitions'])} month(s)")
+    print(f"🔥 Hot: {manifest['hot']['records']:,} sessions ({stats[UNDATED]:,} undated)")
+    print(f"✂️  Prune patches: {manifest['prunePatches']} in {args.out / 'prune'}")
+    if manifest['skipped']:
+        print(f"⚠️  Skipped non-object values: {', '.join(f'{n} {t}' for t, n in sorted(manifest['skipped'].items()))}")
+    if stats['removed']:
+        print(f"🗑️  Removed {stats['removed']} file(s) from the previous run")
+
+
+if __name__ == '__main__':
+    main()
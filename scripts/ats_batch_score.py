@@ -0,0 +1,320 @@
+"""
+Batch ATS Resume Scorer
+- Streams resumes ('resumes/*' by default) out of a JSON export (plain or .gz)
+- Re-applies the calculateATSScore() rubric from functions/advanced-features.js
+  with the same JavaScript coercions (string lengths in UTF-16 units,
+  `summary + ' ' + JSON.stringify(workExperience)`, String.prototype.trim)
+- Matches the whole keyword dictionary in one pass per resume with an
+  Aho-Corasick automaton, so --keywords can hold thousands of terms (small
+  dictionaries use plain substring scans, which are faster below ~200 terms)
+- Scores batches on every core through export_stream.fan_out
+- Writes multi-path patches for users/<uid>/resumes/<id>/atsScore and an
+  NDJSON list of Firestore `resumes` updates, for resumes whose score changed
+
+Resumes the JS function would throw on (a truthy non-string `skills`) are
+counted as errors and left alone.
+
+Usage:
+    python scripts/ats_batch_score.py export.json.gz --out ats-patches
+    python scripts/ats_batch_score.py export.json --keywords action-verbs.txt --workers 8
+    python scripts/ats_batch_score.py export.json --dry-run
+"""
+
+import argparse
+import json
+import math
+from collections import Counter, deque
+from functools import partial
+from pathlib import Path
+
+from export_stream import batched, fan_out, iter_typed
+from rescore_interviews import PatchWriter, js_truthy
+
+# Rubric of calculateATSScore()
+BASE_SCORE = 60
+MAX_SCORE = 100
+KEYWORDS = ['led', 'managed', 'developed', 'improved', 'achieved', 'implemented']
+POINTS_PER_KEYWORD = 2
+KEYWORD_CAP = 10
+POINTS_PER_SKILL = 2
+SKILL_CAP = 20
+# Up to this many keywords, one C-level `in` scan per keyword beats walking the automaton
+SCAN_LIMIT = 200
+
+# Fields the rubric reads, plus the ones the outputs need
+RESUME_FIELDS = ('fullName', 'profTitle', 'summary', 'skills', 'workExperience', 'education', 'userId', 'atsScore')
+# WhiteSpace and LineTerminator code points String.prototype.trim() removes
+JS_WHITESPACE = '\t\n\v\f\r \xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a' \
+                '\u2028\u2029\u202f\u205f\u3000\ufeff'
+MISSING = object()      # an absent property (undefined in JS)
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton reporting which keywords occur anywhere in a text"""
+
+    def __init__(self, keywords, scan_limit=None):
+        self.keywords = list(keywords)
+        self.scan = len(self.keywords) <= (SCAN_LIMIT if scan_limit is None else scan_limit)
+        self.goto = [{}]
+        self.outputs = [set()]
+        self.always = {i for i, keyword in enumerate(self.keywords) if not keyword}   # ''.includes('')
+        for i, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.outputs.append(set())
+                state = nxt
+            if keyword:
+                self.outputs[state].add(i)
+
+        # Breadth-first failure links; each state also reports its suffixes' keywords
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                if state:
+                    f = self.fail[state]
+                    while f and char not in self.goto[f]:
+                        f = self.fail[f]
+                    self.fail[nxt] = self.goto[f].get(char, 0)
+                self.outputs[nxt] |= self.outputs[self.fail[nxt]]
+
+    def find(self, text):
+        """Indices of the keywords contained in text"""
+        if self.scan:
+            return {i for i, keyword in enumerate(self.keywords) if keyword in text}
+        found = set(self.always)
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        total = len(self.keywords)
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+                if len(found) == total:
+                    break
+        return found
+
+
+def utf16_length(text):
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def js_length(value):
+    """`value.length` for decoded JSON values, or None when it is undefined"""
+    if isinstance(value, str):
+        return utf16_length(value)
+    if isinstance(value, list):
+        return len(value)
+    if isinstance(value, dict):
+        length = value.get('length')
+        if isinstance(length, (int, float)) and not isinstance(length, bool):
+            return length
+    return None
+
+
+def has_length_over(value, n):
+    """`value && value.length > n`"""
+    if value is MISSING or not js_truthy(value):
+        return False
+    length = js_length(value)
+    return length is not None and length > n
+
+
+def js_number_string(value):
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e21:
+            return str(int(value))
+        return repr(value)
+    return str(value)
+
+
+def js_string(value):
+    """String(value) for decoded JSON values"""
+    if value is MISSING:
+        return 'undefined'
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)):
+        return js_number_string(value)
+    if isinstance(value, list):
+        return ','.join('' if item is None else js_string(item) for item in value)
+    return '[object Object]'
+
+
+def is_array_index(key):
+    return key.isdigit() and (key == '0' or key[0] != '0') and int(key) < 2 ** 32 - 1
+
+
+def js_key_order(value):
+    """Objects with their keys in JS property order: array indices ascending, then insertion order"""
+    if isinstance(value, list):
+        return [js_key_order(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    keys = list(value)
+    indices = sorted((k for k in keys if is_array_index(k)), key=int)
+    if indices:
+        keys = indices + [k for k in keys if not is_array_index(k)]
+    return {k: js_key_order(value[k]) for k in keys}
+
+
+def js_stringify(value):
+    """JSON.stringify(value) as concatenated into a string"""
+    if value is MISSING:
+        return 'undefined'
+    return json.dumps(js_key_order(value), ensure_ascii=False, separators=(',', ':'))
+
+
+def keyword_text(resume):
+    """(summary + ' ' + JSON.stringify(workExperience)).toLowerCase()"""
+    summary = resume.get('summary', MISSING)
+    work = resume.get('workExperience', MISSING)
+    return (js_string(summary) + ' ' + js_stringify(work)).lower()
+
+
+def count_skills(skills):
+    """Non-empty comma-separated skills; raises TypeError where skills.split would throw"""
+    if skills is MISSING or not js_truthy(skills):
+        return 0
+    if not isinstance(skills, str):
+        raise TypeError('skills.split is not a function')
+    return sum(1 for s in skills.split(',') if s.strip(JS_WHITESPACE))
+
+
+def ats_score(resume, automaton):
+    """calculateATSScore(resume).score; returns (score, matched keyword indices)"""
+    score = BASE_SCORE
+    if has_length_over(resume.get('fullName', MISSING), 0):
+        score += 5
+    if has_length_over(resume.get('profTitle', MISSING), 0):
+        score += 5
+    summary = resume.get('summary', MISSING)
+    if has_length_over(summary, 100):
+        score += 10
+    if has_length_over(summary, 200):
+        score += 5
+    score += min(count_skills(resume.get('skills', MISSING)) * POINTS_PER_SKILL, SKILL_CAP)
+    if has_length_over(resume.get('workExperience', MISSING), 0):
+        score += 10
+    if has_length_over(resume.get('education', MISSING), 0):
+        score += 5
+    matched = automaton.find(keyword_text(resume))
+    score += min(len(matched) * POINTS_PER_KEYWORD, KEYWORD_CAP)
+    return min(score, MAX_SCORE), matched
+
+
+_AUTOMATA = {}
+
+
+def score_batch(keywords, batch):
+    """Score [(resume_id, fields)] in a worker: [(resume_id, userId, old, new or None)], keyword hits"""
+    keywords = tuple(keywords)
+    automaton = _AUTOMATA.get(keywords)
+    if automaton is None:
+        automaton = _AUTOMATA[keywords] = KeywordAutomaton(keywords)
+    rows = []
+    hits = Counter()
+    for resume_id, resume in batch:
+        try:
+            score, matched = ats_score(resume, automaton)
+        except TypeError:
+            score, matched = None, ()
+        hits.update(matched)
+        rows.append((resume_id, resume.get('userId'), resume.get('atsScore'), score))
+    return rows, hits
+
+
+def resume_items(records):
+    """(resume id, the rubric's fields) of every exported resume"""
+    for record in records:
+        yield record.keys[-1], {f: record.value[f] for f in RESUME_FIELDS if f in record.value}
+
+
+def load_keywords(path):
+    """Keywords from a JSON list or a text file with one keyword per line"""
+    text = Path(path).read_text(encoding='utf-8')
+    if path.endswith('.json'):
+        return [str(k) for k in json.loads(text)]
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def same_score(old, new):
+    return isinstance(old, (int, float)) and not isinstance(old, bool) and not math.isnan(old) and old == new
+
+
+def main():
+    """Stream resumes from an export and write ATS score patches"""
+    parser = argparse.ArgumentParser(description='Recompute ATS scores for every resume in an export')
+    parser.add_argument('export', help='JSON export (.json or .json.gz)')
+    parser.add_argument('--path', default='resumes/*', help="resume pattern (default 'resumes/*')")
+    parser.add_argument('--keywords', help='keyword dictionary (.json list or one per line)')
+    parser.add_argument('--out', type=Path, default=Path('ats-patches'), help='output directory')
+    parser.add_argument('--workers', type=int, help='scoring processes (default: all cores)')
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--paths-per-file', type=int, default=100000)
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing')
+    args = parser.parse_args()
+
+    keywords = load_keywords(args.keywords) if args.keywords else KEYWORDS
+    writer = PatchWriter(args.out, args.paths_per_file, args.dry_run)
+    stats = Counter()
+    hits = Counter()
+    skipped = Counter()
+    updates = None
+    print(f"📄 Scoring {args.path} from {args.export} against {len(keywords):,} keyword(s)")
+    print("=" * 60)
+    try:
+        if not args.dry_run:
+            args.out.mkdir(parents=True, exist_ok=True)
+            updates = open(args.out / 'firestore-updates.ndjson', 'w', encoding='utf-8')
+        batches = batched(resume_items(iter_typed(args.export, args.path, skipped)), args.batch_size)
+        for rows, batch_hits in fan_out(partial(score_batch, keywords), batches, args.workers):
+            hits.update(batch_hits)
+            for resume_id, user_id, old, new in rows:
+                stats['resumes'] += 1
+                if new is None:
+                    stats['errors'] += 1
+                    continue
+                stats[f'score:{new // 10 * 10}'] += 1
+                if same_score(old, new):
+                    continue
+                stats['changed'] += 1
+                if isinstance(user_id, str) and user_id:
+                    writer.add(f'users/{user_id}/resumes/{resume_id}/atsScore', new)
+                if updates:
+                    updates.write(json.dumps({'collection': 'resumes', 'id': resume_id, 'atsScore': new}) + '\n')
+            if stats['resumes'] % 100000 < args.batch_size:
+                print(f"   {stats['resumes']:,} resumes, {stats['changed']:,} changed")
+    finally:
+        writer.close()
+        if updates:
+            updates.close()
+
+    print("=" * 60)
+    print(f"✅ Resumes: {stats['resumes']:,}, changed: {stats['changed']:,}, errors: {stats['errors']:,}")
+    for band in range(100, BASE_SCORE - 10, -10):
+        if stats[f'score:{band}']:
+            label = '100' if band == 100 else f'{band}-{band + 9}'
+            print(f"   {label:>6}: {stats[f'score:{band}']:,}")
+    top = ', '.join(f"{keywords[i]} ({n:,})" for i, n in hits.most_common(10))
+    print(f"🔑 Most matched keywords: {top or 'none'}")
+    if skipped:
+        print(f"⚠️  Skipped non-object values: {', '.join(f'{n} {t}' for t, n in sorted(skipped.items()))}")
+    if not args.dry_run:
+        print(f"💾 {writer.files} patch file(s) and firestore-updates.ndjson in {args.out}")
+
+
+if __name__ == '__main__':
+    main()
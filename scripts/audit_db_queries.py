@@ -0,0 +1,584 @@
+"""
+Realtime Database Query / Index Auditor
+- Statically extracts every database ref path, query (orderBy*/limitTo*/
+  equalTo/startAt/endAt) and read or write operation from assets/js and
+  functions/, following refs stored in variables and queries built up
+  conditionally (`query = query.orderByChild(...)`)
+- Cross-checks them against config/FIREBASE_RULES.json and
+  config/REALTIME_DATABASE_RULES.json:
+  * orderByChild/orderByValue queries without a matching `.indexOn`
+  * keys the same file sorts by on the client after a whole-node read
+    (candidates for orderByChild + limitTo* and an index)
+  * paths that neither rules file covers
+- Reports unbounded whole-node reads (no limit, equality or range) ranked by
+  estimated payload
+
+Payload is estimated from the schema the rules and the code describe: every
+wildcard level below a read multiplies the record size by a fan-out
+(--users for the first level under the root, --per-parent for deeper ones),
+and records declaring `.validate: newData.hasChildren([...])` are sized by
+their field count. Pass --export to measure real sizes from a database export
+instead.
+
+Usage:
+    python scripts/audit_db_queries.py
+    python scripts/audit_db_queries.py --export export.json.gz --json db-audit.json
+    python scripts/audit_db_queries.py --strict      # exit 1 when indexes are missing
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+SOURCE_DIRS = ['assets/js', 'functions']
+RULES_FILES = ['config/FIREBASE_RULES.json', 'config/REALTIME_DATABASE_RULES.json']
+
+# Directories that never contain code we ship
+SKIP_DIRS = {'.git', 'node_modules', 'archived_docs', 'vendor', '__pycache__'}
+
+QUERY_METHODS = {'orderByChild', 'orderByKey', 'orderByValue', 'orderByPriority', 'limitToFirst',
+                 'limitToLast', 'equalTo', 'startAt', 'startAfter', 'endAt', 'endBefore'}
+BOUNDING_METHODS = {'limitToFirst', 'limitToLast', 'equalTo', 'startAt', 'startAfter', 'endAt', 'endBefore'}
+READ_METHODS = {'once', 'on', 'get'}
+WRITE_METHODS = {'set', 'update', 'push', 'remove', 'transaction', 'setWithPriority', 'setPriority'}
+
+DEFAULT_USERS = 10000        # children of a wildcard directly under the root
+DEFAULT_PER_PARENT = 20      # children of every deeper wildcard
+FIELD_BYTES = 48
+DEFAULT_RECORD_BYTES = 512
+
+IDENT_RE = re.compile(r'[A-Za-z_$][\w$]*')
+RECEIVER_RE = re.compile(r'([A-Za-z_$][\w$]*(?:\(\))?(?:\s*\.\s*[A-Za-z_$][\w$]*(?:\(\))?)*)\s*$')
+ASSIGN_RE = re.compile(r'(?:\b(?:const|let|var)\s+)?([A-Za-z_$][\w$]*)\s*=\s*(?:await\s+)?$')
+HAS_CHILDREN_RE = re.compile(r'hasChildren\(\[([^\]]*)\]\)')
+SORT_RE = re.compile(r'\.sort\(\s*\(?\s*([A-Za-z_$][\w$]*)\s*,\s*([A-Za-z_$][\w$]*)\s*\)?\s*=>')
+# Characters after which a '/' starts a regular expression rather than a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^') | {''}
+
+
+def blank_comments(source):
+    """Source with comments replaced by spaces (newlines kept), so offsets still line up"""
+    out = list(source)
+    i, n = 0, len(source)
+    template_depth = []          # brace depth at which each open template's ${ started
+    brace_depth = 0
+    last = ''
+    while i < n:
+        c = source[i]
+        if c in '\'"':
+            j = i + 1
+            while j < n and source[j] != c and source[j] != '\n':
+                j += 2 if source[j] == '\\' else 1
+            i, last = j + 1, c
+            continue
+        if c == '`' or (c == '}' and template_depth and template_depth[-1] == brace_depth):
+            if c == '}':
+                template_depth.pop()
+            j = i + 1
+            while j < n and source[j] != '`':
+                if source[j] == '\\':
+                    j += 2
+                    continue
+                if source.startswith('${', j):
+                    template_depth.append(brace_depth)
+                    break
+                j += 1
+            i = j + (2 if source.startswith('${', j) else 1)
+            last = '`'
+            continue
+        if source.startswith('//', i):
+            j = source.find('\n', i)
+            j = n if j < 0 else j
+            out[i:j] = ' ' * (j - i)
+            i = j
+            continue
+        if source.startswith('/*', i):
+            j = source.find('*/', i + 2)
+            j = n if j < 0 else j + 2
+            out[i:j] = [ch if ch == '\n' else ' ' for ch in source[i:j]]
+            i = j
+            continue
+        if c == '/' and last in REGEX_PRECEDERS:
+            j = i + 1
+            in_class = False
+            while j < n and source[j] != '\n':
+                if source[j] == '\\':
+                    j += 2
+                    continue
+                if source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                elif source[j] == '/' and not in_class:
+                    break
+                j += 1
+            i, last = j + 1, '/'
+            continue
+        if c == '{':
+            brace_depth += 1
+        elif c == '}':
+            brace_depth -= 1
+        if not c.isspace():
+            last = c if not (c.isalnum() or c in '_$') else 'a'
+            # `return /re/` and friends
+            if c.isalpha():
+                word = IDENT_RE.match(source, i)
+                if word and word.group() in ('return', 'typeof', 'case', 'in', 'of', 'await'):
+                    last = ''
+                i = word.end() if word else i + 1
+                continue
+        i += 1
+    return ''.join(out)
+
+
+def balanced(text, start):
+    """End offset (exclusive) of the parenthesised group opening at text[start]"""
+    depth = 0
+    i = start
+    while i < len(text):
+        c = text[i]
+        if c in '\'"`':
+            j = i + 1
+            while j < len(text) and text[j] != c:
+                j += 2 if text[j] == '\\' else 1
+            i = j + 1
+            continue
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(text)
+
+
+def parse_chain(text, pos):
+    """[(method, args)] of the `.method(args)` calls starting at pos, and where they end"""
+    chain = []
+    while True:
+        match = re.compile(r'\s*\.\s*([A-Za-z_$][\w$]*)\s*').match(text, pos)
+        if not match:
+            return chain, pos
+        name = match.group(1)
+        if match.end() < len(text) and text[match.end()] == '(':
+            end = balanced(text, match.end())
+            chain.append((name, text[match.end() + 1:end - 1].strip()))
+            pos = end
+        else:
+            chain.append((name, None))      # property access such as .key
+            return chain, match.end()
+
+
+def placeholder(expr):
+    """`user.uid` -> '$uid', `Date.now()` -> '$now'"""
+    names = IDENT_RE.findall(expr)
+    return '$' + (names[-1] if names else 'expr')
+
+
+def literal_value(expr):
+    """Contents of a plain string literal argument, else None"""
+    expr = expr.strip()
+    if len(expr) >= 2 and expr[0] == expr[-1] and expr[0] in '\'"`' and '${' not in expr:
+        return expr[1:-1]
+    return None
+
+
+def normalize_path(arg):
+    """Database path of a .ref()/.child() argument, wildcards as $name; None if unknown"""
+    arg = arg.strip()
+    if not arg:
+        return ''
+    parts = []
+    depth = 0
+    current = ''
+    for c in arg:
+        if c in '([{':
+            depth += 1
+        elif c in ')]}':
+            depth -= 1
+        if c == '+' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+        else:
+            current += c
+    parts.append(current.strip())
+
+    path = ''
+    literal_seen = False
+    for part in parts:
+        if len(part) >= 2 and part[0] == part[-1] and part[0] in '\'"':
+            path += part[1:-1]
+            literal_seen = True
+        elif len(part) >= 2 and part[0] == part[-1] == '`':
+            path += re.sub(r'\$\{([^}]*)\}', lambda m: placeholder(m.group(1)), part[1:-1])
+            literal_seen = True
+        elif IDENT_RE.fullmatch(part.replace('.', '').replace('()', '')):
+            path += placeholder(part)
+        else:
+            return None
+    if not literal_seen:
+        return None
+    path = re.sub(r'\{(\w+)\}', r'$\1', path)     # functions.database trigger params
+    return '/'.join(segment for segment in path.split('/') if segment)
+
+
+class Access:
+    """One database operation found in the source"""
+
+    def __init__(self, file, line, path, queries, operation, event=None, conditional=()):
+        self.file = file
+        self.line = line
+        self.path = path
+        self.queries = list(queries)
+        self.conditional = list(conditional)
+        self.operation = operation
+        self.event = event
+
+    @property
+    def kind(self):
+        return 'read' if self.operation in READ_METHODS else 'write'
+
+    @property
+    def bounded(self):
+        """At least one query always narrows the result"""
+        return any(name in BOUNDING_METHODS for name, _ in self.queries)
+
+    def order_keys(self):
+        keys = []
+        for name, arg in self.queries + self.conditional:
+            if name == 'orderByChild':
+                keys.append(literal_value(arg) or placeholder(arg))
+            elif name == 'orderByValue':
+                keys.append('.value')
+        return keys
+
+
+def apply_chain(path, chain):
+    """Split a call chain into (path, queries, operation, event)"""
+    queries = []
+    for name, args in chain:
+        if name == 'child' and args is not None and path is not None:
+            child = normalize_path(args)
+            path = None if child is None else '/'.join(p for p in (path, child) if p)
+        elif name in QUERY_METHODS:
+            queries.append((name, args))
+        elif name in READ_METHODS or name in WRITE_METHODS:
+            event = literal_value(args.split(',')[0]) if args else None
+            return path, queries, name, event
+        else:
+            break
+    return path, queries, None, None
+
+
+def is_database_receiver(receiver):
+    flat = re.sub(r'\s+', '', receiver)
+    if 'storage' in flat.lower():
+        return False
+    if flat.startswith('functions.database') or flat.endswith('.auth'):
+        return False    # trigger definitions, not reads
+    return True
+
+
+def scan_source(text, rel):
+    """Every Access in one JS file"""
+    code = blank_comments(text)
+    line_of = lambda pos: code.count('\n', 0, pos) + 1     # noqa: E731
+    accesses = []
+    for match in re.finditer(r'\.\s*ref\s*\(', code):
+        receiver = RECEIVER_RE.search(code, max(0, match.start() - 200), match.start())
+        if receiver is None or receiver.end() != match.start():
+            continue
+        if not is_database_receiver(receiver.group(1)):
+            continue
+        open_paren = match.end() - 1
+        end = balanced(code, open_paren)
+        path = normalize_path(code[open_paren + 1:end - 1])
+        chain, chain_end = parse_chain(code, end)
+        path, queries, operation, event = apply_chain(path, chain)
+        if operation:
+            accesses.append(Access(rel, line_of(match.start()), path, queries, operation, event))
+            continue
+        assigned = ASSIGN_RE.search(code, max(0, receiver.start() - 80), receiver.start())
+        if assigned and assigned.end() == receiver.start():
+            accesses.extend(follow_variable(code, rel, assigned.group(1), chain_end, path, queries, line_of))
+    return accesses
+
+
+def follow_variable(code, rel, name, start, path, queries, line_of):
+    """Operations on a ref or query stored in a variable, up to its next reassignment"""
+    accesses = []
+    conditional = []
+    use_re = re.compile(r'(?<![\w$.])' + re.escape(name) + r'(?=\s*\.)')
+    assign_re = re.compile(r'(?<![\w$.])(?:(?:const|let|var)\s+)?' + re.escape(name) + r'\s*=(?![=>])\s*')
+    pos = start
+    while True:
+        use = use_re.search(code, pos)
+        reassign = assign_re.search(code, pos)
+        if reassign and (use is None or reassign.start() <= use.start()):
+            refined = re.match(re.escape(name) + r'(?=\s*\.)', code[reassign.end():])
+            if not refined:
+                return accesses
+            # query = query.orderByChild(...): a refinement that may or may not apply
+            chain, pos = parse_chain(code, reassign.end() + refined.end())
+            conditional.extend((n, a) for n, a in chain if n in QUERY_METHODS)
+            continue
+        if use is None:
+            return accesses
+        chain, pos = parse_chain(code, use.end())
+        use_path, use_queries, operation, event = apply_chain(path, chain)
+        if operation:
+            accesses.append(Access(rel, line_of(use.start()), use_path, queries + use_queries, operation, event,
+                                   conditional))
+
+
+def scan_sort_keys(text):
+    """Record fields compared inside `.sort((a, b) => ...)` callbacks"""
+    code = blank_comments(text)
+    keys = set()
+    for match in SORT_RE.finditer(code):
+        a, b = match.groups()
+        end = balanced(code, code.rfind('(', 0, match.start() + len('.sort(')))
+        body = code[match.end():end]
+        keys.update(re.findall(r'(?<![\w$.])(?:' + re.escape(a) + '|' + re.escape(b) + r')\.([A-Za-z_$][\w$]*)', body))
+    return keys
+
+
+def collect_sources(root, dirs=SOURCE_DIRS):
+    files = []
+    for directory in dirs:
+        for path in sorted((root / directory).rglob('*.js')):
+            if not SKIP_DIRS.intersection(path.relative_to(root).parts):
+                files.append(path)
+    return files
+
+
+class Schema:
+    """Database shape merged from the rules files and the paths the code uses"""
+
+    def __init__(self):
+        self.root = {}
+
+    def add_rules(self, rules, origin):
+        def merge(node, rule):
+            for key, value in rule.items():
+                if key == '.indexOn':
+                    indexes = [value] if isinstance(value, str) else list(value)
+                    node.setdefault('.indexOn', {})[origin] = indexes
+                elif key == '.validate' and isinstance(value, str):
+                    fields = HAS_CHILDREN_RE.search(value)
+                    if fields:
+                        node['.fields'] = max(node.get('.fields', 0), len(re.findall(r"'([^']+)'", fields.group(1))))
+                        node.setdefault('.fieldNames', set()).update(re.findall(r"'([^']+)'", fields.group(1)))
+                elif not key.startswith('.') and isinstance(value, dict):
+                    child = node.setdefault(key, {})
+                    child.setdefault('.origins', set()).add(origin)
+                    merge(child, value)
+        merge(self.root, rules.get('rules', rules))
+
+    def add_path(self, path):
+        node = self.root
+        for segment in path.split('/') if path else []:
+            if segment.startswith('$'):
+                existing = next((k for k in node if k.startswith('$')), None)
+                segment = existing or segment
+            node = node.setdefault(segment, {})
+
+    def lookup(self, path):
+        """Schema node of a code path; literal keys first, then the wildcard"""
+        node = self.root
+        for segment in path.split('/') if path else []:
+            wildcard = next((k for k in node if k.startswith('$')), None)
+            if not segment.startswith('$') and segment in node:
+                node = node[segment]
+            elif wildcard:
+                node = node[wildcard]
+            else:
+                return None
+        return node
+
+    def covered_by(self, path):
+        """Rules files with an explicit entry for the path's first segment"""
+        node = self.lookup(path.split('/')[0]) if path else None
+        return sorted(node.get('.origins', ())) if node else []
+
+    def estimate(self, node, level, users, per_parent):
+        """Estimated JSON bytes of a subtree"""
+        children = [k for k in node if not k.startswith('.')]
+        wildcard = next((k for k in children if k.startswith('$')), None)
+        literals = [k for k in children if not k.startswith('$')]
+        size = sum(self.estimate(node[k], level, users, per_parent) for k in literals)
+        if wildcard:
+            fanout = users if level == 0 else per_parent
+            size += fanout * self.estimate(node[wildcard], level + 1, users, per_parent)
+        elif not literals:
+            size = node.get('.fields', 0) * FIELD_BYTES or DEFAULT_RECORD_BYTES
+        elif node.get('.fields'):
+            size += node['.fields'] * FIELD_BYTES
+        return size
+
+    def level_of(self, path):
+        return sum(1 for segment in path.split('/') if segment.startswith('$')) if path else 0
+
+
+def measure_export(export, patterns):
+    """Average serialized size of the values matching each pattern, in one pass over an export"""
+    from export_stream import iter_matches
+
+    totals = {pattern: [0, 0] for pattern in patterns}
+    for pattern, _, value in iter_matches(export, list(patterns)):
+        totals[pattern][0] += len(json.dumps(value, separators=(',', ':')))
+        totals[pattern][1] += 1
+    return {pattern: (size / count if count else 0) for pattern, (size, count) in totals.items()}
+
+
+def export_pattern(path):
+    return '/'.join('*' if segment.startswith('$') else segment for segment in path.split('/'))
+
+
+def audit(accesses, sort_keys, rules, users=DEFAULT_USERS, per_parent=DEFAULT_PER_PARENT, measured=None):
+    """Findings: missing indexes, unbounded reads (largest first) and uncovered paths"""
+    schema = Schema()
+    for origin, data in rules.items():
+        schema.add_rules(data, origin)
+    for access in accesses:
+        if access.path:
+            # push() children are generated keys: the node is a collection
+            schema.add_path(access.path + '/$pushId' if access.operation == 'push' else access.path)
+
+    def payload(path):
+        if measured is not None and export_pattern(path) in measured:
+            return measured[export_pattern(path)]
+        node = schema.lookup(path)
+        return schema.estimate(node, schema.level_of(path), users, per_parent) if node is not None else 0
+
+    def is_collection(path):
+        node = schema.lookup(path)
+        return node is not None and any(k.startswith('$') for k in node)
+
+    missing = {}
+    unbounded = {}
+    uncovered = defaultdict(list)
+    for access in accesses:
+        where = f'{access.file}:{access.line}'
+        if access.path is None:
+            continue
+        if not schema.covered_by(access.path) and access.path:
+            uncovered[access.path.split('/')[0]].append(where)
+        if access.kind != 'read':
+            continue
+        node = schema.lookup(access.path) or {}
+        declared = node.get('.indexOn', {})
+        for key in access.order_keys():
+            if key.startswith('$'):
+                continue
+            indexed_in = sorted(origin for origin, keys in declared.items() if key in keys)
+            if not indexed_in:
+                entry = missing.setdefault((access.path, key), {
+                    'path': access.path, 'key': key, 'reason': 'query', 'locations': [],
+                    'estimatedBytes': payload(access.path)})
+                entry['locations'].append(where)
+        if is_collection(access.path) and not access.bounded:
+            entry = unbounded.setdefault(access.path, {
+                'path': access.path, 'operations': set(), 'locations': [],
+                'estimatedBytes': payload(access.path), 'clientSortKeys': set()})
+            entry['operations'].add(access.operation + (f"('{access.event}')" if access.event else ''))
+            entry['locations'].append(where)
+            wildcard = next((k for k in node if k.startswith('$')), None)
+            fields = node[wildcard].get('.fieldNames') if wildcard else None
+            for key in sort_keys.get(access.file, ()):
+                if fields is None or key in fields:
+                    entry['clientSortKeys'].add(key)
+
+    # Keys sorted on the client after a whole-node read want an index too
+    for entry in unbounded.values():
+        declared = (schema.lookup(entry['path']) or {}).get('.indexOn', {})
+        for key in sorted(entry['clientSortKeys']):
+            if not any(key in keys for keys in declared.values()) and (entry['path'], key) not in missing:
+                missing[(entry['path'], key)] = {
+                    'path': entry['path'], 'key': key, 'reason': 'client sort',
+                    'locations': list(entry['locations']), 'estimatedBytes': entry['estimatedBytes']}
+
+    by_size = lambda e: (-e['estimatedBytes'], e['path'])     # noqa: E731
+    for entry in unbounded.values():
+        entry['operations'] = sorted(entry['operations'])
+        entry['clientSortKeys'] = sorted(entry['clientSortKeys'])
+    return {
+        'missingIndexes': sorted(missing.values(), key=lambda e: (by_size(e), e['key'])),
+        'unboundedReads': sorted(unbounded.values(), key=by_size),
+        'uncoveredPaths': {path: locations for path, locations in sorted(uncovered.items())},
+    }
+
+
+def format_bytes(size):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+def main():
+    """Audit database queries against the rules files"""
+    parser = argparse.ArgumentParser(description='Find missing .indexOn entries and unbounded database reads')
+    parser.add_argument('--root', type=Path, default=BASE_DIR, help='repository root')
+    parser.add_argument('--export', help='database export (.json/.json.gz) to measure payloads from')
+    parser.add_argument('--users', type=int, default=DEFAULT_USERS, help='children per top-level wildcard')
+    parser.add_argument('--per-parent', type=int, default=DEFAULT_PER_PARENT, help='children per deeper wildcard')
+    parser.add_argument('--json', type=Path, help='also write the findings as JSON')
+    parser.add_argument('--strict', action='store_true', help='exit 1 if any index is missing')
+    args = parser.parse_args()
+
+    rules = {}
+    for name in RULES_FILES:
+        path = args.root / name
+        if path.exists():
+            rules[name] = json.loads(path.read_text(encoding='utf-8'))
+    accesses = []
+    sort_keys = {}
+    for path in collect_sources(args.root):
+        rel = path.relative_to(args.root).as_posix()
+        text = path.read_text(encoding='utf-8', errors='ignore')
+        accesses.extend(scan_source(text, rel))
+        sort_keys[rel] = scan_sort_keys(text)
+
+    measured = None
+    if args.export:
+        patterns = {export_pattern(a.path) for a in accesses if a.path and a.kind == 'read'}
+        measured = measure_export(args.export, sorted(patterns))
+    report = audit(accesses, sort_keys, rules, args.users, args.per_parent, measured)
+
+    reads = sum(1 for a in accesses if a.kind == 'read')
+    print(f"🔍 {len(accesses)} database operations ({reads} reads) in {len(sort_keys)} files")
+    print("=" * 60)
+    print(f"\n🗂️  Missing indexes ({len(report['missingIndexes'])})")
+    for entry in report['missingIndexes']:
+        print(f"❌ {entry['path'] or '/'} .indexOn '{entry['key']}' [{entry['reason']}] "
+              f"~{format_bytes(entry['estimatedBytes'])}")
+        for where in entry['locations']:
+            print(f"     {where}")
+    print(f"\n📥 Unbounded whole-node reads ({len(report['unboundedReads'])}), largest first")
+    for entry in report['unboundedReads']:
+        sort_note = f" sorted client-side by {', '.join(entry['clientSortKeys'])}" if entry['clientSortKeys'] else ''
+        print(f"⚠️  ~{format_bytes(entry['estimatedBytes']):>9}  {entry['path']} "
+              f"{', '.join(entry['operations'])}{sort_note}")
+        for where in entry['locations']:
+            print(f"     {where}")
+    if report['uncoveredPaths']:
+        print(f"\n🚫 Paths without rules in {' or '.join(rules)}")
+        for path, locations in report['uncoveredPaths'].items():
+            print(f"   {path}/ ({len(locations)} operations)")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\n💾 Wrote {args.json}")
+    print("=" * 60)
+    if args.strict and report['missingIndexes']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
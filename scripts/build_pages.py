@@ -0,0 +1,144 @@
+"""
+Incremental Page Builder
+- Hashes every file the pipeline reads (templates, pages, configs) and every
+  task script, and compares them with the hashes saved by the previous build
+  in .build-state.json
+- Plans the rebuild from the files that changed (see scripts/pipeline.py):
+  tasks run in dependency order, and generators regenerate only the pages
+  derived from a changed template, e.g. an edit to
+  interview/cs/ai-interview.html rebuilds the ME/CE/EC/EE AI interviews but
+  not the MCQ pages or the AI reports
+- Explains why each target was rebuilt, then records the new hashes
+- The first run only records the hashes (the committed pages are the build);
+  --all rebuilds everything
+
+Usage:
+    python scripts/build_pages.py                  # rebuild what changed since the last build
+    python scripts/build_pages.py --dry-run        # explain the rebuild without running it
+    python scripts/build_pages.py --why interview/me/ai-interview.html
+    python scripts/build_pages.py --all            # rebuild every task
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import pipeline
+from pipeline import plan, run_step
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+STATE_FILE = BASE_DIR / '.build-state.json'
+STATE_VERSION = 1
+
+
+def file_hash(path):
+    try:
+        return hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def snapshot(tasks=None):
+    """Hashes of every task input and script, by repo-relative path"""
+    tasks = pipeline.TASKS if tasks is None else tasks
+    paths = set()
+    for task in tasks:
+        paths.add(task.script_path)
+        paths.update(task.input_files())
+    hashes = {}
+    for path in sorted(paths):
+        digest = file_hash(BASE_DIR / path)
+        if digest is not None:
+            hashes[path] = digest
+    return hashes
+
+
+def load_state():
+    """The hashes from the previous build, or None when there was none"""
+    try:
+        state = json.loads(STATE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    if state.get('version') != STATE_VERSION:
+        return None
+    return state['hashes']
+
+
+def save_state(hashes):
+    STATE_FILE.write_text(json.dumps({'version': STATE_VERSION, 'hashes': hashes}, indent=1, sort_keys=True) + '\n',
+                          encoding='utf-8')
+
+
+def changed_files(previous, current):
+    """Paths added, removed or edited between two snapshots"""
+    return sorted(path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path))
+
+
+def explain(steps, target=None):
+    """Lines saying why each target of each step is rebuilt (only the given target when set)"""
+    lines = []
+    for step in steps:
+        for path, reasons in sorted(step.why.items()):
+            if target is None or path == target:
+                lines.append(f"{path} <- {step.task.name}: {'; '.join(reasons)}")
+    return lines
+
+
+def build(tasks=None, everything=False, dry_run=False, verbose=False):
+    """Plan and run the rebuild; returns (steps, changed) where changed is None on a first run"""
+    tasks = pipeline.TASKS if tasks is None else tasks
+    previous = load_state()
+    current = snapshot(tasks)
+    if everything:
+        changed = sorted(task.script_path for task in tasks)
+    elif previous is None:
+        changed = None
+    else:
+        changed = changed_files(previous, current)
+    steps = plan(changed, tasks) if changed else []
+    if dry_run:
+        return steps, changed
+    for step in steps:
+        start = time.perf_counter()
+        output = run_step(step, quiet=not verbose)
+        if verbose and output:
+            print(output.rstrip())
+        print(f"   ✅ {step.describe()} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    save_state(snapshot(tasks))
+    return steps, changed
+
+
+def main():
+    """Rebuild the pages downstream of the files changed since the last build"""
+    parser = argparse.ArgumentParser(description='Rebuild only the pages affected by changed sources')
+    parser.add_argument('--all', action='store_true', help='rebuild every task')
+    parser.add_argument('--dry-run', action='store_true', help='explain the rebuild without running it')
+    parser.add_argument('--why', metavar='TARGET', help='explain only this target')
+    parser.add_argument('--verbose', action='store_true', help="show the scripts' own output")
+    args = parser.parse_args()
+
+    print("🧱 Building pages")
+    print("=" * 60)
+    steps, changed = build(everything=args.all, dry_run=args.dry_run or bool(args.why), verbose=args.verbose)
+    if changed is None:
+        if args.dry_run or args.why:
+            print(f"📝 No previous build state in {STATE_FILE.name}; a build would only record it")
+        else:
+            print(f"📝 No previous build state: recorded {STATE_FILE.name}, nothing rebuilt (use --all to rebuild)")
+        return
+    if not steps:
+        print("✅ Everything is up to date")
+        return
+    print(f"\n🔎 Why ({len(changed)} changed file(s)):")
+    lines = explain(steps, args.why)
+    for line in lines:
+        print(f"   {line}")
+    if args.why and not lines:
+        print(f"   {args.why} is up to date")
+
+
+if __name__ == '__main__':
+    main()
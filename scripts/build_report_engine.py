@@ -0,0 +1,278 @@
+"""
+Shared Report Engine Builder
+- Extracts one department-neutral report module (assets/js/report-engine.js)
+  from the per-department clones assets/js/<dept>-report.js: department codes
+  and labels become REPORT_CONFIG lookups, and every other difference between
+  the clones is reported as drift (the --base clone's version is kept)
+- Writes a small config/reports/<dept>.json for each department with a report
+  page, including ones that never had their own clone (me, ce)
+- Fingerprints the module (report-engine.<hash>.js) and rewrites every
+  interview/<dept>/report.html and ai-report.html that loads a report script
+  to inline its department config and load the shared module
+- Prints a size report: bytes per page and for a visitor of every department,
+  before and after
+
+The module reads its config from <script type="application/json"
+id="report-config"> on the page. When node is installed the generated module
+is syntax-checked before anything is written.
+
+Usage:
+    python scripts/build_report_engine.py --extract              # clones -> engine + configs, then build
+    python scripts/build_report_engine.py --extract --remove-clones
+    python scripts/build_report_engine.py                        # rebuild after editing report-engine.js
+    python scripts/build_report_engine.py --check                # fail if pages are stale
+"""
+
+import argparse
+import difflib
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+JS_DIR = BASE_DIR / 'assets' / 'js'
+ENGINE_NAME = 'report-engine.js'
+CONFIG_DIR = BASE_DIR / 'config' / 'reports'
+PAGE_NAMES = ('report.html', 'ai-report.html')
+CLONE_RE = re.compile(r'^([a-z]{2})-report\.js$')
+
+# Loads of a report script (a clone or an earlier engine build), with the
+# config block a previous run placed in front of it
+REPORT_SCRIPT_RE = re.compile(
+    r'(?:<script type="application/json" id="report-config">[^<]*</script>\s*)?'
+    r'<script src="((?:\.\./)*assets/js/(?:[a-z]{2}-report|report-engine\.[0-9a-f]{10})\.js)"></script>'
+)
+
+ENGINE_HEADER = """\
+// Shared Report Page - Advanced Comprehensive Report Generation with Performance Optimization
+// Generated by scripts/build_report_engine.py. Department values come from the
+// page's <script type="application/json" id="report-config"> (config/reports/<dept>.json).
+const REPORT_CONFIG = Object.assign({ department: 'cs', label: 'CS' }, (() => {
+  const el = document.getElementById('report-config');
+  try { return el ? JSON.parse(el.textContent) : {}; } catch (e) { return {}; }
+})());
+"""
+
+# (pattern with {code}/{label}, replacement) applied to every clone
+DEPARTMENT_RULES = [
+    (r"^// {label} Report Page - .*\n", ''),
+    (r"'{label} Report page initialized'", '`${REPORT_CONFIG.label} Report page initialized`'),
+    (r"`{label}_Report_", '`${REPORT_CONFIG.label}_Report_'),
+    (r"(['\"]){code}\1", 'REPORT_CONFIG.department'),
+]
+
+
+def normalize(source, code):
+    """A clone with its department code and label replaced by REPORT_CONFIG lookups"""
+    for pattern, replacement in DEPARTMENT_RULES:
+        regex = pattern.format(code=re.escape(code), label=re.escape(code.upper()))
+        source = re.sub(regex, replacement, source, flags=re.MULTILINE)
+    return source
+
+
+def leftover_tokens(source, code):
+    """Department tokens no rule covered (they would stay hard-coded)"""
+    return [m.group(0) for m in re.finditer(rf"(['\"`]){code}\1|\b{code.upper()}\b", source)]
+
+
+def drift(base, other):
+    """Hunks where a normalized clone differs from the base: [(kind, base_lines, other_lines)]"""
+    a, b = base.splitlines(), other.splitlines()
+    hunks = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            continue
+        ascii_a = [line.encode('ascii', 'ignore').rstrip() for line in a[i1:i2]]
+        ascii_b = [line.encode('ascii', 'ignore').rstrip() for line in b[j1:j2]]
+        kind = 'symbols' if ascii_a == ascii_b else 'code'
+        hunks.append((kind, i2 - i1, j2 - j1))
+    return hunks
+
+
+def find_clones():
+    return {m.group(1): path for path in sorted(JS_DIR.glob('*-report.js'))
+            if (m := CLONE_RE.match(path.name))}
+
+
+def department_pages():
+    """{page: department} for every report page under interview/<dept>/"""
+    pages = {}
+    for name in PAGE_NAMES:
+        for page in sorted((BASE_DIR / 'interview').glob(f'*/{name}')):
+            if REPORT_SCRIPT_RE.search(page.read_text(encoding='utf-8')):
+                pages[page] = page.parent.name
+    return pages
+
+
+def load_config(code):
+    path = CONFIG_DIR / f'{code}.json'
+    if path.exists():
+        return json.loads(path.read_text(encoding='utf-8'))
+    return {'department': code, 'label': code.upper()}
+
+
+def write_config(code, config):
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    (CONFIG_DIR / f'{code}.json').write_text(json.dumps(config, indent=2) + '\n', encoding='utf-8')
+
+
+def node_check(source):
+    """Syntax errors node reports for a script, or None when it parses (or node is missing)"""
+    node = shutil.which('node')
+    if node is None:
+        return None
+    with tempfile.NamedTemporaryFile('w', suffix='.js', encoding='utf-8', delete=False) as f:
+        f.write(source)
+    try:
+        result = subprocess.run([node, '--check', f.name], capture_output=True, text=True)
+    finally:
+        Path(f.name).unlink()
+    if result.returncode:
+        return result.stderr.strip() or 'syntax error'
+    return None
+
+
+def extract(clones, base):
+    """Normalize the clones, report their drift from the base and return the engine source"""
+    normalized = {code: normalize(path.read_text(encoding='utf-8'), code) for code, path in clones.items()}
+    engine = ENGINE_HEADER + normalized[base]
+    for code in clones:
+        leftovers = leftover_tokens(normalized[code], code)
+        if code == base and leftovers:
+            raise ValueError(f"{clones[code].name} keeps department tokens: {', '.join(sorted(set(leftovers)))}")
+        if code != base:
+            hunks = drift(normalized[base], normalized[code])
+            symbols = sum(1 for kind, *_ in hunks if kind == 'symbols')
+            syntax = ' (does not parse)' if node_check(normalized[code]) else ''
+            print(f"↔️  {clones[code].name}: {len(hunks)} hunk(s) differ from {clones[base].name}, "
+                  f"{symbols} only in emoji/symbols{syntax}; kept {clones[base].name}")
+    return engine
+
+
+def sizes(data):
+    return len(data), len(gzip.compress(data, mtime=0))
+
+
+def rewrite_page(page, engine_name, config, dry_run=False):
+    """Point a report page at the shared engine; returns the script it loaded before (or None)"""
+    content = page.read_text(encoding='utf-8')
+    match = REPORT_SCRIPT_RE.search(content)
+    prefix = match.group(1)[:match.group(1).index('assets/js/')]
+    block = (f'<script type="application/json" id="report-config">'
+             f'{json.dumps(config, separators=(",", ":"))}</script>\n'
+             f'  <script src="{prefix}assets/js/{engine_name}"></script>')
+    new_content = content[:match.start()] + block + content[match.end():]
+    if new_content == content:
+        return None
+    if not dry_run:
+        page.write_text(new_content, encoding='utf-8')
+    return (page.parent / match.group(1)).resolve()
+
+
+def main():
+    """Extract and build the shared report engine and rewire the report pages"""
+    parser = argparse.ArgumentParser(description='Build the shared report engine from the department clones')
+    parser.add_argument('--extract', action='store_true', help=f'regenerate {ENGINE_NAME} from the clones')
+    parser.add_argument('--base', default='cs', help='clone whose code wins where the clones differ')
+    parser.add_argument('--remove-clones', action='store_true', help='delete the clones once no page loads them')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing')
+    parser.add_argument('--check', action='store_true', help='fail if any page is not on the current build')
+    args = parser.parse_args()
+
+    engine_path = JS_DIR / ENGINE_NAME
+    clones = find_clones()
+    pages = department_pages()
+
+    if args.extract:
+        if args.base not in clones:
+            parser.error(f'no assets/js/{args.base}-report.js to extract from')
+        print(f"🧬 Extracting {ENGINE_NAME} from {len(clones)} clone(s)")
+        print("=" * 60)
+        try:
+            engine = extract(clones, args.base)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    elif engine_path.exists():
+        engine = engine_path.read_text(encoding='utf-8')
+    else:
+        parser.error(f'{ENGINE_NAME} does not exist yet; run with --extract')
+
+    error = node_check(engine)
+    if error:
+        print(f"❌ Generated engine does not parse:\n{error}")
+        sys.exit(1)
+
+    data = engine.encode('utf-8')
+    engine_name = f"report-engine.{hashlib.sha256(data).hexdigest()[:10]}.js"
+
+    if args.check:
+        stale = [page for page in pages
+                 if f'assets/js/{engine_name}"' not in page.read_text(encoding='utf-8')]
+        for page in stale:
+            print(f"❌ {page.relative_to(BASE_DIR).as_posix()} does not load {engine_name}")
+        if stale or not (JS_DIR / engine_name).exists():
+            sys.exit(1)
+        print(f"✅ {len(pages)} report page(s) load {engine_name}")
+        return
+
+    departments = sorted(set(pages.values()) | set(clones))
+    if not args.dry_run:
+        if args.extract:
+            engine_path.write_text(engine, encoding='utf-8')
+        for old in JS_DIR.glob('report-engine.*.js'):
+            if old.name != engine_name:
+                old.unlink()
+        (JS_DIR / engine_name).write_bytes(data)
+        for code in departments:
+            if not (CONFIG_DIR / f'{code}.json').exists():
+                write_config(code, load_config(code))
+
+    print(f"\n✏️  Rewiring report pages to {engine_name}")
+    print("=" * 60)
+    engine_raw, engine_gz = sizes(data)
+    before_files = set()
+    rows = []
+    for page, code in pages.items():
+        config = load_config(code)
+        previous = rewrite_page(page, engine_name, config, args.dry_run)
+        config_bytes = len(json.dumps(config, separators=(',', ':'))) + 60
+        if previous is not None and previous.exists() and previous.name != engine_name:
+            before_files.add(previous)
+            rows.append((page, sizes(previous.read_bytes()), config_bytes))
+        print(f"✅ {page.relative_to(BASE_DIR).as_posix()} ({code})" + ('' if previous else ' - up to date'))
+
+    if rows:
+        print("\n📏 Size report (raw / gzip bytes)")
+        print("=" * 60)
+        for page, (raw, gz), config_bytes in rows:
+            print(f"   {page.relative_to(BASE_DIR).as_posix()}: {raw:,} / {gz:,} -> "
+                  f"{engine_raw + config_bytes:,} / {engine_gz + config_bytes:,}")
+        before_raw = sum(sizes(path.read_bytes())[0] for path in before_files)
+        before_gz = sum(sizes(path.read_bytes())[1] for path in before_files)
+        print(f"   Every department, cold cache: {before_raw:,} / {before_gz:,} bytes in {len(before_files)} "
+              f"script(s) -> {engine_raw:,} / {engine_gz:,} bytes in 1 shared script")
+
+    if args.remove_clones and not args.dry_run:
+        still_used = [page for page in pages if re.search(r'assets/js/[a-z]{2}-report\.js', page.read_text(encoding='utf-8'))]
+        if still_used:
+            print(f"⚠️  Clones kept: {len(still_used)} page(s) still load them")
+        else:
+            for path in clones.values():
+                path.unlink()
+                print(f"🗑️  Removed {path.relative_to(BASE_DIR).as_posix()}")
+
+    print("=" * 60)
+    print(f"📦 {engine_name}: {engine_raw:,} bytes ({engine_gz:,} gzip) for {len(departments)} department(s)"
+          + (' (dry run)' if args.dry_run else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""
+Static Site Search Index
+- Tokenises every served HTML page (title, headings, meta description and body
+  text; script, style and navigation chrome are skipped), the preparation
+  video titles from the DEPARTMENTS configs of the department generators and
+  the AdaptiveInterview question banks
+- Builds a compact inverted index (term -> [doc, weight, doc, weight, ...])
+  sharded by the first two characters of each term, so assets/js/site-search.js
+  fetches only the shard a query prefix needs
+- Incremental: each page's tokens are cached by content hash in
+  assets/search/.cache.json, so a deploy re-parses only changed pages, keeps
+  document ids stable and rewrites only the shards whose content changed
+
+Shard and document files are content-fingerprinted; search-manifest.json (not
+fingerprinted) points at the current set.
+
+Usage:
+    python scripts/build_search_index.py
+    python scripts/build_search_index.py --full        # ignore the cache, renumber documents
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import re
+import unicodedata
+from html.parser import HTMLParser
+from pathlib import Path
+
+from keyword_coverage import load_questions
+from leaderboard_snapshots import SnapshotWriter, prune
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+OUT_DIR = BASE_DIR / 'assets' / 'search'
+CACHE_NAME = '.cache.json'
+MANIFEST_NAME = 'search-manifest.json'
+CACHE_VERSION = 1
+
+PREFIX_LENGTH = 2         # characters of a term that pick its shard
+MAX_POSTINGS = 100        # best documents kept per term
+SNIPPET_LENGTH = 160
+DEPARTMENT_SOURCES = ('scripts/generate_all_department_files.py', 'scripts/generate_department_files.py')
+
+# Directories and page names that are not part of the site
+SKIP_DIRS = {'.git', 'node_modules', 'archived_docs', 'functions', 'server', 'scripts', 'tests', 'docs', 'assets'}
+SKIP_PAGE = re.compile(r'test|diagnostic|backup|working|emergency|demo', re.IGNORECASE)
+
+# Field weights per token occurrence
+FIELD_WEIGHTS = {'title': 8, 'heading': 4, 'description': 2, 'body': 1}
+MAX_WEIGHT = 255
+SKIP_TAGS = {'script', 'style', 'noscript', 'svg', 'nav', 'template', 'footer'}
+HEADING_TAGS = {'h1', 'h2', 'h3'}
+STOPWORDS = frozenset('''
+a an and are as at be by for from has have how i in is it its of on or our that the this to was were what
+when where which who why will with you your
+'''.split())
+
+_TOKEN = re.compile(r'[^\W_]+')
+_YOUTUBE_ID = re.compile(r'^[\w-]{11}$')
+
+
+def tokenize(text):
+    """Lower-cased word tokens without stopwords, plurals folded ('pages' ~ 'page')"""
+    tokens = _TOKEN.findall(unicodedata.normalize('NFKC', text).lower())
+    return [t[:-1] if len(t) > 3 and t.endswith('s') and not t.endswith('ss') else t
+            for t in tokens if len(t) > 1 and t not in STOPWORDS]
+
+
+class PageText(HTMLParser):
+    """Title, headings, meta description and visible body text of a page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.fields = {name: [] for name in FIELD_WEIGHTS}
+        self.stack = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'meta':
+            attrs = dict(attrs)
+            if (attrs.get('name') or '').lower() == 'description' and attrs.get('content'):
+                self.fields['description'].append(attrs['content'])
+            return
+        if tag in ('br', 'img', 'input', 'link', 'hr', 'source', 'wbr', 'area', 'col', 'embed'):
+            return
+        self.stack.append(tag)
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag not in self.stack:
+            return
+        while self.stack:
+            open_tag = self.stack.pop()
+            if open_tag in SKIP_TAGS:
+                self.skip_depth -= 1
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self.skip_depth or not data.strip():
+            return
+        if 'title' in self.stack:
+            self.fields['title'].append(data)
+        elif HEADING_TAGS.intersection(self.stack):
+            self.fields['heading'].append(data)
+        else:
+            self.fields['body'].append(data)
+
+
+def weigh(fields):
+    """{term: weight} of a document's text fields"""
+    terms = {}
+    for field, texts in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        for text in texts:
+            for token in tokenize(text):
+                terms[token] = min(terms.get(token, 0) + weight, MAX_WEIGHT)
+    return terms
+
+
+def snippet(texts):
+    text = ' '.join(' '.join(texts).split())
+    return text if len(text) <= SNIPPET_LENGTH else text[:SNIPPET_LENGTH].rsplit(' ', 1)[0] + '…'
+
+
+def page_document(path, content):
+    """Search document of one HTML page"""
+    parser = PageText()
+    parser.feed(content)
+    parser.close()
+    fields = parser.fields
+    url = path.relative_to(BASE_DIR).as_posix()
+    title = ' '.join(' '.join(fields['title']).split()) or url
+    return {'url': url, 'title': title, 'type': 'page',
+            'snippet': snippet(fields['description'] or fields['body'])}, weigh(fields)
+
+
+def collect_pages(root=None):
+    root = root or BASE_DIR
+    pages = []
+    for path in sorted(root.rglob('*.html')):
+        rel = path.relative_to(root)
+        if SKIP_DIRS.intersection(rel.parts[:-1]) or SKIP_PAGE.search(path.name):
+            continue
+        pages.append(path)
+    return pages
+
+
+def read_departments(relpath):
+    """The DEPARTMENTS literal of a generator script, without running the script"""
+    path = BASE_DIR / relpath
+    if not path.exists():
+        return {}
+    for node in ast.parse(path.read_text(encoding='utf-8')).body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == 'DEPARTMENTS' for t in node.targets):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+def video_documents():
+    """(key, doc, terms) for the preparation videos the department generators declare"""
+    seen = set()
+    for relpath in DEPARTMENT_SOURCES:
+        for code, config in read_departments(relpath).items():
+            if not isinstance(config, dict):
+                continue
+            for video in config.get('videos', []):
+                video_id = next((v for v in video if _YOUTUBE_ID.match(v) and ' ' not in v), None)
+                texts = [v for v in video if v != video_id]
+                if not texts or (code, video_id, texts[0]) in seen:
+                    continue
+                seen.add((code, video_id, texts[0]))
+                fields = {'title': [texts[0]], 'heading': [], 'description': texts[1:],
+                          'body': [config.get('name', '')]}
+                doc = {'url': f'interview/{code}/preparation.html', 'title': texts[0], 'type': 'video',
+                       'snippet': snippet(texts[1:] or [config.get('name', '')])}
+                yield f'video:{code}:{video_id}:{texts[0]}', doc, weigh(fields)
+
+
+def question_documents():
+    """(key, doc, terms) for every department question of the AdaptiveInterview pools"""
+    for question in load_questions():
+        if question.department == 'default':
+            continue
+        fields = {'title': [question.text], 'heading': [], 'description': question.keywords, 'body': []}
+        doc = {'url': f'interview/{question.department}/ai-interview.html', 'title': question.text,
+               'type': 'question', 'snippet': ', '.join(question.keywords)}
+        yield f'question:{question.id}', doc, weigh(fields)
+
+
+class SearchIndex:
+    """Documents with stable ids and their term weights, cached between builds"""
+
+    def __init__(self, cache=None):
+        cache = cache if cache and cache.get('version') == CACHE_VERSION else {}
+        self.ids = dict(cache.get('ids', {}))
+        self.pages = dict(cache.get('pages', {}))       # path -> {hash, doc, terms}
+        self.next_id = max(self.ids.values(), default=-1) + 1
+        self.entries = {}                                # key -> (doc, terms)
+        self.parsed = 0
+
+    def add_page(self, path):
+        key = path.relative_to(BASE_DIR).as_posix()
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        cached = self.pages.get(key)
+        if cached is None or cached['hash'] != digest:
+            doc, terms = page_document(path, data.decode('utf-8', errors='ignore'))
+            cached = self.pages[key] = {'hash': digest, 'doc': doc, 'terms': terms}
+            self.parsed += 1
+        self.add(key, cached['doc'], cached['terms'])
+
+    def add(self, key, doc, terms):
+        if key not in self.ids:
+            self.ids[key] = self.next_id
+            self.next_id += 1
+        self.entries[key] = (doc, terms)
+
+    def cache(self):
+        live = {key: self.ids[key] for key in self.entries}
+        return {'version': CACHE_VERSION, 'ids': live,
+                'pages': {key: value for key, value in self.pages.items() if key in self.entries}}
+
+    def documents(self):
+        """Document list indexed by id; ids of removed documents stay as null holes"""
+        docs = [None] * (max((self.ids[key] for key in self.entries), default=-1) + 1)
+        for key, (doc, _) in self.entries.items():
+            docs[self.ids[key]] = [doc['url'], doc['title'], doc['type'], doc['snippet']]
+        return docs
+
+    def shards(self):
+        """{prefix: {term: [doc, weight, ...]}} keeping each term's MAX_POSTINGS best documents"""
+        postings = {}
+        for key, (_, terms) in self.entries.items():
+            doc_id = self.ids[key]
+            for term, weight in terms.items():
+                postings.setdefault(term, []).append((weight, -doc_id))
+        shards = {}
+        for term in sorted(postings):
+            best = sorted(postings[term], reverse=True)[:MAX_POSTINGS]
+            flat = []
+            for weight, neg_id in sorted(best, key=lambda p: -p[1]):
+                flat.extend((-neg_id, weight))
+            shards.setdefault(term[:PREFIX_LENGTH], {})[term] = flat
+        return shards
+
+
+def shard_stem(prefix):
+    return 'terms-' + ''.join(c if c.isascii() and c.isalnum() else f'_{ord(c):x}' for c in prefix)
+
+
+def build(out_dir=None, full=False):
+    """Build the index into out_dir; returns (manifest, index, writer, removed)"""
+    out_dir = out_dir or OUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = out_dir / CACHE_NAME
+    cache = None if full or not cache_path.exists() else json.loads(cache_path.read_text(encoding='utf-8'))
+    manifest_path = out_dir / MANIFEST_NAME
+    previous = set()
+    if manifest_path.exists():
+        old = json.loads(manifest_path.read_text(encoding='utf-8'))
+        previous = {old['docs'], *old['shards'].values()}
+
+    index = SearchIndex(cache)
+    for path in collect_pages():
+        index.add_page(path)
+    for key, doc, terms in (*video_documents(), *question_documents()):
+        index.add(key, doc, terms)
+
+    writer = SnapshotWriter(out_dir)
+    docs = index.documents()
+    manifest = {
+        'version': CACHE_VERSION,
+        'prefixLength': PREFIX_LENGTH,
+        'documents': sum(1 for doc in docs if doc),
+        'stopwords': sorted(STOPWORDS),
+        'docs': writer.write('docs', docs),
+        'shards': {},
+    }
+    for prefix, terms in index.shards().items():
+        manifest['shards'][prefix] = writer.write(shard_stem(prefix), terms)
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+    cache_path.write_text(json.dumps(index.cache(), ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    removed = prune(out_dir, previous, writer.written)
+    return manifest, index, writer, removed
+
+
+def main():
+    """Build (or incrementally update) the static search index"""
+    parser = argparse.ArgumentParser(description='Build the static site search index')
+    parser.add_argument('--out', type=Path, default=OUT_DIR, help='index directory (default assets/search)')
+    parser.add_argument('--full', action='store_true', help='ignore the page cache and renumber documents')
+    args = parser.parse_args()
+
+    print("🔎 Building site search index")
+    print("=" * 60)
+    manifest, index, writer, removed = build(args.out, args.full)
+    types = {}
+    for doc, _ in index.entries.values():
+        types[doc['type']] = types.get(doc['type'], 0) + 1
+    print(f"📄 Documents: {', '.join(f'{n} {t}s' for t, n in sorted(types.items()))}")
+    print(f"♻️  Parsed {index.parsed} changed page(s), reused {types.get('page', 0) - index.parsed} from cache")
+    print(f"🧩 {len(manifest['shards'])} shard(s), {writer.bytes / 1024:.1f} KB"
+          + (f", {removed} stale file(s) removed" if removed else ''))
+    print("=" * 60)
+    print(f"✅ {args.out / MANIFEST_NAME}")
+
+
+if __name__ == '__main__':
+    main()
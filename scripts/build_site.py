@@ -0,0 +1,218 @@
+"""
+Full Site Build
+- Runs every pipeline task (scripts/pipeline.py) in one command: each task
+  starts as soon as its prerequisites are done, independent tasks run
+  concurrently on a worker pool, and tasks touching the same files never
+  overlap
+- Caches each task's outputs in .build-cache/, keyed by the hash of its
+  script, the local modules and config/ files the script pulls in, and its
+  input files: a task whose inputs are unchanged restores its outputs
+  instead of running
+- Prints a timing summary with the critical path, the chain of tasks that
+  bounds the build, next to the serial total
+- Records the incremental build state, so scripts/build_pages.py continues
+  from this build, then enforces the page-weight budgets
+  (scripts/check_page_budgets.py)
+
+Usage:
+    python scripts/build_site.py                 # full rebuild, one worker per CPU
+    python scripts/build_site.py --jobs 4 --no-cache
+    python scripts/build_site.py --dry-run       # show the waves without running
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import build_pages
+import check_page_budgets
+import pipeline
+from pipeline import Step, dependencies, run_step
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+CACHE_DIR = BASE_DIR / '.build-cache'
+CACHE_VERSION = 1
+
+
+class TaskCache:
+    """Task outputs by input hash: tasks/<key>.json lists the output blobs stored in objects/"""
+
+    def __init__(self, root=None):
+        self.root = root or CACHE_DIR
+
+    def key(self, task):
+        digest = hashlib.sha1(f'{CACHE_VERSION}\0{task.name}\0'.encode())
+        helpers = [path for path in pipeline.script_dependencies(task.script) if not task.writes(path)]
+        for path in [task.script_path] + helpers + task.input_files():
+            digest.update(path.encode() + b'\0')
+            try:
+                digest.update(hashlib.sha1((BASE_DIR / path).read_bytes()).digest())
+            except OSError:
+                digest.update(b'missing')
+        return digest.hexdigest()
+
+    def restore(self, key):
+        """Write back the outputs stored under key; returns the number rewritten, or None on a miss"""
+        try:
+            outputs = json.loads((self.root / 'tasks' / f'{key}.json').read_text(encoding='utf-8'))
+            blobs = {path: (self.root / 'objects' / blob).read_bytes() for path, blob in outputs.items()}
+        except (OSError, ValueError):
+            return None
+        rewritten = 0
+        for path, body in blobs.items():
+            target = BASE_DIR / path
+            try:
+                if target.read_bytes() == body:
+                    continue
+            except OSError:
+                target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(body)
+            rewritten += 1
+        return rewritten
+
+    def store(self, key, task):
+        outputs = {}
+        for path in task.output_files():
+            try:
+                body = (BASE_DIR / path).read_bytes()
+            except OSError:
+                continue
+            blob = hashlib.sha1(body).hexdigest()
+            target = self.root / 'objects' / blob
+            if not target.exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(body)
+            outputs[path] = blob
+        (self.root / 'tasks').mkdir(parents=True, exist_ok=True)
+        (self.root / 'tasks' / f'{key}.json').write_text(json.dumps(outputs, indent=1, sort_keys=True),
+                                                         encoding='utf-8')
+
+
+class Result:
+    """How one task went: status is 'ran', 'cached', 'failed' or 'skipped'"""
+
+    def __init__(self, task, status, seconds=0.0, error=None):
+        self.task = task
+        self.status = status
+        self.seconds = seconds
+        self.error = error
+
+
+def run_task(task, cache):
+    """Run (or restore) one task as its script; safe to call from several threads"""
+    start = time.perf_counter()
+    key = cache.key(task) if cache else None
+    if key and cache.restore(key) is not None:
+        return Result(task, 'cached', time.perf_counter() - start)
+    run_step(Step(task, None, ['build']), in_process=False)
+    if key:
+        cache.store(key, task)
+    return Result(task, 'ran', time.perf_counter() - start)
+
+
+def waves(tasks=None):
+    """Task names grouped by the earliest round they can start in"""
+    deps = dependencies(tasks)
+    level = {}
+    for name, needs in deps.items():         # dependencies() is in build order
+        level[name] = max((level[need] + 1 for need in needs), default=0)
+    grouped = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for name, depth in level.items():
+        grouped[depth].append(name)
+    return grouped
+
+
+def schedule(tasks=None, jobs=None, cache=None):
+    """Run every task as soon as its dependencies succeeded; returns the results in finishing order"""
+    tasks = pipeline.TASKS if tasks is None else tasks
+    by_name = {task.name: task for task in tasks}
+    deps = dependencies(tasks)
+    pending = dict(deps)
+    done = {}
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        while pending or running:
+            for name in list(pending):
+                needs = pending[name]
+                if any(done.get(need) and done[need].status in ('failed', 'skipped') for need in needs):
+                    done[name] = Result(by_name[name], 'skipped')
+                    del pending[name]
+                elif all(need in done for need in needs):
+                    running[pool.submit(run_task, by_name[name], cache)] = name
+                    del pending[name]
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    done[name] = future.result()
+                except Exception as e:
+                    done[name] = Result(by_name[name], 'failed', error=e)
+    return list(done.values())
+
+
+def critical_path(results, deps):
+    """(seconds, [task names]) of the longest dependency chain by task time"""
+    seconds = {result.task.name: result.seconds for result in results}
+    best = {}
+    for name in deps:                          # dependencies() is in build order
+        before = max(deps[name], key=lambda need: best[need][0], default=None)
+        total, chain = best[before] if before else (0.0, [])
+        best[name] = (total + seconds.get(name, 0.0), chain + [name])
+    return max(best.values(), default=(0.0, []))
+
+
+def main():
+    """Rebuild the whole site with independent tasks in parallel"""
+    parser = argparse.ArgumentParser(description='Run every pipeline task, in parallel where possible')
+    parser.add_argument('--jobs', type=int, default=None, help='worker count (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='run every task even if its inputs are unchanged')
+    parser.add_argument('--dry-run', action='store_true', help='show which tasks can run together')
+    args = parser.parse_args()
+
+    deps = dependencies()
+    if args.dry_run:
+        print("🧱 Build waves (tasks in a wave run concurrently)")
+        print("=" * 60)
+        for i, names in enumerate(waves(), 1):
+            print(f"   {i}. {', '.join(names)}")
+        return
+
+    print(f"🚀 Building the site ({args.jobs or os.cpu_count()} workers"
+          + (', no cache' if args.no_cache else '') + ")")
+    print("=" * 60)
+    start = time.perf_counter()
+    results = schedule(jobs=args.jobs, cache=None if args.no_cache else TaskCache())
+    wall = time.perf_counter() - start
+
+    icons = {'ran': '✅', 'cached': '♻️ ', 'failed': '❌', 'skipped': '⏭️ '}
+    for result in results:
+        print(f"   {icons[result.status]} {result.task.name:<22} {result.status:<8} {result.seconds:6.2f}s")
+        if result.error:
+            print(f"      {result.error}")
+
+    total, chain = critical_path(results, deps)
+    serial = sum(result.seconds for result in results)
+    print("\n⏱️  Timing")
+    print(f"   Wall time:     {wall:.2f}s")
+    print(f"   Serial total:  {serial:.2f}s")
+    print(f"   Critical path: {total:.2f}s ({' → '.join(chain)})")
+
+    failed = [result.task.name for result in results if result.status in ('failed', 'skipped')]
+    if failed:
+        print(f"\n❌ Not built: {', '.join(failed)}")
+        raise SystemExit(1)
+    build_pages.save_state(build_pages.snapshot())
+    print("\n✅ Site rebuilt\n")
+    if check_page_budgets.enforce():
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
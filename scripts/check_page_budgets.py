@@ -0,0 +1,192 @@
+"""
+Page-Weight Budgets
+- Budgets per page glob are declared in config/page-budgets.json: maximum
+  HTML bytes, inline CSS bytes (<style> blocks and style attributes), inline
+  JS bytes (<script> blocks without src), requests (distinct subresources the
+  page references directly) and third-party requests (absolute URLs to other
+  hosts); each page is held to the first budget whose glob matches it
+- Measures every matching page, prints the pages over budget and exits
+  non-zero when there is one, so a regression (say, a theme blob injected
+  into every page) fails the build instead of reaching mobile users
+- Appends each run to the history file (JSON Lines, one run per line) so
+  the weights can be charted over time
+
+Usage:
+    python scripts/check_page_budgets.py
+    python scripts/check_page_budgets.py --no-history    # check without recording the run
+    python scripts/check_page_budgets.py --report        # print every page's weight
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import urllib.parse
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+CONFIG_PATH = BASE_DIR / 'config' / 'page-budgets.json'
+
+METRICS = ('htmlBytes', 'inlineCssBytes', 'inlineJsBytes', 'requests', 'thirdPartyRequests')
+FETCHING_RELS = {'stylesheet', 'icon', 'shortcut', 'apple-touch-icon', 'preload', 'modulepreload', 'manifest',
+                 'prefetch'}
+SOURCE_ATTRS = {'script': 'src', 'img': 'src', 'iframe': 'src', 'audio': 'src', 'video': 'src', 'source': 'src',
+                'embed': 'src', 'track': 'src', 'object': 'data'}
+NOT_JS = {'application/json', 'application/ld+json', 'importmap', 'text/template', 'text/x-template'}
+
+
+class PageWeight(HTMLParser):
+    """Inline CSS/JS bytes and referenced subresource URLs of one page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.css = 0
+        self.js = 0
+        self.urls = set()
+        self.inline = None          # 'css' or 'js' while inside an inline <style>/<script>
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get('style'):
+            self.css += len(attrs['style'].encode('utf-8'))
+        if tag == 'link':
+            rels = set((attrs.get('rel') or '').lower().split())
+            if rels & FETCHING_RELS:
+                self.add(attrs.get('href'))
+        elif tag in SOURCE_ATTRS:
+            self.add(attrs.get(SOURCE_ATTRS[tag]))
+            if tag == 'video':
+                self.add(attrs.get('poster'))
+        if tag == 'style':
+            self.inline = 'css'
+        elif tag == 'script' and not attrs.get('src') and (attrs.get('type') or '').lower() not in NOT_JS:
+            self.inline = 'js'
+
+    def handle_endtag(self, tag):
+        if tag in ('style', 'script'):
+            self.inline = None
+
+    def handle_data(self, data):
+        if self.inline == 'css':
+            self.css += len(data.encode('utf-8'))
+        elif self.inline == 'js':
+            self.js += len(data.encode('utf-8'))
+
+    def add(self, url):
+        url = (url or '').strip()
+        if url and not url.startswith(('data:', 'blob:', 'javascript:', '#', 'about:')):
+            self.urls.add(url)
+
+
+def is_third_party(url, first_party=()):
+    host = urllib.parse.urlsplit(url).netloc
+    return bool(host) and host.lower() not in first_party
+
+
+def measure(path, first_party=()):
+    """The metrics of one page"""
+    body = path.read_bytes()
+    parser = PageWeight()
+    parser.feed(body.decode('utf-8', errors='replace'))
+    parser.close()
+    return {
+        'htmlBytes': len(body),
+        'inlineCssBytes': parser.css,
+        'inlineJsBytes': parser.js,
+        'requests': len(parser.urls),
+        'thirdPartyRequests': sum(is_third_party(url, first_party) for url in parser.urls),
+    }
+
+
+def load_config(path=None):
+    return json.loads((path or CONFIG_PATH).read_text(encoding='utf-8'))
+
+
+def assign(budgets):
+    """Repo-relative page path -> the first budget whose glob matches it"""
+    pages = {}
+    for budget in budgets:
+        for path in sorted(BASE_DIR.glob(budget['pages'])):
+            if path.is_file():
+                pages.setdefault(path.relative_to(BASE_DIR).as_posix(), budget)
+    return dict(sorted(pages.items()))
+
+
+def check(config):
+    """(weights, violations): every page's metrics, and (page, glob, metric, actual, limit) over budget"""
+    first_party = {host.lower() for host in config.get('firstPartyHosts', [])}
+    weights = {}
+    violations = []
+    for page, budget in assign(config['budgets']).items():
+        weights[page] = measure(BASE_DIR / page, first_party)
+        for metric in METRICS:
+            limit = budget.get(metric)
+            if limit is not None and weights[page][metric] > limit:
+                violations.append((page, budget['pages'], metric, weights[page][metric], limit))
+    return weights, violations
+
+
+def current_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def record(history_path, weights, violations):
+    """Append one run to the history file"""
+    entry = {
+        'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': current_commit(),
+        'violations': len(violations),
+        'totals': {metric: sum(page[metric] for page in weights.values()) for metric in METRICS},
+        'pages': {page: [values[metric] for metric in METRICS] for page, values in weights.items()},
+        'metrics': list(METRICS),
+    }
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+    return entry
+
+
+def enforce(history=True, report=False):
+    """Check every page against its budget, print the result and record the run; returns the violations"""
+    config = load_config()
+    weights, violations = check(config)
+    print(f"⚖️  Page-weight budgets: {len(weights)} pages, {len(config['budgets'])} budgets")
+    print("=" * 60)
+    if report:
+        for page, values in weights.items():
+            print(f"   {page:<45} {values['htmlBytes']:>8,} B html, {values['inlineCssBytes']:>7,} B css, "
+                  f"{values['inlineJsBytes']:>7,} B js, {values['requests']:>3} req "
+                  f"({values['thirdPartyRequests']} 3rd-party)")
+    if history:
+        record(BASE_DIR / config['history'], weights, violations)
+
+    if violations:
+        print(f"❌ {len(violations)} budget(s) exceeded:")
+        for page, glob, metric, actual, limit in violations:
+            print(f"   {page}: {metric} {actual:,} > {limit:,} (budget {glob})")
+    else:
+        print("✅ Every page is within budget")
+    return violations
+
+
+def main():
+    """Check every page against its budget and record the run"""
+    parser = argparse.ArgumentParser(description='Enforce per-page weight budgets')
+    parser.add_argument('--no-history', action='store_true', help='do not append this run to the history')
+    parser.add_argument('--report', action='store_true', help="print every page's weight")
+    args = parser.parse_args()
+
+    if enforce(history=not args.no_history, report=args.report):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,20 @@
 """
 Script to create AI interview pages for all departments (ME, CE, EC)
+
+Pass output paths to regenerate only those pages:
+    python scripts/create_all_ai_interviews.py interview/me/ai-interview.html
 """
 
+import sys
+
+# Build graph (read by scripts/pipeline.py without running this script):
+# each generated page and the files it is generated from, besides this script
+TARGETS = {
+    'interview/me/ai-interview.html': ['interview/cs/ai-interview.html'],
+    'interview/ce/ai-interview.html': ['interview/cs/ai-interview.html'],
+    'interview/ec/ai-interview.html': ['interview/cs/ai-interview.html'],
+}
+
 # Department configurations
 departments = {
     'me': {
@@ -121,14 +134,21 @@ def create_ai_interview(dept_code, config):
     print(f'   - Navigation updated with AI Interview link')
     print()
 
-# Create all department AI interviews
-print('🚀 Creating AI interview pages for all departments...\n')
+def main(targets=None):
+    """Create the AI interview pages (all of them, or just the given output paths)"""
+    targets = set(targets or TARGETS)
+    print('🚀 Creating AI interview pages for all departments...\n')
+
+    for dept_code, config in departments.items():
+        if f'interview/{dept_code}/ai-interview.html' in targets:
+            create_ai_interview(dept_code, config)
+
+    print('✅ All AI interview pages created successfully!')
+    print('\nSummary:')
+    print('- ME: Thermodynamics, Fluid Mechanics, Materials')
+    print('- CE: Structures, Hydraulics, Geotechnical')
+    print('- EC: Communications, Microcontrollers, Signals')
 
-for dept_code, config in departments.items():
-    create_ai_interview(dept_code, config)
 
-print('✅ All AI interview pages created successfully!')
-print('\nSummary:')
-print('- ME: Thermodynamics, Fluid Mechanics, Materials')
-print('- CE: Structures, Hydraulics, Geotechnical')
-print('- EC: Communications, Microcontrollers, Signals')
+if __name__ == '__main__':
+    main(sys.argv[1:])
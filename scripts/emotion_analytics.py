@@ -0,0 +1,270 @@
+"""
+Offline Emotion-Timeline Analytics Engine
+- Batch port of SmartMockVisualizations (assets/js/visualizations.js):
+  heatmap segments (createEmotionHeatmap), identifySpikes and
+  calculateEmotionDistribution
+- Processes thousands of exported sessions at once: every sample of every
+  session is laid out in flat NumPy arrays and reduced per session
+- Writes one compact JSON summary per session, plus an index; published
+  under analytics/emotions, SmartMockVisualizations.loadEmotionHeatmap renders
+  them (dashboard report cards) and builds the heatmap client-side only for
+  sessions without one
+
+Input is NDJSON (one session per line) or a JSON object keyed by session id.
+A session carries `emotions` ([{type, confidence, timestamp}], the shape the
+visualizations take) or the recorded `expression_list` of lowercase labels,
+which are capitalised to the heatmap's emotion names.
+
+Usage:
+    python scripts/emotion_analytics.py sessions.ndjson --out analytics/emotions
+    python scripts/emotion_analytics.py sessions.json --out analytics/emotions --max-bins 400
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+
+import numpy as np
+
+# Same order as EMOTION_COLORS in visualizations.js; 'default' must stay last
+PALETTE = [
+    ('Happy', '#00FF88'),
+    ('Confident', '#6C63FF'),
+    ('Neutral', '#FFB800'),
+    ('Nervous', '#FF8C00'),
+    ('Confused', '#FF3366'),
+    ('default', '#888888'),
+]
+SPIKE_TYPES = ('Nervous', 'Confused')
+SPIKE_THRESHOLD = 0.7
+HIGH_SEVERITY_THRESHOLD = 0.9
+DEFAULT_INTENSITY = 0.5
+CANVAS_WIDTH = 800
+
+
+def js_to_fixed(value, digits):
+    """Number.prototype.toFixed: exact binary value, ties rounded up"""
+    quantum = Decimal(1).scaleb(-digits)
+    return str(Decimal(value).quantize(quantum, rounding=ROUND_HALF_UP))
+
+
+def js_key(sample):
+    """Property name a sample's `type` becomes in a JS object"""
+    if 'type' not in sample:
+        return 'undefined'
+    value = sample['type']
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def js_object_order(entries):
+    """(key, value) pairs in JS property order: array-index keys ascending, then insertion order"""
+    def rank(entry):
+        key = entry[0]
+        if re.fullmatch(r'0|[1-9][0-9]*', key) and int(key) < 2 ** 32 - 1:
+            return 0, int(key)
+        return 1, 0
+    return sorted(entries, key=rank)
+
+
+def normalize_session(session_id, session):
+    """Session id, duration and the [{type, confidence, timestamp}] timeline of an exported session"""
+    emotions = session.get('emotions')
+    if emotions is None:
+        labels = session.get('expression_list') or session.get('expressions') or []
+        emotions = [{'type': str(label).capitalize()} for label in labels]
+    duration = session.get('duration') or session.get('durationSec') or len(emotions)
+    return str(session.get('sessionId', session_id)), duration, emotions
+
+
+def read_sessions(path):
+    """Yield (session_id, duration, emotions) from NDJSON or a JSON object/array"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix in ('.ndjson', '.jsonl'):
+            for line_no, line in enumerate(f):
+                if line.strip():
+                    yield normalize_session(line_no, json.loads(line))
+            return
+        data = json.load(f)
+    items = data.items() if isinstance(data, dict) else enumerate(data)
+    for session_id, session in items:
+        yield normalize_session(session_id, session)
+
+
+class TimelineBatch:
+    """Flat NumPy layout of many sessions' emotion samples"""
+
+    def __init__(self, sessions):
+        self.ids = []
+        self.durations = []
+        self.timestamps = []
+        codes = {}
+        type_codes, confidence, lengths = [], [], []
+        for session_id, duration, emotions in sessions:
+            self.ids.append(session_id)
+            self.durations.append(duration)
+            lengths.append(len(emotions))
+            keys = [s['type'] if type(s.get('type')) is str else js_key(s) for s in emotions]
+            type_codes.extend([codes.setdefault(key, len(codes)) for key in keys])
+            confidence.extend([c if type(c) in (int, float) else np.nan
+                               for c in (s.get('confidence') for s in emotions)])
+            self.timestamps.extend([s.get('timestamp') for s in emotions])
+        self.keys = list(codes)                # type code -> JS key
+        self.types = np.asarray(type_codes, dtype=np.int32)
+        self.confidence = np.asarray(confidence, dtype=float)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+        self.offsets = np.concatenate([[0], np.cumsum(self.lengths)])
+        self.session_of = np.repeat(np.arange(len(self.ids)), self.lengths)
+        palette_index = {name: i for i, (name, _) in enumerate(PALETTE[:-1])}
+        self.type_palette = np.asarray(
+            [palette_index.get(key, len(PALETTE) - 1) for key in self.keys], dtype=np.int8)
+
+    def intensities(self):
+        """`emotion.confidence || 0.5`: missing, NaN and 0 fall back to 0.5"""
+        conf = self.confidence
+        return np.where(np.isnan(conf) | (conf == 0), DEFAULT_INTENSITY, conf)
+
+    def spike_mask(self):
+        codes = [self.keys.index(t) for t in SPIKE_TYPES if t in self.keys]
+        return np.isin(self.types, codes) & (self.confidence > SPIKE_THRESHOLD)
+
+    def distributions(self):
+        """calculateEmotionDistribution for every session"""
+        pair = self.session_of * max(len(self.keys), 1) + self.types
+        unique, first, counts = np.unique(pair, return_index=True, return_counts=True)
+        order = np.argsort(first, kind='stable')     # JS keeps first-insertion order
+        per_session = [[] for _ in self.ids]
+        for idx in order:
+            session, code = divmod(int(unique[idx]), max(len(self.keys), 1))
+            per_session[session].append((self.keys[code], int(counts[idx])))
+
+        results = []
+        for session, entries in enumerate(per_session):
+            entries = js_object_order(entries)
+            total = int(self.lengths[session])
+            dominant = None
+            for key, count in entries:
+                if dominant is None or not dominant[1] > count:
+                    dominant = (key, count)
+            results.append({
+                'counts': dict(entries),
+                'percentages': {key: js_to_fixed(count / total * 100, 1) for key, count in entries},
+                'dominant': dominant[0] if dominant else None,
+            })
+        return results
+
+    def bins(self, max_bins):
+        """Heatmap colour index and opacity per bin; one bin per sample up to max_bins"""
+        color = self.type_palette[self.types]
+        alpha = self.intensities()
+        results = []
+        for session in range(len(self.ids)):
+            start, end = self.offsets[session], self.offsets[session + 1]
+            n = end - start
+            if n <= max_bins:
+                results.append((color[start:end], alpha[start:end], None))
+                continue
+            edges = start + (np.arange(max_bins) * n) // max_bins
+            bin_of = np.searchsorted(edges, np.arange(start, end), side='right') - 1
+            votes = np.zeros((max_bins, len(PALETTE)), dtype=np.int64)
+            np.add.at(votes, (bin_of, color[start:end]), 1)
+            mean_alpha = np.add.reduceat(alpha[start:end], edges - start) / np.diff(np.append(edges, end))
+            results.append((votes.argmax(axis=1).astype(np.int8), mean_alpha, (edges - start, n)))
+        return results
+
+
+def summarize(batch, max_bins=CANVAS_WIDTH):
+    """Compact per-session summaries: bins, spikes and distribution"""
+    spikes = batch.spike_mask()
+    high = batch.confidence > HIGH_SEVERITY_THRESHOLD
+    distributions = batch.distributions()
+    summaries = []
+    for session, (color, alpha, binning) in enumerate(batch.bins(max_bins)):
+        start, end = batch.offsets[session], batch.offsets[session + 1]
+        session_spikes = []
+        for idx in np.flatnonzero(spikes[start:end]):
+            flat = start + idx
+            spike = {'index': int(idx)}
+            if batch.timestamps[flat] is not None:
+                spike['timestamp'] = batch.timestamps[flat]
+            spike.update({
+                'type': batch.keys[batch.types[flat]],
+                'confidence': float(batch.confidence[flat]),
+                'severity': 'High' if high[flat] else 'Medium',
+                'bin': int(idx) if binning is None else int(np.searchsorted(binning[0], idx, side='right') - 1),
+            })
+            session_spikes.append(spike)
+        summaries.append({
+            'sessionId': batch.ids[session],
+            'duration': batch.durations[session],
+            'samples': int(end - start),
+            'bins': {
+                'palette': [hex_color for _, hex_color in PALETTE],
+                'color': color.tolist(),
+                'alpha': np.round(alpha, 3).tolist(),
+            },
+            'spikes': session_spikes,
+            'distribution': distributions[session],
+        })
+    return summaries
+
+
+def iter_chunks(sessions, size):
+    chunk = []
+    for session in sessions:
+        chunk.append(session)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def safe_name(session_id):
+    """File stem for a session id; ids that sanitise alike keep distinct hashes"""
+    stem = ''.join(c if c.isalnum() or c in '-_' else '_' for c in session_id)
+    return f"{stem}.{hashlib.sha1(session_id.encode('utf-8')).hexdigest()[:8]}"
+
+
+def main():
+    """Summarise every exported session and write per-session JSON files"""
+    parser = argparse.ArgumentParser(description='Precompute emotion heatmaps, spikes and distributions')
+    parser.add_argument('sessions', help='.ndjson/.jsonl or .json export of emotion timelines')
+    parser.add_argument('--out', type=Path, required=True, help='output directory')
+    parser.add_argument('--max-bins', type=int, default=CANVAS_WIDTH, help='heatmap bins per session')
+    parser.add_argument('--batch-size', type=int, default=5000, help='sessions per NumPy batch')
+    args = parser.parse_args()
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    index = {}
+    total_samples = 0
+    print("📈 Summarising emotion timelines...")
+    print("=" * 60)
+    for chunk in iter_chunks(read_sessions(args.sessions), args.batch_size):
+        for summary in summarize(TimelineBatch(chunk), args.max_bins):
+            name = safe_name(summary['sessionId']) + '.json'
+            with open(args.out / name, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(summary, separators=(',', ':')))
+            index[summary['sessionId']] = {
+                'file': name,
+                'dominant': summary['distribution']['dominant'],
+                'spikes': len(summary['spikes']),
+            }
+            total_samples += summary['samples']
+        print(f"✅ {len(index):,} sessions")
+
+    with open(args.out / 'index.json', 'w', encoding='utf-8') as f:
+        f.write(json.dumps(index, separators=(',', ':')))
+    print("=" * 60)
+    print(f"📊 {len(index):,} sessions, {total_samples:,} samples -> {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+Emotion Rules Compiler + NumPy Batch Evaluator
+- Validates assets/js/emotion-rules.json (features, operators, thresholds, weights)
+- Compiles the ordered rule list into a vectorized evaluator that classifies
+  whole arrays of feature frames at once
+- Mirrors classifyEmotion() in the ai-interview pages: rules are tried in
+  order, the first rule whose conditions all pass wins, a missing feature
+  fails the condition and 'neutral' is returned when nothing matches
+
+Usage:
+    python scripts/emotion_rules.py frames.csv            # header row = feature names
+    python scripts/emotion_rules.py frames.npy --labels-out labels.npy
+    python scripts/emotion_rules.py --check               # validate the rule file only
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+RULES_PATH = BASE_DIR / 'assets' / 'js' / 'emotion-rules.json'
+
+FALLBACK_EMOTION = 'neutral'
+COMPARISONS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+}
+OPERATORS = tuple(COMPARISONS) + ('between',)
+
+
+class RuleError(ValueError):
+    """Raised when an emotion rule file is malformed"""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def validate_rules(data):
+    """Check a parsed rule file and raise RuleError listing every problem found"""
+    problems = []
+    if not isinstance(data, dict):
+        raise RuleError('rule file must be a JSON object')
+
+    features = data.get('features')
+    if not isinstance(features, list) or not features or not all(isinstance(f, str) for f in features):
+        problems.append("'features' must be a non-empty list of names")
+        features = []
+    elif len(set(features)) != len(features):
+        problems.append("'features' contains duplicates")
+
+    rules = data.get('rules')
+    if not isinstance(rules, list):
+        problems.append("'rules' must be a list")
+        rules = []
+
+    for i, rule in enumerate(rules):
+        where = f'rules[{i}]'
+        if not isinstance(rule, dict):
+            problems.append(f'{where} must be an object')
+            continue
+        if 'emotion' in rule and not isinstance(rule['emotion'], str):
+            problems.append(f'{where}.emotion must be a string')
+        conditions = rule.get('conditions', {})
+        if not isinstance(conditions, dict):
+            problems.append(f'{where}.conditions must be an object')
+            continue
+        for feat, expr in conditions.items():
+            at = f'{where}.conditions.{feat}'
+            if feat not in features:
+                problems.append(f'{at}: unknown feature')
+            if not isinstance(expr, dict) or not expr:
+                problems.append(f'{at} must be a non-empty object of operators')
+                continue
+            for op, value in expr.items():
+                if op not in OPERATORS:
+                    problems.append(f'{at}: unknown operator {op!r}')
+                elif op == 'between':
+                    if (not isinstance(value, list) or len(value) != 2
+                            or not all(_is_number(v) for v in value)):
+                        problems.append(f'{at}: between needs [min, max]')
+                    elif value[0] > value[1]:
+                        problems.append(f'{at}: between min is greater than max')
+                elif not _is_number(value):
+                    problems.append(f'{at}: {op} threshold must be a number')
+
+    weights = data.get('weights', {})
+    if not isinstance(weights, dict):
+        problems.append("'weights' must be an object")
+    else:
+        for emotion, weight in weights.items():
+            if not _is_number(weight) or weight < 0:
+                problems.append(f'weights.{emotion} must be a non-negative number')
+
+    if problems:
+        raise RuleError('invalid emotion rules:\n  ' + '\n  '.join(problems))
+    return data
+
+
+def load_rules(path=RULES_PATH):
+    """Read and validate a rule file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return validate_rules(json.load(f))
+
+
+def iter_checks(conditions, features):
+    """Flatten a rule's conditions into (column, operator, threshold) checks in JS order"""
+    for feat, expr in conditions.items():
+        col = features.index(feat)
+        for op in ('>', '>=', '<', '<='):
+            if op in expr:
+                yield col, op, expr[op]
+        if 'between' in expr:
+            low, high = expr['between']
+            yield col, '>=', low
+            yield col, '<=', high
+
+
+class EmotionClassifier:
+    """Vectorized first-match evaluator produced by compile_rules()"""
+
+    def __init__(self, features, rules):
+        self.features = list(features)
+        self.rules = rules                      # [(emotion, [(col, op, value), ...]), ...]
+        self.emotions = [emotion for emotion, _ in rules] + [FALLBACK_EMOTION]
+
+    def as_matrix(self, frames):
+        """Coerce frames to a float (n, len(features)) matrix; missing values become NaN.
+
+        Accepts a 2D array in feature order, a mapping of feature name to
+        column, or a sequence of per-frame dicts.
+        """
+        if isinstance(frames, dict):
+            n = len(next(iter(frames.values()))) if frames else 0
+            matrix = np.full((n, len(self.features)), np.nan)
+            for col, feat in enumerate(self.features):
+                if feat in frames:
+                    matrix[:, col] = np.asarray(frames[feat], dtype=float)
+            return matrix
+        if isinstance(frames, (list, tuple)) and frames and isinstance(frames[0], dict):
+            return np.array(
+                [[np.nan if f.get(feat) is None else f[feat] for feat in self.features] for f in frames],
+                dtype=float,
+            )
+        matrix = np.asarray(frames, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self.features):
+            raise ValueError(f'expected an (n, {len(self.features)}) array of {self.features}')
+        return matrix
+
+    def classify_indices(self, frames):
+        """Index into self.emotions of the first matching rule for every frame"""
+        matrix = self.as_matrix(frames)
+        result = np.full(len(matrix), len(self.rules), dtype=np.int16)
+        pending = np.ones(len(matrix), dtype=bool)
+        for idx, (_, checks) in enumerate(self.rules):
+            mask = pending.copy()
+            for col, op, value in checks:
+                # NaN compares False, matching `val == null` / failed comparisons in JS
+                mask &= COMPARISONS[op](matrix[:, col], value)
+            result[mask] = idx
+            pending &= ~mask
+            if not pending.any():
+                break
+        return result
+
+    def classify(self, frames):
+        """Emotion label of every frame"""
+        return np.asarray(self.emotions, dtype=object)[self.classify_indices(frames)]
+
+    def counts(self, frames):
+        """Frames per emotion, in rule order"""
+        tally = np.bincount(self.classify_indices(frames), minlength=len(self.emotions))
+        counts = Counter()
+        for emotion, count in zip(self.emotions, tally):
+            counts[emotion] += int(count)
+        return dict(counts)
+
+
+def compile_rules(data):
+    """Validate a parsed rule file and compile it into an EmotionClassifier"""
+    validate_rules(data)
+    features = data['features']
+    rules = [
+        (rule.get('emotion') or FALLBACK_EMOTION, list(iter_checks(rule.get('conditions') or {}, features)))
+        for rule in data['rules']
+    ]
+    return EmotionClassifier(features, rules)
+
+
+def read_frames(path, features):
+    """Load frames from a .npy matrix (feature order) or a CSV with a header row"""
+    path = Path(path)
+    if path.suffix == '.npy':
+        return np.load(path, mmap_mode='r')
+    with open(path, 'r', encoding='utf-8') as f:
+        header = [h.strip() for h in f.readline().split(',')]
+    missing = [feat for feat in features if feat not in header]
+    if missing:
+        raise ValueError(f'{path} has no column for {missing}')
+    columns = [header.index(feat) for feat in features]
+    return np.loadtxt(path, delimiter=',', skiprows=1, usecols=columns, ndmin=2)
+
+
+def main():
+    """Validate the rule file and optionally classify a batch of frames"""
+    parser = argparse.ArgumentParser(description='Validate and batch-evaluate emotion-rules.json')
+    parser.add_argument('frames', nargs='?', help='.csv (header row) or .npy feature frames')
+    parser.add_argument('--rules', type=Path, default=RULES_PATH)
+    parser.add_argument('--labels-out', type=Path, help='write per-frame rule indices (.npy)')
+    parser.add_argument('--check', action='store_true', help='only validate the rule file')
+    args = parser.parse_args()
+
+    try:
+        data = load_rules(args.rules)
+    except RuleError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    classifier = compile_rules(data)
+    print(f"✅ {args.rules.name}: {len(classifier.rules)} rules over {classifier.features}")
+    if args.check or not args.frames:
+        return
+
+    frames = read_frames(args.frames, classifier.features)
+    indices = classifier.classify_indices(frames)
+    if args.labels_out:
+        np.save(args.labels_out, indices)
+        print(f"💾 Labels written to {args.labels_out} (indices into {classifier.emotions})")
+
+    tally = np.bincount(indices, minlength=len(classifier.emotions))
+    print(f"\n📊 {len(indices):,} frames")
+    for idx, emotion in enumerate(classifier.emotions):
+        share = tally[idx] / len(indices) * 100 if len(indices) else 0.0
+        origin = f'rule {idx}' if idx < len(classifier.rules) else 'fallback'
+        print(f"   {emotion:<10} {tally[idx]:>12,}  {share:5.1f}%  ({origin})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,428 @@
+"""
+Streaming Reader and Processor for Realtime Database JSON Exports
+- Walks an exported JSON document incrementally, a chunk at a time, so memory
+  stays flat no matter how large interviews/ or traditional_interviews/ grow
+- Yields only the values under a path pattern such as 'interviews/*/*'
+  (one record per user session); everything else is skipped without being
+  materialised
+- Reads plain or gzip-compressed (.gz) exports
+- Generator pipeline helpers: Record tuples, batching, an order-preserving
+  process-pool fan-out with a bounded number of batches in flight, and
+  NDJSON shard writing/reading for downstream jobs
+
+Matched values are decoded by the C JSON decoder and skipped subtrees are
+scanned by a single regular expression; only the levels above them are walked
+in Python. Requires Python 3.11+ (possessive quantifiers).
+
+Usage:
+    from export_stream import iter_records
+    for (uid, session_id), record in iter_records('export.json', 'interviews/*/*'):
+        ...
+
+    python scripts/export_stream.py export.json.gz --path 'interviews/*/*' --out shards/
+    python scripts/export_stream.py export.json.gz --path 'leaderboard/*' --out shards/ --gzip
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatchcase
+from itertools import islice
+from pathlib import Path
+from json.decoder import scanstring
+
+CHUNK_SIZE = 1 << 20
+SHARD_SIZE = 100000       # records per NDJSON shard
+BATCH_SIZE = 5000         # records per process-pool task
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# Everything up to the next bracket, complete strings included; possessive
+# quantifiers (Python 3.11+) keep this a single linear scan in C
+_SKIP_RUN = re.compile(r'[^"{}\[\]]*+(?:"[^"\\]*+(?:\\.[^"\\]*+)*+"[^"{}\[\]]*+)*+')
+_DELIMITERS = frozenset(' \t\n\r,:]}')
+
+
+# One matched value: its database path, the pattern's wildcard keys and the decoded value
+Record = namedtuple('Record', 'path keys value')
+
+
+class ExportFormatError(ValueError):
+    """Raised when an export is not well-formed JSON"""
+
+
+def open_export(path):
+    """Open an export for text reading, decompressing .gz files"""
+    path = str(path)
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def split_pattern(pattern):
+    """'interviews/*/*' -> ['interviews', '*', '*']"""
+    return [part for part in pattern.strip('/').split('/') if part]
+
+
+def is_wildcard(part):
+    return any(c in part for c in '*?[')
+
+
+def record_path(pattern, keys):
+    """Database path of a record: the pattern with its wildcards filled from keys"""
+    matched = iter(keys)
+    return '/'.join(next(matched) if is_wildcard(part) else part for part in split_pattern(pattern))
+
+
+class _Reader:
+    """Sliding text buffer over a file object"""
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, need=None):
+        """Append at least one chunk (or `need` characters); False at end of file"""
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        data = self.fp.read(max(self.chunk_size, need or 0))
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def peek(self):
+        """Next non-whitespace character without consuming it ('' at end of file)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ExportFormatError(f'expected {char!r} near offset {self.pos}')
+        self.pos += 1
+
+    def string(self):
+        """Consume a JSON string (the opening quote is at pos)"""
+        while True:
+            try:
+                value, end = scanstring(self.buf, self.pos + 1)
+            except json.JSONDecodeError:
+                if self.fill(len(self.buf) - self.pos):
+                    continue
+                raise ExportFormatError(f'unterminated string near offset {self.pos}') from None
+            self.pos = end
+            return value
+
+    def value(self):
+        """Consume and decode one complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                # Grow geometrically so a large value is re-parsed O(log n) times
+                if self.fill(len(self.buf) - self.pos):
+                    continue
+                raise ExportFormatError(str(e)) from None
+            # A number cut by the chunk boundary decodes as a shorter number;
+            # a complete value is always followed by a delimiter or end of file
+            if (end == len(self.buf) or self.buf[end] not in _DELIMITERS) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip(self):
+        """Consume one JSON value without building it"""
+        char = self.peek()
+        if char == '"':
+            self.string()
+            return
+        if char not in '{[':
+            self.value()
+            return
+        depth = 0
+        while True:
+            self.pos = _SKIP_RUN.match(self.buf, self.pos).end()
+            if self.pos == len(self.buf) or self.buf[self.pos] == '"':
+                # Out of buffer, or a string the chunk boundary cut in two
+                if not self.fill(len(self.buf) - self.pos):
+                    raise ExportFormatError('unexpected end of export')
+                continue
+            char = self.buf[self.pos]
+            self.pos += 1
+            depth += 1 if char in '{[' else -1
+            if depth == 0:
+                return
+
+    def members(self):
+        """Iterate the keys of the object or array at pos, leaving pos at each member's value"""
+        opening = self.peek()
+        self.pos += 1
+        closing = '}' if opening == '{' else ']'
+        index = 0
+        if self.peek() == closing:
+            self.pos += 1
+            return
+        while True:
+            if opening == '{':
+                if self.peek() != '"':
+                    raise ExportFormatError(f'expected a key near offset {self.pos}')
+                key = self.string()
+                self.expect(':')
+            else:
+                key = str(index)
+                index += 1
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == closing:
+                return
+            if char != ',':
+                raise ExportFormatError(f'expected , or {closing} near offset {self.pos - 1}')
+
+
+def _match_decoded(value, parts, path):
+    """Matches of the rest of a pattern inside an already decoded value"""
+    depth = len(path)
+    if depth == len(parts):
+        yield tuple(path), value
+        return
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = ((str(i), child) for i, child in enumerate(value))
+    else:
+        return
+    for key, child in items:
+        if fnmatchcase(key, parts[depth]):
+            path.append(key)
+            yield from _match_decoded(child, parts, path)
+            path.pop()
+
+
+def _walk(reader, patterns, path):
+    """(pattern index, path, value) for the patterns, as (index, parts), still matching path"""
+    depth = len(path)
+    if any(len(parts) == depth for _, parts in patterns):
+        # One pattern ends here; longer ones are matched inside the decoded value
+        value = reader.value()
+        for index, parts in patterns:
+            for matched, child in _match_decoded(value, parts, list(path)):
+                yield index, matched, child
+        return
+    if reader.peek() not in ('{', '['):
+        reader.skip()     # a leaf above the pattern depth is not a record
+        return
+    for key in reader.members():
+        active = [(index, parts) for index, parts in patterns if fnmatchcase(key, parts[depth])]
+        if active:
+            path.append(key)
+            yield from _walk(reader, active, path)
+            path.pop()
+        else:
+            reader.skip()
+
+
+def iter_matches(source, patterns, chunk_size=CHUNK_SIZE):
+    """Yield (pattern, wildcard_keys, value) for several patterns in one pass over the export"""
+    split = [split_pattern(pattern) for pattern in patterns]
+    wildcards = [[i for i, part in enumerate(parts) if is_wildcard(part)] for parts in split]
+    fp = open_export(source) if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__') else source
+    try:
+        reader = _Reader(fp, chunk_size)
+        if reader.peek() == '':
+            return
+        for index, path, value in _walk(reader, list(enumerate(split)), []):
+            yield patterns[index], tuple(path[i] for i in wildcards[index]), value
+    finally:
+        if fp is not source:
+            fp.close()
+
+
+def iter_records(source, pattern, chunk_size=CHUNK_SIZE):
+    """Yield (wildcard_keys, value) for every value whose path matches pattern.
+
+    `source` is a path (plain or .gz) or an open text file. `wildcard_keys`
+    holds the keys matched by the pattern's wildcard segments, e.g. (uid,
+    session_id) for 'interviews/*/*'. The pattern may be '' for the root.
+    """
+    for _, keys, value in iter_matches(source, [pattern], chunk_size):
+        yield keys, value
+
+
+def iter_typed(source, pattern, skipped=None, chunk_size=CHUNK_SIZE):
+    """Yield a Record for every object (dict) value matching pattern.
+
+    Values of any other JSON type are not records; pass a Counter as
+    `skipped` to count them by type name ('list', 'str', 'NoneType', ...).
+    """
+    for keys, value in iter_records(source, pattern, chunk_size):
+        if isinstance(value, dict):
+            yield Record(record_path(pattern, keys), keys, value)
+        elif skipped is not None:
+            skipped[type(value).__name__] += 1
+
+
+def pipeline(source, *stages):
+    """Chain generator stages: pipeline(records, f, g) is g(f(records))"""
+    for stage in stages:
+        source = stage(source)
+    return source
+
+
+def batched(items, size=BATCH_SIZE):
+    """Lists of up to `size` consecutive items"""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def fan_out(func, batches, workers=None, max_pending=None):
+    """Yield func(batch) for each batch, in order, computed by a process pool.
+
+    At most `max_pending` batches (default twice the workers) are queued at
+    once, so a slow consumer never makes the whole export pile up in memory.
+    `func` must be a module-level function so it can be pickled. Every batch
+    is pickled to a worker, so fan out per-record work that costs more than
+    that (scoring, feature extraction), not plain re-encoding. With one
+    worker everything runs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for batch in batches:
+            yield func(batch)
+        return
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(func, batch))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def encode_records(records):
+    """NDJSON lines of a batch of Records"""
+    return [json.dumps({'path': r.path, 'keys': list(r.keys), 'value': r.value},
+                       separators=(',', ':')) + '\n' for r in records]
+
+
+class ShardWriter:
+    """NDJSON files of at most `shard_size` records each, optionally gzip-compressed"""
+
+    def __init__(self, out_dir, prefix='records', shard_size=SHARD_SIZE, compress=False):
+        self.out_dir = Path(out_dir)
+        self.prefix = prefix
+        self.shard_size = shard_size
+        self.compress = compress
+        self.shards = []
+        self.count = 0
+        self.fp = None
+
+    def write_lines(self, lines):
+        for line in lines:
+            if self.fp is None or self.count == self.shard_size:
+                self._next_shard()
+            self.fp.write(line)
+            self.count += 1
+            self.shards[-1]['records'] += 1
+
+    def write(self, records):
+        self.write_lines(encode_records(records))
+
+    def remove_stale(self):
+        """Delete shards with this prefix left by an earlier, larger run"""
+        removed = 0
+        for path in self.out_dir.glob(f'{self.prefix}-[0-9]*.ndjson*'):
+            if re.fullmatch(re.escape(self.prefix) + r'-\d{5}\.ndjson(\.gz)?', path.name):
+                path.unlink()
+                removed += 1
+        return removed
+
+    def _next_shard(self):
+        self.close()
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        name = f'{self.prefix}-{len(self.shards) + 1:05d}.ndjson' + ('.gz' if self.compress else '')
+        path = self.out_dir / name
+        self.fp = gzip.open(path, 'wt', encoding='utf-8') if self.compress else open(path, 'w', encoding='utf-8')
+        self.shards.append({'file': name, 'records': 0})
+        self.count = 0
+
+    def close(self):
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+
+
+def read_shards(paths):
+    """Yield the Records stored in NDJSON shards (plain or .gz)"""
+    for path in paths:
+        with open_export(path) as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    yield Record(row['path'], tuple(row['keys']), row['value'])
+
+
+def main():
+    """Split the records under a path pattern into NDJSON shards"""
+    parser = argparse.ArgumentParser(description='Stream records out of a database export into NDJSON shards')
+    parser.add_argument('export', help='Realtime Database export (.json or .json.gz)')
+    parser.add_argument('--path', default='interviews/*/*', help="record pattern (default 'interviews/*/*')")
+    parser.add_argument('--out', type=Path, required=True, help='shard output directory')
+    parser.add_argument('--prefix', help='shard file prefix (default: first path segment)')
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, help='records per shard')
+    parser.add_argument('--gzip', action='store_true', help='compress shards')
+    args = parser.parse_args()
+
+    prefix = args.prefix or (split_pattern(args.path) or ['records'])[0]
+    args.out.mkdir(parents=True, exist_ok=True)
+    writer = ShardWriter(args.out, prefix, args.shard_size, args.gzip)
+    removed = writer.remove_stale()
+    skipped = Counter()
+    print(f"📤 Sharding {args.path} from {args.export}")
+    print("=" * 60)
+    try:
+        for batch in batched(iter_typed(args.export, args.path, skipped)):
+            writer.write(batch)
+    finally:
+        writer.close()
+
+    manifest = {
+        'export': str(args.export),
+        'pattern': args.path,
+        'shards': writer.shards,
+        'skipped': dict(skipped),
+    }
+    (args.out / f'{prefix}-manifest.json').write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    total = sum(shard['records'] for shard in writer.shards)
+    print("=" * 60)
+    print(f"✅ {total:,} records in {len(writer.shards)} shard(s) -> {args.out}")
+    if skipped:
+        print(f"⚠️  Skipped non-object values: {', '.join(f'{n} {t}' for t, n in sorted(skipped.items()))}")
+    if removed:
+        print(f"🗑️  Removed {removed} stale shard(s)")
+
+
+if __name__ == '__main__':
+    main()
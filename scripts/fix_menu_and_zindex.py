@@ -40,19 +40,19 @@ def fix_html_file(filepath):
             changes_made.append("Fixed dropdown menu position to left")
         
         # Fix 3: Add specific dropdown left positioning if not present
-        # Find .menu-left .dropdown and ensure it has left: 0
-        if '.menu-left .dropdown' in content or '.dropdown' in content:
-            # Check if dropdown positioning exists
-            if 'left: 0' not in content or 'left:0' not in content:
-                # Find the dropdown style block and add left: 0
-                dropdown_block_pattern = r'(\.dropdown\s*\{[^}]*?)(position:\s*absolute;)'
-                if re.search(dropdown_block_pattern, content):
-                    content = re.sub(
-                        dropdown_block_pattern,
-                        r'\1\2\n        left: 0;',
-                        content
-                    )
-                    changes_made.append("Added left: 0 to dropdown")
+        # Checked per .dropdown block (a left: 0 elsewhere on the page does not count),
+        # so a block that already has it is left alone on the next run
+        def add_left(match):
+            block = match.group(0)
+            if re.search(r'(?<![\w-])left\s*:', block):
+                return block
+            return re.sub(r'(position:\s*absolute;)', r'\1\n        left: 0;', block, count=1)
+
+        dropdown_block_pattern = r'\.dropdown\s*\{[^}]*?position:\s*absolute;[^}]*\}'
+        new_content = re.sub(dropdown_block_pattern, add_left, content)
+        if new_content != content:
+            content = new_content
+            changes_made.append("Added left: 0 to dropdown")
         
         # Fix 4: Ensure particles container has proper z-index
         particles_pattern = r'(\.particles-container\s*\{[^}]*?)z-index:\s*\d+;'
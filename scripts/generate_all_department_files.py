@@ -5,10 +5,28 @@ Complete script to generate ALL remaining department files:
 - AI report pages
 
 This will complete ME, CE, EC departments fully.
+
+Pass output paths to regenerate only those pages:
+    python scripts/generate_all_department_files.py interview/me/interview.html
 """
 
 import os
 import json
+import sys
+
+# Build graph (read by scripts/pipeline.py without running this script):
+# each generated page and the files it is generated from, besides this script
+TARGETS = {
+    'interview/me/preparation.html': [],
+    'interview/me/interview.html': ['interview/ee/interview.html'],
+    'interview/me/ai-report.html': ['interview/cs/ai-report.html'],
+    'interview/ce/preparation.html': [],
+    'interview/ce/interview.html': ['interview/ee/interview.html'],
+    'interview/ce/ai-report.html': ['interview/cs/ai-report.html'],
+    'interview/ec/preparation.html': [],
+    'interview/ec/interview.html': ['interview/ee/interview.html'],
+    'interview/ec/ai-report.html': ['interview/cs/ai-report.html'],
+}
 
 # Department configurations with videos and questions
 DEPARTMENTS = {
@@ -307,29 +325,38 @@ def create_ai_report(dept_code, config):
         f.write(content)
     print(f'✅ Created {output_path}')
 
-# Main execution
-print('🚀 Generating all department files...\n')
-print('=' * 60)
+def main(targets=None):
+    """Generate the department pages (all of them, or just the given output paths)"""
+    targets = set(targets or TARGETS)
+    print('🚀 Generating all department files...\n')
+    print('=' * 60)
+
+    for dept_code, config in DEPARTMENTS.items():
+        print(f'\n📁 Processing {config["name"]} ({config["short"]})...')
+        print('-' * 60)
+
+        # Create preparation page
+        if f'interview/{dept_code}/preparation.html' in targets:
+            create_preparation_page(dept_code, config)
+
+        # Create MCQ interview
+        if f'interview/{dept_code}/interview.html' in targets:
+            create_mcq_interview(dept_code, config)
+
+        # Create AI report
+        if f'interview/{dept_code}/ai-report.html' in targets:
+            create_ai_report(dept_code, config)
+
+        print(f'✅ {config["short"]} department complete!')
+
+    print('\n' + '=' * 60)
+    print('✅ ALL DEPARTMENT FILES GENERATED SUCCESSFULLY!')
+    print('\nSummary:')
+    print('- ME: 16 videos, MCQ quiz, AI interview, AI report')
+    print('- CE: 16 videos, MCQ quiz, AI interview, AI report')
+    print('- EC: 16 videos, MCQ quiz, AI interview, AI report')
+    print('\n🎉 All 5 departments (CS, EE, ME, CE, EC) are now complete!')
 
-for dept_code, config in DEPARTMENTS.items():
-    print(f'\n📁 Processing {config["name"]} ({config["short"]})...')
-    print('-' * 60)
-    
-    # Create preparation page
-    create_preparation_page(dept_code, config)
-    
-    # Create MCQ interview
-    create_mcq_interview(dept_code, config)
-    
-    # Create AI report
-    create_ai_report(dept_code, config)
-    
-    print(f'✅ {config["short"]} department complete!')
 
-print('\n' + '=' * 60)
-print('✅ ALL DEPARTMENT FILES GENERATED SUCCESSFULLY!')
-print('\nSummary:')
-print('- ME: 16 videos, MCQ quiz, AI interview, AI report')
-print('- CE: 16 videos, MCQ quiz, AI interview, AI report')
-print('- EC: 16 videos, MCQ quiz, AI interview, AI report')
-print('\n🎉 All 5 departments (CS, EE, ME, CE, EC) are now complete!')
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,137 @@
+"""
+JavaScript Object Literal Reader
+- Parses the data literals the browser scripts declare inline (question pools,
+  translation tables, config objects) into Python values, so the offline tools
+  read the same source of truth as the pages
+- Understands comments, single/double-quoted and plain template strings,
+  unquoted and numeric keys, hex/decimal numbers, true/false/null/undefined
+  and trailing commas; anything else (function calls, `${}` interpolation,
+  spreads) raises JsLiteralError
+
+Usage:
+    from js_literal import literal_after
+    pools = literal_after(source, 'questionPools:')
+"""
+
+import re
+
+_NUMBER = re.compile(r'-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)')
+_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_SPACE_OR_COMMENT = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+_KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None}
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+class JsLiteralError(ValueError):
+    """Raised when the source is not a plain data literal"""
+
+
+def _skip(source, i):
+    return _SPACE_OR_COMMENT.match(source, i).end()
+
+
+def _string(source, i):
+    quote = source[i]
+    out = []
+    i += 1
+    while i < len(source):
+        char = source[i]
+        if char == quote:
+            return ''.join(out), i + 1
+        if char == '\\':
+            nxt = source[i + 1]
+            if nxt == 'u':
+                if source[i + 2] == '{':
+                    end = source.index('}', i)
+                    out.append(chr(int(source[i + 3:end], 16)))
+                    i = end + 1
+                else:
+                    out.append(chr(int(source[i + 2:i + 6], 16)))
+                    i += 6
+                continue
+            if nxt == 'x':
+                out.append(chr(int(source[i + 2:i + 4], 16)))
+                i += 4
+                continue
+            if nxt == '\r' and source[i + 2:i + 3] == '\n':
+                i += 3                      # line continuation
+                continue
+            if nxt in '\n\r\u2028\u2029':
+                i += 2
+                continue
+            out.append(_ESCAPES.get(nxt, nxt))
+            i += 2
+            continue
+        if quote == '`' and source.startswith('${', i):
+            raise JsLiteralError(f'template interpolation at offset {i}')
+        if char == '\n' and quote != '`':
+            raise JsLiteralError(f'unterminated string at offset {i}')
+        out.append(char)
+        i += 1
+    raise JsLiteralError('unterminated string')
+
+
+def parse_value(source, i=0):
+    """Parse one literal starting at offset i; returns (value, end offset)"""
+    i = _skip(source, i)
+    if i >= len(source):
+        raise JsLiteralError('unexpected end of source')
+    char = source[i]
+    if char == '{':
+        result = {}
+        i = _skip(source, i + 1)
+        while source[i] != '}':
+            if source[i] in '\'"`':
+                key, i = _string(source, i)
+            else:
+                match = _IDENTIFIER.match(source, i) or _NUMBER.match(source, i)
+                if not match:
+                    raise JsLiteralError(f'bad object key at offset {i}')
+                key, i = match.group(0), match.end()
+            i = _skip(source, i)
+            if source[i] != ':':
+                raise JsLiteralError(f"expected ':' at offset {i}")
+            result[key], i = parse_value(source, i + 1)
+            i = _skip(source, i)
+            if source[i] == ',':
+                i = _skip(source, i + 1)
+            elif source[i] != '}':
+                raise JsLiteralError(f"expected ',' or '}}' at offset {i}")
+        return result, i + 1
+    if char == '[':
+        result = []
+        i = _skip(source, i + 1)
+        while source[i] != ']':
+            value, i = parse_value(source, i)
+            result.append(value)
+            i = _skip(source, i)
+            if source[i] == ',':
+                i = _skip(source, i + 1)
+            elif source[i] != ']':
+                raise JsLiteralError(f"expected ',' or ']' at offset {i}")
+        return result, i + 1
+    if char in '\'"`':
+        return _string(source, i)
+    match = _NUMBER.match(source, i)
+    if match:
+        text = match.group(0)
+        if text.lstrip('-')[:2].lower() == '0x':
+            return (-1 if text[0] == '-' else 1) * int(text.lstrip('-'), 16), match.end()
+        number = float(text)
+        return (int(number) if number.is_integer() and not re.search('[.eE]', text) else number), match.end()
+    match = _IDENTIFIER.match(source, i)
+    if match and match.group(0) in _KEYWORDS:
+        return _KEYWORDS[match.group(0)], match.end()
+    raise JsLiteralError(f'not a data literal at offset {i}: {source[i:i + 30]!r}')
+
+
+def literal_after(source, marker):
+    """The literal that follows the first occurrence of marker (e.g. 'questionPools:')"""
+    start = source.find(marker)
+    if start < 0:
+        raise JsLiteralError(f'{marker!r} not found')
+    try:
+        value, _ = parse_value(source, start + len(marker))
+    except IndexError:
+        raise JsLiteralError(f'literal after {marker!r} is not closed') from None
+    return value
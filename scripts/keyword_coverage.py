@@ -0,0 +1,325 @@
+"""
+Keyword-Coverage Scorer and Difficulty Calibration
+- Reads the question pools (with their expectedKeywords) straight from
+  assets/js/adaptive-interview.js
+- Builds an inverted index from normalised keyword terms to questions;
+  multiword phrases such as 'consistent hashing' or 'O(log n)' match as token
+  sequences, after NFKC case folding and plural folding ('antennas' ~ 'antenna')
+- Streams interview sessions from an export, pairs each answer with the pool
+  question it was asked for (by question text) and scores keyword coverage in
+  vectorized NumPy batches
+- Emits per-question calibration statistics (coverage distribution, recorded
+  score, coverage/score correlation, per-keyword hit rates) and a suggested
+  difficulty tier from the observed coverage ranking within each department
+
+Usage:
+    python scripts/keyword_coverage.py export.json.gz --out coverage-report.json
+    python scripts/keyword_coverage.py export.json --min-answers 50 --answers-out answers.ndjson
+"""
+
+import argparse
+import json
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from export_stream import batched, iter_typed
+from js_literal import literal_after
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+ADAPTIVE_JS = BASE_DIR / 'assets' / 'js' / 'adaptive-interview.js'
+TIER_NAMES = {1: 'EASY', 2: 'MEDIUM', 3: 'HARD', 4: 'EXPERT'}
+MIN_ANSWERS = 30          # answers a question needs before it is re-tiered
+BATCH_SIZE = 20000        # answers per scoring batch
+
+_TOKEN = re.compile(r'[^\W_]+')
+
+
+def normalize_tokens(text):
+    """Case-folded word tokens with simple plural folding"""
+    tokens = _TOKEN.findall(unicodedata.normalize('NFKC', text).casefold())
+    return [t[:-1] if len(t) > 3 and t.endswith('s') and not t.endswith('ss') else t for t in tokens]
+
+
+def question_key(text):
+    return ' '.join(text.split()).casefold()
+
+
+class Question:
+    __slots__ = ('index', 'id', 'department', 'tier', 'text', 'keywords')
+
+    def __init__(self, index, department, tier, data):
+        self.index = index
+        self.id = data['id']
+        self.department = department
+        self.tier = tier
+        self.text = data['text']
+        self.keywords = list(data.get('expectedKeywords') or [])
+
+
+def load_questions(path=ADAPTIVE_JS):
+    """Every pool question of AdaptiveInterview.questionPools, in source order"""
+    pools = literal_after(Path(path).read_text(encoding='utf-8'), 'questionPools:')
+    questions = []
+    for department, tiers in pools.items():
+        for tier, entries in tiers.items():
+            for data in entries:
+                questions.append(Question(len(questions), department, int(tier), data))
+    return questions
+
+
+class KeywordIndex:
+    """Inverted index: first term of each normalised keyword -> (keyword id, full term sequence)"""
+
+    def __init__(self, questions):
+        self.questions = questions
+        self.terms = []                 # keyword id -> token tuple
+        term_ids = {}
+        self.by_first = {}
+        pairs = []
+        for question in questions:
+            for keyword in question.keywords:
+                tokens = tuple(normalize_tokens(keyword))
+                if not tokens:
+                    continue
+                if tokens not in term_ids:
+                    term_ids[tokens] = len(self.terms)
+                    self.terms.append(tokens)
+                    self.by_first.setdefault(tokens[0], []).append((term_ids[tokens], tokens))
+                pairs.append((question.index, term_ids[tokens], keyword))
+        # question x keyword incidence, and the keyword text each pair was written as
+        self.incidence = np.zeros((len(questions), len(self.terms)), dtype=bool)
+        self.labels = {}
+        for q, k, keyword in pairs:
+            self.incidence[q, k] = True
+            self.labels[q, k] = keyword
+        self.keyword_counts = self.incidence.sum(axis=1)
+
+        self.by_text = {}
+        for question in questions:
+            self.by_text.setdefault(question_key(question.text), []).append(question)
+
+    def question_for(self, text, department=None):
+        """Pool question asked with this text (department disambiguates shared texts)"""
+        if not isinstance(text, str):
+            return None
+        candidates = self.by_text.get(question_key(text))
+        if not candidates:
+            return None
+        if isinstance(department, str):
+            for question in candidates:
+                if question.department == department.lower():
+                    return question
+        return candidates[0]
+
+    def find(self, text):
+        """Ids of the keyword terms occurring in text"""
+        tokens = normalize_tokens(text)
+        found = set()
+        for i, token in enumerate(tokens):
+            for term_id, term in self.by_first.get(token, ()):
+                if len(term) == 1 or tuple(tokens[i:i + len(term)]) == term:
+                    found.add(term_id)
+        return found
+
+
+class CoverageStats:
+    """Running per-question sums, updated a batch at a time"""
+
+    def __init__(self, index):
+        self.index = index
+        n, k = index.incidence.shape
+        self.answers = np.zeros(n)
+        self.coverage = np.zeros(n)
+        self.coverage_sq = np.zeros(n)
+        self.full = np.zeros(n)
+        self.zero = np.zeros(n)
+        self.scored = np.zeros(n)
+        self.score = np.zeros(n)
+        self.score_sq = np.zeros(n)
+        self.scored_coverage = np.zeros(n)
+        self.scored_coverage_sq = np.zeros(n)
+        self.cross = np.zeros(n)
+        self.keyword_hits = np.zeros(n * k)
+
+    def add_batch(self, answers):
+        """Score [(question index, answer text, recorded score or None)]; returns coverage per answer"""
+        index = self.index
+        n, k = index.incidence.shape
+        questions = np.fromiter((q for q, _, _ in answers), dtype=np.int64, count=len(answers))
+        rows, cols = [], []
+        for row, (_, text, _) in enumerate(answers):
+            for term_id in index.find(text):
+                rows.append(row)
+                cols.append(term_id)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+
+        # Only terms the asked question expects count towards its coverage
+        expected = index.incidence[questions[rows], cols] if len(rows) else np.zeros(0, dtype=bool)
+        covered = np.bincount(rows[expected], minlength=len(answers))
+        totals = index.keyword_counts[questions]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            coverage = np.where(totals > 0, covered / totals, np.nan)
+        self.keyword_hits += np.bincount(questions[rows[expected]] * k + cols[expected], minlength=n * k)
+
+        valid = ~np.isnan(coverage)
+        q, c = questions[valid], coverage[valid]
+        self.answers += np.bincount(q, minlength=n)
+        self.coverage += np.bincount(q, weights=c, minlength=n)
+        self.coverage_sq += np.bincount(q, weights=c * c, minlength=n)
+        self.full += np.bincount(q, weights=(c == 1.0), minlength=n)
+        self.zero += np.bincount(q, weights=(c == 0.0), minlength=n)
+
+        scores = np.array([s if isinstance(s, (int, float)) and not isinstance(s, bool) else np.nan
+                           for _, _, s in answers], dtype=float)
+        has_score = valid & ~np.isnan(scores)
+        q, c, s = questions[has_score], coverage[has_score], scores[has_score]
+        self.scored += np.bincount(q, minlength=n)
+        self.score += np.bincount(q, weights=s, minlength=n)
+        self.score_sq += np.bincount(q, weights=s * s, minlength=n)
+        self.scored_coverage += np.bincount(q, weights=c, minlength=n)
+        self.scored_coverage_sq += np.bincount(q, weights=c * c, minlength=n)
+        self.cross += np.bincount(q, weights=c * s, minlength=n)
+        return coverage
+
+    def report(self, min_answers=MIN_ANSWERS):
+        """Calibration entry per question that has expected keywords"""
+        index = self.index
+        n, k = index.incidence.shape
+        hits = self.keyword_hits.reshape(n, k)
+        entries = []
+        for question in index.questions:
+            q = question.index
+            if not index.keyword_counts[q]:
+                continue
+            count = self.answers[q]
+            entry = {'id': question.id, 'department': question.department, 'tier': question.tier,
+                     'answers': int(count)}
+            if count:
+                mean = self.coverage[q] / count
+                entry.update({
+                    'meanCoverage': round(mean, 4),
+                    'stdCoverage': round(float(np.sqrt(max(self.coverage_sq[q] / count - mean * mean, 0.0))), 4),
+                    'fullCoverage': round(self.full[q] / count, 4),
+                    'zeroCoverage': round(self.zero[q] / count, 4),
+                    'keywordHitRate': {index.labels[q, t]: round(hits[q, t] / count, 4)
+                                       for t in np.flatnonzero(index.incidence[q])},
+                })
+            scored = self.scored[q]
+            if scored:
+                mean_s = self.score[q] / scored
+                mean_c = self.scored_coverage[q] / scored
+                var_s = self.score_sq[q] / scored - mean_s ** 2
+                var_c = self.scored_coverage_sq[q] / scored - mean_c ** 2
+                entry['meanScore'] = round(mean_s, 4)
+                if var_s > 1e-12 and var_c > 1e-12:
+                    entry['coverageScoreCorrelation'] = round(
+                        (self.cross[q] / scored - mean_c * mean_s) / np.sqrt(var_c * var_s), 4)
+            entries.append(entry)
+        suggest_tiers(entries, min_answers)
+        return entries
+
+
+def suggest_tiers(entries, min_answers=MIN_ANSWERS):
+    """Re-rank each department's calibrated questions by coverage, keeping its tier sizes"""
+    departments = {}
+    for entry in entries:
+        if entry['answers'] >= min_answers:
+            departments.setdefault(entry['department'], []).append(entry)
+    for group in departments.values():
+        tiers = sorted(entry['tier'] for entry in group)
+        # Highest coverage is easiest; ties keep the current tier order
+        ranked = sorted(group, key=lambda e: (-e['meanCoverage'], e['tier']))
+        for entry, tier in zip(ranked, tiers):
+            entry['suggestedTier'] = tier
+
+
+def session_answers(index, records, stats):
+    """(question index, answer, score, session path, position) for every pool answer in the sessions"""
+    for record in records:
+        value = record.value
+        questions = value.get('questions')
+        answers = value.get('answers')
+        if not isinstance(questions, list) or not isinstance(answers, list):
+            stats['no transcript'] += 1
+            continue
+        scores = value.get('score_list') if isinstance(value.get('score_list'), list) else []
+        stats['sessions'] += 1
+        for position, (text, answer) in enumerate(zip(questions, answers)):
+            question = index.question_for(text, value.get('department'))
+            if question is None:
+                stats['unmatched questions'] += 1
+                continue
+            if not isinstance(answer, str):
+                stats['non-text answers'] += 1
+                continue
+            score = scores[position] if position < len(scores) else None
+            yield question.index, answer, score, record.path, position
+
+
+def main():
+    """Score exported answers for keyword coverage and write calibration statistics"""
+    parser = argparse.ArgumentParser(description='Score interview answers for expected-keyword coverage')
+    parser.add_argument('export', help='Realtime Database export (.json or .json.gz)')
+    parser.add_argument('--path', default='interviews/*/*', help="session pattern (default 'interviews/*/*')")
+    parser.add_argument('--questions', type=Path, default=ADAPTIVE_JS, help='script declaring questionPools')
+    parser.add_argument('--out', type=Path, default=Path('coverage-report.json'), help='calibration report')
+    parser.add_argument('--answers-out', type=Path, help='optional NDJSON of per-answer coverage')
+    parser.add_argument('--min-answers', type=int, default=MIN_ANSWERS, help='answers needed to suggest a tier')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    index = KeywordIndex(load_questions(args.questions))
+    stats = CoverageStats(index)
+    counts = Counter()
+    skipped = Counter()
+    print(f"🔑 {len(index.terms)} keyword terms over {len(index.questions)} questions")
+    print(f"📝 Scoring {args.path} from {args.export}")
+    print("=" * 60)
+    answers_out = open(args.answers_out, 'w', encoding='utf-8') if args.answers_out else None
+    try:
+        items = session_answers(index, iter_typed(args.export, args.path, skipped), counts)
+        for batch in batched(items, args.batch_size):
+            coverage = stats.add_batch([(q, text, score) for q, text, score, _, _ in batch])
+            counts['answers'] += len(batch)
+            if answers_out:
+                for (q, _, _, path, position), c in zip(batch, coverage.tolist()):
+                    answers_out.write(json.dumps({'path': path, 'position': position, 'question': index.questions[q].id,
+                                                  'coverage': None if c != c else round(c, 4)}) + '\n')
+    finally:
+        if answers_out:
+            answers_out.close()
+
+    entries = stats.report(args.min_answers)
+    report = {
+        'export': str(args.export),
+        'minAnswers': args.min_answers,
+        'sessions': counts['sessions'],
+        'answers': counts['answers'],
+        'unmatchedQuestions': counts['unmatched questions'],
+        'questions': entries,
+    }
+    args.out.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    print("=" * 60)
+    print(f"✅ Sessions: {counts['sessions']:,}, scored answers: {counts['answers']:,}, "
+          f"unmatched questions: {counts['unmatched questions']:,}")
+    moves = [e for e in entries if 'suggestedTier' in e and e['suggestedTier'] != e['tier']]
+    for entry in moves:
+        print(f"↕️  {entry['id']}: {TIER_NAMES.get(entry['tier'], entry['tier'])} -> "
+              f"{TIER_NAMES.get(entry['suggestedTier'], entry['suggestedTier'])} "
+              f"(coverage {entry['meanCoverage']:.0%}, {entry['answers']} answers)")
+    if not moves:
+        print("✅ No tier changes suggested")
+    if skipped:
+        print(f"⚠️  Skipped non-object values: {', '.join(f'{n} {t}' for t, n in sorted(skipped.items()))}")
+    print(f"💾 Report: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
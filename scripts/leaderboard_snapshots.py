@@ -0,0 +1,276 @@
+"""
+Precomputed Leaderboard Snapshots
+- Streams the `leaderboard/` node of a Realtime Database export (plain or .gz)
+- Ranks users the way loadLeaderboardData() in assets/js/leaderboard.js does:
+  totalStars desc, then bestScore desc (`|| 0`), ties kept in key order
+- Keeps only the top entries in bounded heaps (global and per department), so
+  page payloads never hold more than --top records each
+- Writes paginated, content-fingerprinted JSON pages, a user -> rank index
+  sharded by uid prefix, and an unhashed manifest.json pointing at them
+
+Page entries carry the fields the leaderboard table renders; email addresses
+are left out of the static files.
+
+Usage:
+    python scripts/leaderboard_snapshots.py export.json.gz --out assets/data/leaderboard
+    python scripts/leaderboard_snapshots.py export.json --top 100 --page-size 25 --department-top 50
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from export_stream import iter_records
+from rescore_interviews import js_number
+
+PAGE_SIZE = 25            # itemsPerPage in leaderboard.js
+TOP_K = 100
+DEPARTMENT_TOP_K = 100
+SHARD_PREFIX = 2          # uid characters per rank-index shard
+
+# Fields of a leaderboard entry the podium and table render
+PAGE_FIELDS = ('name', 'department', 'bestScore', 'totalStars', 'totalInterviews', 'grade', 'lastActive',
+               'improvement')
+
+
+def sort_number(value):
+    """`value || 0` as the comparator sees it; NaN compares equal, so it ranks as 0"""
+    number = js_number(value)
+    return 0.0 if math.isnan(number) else number
+
+
+def department_of(record):
+    """Department key the page filter compares against, or None"""
+    department = record.get('department')
+    return department if isinstance(department, str) and department else None
+
+
+def fingerprint(payload):
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:10]
+
+
+class TopK:
+    """Bounded min-heap of the k best (stars, best, -seq) entries"""
+
+    def __init__(self, k):
+        self.k = k
+        self.heap = []
+
+    def push(self, key, entry):
+        item = (key, entry)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, item)
+        elif key > self.heap[0][0]:
+            heapq.heapreplace(self.heap, item)
+
+    def ranked(self):
+        """Entries best first"""
+        return [entry for _, entry in sorted(self.heap, key=lambda item: item[0], reverse=True)]
+
+
+class LeaderboardSnapshot:
+    """Single pass over leaderboard records: heaps for pages, compact columns for ranks"""
+
+    def __init__(self, top_k=TOP_K, department_top_k=DEPARTMENT_TOP_K):
+        self.department_top_k = department_top_k
+        self.top = TopK(top_k)
+        self.department_tops = {}
+        self.uids = []
+        self.departments = []
+        self.stars = []
+        self.best = []
+        self.total_interviews = 0.0
+
+    def add(self, uid, record):
+        if not isinstance(record, dict):
+            return
+        seq = len(self.uids)
+        stars = sort_number(record.get('totalStars'))
+        best = sort_number(record.get('bestScore'))
+        department = department_of(record)
+        self.uids.append(uid)
+        self.departments.append(department)
+        self.stars.append(stars)
+        self.best.append(best)
+        self.total_interviews += sort_number(record.get('totalInterviews'))
+
+        # -seq: of two equal scores the earlier key is "larger", matching the stable sort
+        key = (stars, best, -seq)
+        entry = {'userId': uid, **{f: record[f] for f in PAGE_FIELDS if f in record}}
+        self.top.push(key, entry)
+        if department is not None:
+            if department not in self.department_tops:
+                self.department_tops[department] = TopK(self.department_top_k)
+            self.department_tops[department].push(key, entry)
+
+    def ranks(self):
+        """Global and in-department 1-based rank of every user, in input order"""
+        stars = np.asarray(self.stars, dtype=float)
+        best = np.asarray(self.best, dtype=float)
+        order = np.lexsort((best * -1, stars * -1))     # stable: equal keys keep input order
+        global_rank = np.empty(len(order), dtype=np.int64)
+        global_rank[order] = np.arange(1, len(order) + 1)
+
+        codes = {}
+        department_codes = np.asarray([codes.setdefault(d, len(codes)) for d in self.departments], dtype=np.int64)
+        sorted_codes = department_codes[order]
+        # Position within each department along the global order
+        department_rank = np.empty(len(order), dtype=np.int64)
+        for code in range(len(codes)):
+            members = order[sorted_codes == code]
+            department_rank[members] = np.arange(1, len(members) + 1)
+        return global_rank, department_rank
+
+    def stats(self):
+        """Header figures of updateStats()"""
+        total_users = len(self.uids)
+        avg = math.floor(sum(self.best) / total_users + 0.5) if total_users else 0
+        interviews = self.total_interviews
+        return {
+            'totalUsers': total_users,
+            'totalInterviews': int(interviews) if float(interviews).is_integer() else interviews,
+            'avgScore': avg,
+        }
+
+
+def paginate(entries, page_size, first_rank=1):
+    for start in range(0, len(entries), page_size):
+        yield [dict(entry, rank=first_rank + start + offset)
+               for offset, entry in enumerate(entries[start:start + page_size])]
+
+
+class SnapshotWriter:
+    """Writes fingerprinted JSON files and remembers what it wrote"""
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.written = set()
+        self.bytes = 0
+
+    def write(self, stem, data):
+        payload = json.dumps(data, separators=(',', ':'))
+        name = f'{stem}.{fingerprint(payload)}.json'
+        path = self.out_dir / name
+        if not path.exists():
+            path.write_text(payload, encoding='utf-8')
+        self.written.add(name)
+        self.bytes += len(payload)
+        return name
+
+
+def write_pages(writer, stem, entries, page_size, total):
+    files = []
+    pages = list(paginate(entries, page_size))
+    for number, page in enumerate(pages, 1):
+        files.append(writer.write(f'{stem}-{number}', {
+            'page': number,
+            'pages': len(pages),
+            'total': total,
+            'entries': page,
+        }))
+    return files
+
+
+def build_snapshot(snapshot, out_dir, page_size=PAGE_SIZE, shard_prefix=SHARD_PREFIX):
+    """Write every page and rank shard of a filled LeaderboardSnapshot; return the manifest"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    writer = SnapshotWriter(out_dir)
+    global_rank, department_rank = snapshot.ranks()
+
+    department_sizes = {}
+    for department in snapshot.departments:
+        if department is not None:
+            department_sizes[department] = department_sizes.get(department, 0) + 1
+
+    manifest = {
+        'pageSize': page_size,
+        'stats': snapshot.stats(),
+        'global': {
+            'total': len(snapshot.uids),
+            'pages': write_pages(writer, 'global', snapshot.top.ranked(), page_size, len(snapshot.uids)),
+        },
+        'departments': {},
+        'ranks': {'prefixLength': shard_prefix, 'shards': {}},
+    }
+    for department in sorted(snapshot.department_tops):
+        total = department_sizes[department]
+        stem = 'dept-' + ''.join(c if c.isalnum() or c in '-_' else '_' for c in department)
+        manifest['departments'][department] = {
+            'total': total,
+            'pages': write_pages(writer, stem, snapshot.department_tops[department].ranked(), page_size, total),
+        }
+
+    shards = {}
+    for uid, department, rank, dept_rank in zip(snapshot.uids, snapshot.departments,
+                                                global_rank.tolist(), department_rank.tolist()):
+        entry = [rank, dept_rank] if department is not None else [rank]
+        shards.setdefault(uid[:shard_prefix], {})[uid] = entry
+    for prefix in sorted(shards):
+        safe = ''.join(c if c.isalnum() else f'_{ord(c):x}' for c in prefix) or '_'
+        manifest['ranks']['shards'][prefix] = writer.write(f'ranks-{safe}', shards[prefix])
+    return manifest, writer
+
+
+def prune(out_dir, previous, current):
+    """Remove files the previous manifest referenced that the new one does not"""
+    removed = 0
+    for name in previous - current:
+        path = out_dir / name
+        if path.exists():
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def manifest_files(manifest):
+    files = set(manifest.get('global', {}).get('pages', []))
+    for department in manifest.get('departments', {}).values():
+        files.update(department.get('pages', []))
+    files.update(manifest.get('ranks', {}).get('shards', {}).values())
+    return files
+
+
+def main():
+    """Stream leaderboard records from an export and write snapshot pages"""
+    parser = argparse.ArgumentParser(description='Precompute paginated leaderboard snapshots from an export')
+    parser.add_argument('export', help='Realtime Database export (.json or .json.gz)')
+    parser.add_argument('--path', default='leaderboard/*', help="record pattern (default 'leaderboard/*')")
+    parser.add_argument('--out', type=Path, default=Path('leaderboard-snapshots'), help='output directory')
+    parser.add_argument('--top', type=int, default=TOP_K, help='global entries to paginate')
+    parser.add_argument('--department-top', type=int, default=DEPARTMENT_TOP_K, help='entries per department')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE)
+    parser.add_argument('--shard-prefix', type=int, default=SHARD_PREFIX, help='uid characters per rank shard')
+    args = parser.parse_args()
+
+    print(f"🏆 Building leaderboard snapshot from {args.export}")
+    print("=" * 60)
+    snapshot = LeaderboardSnapshot(args.top, args.department_top)
+    for (uid,), record in iter_records(args.export, args.path):
+        snapshot.add(uid, record)
+        if len(snapshot.uids) % 100000 == 0:
+            print(f"   {len(snapshot.uids):,} users")
+
+    manifest_path = args.out / 'manifest.json'
+    previous = set()
+    if manifest_path.exists():
+        previous = manifest_files(json.loads(manifest_path.read_text(encoding='utf-8')))
+    manifest, writer = build_snapshot(snapshot, args.out, args.page_size, args.shard_prefix)
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding='utf-8')
+    removed = prune(args.out, previous, writer.written)
+
+    print("=" * 60)
+    print(f"✅ Users: {len(snapshot.uids):,}")
+    print(f"📄 Global pages: {len(manifest['global']['pages'])}, "
+          f"departments: {', '.join(manifest['departments']) or 'none'}")
+    print(f"🔎 Rank shards: {len(manifest['ranks']['shards'])}")
+    print(f"💾 {len(writer.written)} file(s), {writer.bytes / 1024:.1f} KB in {args.out}"
+          + (f" ({removed} stale removed)" if removed else ''))
+
+
+if __name__ == '__main__':
+    main()
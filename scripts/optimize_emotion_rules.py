@@ -0,0 +1,421 @@
+"""
+Emotion Rule-Set Optimizer
+- Analyses assets/js/emotion-rules.json for unreachable, redundant and
+  overlapping rules (e.g. rules hidden behind the catch-all "neutral" rule)
+- Compiles the ordered rule list into a decision tree that needs the fewest
+  expected threshold comparisons per frame, and writes it as
+  assets/js/emotion-tree.json for assets/js/emotion-tree.js to evaluate
+- Benchmarks comparisons per frame before (linear rule scan, as in
+  classifyEmotion) and after (tree), and writes the tree only once both agree
+  on every frame
+- Stamps the tree with a hash of the rules file's bytes, which
+  emotion-tree.js recomputes in the browser: a tree built from other rules
+  is ignored in favour of the linear scan
+
+Every condition compares one feature with a constant, so the thresholds split
+each feature axis into elementary segments (open intervals and the threshold
+points themselves). The rules are constant on each cell of that grid, which
+makes the analysis exact and the tree search a small dynamic program.
+
+Usage:
+    python scripts/optimize_emotion_rules.py
+    python scripts/optimize_emotion_rules.py --frames recorded.npy   # weight by real frames
+    python scripts/optimize_emotion_rules.py --check                 # fail if the tree is stale
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from emotion_rules import COMPARISONS, RULES_PATH, RuleError, compile_rules, read_frames
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+TREE_PATH = BASE_DIR / 'assets' / 'js' / 'emotion-tree.json'
+
+# Probability mass given to a threshold point, which has zero width
+POINT_WEIGHT = 1e-9
+# Sub-boxes the exact tree search may memoise; larger grids are split greedily
+EXACT_STATE_LIMIT = 20000
+
+
+class FeatureAxis:
+    """Elementary segments of one feature: even indices are open intervals, odd ones thresholds"""
+
+    def __init__(self, thresholds):
+        self.thresholds = sorted(set(thresholds))
+        t = self.thresholds
+        pad = max((t[-1] - t[0]) if len(t) > 1 else 0.0, 0.1) if t else 1.0
+        self.bounds = (t[0] - pad, t[-1] + pad) if t else (-pad, pad)
+        edges = [self.bounds[0]] + t + [self.bounds[1]]
+        self.representatives = []
+        self.widths = []
+        for k in range(len(t) + 1):
+            self.representatives.append((edges[k] + edges[k + 1]) / 2)
+            self.widths.append(edges[k + 1] - edges[k])
+            if k < len(t):
+                self.representatives.append(t[k])
+                self.widths.append(POINT_WEIGHT)
+
+    def __len__(self):
+        return len(self.representatives)
+
+    def segment_of(self, values):
+        """Segment index of every value (NaN maps to -1)"""
+        t = np.asarray(self.thresholds)
+        k = np.searchsorted(t, values, side='left')
+        on_point = (k < len(t)) & (t[np.minimum(k, len(t) - 1)] == values) if len(t) else np.zeros(len(values), bool)
+        segments = 2 * k + on_point.astype(int)
+        segments[np.isnan(values)] = -1
+        return segments
+
+    def split(self, s):
+        """Comparison that sends segments < s one way and segments >= s the other"""
+        if s % 2:
+            return '<', self.thresholds[(s - 1) // 2]
+        return '<=', self.thresholds[(s - 2) // 2]
+
+
+def rule_source_hash(raw):
+    """Hash of the rules file as served (bytes), matching EmotionTree.sourceHash in the browser"""
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+class RuleSetAnalysis:
+    """Exact cell-grid view of a rule set"""
+
+    def __init__(self, data, frames=None):
+        self.data = data
+        self.classifier = compile_rules(data)
+        self.features = self.classifier.features
+        thresholds = {col: [] for col in range(len(self.features))}
+        for _, checks in self.classifier.rules:
+            for col, _, value in checks:
+                thresholds[col].append(value)
+        self.axes = [FeatureAxis(thresholds[col]) for col in range(len(self.features))]
+        self.shape = tuple(len(axis) for axis in self.axes)
+
+        points = self.cell_points()
+        self.labels = self.classifier.classify_indices(points).reshape(self.shape)
+        self.matches = []
+        for _, checks in self.classifier.rules:
+            mask = np.ones(len(points), dtype=bool)
+            for col, op, value in checks:
+                mask &= COMPARISONS[op](points[:, col], value)
+            self.matches.append(mask.reshape(self.shape))
+        self.weights = self.cell_weights(frames)
+
+    def cell_weights(self, frames):
+        """Probability of each cell: observed frequency when frames are given, else box volume"""
+        if frames is not None:
+            matrix = self.classifier.as_matrix(frames)
+            segments = np.stack([axis.segment_of(matrix[:, col]) for col, axis in enumerate(self.axes)], axis=1)
+            segments = segments[(segments >= 0).all(axis=1)]
+            counts = np.zeros(self.shape)
+            np.add.at(counts, tuple(segments.T), 1)
+            weights = counts + POINT_WEIGHT   # unseen cells must still be classified correctly
+        else:
+            weights = np.ones(self.shape)
+            for col, axis in enumerate(self.axes):
+                shape = [1] * len(self.axes)
+                shape[col] = len(axis)
+                weights = weights * np.asarray(axis.widths).reshape(shape)
+        return weights / weights.sum()
+
+    def emotion(self, index):
+        return self.classifier.emotions[index]
+
+    def rule_report(self):
+        """Per-rule coverage and status: ok, unreachable or redundant"""
+        report = []
+        for idx, (emotion, checks) in enumerate(self.classifier.rules):
+            wins = self.labels == idx
+            entry = {
+                'rule': idx,
+                'emotion': emotion,
+                'matchShare': float(self.weights[self.matches[idx]].sum()),
+                'winShare': float(self.weights[wins].sum()),
+                'status': 'ok',
+            }
+            if not self.matches[idx].any():
+                entry['status'] = 'unreachable'
+                entry['reason'] = 'conditions contradict each other'
+            elif not wins.any():
+                shadowing = [j for j in range(idx) if (self.matches[j] & self.matches[idx]).any()]
+                entry['status'] = 'unreachable'
+                entry['reason'] = f'fully shadowed by rules {shadowing}'
+            elif self.without_rule(idx) == self.emotion_grid():
+                entry['status'] = 'redundant'
+                entry['reason'] = 'removing it changes no classification'
+            report.append(entry)
+        return report
+
+    def cell_points(self):
+        return np.array(list(itertools.product(*[axis.representatives for axis in self.axes])))
+
+    def emotion_grid(self):
+        return np.asarray(self.classifier.emotions, dtype=object)[self.labels.ravel()].tolist()
+
+    def without_rule(self, idx):
+        """Emotion of every cell when rule idx is deleted"""
+        data = dict(self.data, rules=[r for i, r in enumerate(self.data['rules']) if i != idx])
+        return list(compile_rules(data).classify(self.cell_points()))
+
+    def overlaps(self):
+        """Pairs of rules that both match some frames; the later rule loses there.
+
+        Unconditional catch-all rules overlap everything by design and are skipped.
+        """
+        found = []
+        rules = self.classifier.rules
+        for i, j in itertools.combinations(range(len(rules)), 2):
+            if not rules[j][1]:
+                continue
+            both = self.matches[i] & self.matches[j]
+            if both.any():
+                found.append({
+                    'winner': i,
+                    'loser': j,
+                    'share': float(self.weights[both].sum()),
+                    'sameEmotion': rules[i][0] == rules[j][0],
+                    'region': self.describe(both),
+                })
+        return found
+
+    def describe(self, mask):
+        """Bounding box of a cell mask as readable interval conditions"""
+        parts = []
+        for col, axis in enumerate(self.axes):
+            other = tuple(a for a in range(len(self.axes)) if a != col)
+            present = np.flatnonzero(mask.any(axis=other))
+            lo, hi = int(present[0]), int(present[-1])
+            if lo == 0 and hi == len(axis) - 1:
+                continue
+            low = '-inf' if lo == 0 else axis.representatives[lo] if lo % 2 else axis.thresholds[(lo - 1) // 2]
+            high = 'inf' if hi == len(axis) - 1 else axis.representatives[hi] if hi % 2 else axis.thresholds[hi // 2]
+            parts.append(f"{self.features[col]} in {'[' if lo % 2 else '('}{low}, {high}{']' if hi % 2 else ')'}")
+        return ', '.join(parts) or 'everywhere'
+
+    def search_states(self):
+        """Sub-boxes of the cell grid, i.e. states of the exact tree search"""
+        return int(np.prod([n * (n + 1) // 2 for n in self.shape], dtype=float))
+
+    def build_tree(self, exact_limit=EXACT_STATE_LIMIT):
+        """Decision tree for the rules: exact when the grid is small enough, greedy otherwise"""
+        if self.search_states() <= exact_limit:
+            return self.build_exact_tree()
+        return self.build_greedy_tree()
+
+    def build_greedy_tree(self):
+        """Top-down tree choosing, at each node, the split with the lowest weighted label entropy.
+
+        Each node costs one pass over its sub-box, so this scales to rule sets
+        whose exact search would not finish; the tree is still exact, just not
+        guaranteed to need the fewest comparisons.
+        """
+        labels, weights = self.labels, self.weights
+        n_labels = len(self.classifier.emotions)
+
+        def entropy(hist):
+            total = hist.sum(axis=-1, keepdims=True)
+            p = np.divide(hist, total, out=np.zeros_like(hist), where=total > 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                h = -np.where(p > 0, p * np.log2(p), 0.0).sum(axis=-1)
+            return total[..., 0] * h
+
+        def grow(state):
+            region = tuple(slice(state[2 * c], state[2 * c + 1] + 1) for c in range(len(self.axes)))
+            sub, w = labels[region], weights[region]
+            first = sub.flat[0]
+            if (sub == first).all():
+                return 0.0, 1, {'emotion': self.emotion(int(first))}
+            choice = None
+            for col, axis in enumerate(self.axes):
+                lo, hi = state[2 * col], state[2 * col + 1]
+                if hi == lo:
+                    continue
+                # Label weight per segment along this axis, then every prefix/suffix split at once
+                hist = np.zeros((hi - lo + 1, n_labels))
+                np.add.at(hist, (np.moveaxis(np.indices(sub.shape), 0, -1)[..., col].ravel(), sub.ravel()),
+                          w.ravel())
+                left = np.cumsum(hist, axis=0)[:-1]
+                score = entropy(left) + entropy(left[-1] + hist[-1] - left)
+                k = int(np.argmin(score))
+                if choice is None or score[k] < choice[0] - 1e-15:
+                    choice = (score[k], col, lo + k + 1)
+            _, col, s = choice
+            left = state[:2 * col + 1] + (s - 1,) + state[2 * col + 2:]
+            right = state[:2 * col] + (s,) + state[2 * col + 1:]
+            cost_l, nodes_l, tree_l = grow(left)
+            cost_r, nodes_r, tree_r = grow(right)
+            op, value = self.axes[col].split(s)
+            node = {'feature': self.features[col], 'op': op, 'value': value, 'then': tree_l, 'else': tree_r}
+            return float(w.sum()) + cost_l + cost_r, 1 + nodes_l + nodes_r, node
+
+        root = tuple(v for axis in self.axes for v in (0, len(axis) - 1))
+        cost, nodes, tree = grow(root)
+        return tree, cost, nodes
+
+    def build_exact_tree(self):
+        """Decision tree minimising expected comparisons per frame (ties: fewer nodes)"""
+        labels, weights = self.labels, self.weights
+
+        @lru_cache(maxsize=None)
+        def best(state):
+            region = tuple(slice(state[2 * c], state[2 * c + 1] + 1) for c in range(len(self.axes)))
+            sub = labels[region]
+            first = sub.flat[0]
+            if (sub == first).all():
+                return 0.0, 1, {'emotion': self.emotion(int(first))}
+            mass = float(weights[region].sum())
+            choice = None
+            for col, axis in enumerate(self.axes):
+                lo, hi = state[2 * col], state[2 * col + 1]
+                for s in range(lo + 1, hi + 1):
+                    left = state[:2 * col + 1] + (s - 1,) + state[2 * col + 2:]
+                    right = state[:2 * col] + (s,) + state[2 * col + 1:]
+                    cost_l, nodes_l, tree_l = best(left)
+                    cost_r, nodes_r, tree_r = best(right)
+                    key = (round(mass + cost_l + cost_r, 12), 1 + nodes_l + nodes_r)
+                    if choice is None or key < choice[0]:
+                        op, value = axis.split(s)
+                        node = {'feature': self.features[col], 'op': op, 'value': value,
+                                'then': tree_l, 'else': tree_r}
+                        choice = (key, node)
+            (cost, nodes), node = choice
+            return cost, nodes, node
+
+        root = tuple(v for axis in self.axes for v in (0, len(axis) - 1))
+        cost, nodes, tree = best(root)
+        return tree, cost, nodes
+
+
+def linear_comparisons(classifier, matrix):
+    """Threshold comparisons per frame made by the linear first-match scan"""
+    count = np.zeros(len(matrix), dtype=np.int32)
+    pending = np.ones(len(matrix), dtype=bool)
+    for _, checks in classifier.rules:
+        alive = pending.copy()
+        for col, op, value in checks:
+            count[alive] += 1
+            alive &= COMPARISONS[op](matrix[:, col], value)
+        pending &= ~alive
+    return count
+
+
+def evaluate_tree(tree, features, matrix):
+    """Vectorized tree walk: (emotion per frame, comparisons per frame)"""
+    emotions = np.empty(len(matrix), dtype=object)
+    depth = np.zeros(len(matrix), dtype=np.int32)
+
+    def walk(node, rows, level):
+        if 'emotion' in node:
+            emotions[rows] = node['emotion']
+            depth[rows] = level
+            return
+        values = matrix[rows, features.index(node['feature'])]
+        yes = COMPARISONS[node['op']](values, node['value'])
+        walk(node['then'], rows[yes], level + 1)
+        walk(node['else'], rows[~yes], level + 1)
+
+    walk(tree, np.arange(len(matrix)), 0)
+    return emotions, depth
+
+
+def tree_stats(tree):
+    """Node count and maximum depth of a tree"""
+    if 'emotion' in tree:
+        return 0, 0
+    nodes_l, depth_l = tree_stats(tree['then'])
+    nodes_r, depth_r = tree_stats(tree['else'])
+    return 1 + nodes_l + nodes_r, 1 + max(depth_l, depth_r)
+
+
+def sample_frames(analysis, n, seed=0):
+    """Uniform frames over the padded threshold range of every feature"""
+    rng = np.random.default_rng(seed)
+    return np.stack([rng.uniform(*axis.bounds, size=n) for axis in analysis.axes], axis=1)
+
+
+def main():
+    """Analyse the rule set, emit the decision tree and benchmark it"""
+    parser = argparse.ArgumentParser(description='Analyse emotion-rules.json and compile a decision tree')
+    parser.add_argument('--rules', type=Path, default=RULES_PATH)
+    parser.add_argument('--out', type=Path, default=TREE_PATH)
+    parser.add_argument('--frames', help='recorded frames (.csv/.npy) used to weight the tree and benchmark')
+    parser.add_argument('--samples', type=int, default=200000, help='synthetic frames when --frames is not given')
+    parser.add_argument('--check', action='store_true', help='fail if --out was built from different rules')
+    args = parser.parse_args()
+
+    raw = args.rules.read_bytes()
+    data = json.loads(raw.decode('utf-8'))
+    try:
+        analysis_frames = read_frames(args.frames, data.get('features', [])) if args.frames else None
+        analysis = RuleSetAnalysis(data, analysis_frames)
+    except RuleError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    source_hash = rule_source_hash(raw)
+    if args.check:
+        current = json.loads(args.out.read_text(encoding='utf-8')) if args.out.exists() else {}
+        if current.get('sourceHash') != source_hash:
+            print(f"❌ {args.out.name} is stale; rerun scripts/optimize_emotion_rules.py")
+            sys.exit(1)
+        print(f"✅ {args.out.name} matches {args.rules.name}")
+        return
+
+    print("🔍 Rule analysis")
+    print("=" * 60)
+    for entry in analysis.rule_report():
+        icon = {'ok': '✅', 'redundant': '⚠️ ', 'unreachable': '❌'}[entry['status']]
+        note = f" - {entry['reason']}" if 'reason' in entry else ''
+        print(f"{icon} rule {entry['rule']} ({entry['emotion']}): wins {entry['winShare'] * 100:.1f}% "
+              f"of frames, matches {entry['matchShare'] * 100:.1f}%{note}")
+    for overlap in analysis.overlaps():
+        kind = 'same emotion' if overlap['sameEmotion'] else 'conflict'
+        print(f"↔️  rule {overlap['loser']} overlaps rule {overlap['winner']} ({kind}, "
+              f"{overlap['share'] * 100:.1f}%): {overlap['region']}")
+
+    tree, expected, _ = analysis.build_tree()
+    nodes, max_depth = tree_stats(tree)
+    model = {
+        'version': 1,
+        'source': args.rules.name,
+        'sourceHash': source_hash,
+        'features': analysis.features,
+        'fallback': analysis.classifier.emotions[-1],
+        'tree': tree,
+        # Linear rules are kept for frames with missing features
+        'rules': data['rules'],
+    }
+    matrix = analysis.classifier.as_matrix(analysis_frames) if analysis_frames is not None \
+        else sample_frames(analysis, args.samples)
+    matrix = matrix[~np.isnan(matrix).any(axis=1)]
+    before = linear_comparisons(analysis.classifier, matrix)
+    emotions, after = evaluate_tree(tree, analysis.features, matrix)
+    mismatches = int((emotions != analysis.classifier.classify(matrix)).sum())
+
+    print("\n⏱️  Comparisons per frame")
+    print("=" * 60)
+    source = args.frames or f'{len(matrix):,} synthetic frames'
+    print(f"   Frames:         {source}")
+    print(f"   Linear rules:   mean {before.mean():.2f}, max {before.max()}")
+    print(f"   Decision tree:  mean {after.mean():.2f}, max {after.max()} "
+          f"({nodes} nodes, expected {expected:.2f})")
+    print(f"   Saved:          {(1 - after.mean() / max(before.mean(), 1e-9)) * 100:.1f}%")
+    if mismatches:
+        print(f"❌ Tree disagrees with the rules on {mismatches} frames; {args.out.name} left unchanged")
+        sys.exit(1)
+    args.out.write_text(json.dumps(model, separators=(',', ':')) + '\n', encoding='utf-8')
+    print(f"\n✅ Tree agrees with the rules on every frame; written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Page Classes
+- config/page-classes.json groups the site's pages into classes by glob
+  (AI interview rooms, department pages, recruiter portal, landing pages,
+  everything else) and holds per-class settings for the page transforms,
+  e.g. which particle renderer the theme injector emits and how the
+  background robot is loaded
+- A page belongs to the first class whose glob matches it; globs use the
+  pipeline's syntax ('*' stays within one path segment)
+
+Usage:
+    python scripts/page_classes.py              # list the classes and their pages
+"""
+
+import json
+from pathlib import Path
+
+from pipeline import matches
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+CONFIG_PATH = BASE_DIR / 'config' / 'page-classes.json'
+
+_CLASSES = {}
+
+
+def load_classes(path=None):
+    """The configured classes, in matching order (cached per config mtime)"""
+    path = path or CONFIG_PATH
+    mtime = path.stat().st_mtime_ns
+    cached = _CLASSES.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = _CLASSES[path] = (mtime, json.loads(path.read_text(encoding='utf-8'))['classes'])
+    return cached[1]
+
+
+def relative_page(path):
+    """Repo-relative posix path of a page given as an absolute or cwd-relative path"""
+    path = Path(path)
+    try:
+        return path.resolve().relative_to(BASE_DIR.resolve()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def page_class(page, classes=None):
+    """The first class whose globs match the page (repo-relative, or a path under the repo), or None"""
+    page = relative_page(page) if Path(page).is_absolute() else Path(page).as_posix()
+    for cls in load_classes() if classes is None else classes:
+        if matches(page, cls['pages']):
+            return cls
+    return None
+
+
+def setting(page, key, default=None, classes=None):
+    """A class setting for the page, or default when its class (or the page) has none"""
+    cls = page_class(page, classes)
+    return default if cls is None else cls.get(key, default)
+
+
+def main():
+    """List every class with the pages it currently holds"""
+    classes = load_classes()
+    pages = sorted(p.relative_to(BASE_DIR).as_posix() for pattern in ('*.html', 'interview/*/*.html',
+                                                                      'recruiter/*.html')
+                   for p in BASE_DIR.glob(pattern))
+    members = {cls['name']: [] for cls in classes}
+    for page in pages:
+        cls = page_class(page, classes)
+        if cls is not None:
+            members[cls['name']].append(page)
+    print("🗂️  Page classes")
+    print("=" * 60)
+    for cls in classes:
+        settings = ', '.join(f"{key}={value}" for key, value in cls.items() if key not in ('name', 'pages'))
+        print(f"   {cls['name']:<14} {len(members[cls['name']]):>3} pages  {settings}")
+
+
+if __name__ == '__main__':
+    main()
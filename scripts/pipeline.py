@@ -0,0 +1,401 @@
+"""
+Page Pipeline Registry
+- Declares every transform of the site build: the script, the files it reads
+  and writes (repo-relative globs) and the tasks that must run before it
+- Orders the tasks topologically and plans the minimal rebuild for a set of
+  changed files: a task runs when it reads a changed file or a file an earlier
+  step rewrote, and an edited script reruns its task over all of its pages
+- Generators declare a TARGETS literal (each output page and the template
+  files it is derived from); a changed template regenerates only the pages
+  built from it, and every step records why each target was rebuilt
+- In-place page transforms that expose a per-page function run in-process on
+  just the affected pages; everything else runs as its script, from the repo
+  root
+
+Used by scripts/watch.py, scripts/build_pages.py and scripts/build_site.py; the task order is the documented rebuild order
+(generate departments, navigation, leaderboard link, theme, parallax, z-index
+fixes, then the derived assets).
+
+Usage:
+    python scripts/pipeline.py                                  # list the tasks in build order
+    python scripts/pipeline.py interview/cs/ai-interview.html   # plan the rebuild for changed files
+    python scripts/pipeline.py --apply parallax index.html      # run one task's page function
+"""
+
+import ast
+import contextlib
+import importlib
+import io
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+SCRIPTS_DIR = Path(__file__).parent
+
+SITE_PAGES = ('*.html', 'interview/*/*.html', 'recruiter/*.html')
+DEPARTMENT_PAGES = 'interview/*/*.html'
+
+
+def on_page(function):
+    """Per-page adapter for a module function taking the page path"""
+    return lambda module, path: getattr(module, function)(path)
+
+
+def on_department(function):
+    """Per-page adapter for a module function taking the department code"""
+    return lambda module, path: getattr(module, function)(path.parent.name)
+
+
+def declared_targets(script):
+    """The TARGETS literal of a generator script ({output: [sources]}), read without running it"""
+    tree = ast.parse((SCRIPTS_DIR / script).read_text(encoding='utf-8'))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == 'TARGETS'
+                                                for t in node.targets):
+            return {output: list(sources) for output, sources in ast.literal_eval(node.value).items()}
+    raise ValueError(f"{script} does not declare TARGETS")
+
+
+def _path_literal(node):
+    """'config/x.json' for BASE_DIR / 'config' / 'x.json' or a plain string, else None"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+        right = _path_literal(node.right)
+        if right is None:
+            return None
+        # the leftmost operand is the base directory (BASE_DIR, Path(__file__).parent, ...)
+        base = not isinstance(node.left, (ast.Constant, ast.BinOp))
+        left = '' if base else _path_literal(node.left)
+        return None if left is None else f'{left}/{right}'.lstrip('/')
+    return None
+
+
+_DEPENDENCIES = {}
+CONFIG_PATH = re.compile(r'config/[\w@.-]+(?:/[\w@.-]+)*\Z')
+
+
+def script_dependencies(script):
+    """Files a script depends on besides its declared inputs, read without running it: the
+    local modules it imports (transitively) and the config/ files they name as path literals"""
+    modules, files = set(), set()
+    pending = [Path(script).stem]
+    while pending:
+        name = pending.pop()
+        path = SCRIPTS_DIR / f'{name}.py'
+        if name in modules or not path.is_file():
+            continue
+        modules.add(name)
+        stamp = path.stat().st_mtime_ns
+        cached = _DEPENDENCIES.get(path)
+        if cached is None or cached[0] != stamp:
+            imports, literals = set(), set()
+            for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+                if isinstance(node, ast.Import):
+                    imports.update(alias.name.split('.')[0] for alias in node.names)
+                elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                    imports.add(node.module.split('.')[0])
+                elif isinstance(node, (ast.BinOp, ast.Constant)):
+                    literal = _path_literal(node)
+                    if literal and CONFIG_PATH.match(literal) and (BASE_DIR / literal).is_file():
+                        literals.add(literal)
+            cached = _DEPENDENCIES[path] = (stamp, imports, literals)
+        pending.extend(cached[1])
+        files.update(cached[2])
+    scripts = {f'scripts/{name}.py' for name in modules} - {f'scripts/{Path(script).name}'}
+    return sorted(scripts | files)
+
+
+class Task:
+    """One transform: script, files read and written, and prerequisite task names"""
+
+    def __init__(self, name, script, inputs, outputs=None, requires=(), exclude=(), page=None, targets=None):
+        self.name = name
+        self.script = script
+        self.inputs = tuple(inputs)
+        self.outputs = self.inputs if outputs is None else tuple(outputs)   # in place by default
+        self.requires = tuple(requires)
+        self.exclude = tuple(exclude)
+        self.page = page
+        self.targets = targets          # generator: output -> sources; selected outputs are passed as argv
+
+    @property
+    def script_path(self):
+        return f'scripts/{self.script}'
+
+    @property
+    def module(self):
+        return Path(self.script).stem
+
+    def reads(self, path):
+        return matches(path, self.inputs) and not matches(path, self.exclude)
+
+    def writes(self, path):
+        return matches(path, self.outputs) and not matches(path, self.exclude)
+
+    def input_files(self):
+        return expand(self.inputs, self.exclude)
+
+    def output_files(self):
+        return expand(self.outputs, self.exclude)
+
+    def __repr__(self):
+        return f'Task({self.name!r})'
+
+
+def generator(name, script, requires=()):
+    """Task for a generator script from its declared TARGETS"""
+    targets = declared_targets(script)
+    inputs = sorted({source for sources in targets.values() for source in sources})
+    return Task(name, script, inputs, list(targets), requires=requires, targets=targets)
+
+
+TASKS = [
+    # Generators: department pages derived from the CS/EE templates
+    generator('ai-interviews', 'create_all_ai_interviews.py'),
+    generator('ee-ai-interview', 'create_ee_ai.py'),
+    generator('department-pages', 'generate_all_department_files.py'),
+    Task('ee-report', 'update_ee_report.py', ['interview/ee/ai-report.html']),
+    # Navigation and page features
+    Task('ai-interviews-v2', 'update_ai_interviews_v2.py', ['interview/*/ai-interview.html'],
+         requires=['ai-interviews', 'ee-ai-interview'], page=on_department('update_ai_interview_page')),
+    Task('ai-interview-links', 'fix_navigation_menus.py', [DEPARTMENT_PAGES],
+         requires=['ai-interviews-v2', 'department-pages', 'ee-report'], page=on_page('fix_navigation_in_file')),
+    Task('department-navigation', 'add_department_navigation.py', ['interview/*/courses.html'],
+         page=lambda module, path: module.process_courses_file(path, path.parent.name)),
+    Task('certificate-modal', 'final_updates.py', ['interview/*/courses.html'],
+         requires=['department-navigation']),
+    Task('leaderboard-link', 'add_leaderboard_navigation.py',
+         [f'{name}.html' for name in ('about', 'certificate', 'community', 'contact', 'interview', 'report',
+                                      'verify-certificate')]),
+    # Theme layers over every page
+    Task('dark-theme', 'apply_dark_theme_particles.py',
+         SITE_PAGES + ('config/page-classes.json', 'assets/vendor/manifest.json'), SITE_PAGES,
+         requires=['ai-interview-links', 'certificate-modal', 'leaderboard-link'],
+         page=on_page('process_html_file')),
+    Task('parallax', 'apply_parallax_ui_globally.py', SITE_PAGES, exclude=['home-champion.html'],
+         requires=['dark-theme'], page=on_page('process_html_file')),
+    Task('menu-zindex', 'fix_menu_and_zindex.py',
+         [f'{name}.html' for name in ('home', 'index', 'dashboard', 'interview', 'about', 'contact', 'community',
+                                      'profile', 'report', 'leaderboard', 'certificate', 'verify-certificate',
+                                      'loading')]
+         + [f'interview/*/{name}.html' for name in ('courses', 'interview', 'preparation', 'report',
+                                                    'ai-interview')]
+         + [f'recruiter/{name}.html' for name in ('dashboard', 'candidates', 'interview-room', 'leaderboard',
+                                                  'login', 'register', 'reports', 'schedule', 'settings')],
+         requires=['parallax'], page=on_page('fix_html_file')),
+    # Derived assets
+    Task('report-engine', 'build_report_engine.py',
+         ['assets/js/report-engine.js', 'config/reports/*.json', 'interview/*/report.html',
+          'interview/*/ai-report.html'],
+         ['interview/*/report.html', 'interview/*/ai-report.html', 'assets/js/report-engine.*.js'],
+         requires=['menu-zindex']),
+    Task('purge-css', 'purge_css.py',
+         SITE_PAGES + ('assets/css/*.css', 'assets/js/*.js', 'config/page-classes.json'),
+         SITE_PAGES + ('assets/css/purged/*.css',), requires=['report-engine']),
+    Task('emotion-tree', 'optimize_emotion_rules.py', ['assets/js/emotion-rules.json'],
+         ['assets/js/emotion-tree.json']),
+    Task('i18n-bundles', 'split_i18n_bundles.py', ['config/i18n/*.json'],
+         ['assets/js/i18n-accessibility.js', 'assets/i18n/*.json']),
+    Task('search-index', 'build_search_index.py',
+         SITE_PAGES + ('assets/js/adaptive-interview.js', 'scripts/generate_all_department_files.py',
+                       'scripts/generate_department_files.py'),
+         ['assets/search/*'], requires=['report-engine']),
+]
+
+
+def glob_regex(pattern):
+    """Regex for a repo-relative glob: '*' and '?' stay within one path segment, '**/' spans any"""
+    parts = re.split(r'(\*\*/|\*|\?)', pattern)
+    table = {'**/': '(?:.*/)?', '*': '[^/]*', '?': '[^/]'}
+    return re.compile(''.join(table.get(part, re.escape(part)) for part in parts) + r'\Z')
+
+
+_REGEXES = {}
+
+
+def matches(path, patterns):
+    for pattern in patterns:
+        regex = _REGEXES.get(pattern)
+        if regex is None:
+            regex = _REGEXES[pattern] = glob_regex(pattern)
+        if regex.match(path):
+            return True
+    return False
+
+
+def expand(patterns, exclude=()):
+    """Repo-relative files matching the patterns, sorted; literal paths count even before they exist"""
+    files = set()
+    for pattern in patterns:
+        if not any(char in pattern for char in '*?['):
+            files.add(pattern)
+            continue
+        for path in BASE_DIR.glob(pattern):
+            if path.is_file():
+                files.add(path.relative_to(BASE_DIR).as_posix())
+    return sorted(path for path in files if not matches(path, exclude))
+
+
+def order(tasks=None):
+    """Tasks with every prerequisite first, otherwise in registry order"""
+    tasks = TASKS if tasks is None else tasks
+    by_name = {task.name: task for task in tasks}
+    for task in tasks:
+        unknown = [name for name in task.requires if name not in by_name]
+        if unknown:
+            raise ValueError(f"{task.name} requires unknown task(s): {', '.join(unknown)}")
+    done = []
+    placed = set()
+    while len(done) < len(tasks):
+        ready = [task for task in tasks if task.name not in placed and placed.issuperset(task.requires)]
+        if not ready:
+            stuck = sorted(task.name for task in tasks if task.name not in placed)
+            raise ValueError(f"cycle between tasks: {', '.join(stuck)}")
+        done.append(ready[0])
+        placed.add(ready[0].name)
+    return done
+
+
+def dependencies(tasks=None):
+    """Task name -> names of the tasks it must wait for: its prerequisites, plus any earlier task
+    writing a file it reads or writes (or reading a file it writes), so the two never run at once"""
+    tasks = order(tasks)
+    files = {task.name: (set(task.input_files()), set(task.output_files())) for task in tasks}
+    deps = {}
+    for i, task in enumerate(tasks):
+        reads, writes = files[task.name]
+        deps[task.name] = set(task.requires)
+        for earlier in tasks[:i]:
+            their_reads, their_writes = files[earlier.name]
+            if their_writes & (reads | writes) or writes & their_reads:
+                deps[task.name].add(earlier.name)
+    return deps
+
+
+class Step:
+    """A task to run on some pages (or all of them when pages is None), and what made it necessary"""
+
+    def __init__(self, task, pages, because, why=None):
+        self.task = task
+        self.pages = pages
+        self.because = because
+        self.why = why or {}        # target -> reasons it was rebuilt
+
+    def describe(self):
+        if self.pages is None:
+            target = 'all pages'
+        elif len(self.pages) > 3:
+            target = f'{len(self.pages)} pages'
+        else:
+            target = ', '.join(self.pages)
+        return f"{self.task.name}: {target} (because of {', '.join(self.because)})"
+
+
+def plan(changed, tasks=None):
+    """Steps that bring the outputs up to date after the changed repo-relative files"""
+    dirty = {path: path for path in changed}     # dirty file -> the edit or task that made it dirty
+
+    def reason(path):
+        return f'{path} edited' if dirty[path] == path else f'{path} rebuilt by {dirty[path]}'
+
+    steps = []
+    for task in order(tasks):
+        if task.script_path in dirty:
+            pages, hits = None, [task.script_path]
+            why = {path: [reason(task.script_path)] for path in task.output_files()}
+        elif task.targets is not None:
+            why = {output: [reason(source) for source in sources if source in dirty]
+                   for output, sources in task.targets.items()}
+            why = {output: reasons for output, reasons in why.items() if reasons}
+            if not why:
+                continue
+            hits = sorted({source for output in why for source in task.targets[output] if source in dirty})
+            pages = sorted(why)
+        else:
+            hits = sorted(path for path in dirty if task.reads(path))
+            if not hits:
+                continue
+            in_place = task.page is not None and all(task.writes(path) for path in hits)
+            pages = hits if in_place else None
+            if in_place:
+                why = {path: [reason(path)] for path in hits}
+            else:
+                why = {path: [reason(hit) for hit in hits] for path in task.output_files()}
+        steps.append(Step(task, pages, sorted({dirty[path] for path in hits}), why))
+        for path in task.output_files() if pages is None else pages:
+            dirty.setdefault(path, task.name)
+    return steps
+
+
+_MODULES = {}
+
+
+def load_module(task):
+    """The task's script as a module, reloaded when the script changed since it was imported"""
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))
+    mtime = (SCRIPTS_DIR / task.script).stat().st_mtime_ns
+    module, loaded = _MODULES.get(task.module, (None, None))
+    if module is None:
+        module = importlib.import_module(task.module)
+    elif loaded != mtime:
+        module = importlib.reload(module)
+    _MODULES[task.module] = (module, mtime)
+    return module
+
+
+def run_step(step, quiet=True, in_process=True):
+    """Apply one step; returns the script's output
+
+    In-process page runs change the working directory and stdout of the whole process, so
+    concurrent callers pass in_process=False to run every step in a child process instead:
+    the script itself, or `pipeline.py --apply` for a page function on selected pages.
+    """
+    task = step.task
+    if task.page is not None and in_process:
+        module = load_module(task)
+        pages = task.output_files() if step.pages is None else step.pages
+        output = io.StringIO()
+        with contextlib.chdir(BASE_DIR), contextlib.redirect_stdout(output if quiet else sys.stdout):
+            for page in pages:
+                if (BASE_DIR / page).exists():
+                    task.page(module, BASE_DIR / page)
+        return output.getvalue()
+    if task.page is not None and step.pages is not None:
+        command = [str(Path(__file__).resolve()), '--apply', task.name, *step.pages]
+    else:
+        command = [str(SCRIPTS_DIR / task.script)] + ([] if step.pages is None else list(step.pages))
+    result = subprocess.run([sys.executable, *command], cwd=BASE_DIR,
+                            capture_output=True, text=True, encoding='utf-8', errors='replace')
+    if result.returncode:
+        raise RuntimeError(f"{task.script} exited with {result.returncode}:\n{result.stderr.strip()}")
+    return result.stdout
+
+
+def main():
+    """List the tasks, plan a rebuild for the files given on the command line, or apply a page step"""
+    if sys.argv[1:2] == ['--apply']:
+        task = {task.name: task for task in TASKS}[sys.argv[2]]
+        run_step(Step(task, sys.argv[3:], ['--apply']), quiet=False)
+        return
+    changed = [Path(arg).resolve().relative_to(BASE_DIR).as_posix() for arg in sys.argv[1:]]
+    if not changed:
+        print("🧱 Pipeline tasks in build order")
+        print("=" * 60)
+        for task in order():
+            mode = 'per page' if task.page else 'script'
+            requires = f" after {', '.join(task.requires)}" if task.requires else ''
+            print(f"   {task.name:<22} {task.script} ({mode}){requires}")
+        return
+    print(f"🧭 Rebuild plan for {', '.join(changed)}")
+    print("=" * 60)
+    for step in plan(changed):
+        print(f"   {step.describe()}")
+
+
+if __name__ == '__main__':
+    main()
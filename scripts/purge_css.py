@@ -0,0 +1,387 @@
+"""
+Unused-CSS Purger
+- Collects what each page can match: the tags, classes and ids in its static
+  markup, plus every identifier in its inline scripts and in the local scripts
+  it loads (a conservative safelist for classes added at runtime; a
+  'prefix-${...}' template keeps every class starting with 'prefix-')
+- For every page class (config/page-classes.json) and every assets/css
+  stylesheet its pages link, drops the rules no page of the class can match
+  and writes the rest to assets/css/purged/<sheet>.<class>.<hash>.css
+- Rewrites each page's <link> to its class's purged copy; assets/css/*.css
+  stay the sources, so rerunning after editing a stylesheet or a page
+  rebuilds from them
+- Reports the bytes removed per stylesheet and class, and how much of the
+  pages' inline <style> blocks (the injected theme CSS) matches nothing
+
+Attribute selectors, pseudo-classes and at-rules other than @media/@supports
+are kept as written; @keyframes survive while a kept rule names them.
+
+Usage:
+    python scripts/purge_css.py                 # purge, fingerprint and rewire the pages
+    python scripts/purge_css.py --dry-run       # report only
+    python scripts/purge_css.py --check         # fail if a page does not load its current purged copy
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from collections import defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+
+from page_classes import page_class
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+CSS_DIR = BASE_DIR / 'assets' / 'css'
+PURGED_DIR = CSS_DIR / 'purged'
+PAGE_GLOBS = ('*.html', 'interview/*/*.html', 'recruiter/*.html')
+
+# A stylesheet link to a source sheet or to an earlier purged copy of it
+SHEET_LINK_RE = re.compile(
+    r'(<link\b[^>]*\bhref=")((?:\.\./)*)assets/css/(?:purged/)?([\w-]+?)(?:\.[\w-]+\.[0-9a-f]{10})?\.css(")')
+IDENT_RE = re.compile(r'-?[A-Za-z_][\w-]*')
+TEMPLATE_PREFIX_RE = re.compile(r'([A-Za-z_][\w-]*-)(?:\$\{|[\'"`]\s*\+)')
+ALWAYS_TAGS = {'html', 'body', 'head'}
+GROUPING_AT_RULES = ('@media', '@supports', '@layer', '@container', '@document')
+
+
+class PageMarkup(HTMLParser):
+    """Tags, classes and ids in a page's markup, its inline script text and its linked script paths"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags = set()
+        self.classes = set()
+        self.ids = set()
+        self.scripts = []
+        self.styles = []
+        self.sources = []
+        self.inside = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self.tags.add(tag)
+        self.classes.update((attrs.get('class') or '').split())
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        if tag == 'script':
+            if attrs.get('src'):
+                self.sources.append(attrs['src'])
+            else:
+                self.inside = 'script'
+        elif tag == 'style':
+            self.inside = 'style'
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self.inside = None
+
+    def handle_data(self, data):
+        if self.inside == 'script':
+            self.scripts.append(data)
+        elif self.inside == 'style':
+            self.styles.append(data)
+
+
+class Usage:
+    """What the pages of one class can match; script identifiers count as tags, classes and ids"""
+
+    def __init__(self):
+        self.tags = set(ALWAYS_TAGS)
+        self.classes = set()
+        self.ids = set()
+        self.script_names = set()
+        self.prefixes = set()
+
+    def add_markup(self, markup):
+        self.tags |= markup.tags
+        self.classes |= markup.classes
+        self.ids |= markup.ids
+
+    def add_script(self, text):
+        self.script_names.update(IDENT_RE.findall(text))
+        self.prefixes.update(TEMPLATE_PREFIX_RE.findall(text))
+
+    def has_class(self, name):
+        return (name in self.classes or name in self.script_names
+                or any(name.startswith(prefix) for prefix in self.prefixes))
+
+    def has_id(self, name):
+        return name in self.ids or name in self.script_names
+
+    def has_tag(self, name):
+        return name.lower() in self.tags or name in self.script_names
+
+
+def read_page(page):
+    markup = PageMarkup()
+    markup.feed(page.read_text(encoding='utf-8', errors='replace'))
+    markup.close()
+    return markup
+
+
+def local_script(page, src):
+    """The file a script src points at, when it is part of the site"""
+    if re.match(r'^(?:[a-z]+:)?//', src, re.I):
+        return None
+    path = (page.parent / src.split('?')[0].split('#')[0]).resolve()
+    try:
+        path.relative_to(BASE_DIR.resolve())
+    except ValueError:
+        return None
+    return path if path.is_file() else None
+
+
+def strip_comments(css):
+    return re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+
+
+def split_rules(css):
+    """Top-level (prelude, body) pairs of a stylesheet; body is None for statements like @import"""
+    items = []
+    i, n = 0, len(css)
+    while i < n:
+        j = i
+        quote = None
+        while j < n:
+            c = css[j]
+            if quote:
+                if c == '\\':
+                    j += 1
+                elif c == quote:
+                    quote = None
+            elif c in '"\'':
+                quote = c
+            elif c in '{;':
+                break
+            j += 1
+        prelude = css[i:j].strip()
+        if j >= n:
+            break
+        if css[j] == ';':
+            if prelude:
+                items.append((prelude, None))
+            i = j + 1
+            continue
+        depth, k = 0, j
+        while k < n:
+            c = css[k]
+            if quote:
+                if c == '\\':
+                    k += 1
+                elif c == quote:
+                    quote = None
+            elif c in '"\'':
+                quote = c
+            elif c == '{':
+                depth += 1
+            elif c == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            k += 1
+        items.append((prelude, css[j + 1:k].strip()))
+        i = k + 1
+    return items
+
+
+def split_selectors(prelude):
+    """A selector list split at its top-level commas"""
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(prelude):
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            parts.append(prelude[start:i].strip())
+            start = i + 1
+    parts.append(prelude[start:].strip())
+    return [part for part in parts if part]
+
+
+def selector_matches(selector, usage):
+    """False only when the selector needs a tag, class or id none of the class's pages can have"""
+    if usage is None:
+        return True
+    bare = re.sub(r'\[[^\]]*\]', '', selector)
+    bare = re.sub(r'::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?', '', bare)
+    if not all(usage.has_class(name) for name in re.findall(r'\.(-?[A-Za-z_][\w-]*)', bare)):
+        return False
+    if not all(usage.has_id(name) for name in re.findall(r'#(-?[A-Za-z_][\w-]*)', bare)):
+        return False
+    return all(usage.has_tag(name) for name in re.findall(r'(?:^|[\s>+~(])([A-Za-z][\w-]*)', bare))
+
+
+def purge(css, usage=None):
+    """The stylesheet without the rules the usage cannot match (all kept for None), one rule per line"""
+    kept = []
+    keyframes = []
+    for prelude, body in split_rules(strip_comments(css)):
+        if body is None:
+            kept.append(f'{prelude};')
+        elif prelude.startswith('@'):
+            if prelude.lower().startswith(GROUPING_AT_RULES):
+                inner = purge(body, usage)
+                if inner:
+                    kept.append(f'{prelude} {{\n{inner}\n}}')
+            elif re.match(r'@(?:-[a-z]+-)?keyframes\b', prelude, re.I):
+                keyframes.append((prelude.split()[-1], f'{prelude} {{{body}}}'))
+            else:
+                kept.append(f'{prelude} {{{body}}}')
+        else:
+            selectors = [s for s in split_selectors(prelude) if selector_matches(s, usage)]
+            if selectors:
+                kept.append(f"{', '.join(selectors)} {{{body}}}")
+    text = '\n'.join(kept)
+    for name, rule in keyframes:
+        if re.search(rf'(?<![\w-]){re.escape(name)}(?![\w-])', text):
+            kept.append(rule)
+    return '\n'.join(kept)
+
+
+def site_pages():
+    pages = set()
+    for pattern in PAGE_GLOBS:
+        pages.update(path for path in BASE_DIR.glob(pattern) if path.is_file())
+    return sorted(pages)
+
+
+def collect(pages=None):
+    """(usage per class, {(class, sheet): [pages]}, inline style text per class)"""
+    usage = defaultdict(Usage)
+    links = defaultdict(list)
+    inline = defaultdict(list)
+    script_cache = {}
+    for page in site_pages() if pages is None else pages:
+        cls = page_class(page)
+        if cls is None:
+            continue
+        name = cls['name']
+        content = page.read_text(encoding='utf-8', errors='replace')
+        markup = read_page(page)
+        usage[name].add_markup(markup)
+        for text in markup.scripts:
+            usage[name].add_script(text)
+        for src in markup.sources:
+            path = local_script(page, src)
+            if path is not None:
+                if path not in script_cache:
+                    script_cache[path] = path.read_text(encoding='utf-8', errors='replace')
+                usage[name].add_script(script_cache[path])
+        inline[name].extend(markup.styles)
+        for match in SHEET_LINK_RE.finditer(content):
+            if (CSS_DIR / f'{match.group(3)}.css').is_file():
+                links[(name, match.group(3))].append(page)
+    return usage, links, inline
+
+
+def purged_name(sheet, cls, data):
+    return f"{sheet}.{cls}.{hashlib.sha256(data).hexdigest()[:10]}.css"
+
+
+def build(usage, links):
+    """{(class, sheet): (purged file name, purged bytes, source bytes)}"""
+    builds = {}
+    for (cls, sheet) in sorted(links):
+        source = (CSS_DIR / f'{sheet}.css').read_text(encoding='utf-8')
+        data = (purge(source, usage[cls]) + '\n').encode('utf-8')
+        builds[(cls, sheet)] = (purged_name(sheet, cls, data), data, len(source.encode('utf-8')))
+    return builds
+
+
+def rewrite_page(page, names, dry_run=False):
+    """Point the page's stylesheet links at its class's purged copies; returns True if it changed"""
+    content = page.read_text(encoding='utf-8')
+
+    def relink(match):
+        name = names.get(match.group(3))
+        if name is None:
+            return match.group(0)
+        return f'{match.group(1)}{match.group(2)}assets/css/purged/{name}{match.group(4)}'
+
+    new_content = SHEET_LINK_RE.sub(relink, content)
+    if new_content == content:
+        return False
+    if not dry_run:
+        page.write_text(new_content, encoding='utf-8')
+    return True
+
+
+def rebuild(dry_run=False):
+    """Write the purged copies for the pages as they are now and rewire them; returns the pages changed"""
+    usage, links, inline = collect()
+    builds = build(usage, links)
+    names = defaultdict(dict)
+    for (cls, sheet), (name, _, _) in builds.items():
+        names[cls][sheet] = name
+
+    if not dry_run:
+        PURGED_DIR.mkdir(parents=True, exist_ok=True)
+        wanted = {name for name, _, _ in builds.values()}
+        for old in PURGED_DIR.glob('*.css'):
+            if old.name not in wanted:
+                old.unlink()
+        for name, data, _ in builds.values():
+            target = PURGED_DIR / name
+            if not target.exists():
+                target.write_bytes(data)
+
+    print("✂️  Purged stylesheets per page class (source -> purged bytes)")
+    print("=" * 60)
+    before = after = 0
+    for (cls, sheet), (name, data, source_bytes) in builds.items():
+        pages = links[(cls, sheet)]
+        before += source_bytes * len(pages)
+        after += len(data) * len(pages)
+        print(f"   {cls:<14} {sheet + '.css':<26} {source_bytes:>7,} -> {len(data):>7,} "
+              f"(-{100 - 100 * len(data) // max(source_bytes, 1)}%) on {len(pages)} page(s)")
+
+    print("\n🧵 Inline <style> blocks matching nothing (not rewritten)")
+    print("=" * 60)
+    for cls, styles in sorted(inline.items()):
+        total = sum(len(purge(text).encode('utf-8')) for text in styles)
+        unused = total - sum(len(purge(text, usage[cls]).encode('utf-8')) for text in styles)
+        if total:
+            print(f"   {cls:<14} {unused:>9,} of {total:>9,} bytes across the class's pages")
+
+    changed = [page for page in sorted({page for pages in links.values() for page in pages})
+               if rewrite_page(page, names[page_class(page)['name']], dry_run)]
+    print("=" * 60)
+    print(f"📦 {len(builds)} purged stylesheet(s); {before:,} -> {after:,} bytes of linked CSS over all page "
+          f"loads (-{before - after:,}); {len(changed)} page(s) rewired" + (' (dry run)' if dry_run else ''))
+    return changed
+
+
+def main():
+    """Purge the linked stylesheets per page class and rewire the pages"""
+    parser = argparse.ArgumentParser(description='Emit purged, fingerprinted stylesheets per page class')
+    parser.add_argument('--dry-run', action='store_true', help='report without writing')
+    parser.add_argument('--check', action='store_true', help='fail if any page is not on its current purged copy')
+    args = parser.parse_args()
+
+    if args.check:
+        usage, links, _ = collect()
+        names = defaultdict(dict)
+        for (cls, sheet), (name, _, _) in build(usage, links).items():
+            names[cls][sheet] = name
+        stale = []
+        for (cls, sheet), pages in sorted(links.items()):
+            name = names[cls][sheet]
+            if not (PURGED_DIR / name).exists():
+                stale.append(f'assets/css/purged/{name} is missing')
+            stale += [f'{page.relative_to(BASE_DIR).as_posix()} does not load {name}' for page in pages
+                      if f'assets/css/purged/{name}"' not in page.read_text(encoding='utf-8')]
+        for problem in stale:
+            print(f"❌ {problem}")
+        if stale:
+            sys.exit(1)
+        print(f"✅ {sum(map(len, links.values()))} stylesheet link(s) load their current purged copy")
+        return
+    rebuild(args.dry_run)
+
+
+if __name__ == '__main__':
+    main()
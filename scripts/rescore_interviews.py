@@ -0,0 +1,218 @@
+"""
+Batch Recompute Interview Stars and Grades
+- Streams a Realtime Database JSON export (plain or .gz) record by record
+- Re-applies calculateStars() and calculateGrade() from
+  assets/js/interview-postprocess.js, vectorized with NumPy over batches
+- Writes only the records whose stars or grade change, as multi-path update
+  patch files usable with `firebase database:update / patch-0001.json`
+
+Memory is bounded by --batch-size records, independent of the export size.
+
+Usage:
+    python scripts/rescore_interviews.py export.json.gz --out rescore-patches
+    python scripts/rescore_interviews.py export.json --path 'interviews/*/*' --dry-run
+"""
+
+import argparse
+import json
+import math
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+from export_stream import iter_records, record_path
+
+# Emotion component of calculateStars(); anything else scores 0.5
+EMOTION_SCORES = {
+    'confident': 1.0,
+    'happy': 0.9,
+    'neutral': 0.6,
+    'surprised': 0.5,
+    'nervous': 0.3,
+    'sad': 0.2,
+}
+DEFAULT_EMOTION_SCORE = 0.5
+# Object.prototype members that `emotionMap[emotion]` finds in JS (score becomes NaN)
+PROTOTYPE_KEYS = ('constructor', '__proto__')
+
+# (minimum composite, stars); below the last threshold is still 1 star
+STAR_THRESHOLDS = [(0.90, 5), (0.80, 4), (0.65, 3), (0.50, 2), (0.30, 1)]
+MIN_STARS = 1
+
+# (minimum percentage, grade)
+GRADE_THRESHOLDS = [(95, 'A+'), (90, 'A'), (80, 'B'), (70, 'C'), (60, 'D')]
+FAIL_GRADE = 'F'
+
+
+def js_truthy(value):
+    """JavaScript truthiness of a decoded JSON value"""
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return bool(value) or isinstance(value, (dict, list))
+
+
+def js_number(value):
+    """`value || 0` followed by arithmetic coercion, as a float (NaN if not numeric)"""
+    if not js_truthy(value):
+        return 0.0
+    if isinstance(value, bool):
+        return 1.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip() or 0)
+        except ValueError:
+            return math.nan
+    return math.nan
+
+
+def emotion_score(value):
+    """Emotion component; a non-string truthy emotion makes the JS throw (None)"""
+    if not js_truthy(value):
+        value = 'neutral'
+    if not isinstance(value, str):
+        return None
+    if value.lower() in PROTOTYPE_KEYS:
+        return math.nan
+    return EMOTION_SCORES.get(value.lower(), DEFAULT_EMOTION_SCORE)
+
+
+class ScoreBatch:
+    """Columnar inputs of calculateStars()/calculateGrade() for a batch of records"""
+
+    def __init__(self, records):
+        self.base = np.array([js_number(r.get('overallScore')) for r in records])
+        self.wpm = np.array([js_number(r.get('avgWPM')) for r in records])
+        emotions = [emotion_score(r.get('dominantEmotion')) for r in records]
+        self.errors = np.array([e is None for e in emotions], dtype=bool)
+        self.emotion = np.array([DEFAULT_EMOTION_SCORE if e is None else e for e in emotions])
+        self.completed = np.array([js_truthy(r.get('completed')) for r in records], dtype=bool)
+
+
+def wpm_scores(wpm):
+    """Pacing component of calculateStars()"""
+    return np.select(
+        [
+            (wpm >= 120) & (wpm <= 160),
+            (wpm >= 100) & (wpm < 120),
+            (wpm > 160) & (wpm <= 180),
+            (wpm >= 80) & (wpm < 100),
+            (wpm > 180) & (wpm <= 200),
+            (wpm < 80) | (wpm > 200),
+        ],
+        [1.0, 0.7, 0.7, 0.4, 0.4, 0.2],
+        default=0.0,      # NaN matches no branch and keeps the initial 0
+    )
+
+
+def calculate_stars(batch):
+    """Vectorized calculateStars(): int array of 1-5 stars"""
+    bonus = np.where(batch.completed, 0.2, 0.0)
+    # Same operation order as the JS so threshold ties round identically
+    composite = batch.base * 0.5 + wpm_scores(batch.wpm) * 0.2 + batch.emotion * 0.2 + bonus
+    stars = np.select([composite >= t for t, _ in STAR_THRESHOLDS], [s for _, s in STAR_THRESHOLDS],
+                      default=MIN_STARS)
+    stars[batch.errors] = MIN_STARS      # JS catch block returns 1 star
+    return stars
+
+
+def calculate_grades(batch):
+    """Vectorized calculateGrade(overallScore || 0): object array of grade letters"""
+    percentage = batch.base * 100
+    return np.select([percentage >= t for t, _ in GRADE_THRESHOLDS],
+                     np.array([g for _, g in GRADE_THRESHOLDS], dtype=object), default=FAIL_GRADE)
+
+
+class PatchWriter:
+    """Multi-path update JSON files of at most `limit` paths each"""
+
+    def __init__(self, out_dir, limit, dry_run=False):
+        self.out_dir = out_dir
+        self.limit = limit
+        self.dry_run = dry_run
+        self.files = 0
+        self.count = 0
+        self.fp = None
+
+    def add(self, path, value):
+        if self.dry_run:
+            return
+        if self.fp is None or self.count == self.limit:
+            self.close()
+            self.files += 1
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            self.fp = open(self.out_dir / f'patch-{self.files:04d}.json', 'w', encoding='utf-8')
+            self.fp.write('{')
+            self.count = 0
+        self.fp.write((',\n' if self.count else '\n') + json.dumps(path) + ': ' + json.dumps(value))
+        self.count += 1
+
+    def close(self):
+        if self.fp is not None:
+            self.fp.write('\n}\n')
+            self.fp.close()
+            self.fp = None
+
+
+def rescore(records, pattern, writer, stats):
+    """Score one batch of (keys, record) pairs and emit patches for changed records"""
+    records = [(keys, r) for keys, r in records if isinstance(r, dict)]
+    if not records:
+        return
+    batch = ScoreBatch([r for _, r in records])
+    stars = calculate_stars(batch)
+    grades = calculate_grades(batch)
+    for (keys, record), new_stars, new_grade in zip(records, stars.tolist(), grades.tolist()):
+        stats['records'] += 1
+        stats[f'stars:{new_stars}'] += 1
+        path = record_path(pattern, keys)
+        changed = False
+        if record.get('stars') != new_stars:
+            writer.add(f'{path}/stars', new_stars)
+            changed = True
+        if record.get('grade') != new_grade:
+            writer.add(f'{path}/grade', new_grade)
+            changed = True
+        stats['changed'] += changed
+
+
+def main():
+    """Stream interview records from an export and write star/grade patches"""
+    parser = argparse.ArgumentParser(description='Recompute interview stars and grades from an export')
+    parser.add_argument('export', help='Realtime Database export (.json or .json.gz)')
+    parser.add_argument('--path', default='interviews/*/*', help="record pattern (default 'interviews/*/*')")
+    parser.add_argument('--out', type=Path, default=Path('rescore-patches'), help='patch output directory')
+    parser.add_argument('--batch-size', type=int, default=50000)
+    parser.add_argument('--paths-per-file', type=int, default=100000)
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing patches')
+    args = parser.parse_args()
+
+    writer = PatchWriter(args.out, args.paths_per_file, args.dry_run)
+    stats = Counter()
+    pending = []
+    print(f"⭐ Rescoring {args.path} from {args.export}")
+    print("=" * 60)
+    try:
+        for item in iter_records(args.export, args.path):
+            pending.append(item)
+            if len(pending) == args.batch_size:
+                rescore(pending, args.path, writer, stats)
+                pending = []
+                print(f"   {stats['records']:,} records, {stats['changed']:,} changed")
+        rescore(pending, args.path, writer, stats)
+    finally:
+        writer.close()
+
+    print("=" * 60)
+    print(f"✅ Records: {stats['records']:,}")
+    print(f"✏️  Changed: {stats['changed']:,}")
+    for s in range(5, 0, -1):
+        print(f"   {'★' * s:<5} {stats[f'stars:{s}']:,}")
+    if not args.dry_run:
+        print(f"💾 {writer.files} patch file(s) in {args.out}")
+
+
+if __name__ == '__main__':
+    main()
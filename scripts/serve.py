@@ -0,0 +1,255 @@
+"""
+Local Development Server
+- Threaded replacement for `python -m http.server`: one thread per connection,
+  HTTP/1.1 keep-alive, so a page and its ~20 subresources load in parallel
+- Keeps file bodies in an in-memory LRU cache keyed by path and validated by
+  mtime and size, so unchanged files are never re-read; each entry carries a
+  content-hash ETag
+- Answers If-None-Match / If-Modified-Since with 304, sends Cache-Control like
+  production (fingerprinted files are immutable, everything else revalidates)
+- Serves a precompressed `<file>.gz` sibling to clients that accept gzip
+- --pipeline: before serving a page, applies the pipeline steps for any source
+  that changed since the last request (see scripts/pipeline.py)
+
+Usage:
+    python scripts/serve.py                     # http://localhost:8080
+    python scripts/serve.py --port 5000 --pipeline
+    python scripts/serve.py --cache-mb 128 --quiet
+"""
+
+import argparse
+import email.utils
+import hashlib
+import mimetypes
+import posixpath
+import re
+import threading
+import urllib.parse
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from watch import PollingWatcher, Watch
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+PORT = 8080
+CACHE_MB = 64
+
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{10}\.[a-z0-9]+$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+TYPES = {'.js': 'text/javascript', '.mjs': 'text/javascript', '.json': 'application/json', '.wasm': 'application/wasm',
+         '.svg': 'image/svg+xml', '.webp': 'image/webp', '.woff2': 'font/woff2', '.glb': 'model/gltf-binary'}
+
+
+class Entry:
+    """A cached file body with the stat it was read at"""
+    __slots__ = ('stamp', 'body', 'etag', 'modified')
+
+    def __init__(self, stamp, body, mtime):
+        self.stamp = stamp
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        self.modified = email.utils.formatdate(mtime, usegmt=True)
+
+
+class FileCache:
+    """LRU cache of file bodies bounded by total bytes; entries are checked against the file's stat"""
+
+    def __init__(self, max_bytes=CACHE_MB * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, path):
+        """The Entry for a file, or None when it does not exist"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return entry
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return None
+        entry = Entry(stamp, body, stat.st_mtime)
+        with self.lock:
+            self.misses += 1
+            old = self.entries.pop(path, None)
+            if old is not None:
+                self.bytes -= len(old.body)
+            if len(body) <= self.max_bytes:
+                self.entries[path] = entry
+                self.bytes += len(body)
+                while self.bytes > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.bytes -= len(evicted.body)
+        return entry
+
+
+class PipelineHook:
+    """Applies the pipeline for sources changed since the previous page request"""
+
+    def __init__(self):
+        # Steps run in child processes: request threads share this process's cwd and stdout
+        self.watch = Watch(PollingWatcher(BASE_DIR), in_process=False)
+        self.lock = threading.Lock()
+
+    def refresh(self):
+        with self.lock:
+            changed = self.watch.relevant(self.watch.watcher.changes(0))
+            if changed:
+                print(f"✏️  {', '.join(sorted(changed))}")
+                self.watch.rebuild(changed)
+
+
+def accepts_gzip(header):
+    for part in (header or '').split(','):
+        coding, _, params = part.strip().partition(';')
+        if coding.strip().lower() in ('gzip', '*'):
+            return params.replace(' ', '').lower() not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+def not_modified(headers, entry):
+    tags = headers.get('If-None-Match')
+    if tags is not None:
+        return tags.strip() == '*' or entry.etag in [t.strip().removeprefix('W/') for t in tags.split(',')]
+    since = headers.get('If-Modified-Since')
+    if since:
+        try:
+            return email.utils.parsedate_to_datetime(since) >= email.utils.parsedate_to_datetime(entry.modified)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class DevRequestHandler(BaseHTTPRequestHandler):
+    """GET/HEAD of files under the site root from the shared cache"""
+    protocol_version = 'HTTP/1.1'
+    server_version = 'SmartMockDev/1.0'
+    cache = None
+    pipeline = None
+    quiet = False
+
+    def resolve(self):
+        """File path for the request URL, or None when it is outside the root or missing"""
+        url_path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        parts = [p for p in posixpath.normpath(url_path).split('/') if p not in ('', '.', '..')]
+        path = BASE_DIR.joinpath(*parts)
+        if path.is_dir():
+            if not url_path.endswith('/'):
+                return 'redirect'
+            path = path / 'index.html'
+        return path if path.is_file() else None
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        path = self.resolve()
+        if path == 'redirect':
+            parts = urllib.parse.urlsplit(self.path)
+            self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+            self.send_header('Location', urllib.parse.urlunsplit(parts._replace(path=parts.path + '/')))
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if path is not None and self.pipeline is not None and path.suffix == '.html':
+            self.pipeline.refresh()
+        entry = self.cache.get(path) if path is not None else None
+        if entry is None:
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return
+
+        encoding = None
+        if accepts_gzip(self.headers.get('Accept-Encoding')):
+            compressed = self.cache.get(path.with_name(path.name + '.gz'))
+            if compressed is not None and compressed.stamp[0] >= entry.stamp[0]:
+                entry, encoding = compressed, 'gzip'
+
+        cache_control = IMMUTABLE if FINGERPRINTED.search(path.name) else REVALIDATE
+        if not_modified(self.headers, entry):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_common(entry, cache_control)
+            self.end_headers()
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_common(entry, cache_control)
+        self.send_header('Content-Type', content_type(path))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(entry.body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(entry.body)
+
+    def send_common(self, entry, cache_control):
+        self.send_header('ETag', entry.etag)
+        self.send_header('Last-Modified', entry.modified)
+        self.send_header('Cache-Control', cache_control)
+        self.send_header('Vary', 'Accept-Encoding')
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def content_type(path):
+    kind = TYPES.get(path.suffix.lower()) or mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+    if kind.startswith('text/') or kind in ('application/json', 'image/svg+xml'):
+        kind += '; charset=utf-8'
+    return kind
+
+
+def make_server(host='127.0.0.1', port=PORT, cache_mb=CACHE_MB, pipeline=False, quiet=False):
+    """A ThreadingHTTPServer with its own cache (and pipeline hook when requested)"""
+    handler = type('Handler', (DevRequestHandler,), {
+        'cache': FileCache(cache_mb * 1024 * 1024),
+        'pipeline': PipelineHook() if pipeline else None,
+        'quiet': quiet,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    """Serve the site for local development"""
+    parser = argparse.ArgumentParser(description='Threaded dev server with caching, ETags and .gz siblings')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--host', default='127.0.0.1', help='interface to bind (0.0.0.0 for the LAN)')
+    parser.add_argument('--cache-mb', type=int, default=CACHE_MB, help='in-memory cache size')
+    parser.add_argument('--pipeline', action='store_true', help='rebuild changed sources before serving pages')
+    parser.add_argument('--quiet', action='store_true', help='do not log requests')
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.cache_mb, args.pipeline, args.quiet)
+    print(f"🚀 Serving {BASE_DIR} at http://{args.host}:{args.port}/")
+    print(f"   {args.cache_mb} MB cache" + (', pipeline on' if args.pipeline else '') + '; Ctrl+C to stop')
+    print("=" * 60)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        cache = server.RequestHandlerClass.cache
+        print(f"\n👋 Stopped ({cache.hits:,} cache hits, {cache.misses:,} reads)")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
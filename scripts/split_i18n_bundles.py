@@ -0,0 +1,264 @@
+"""
+Per-Locale Translation Bundles
+- Extracts the string tables SmartMockI18n.loadTranslations() embeds in
+  assets/js/i18n-accessibility.js into config/i18n/<locale>.json
+- Checks every locale's keys against English: missing keys (the page falls back
+  to English for them) and keys English does not have (never looked up)
+- Writes content-fingerprinted bundles assets/i18n/<locale>.<hash>.json and
+  replaces loadTranslations() with a small loader: English stays inline as the
+  fallback, the detected (or selected) locale is fetched on demand
+- Prints a size report: bytes per page that loads the script, before and after,
+  for an English visitor and for each fetched locale
+
+After --extract, config/i18n/*.json is the place to edit translations; re-run
+the script to rebuild the bundles and the loader.
+
+Usage:
+    python scripts/split_i18n_bundles.py --extract     # tables in the script -> config/i18n, then build
+    python scripts/split_i18n_bundles.py               # rebuild after editing config/i18n/*.json
+    python scripts/split_i18n_bundles.py --check       # fail if bundles or the loader are stale
+    python scripts/split_i18n_bundles.py --strict      # fail on keys missing from a locale
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from js_literal import JsLiteralError, literal_after, parse_value
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+SCRIPT_PATH = BASE_DIR / 'assets' / 'js' / 'i18n-accessibility.js'
+CONFIG_DIR = BASE_DIR / 'config' / 'i18n'
+BUNDLE_DIR = BASE_DIR / 'assets' / 'i18n'
+BASE_LOCALE = 'en'
+
+START_MARKER = '// <i18n-bundles>'
+END_MARKER = '// </i18n-bundles>'
+# The generated loader, or (first run) the original method with its doc comment
+GENERATED_RE = re.compile(rf'^[ \t]*{re.escape(START_MARKER)}.*?{re.escape(END_MARKER)}[ \t]*\n', re.DOTALL | re.MULTILINE)
+METHOD_START_RE = re.compile(r'^[ \t]*/\*\*\s*\*\s*Load translations\s*\*/\s*\n[ \t]*loadTranslations\(\) \{', re.MULTILINE)
+METHOD_END_RE = re.compile(r'\s*;\s*\},[ \t]*\n')
+SUPPORTED_RE = re.compile(r'supportedLanguages:\s*(\[[^\]]*\])')
+
+LOADER_TEMPLATE = """\
+    {start} generated by scripts/split_i18n_bundles.py from config/i18n/*.json
+    /**
+     * Load translations: English is inline, other locales are fetched once on demand
+     */
+    loadTranslations(language = this.currentLanguage) {{
+      const bundles = {bundles};
+      if (!this.translations.{base}) {{
+        this.translations.{base} = {base_table};
+      }}
+      if (this.translations[language] || !bundles[language]) {{
+        return Promise.resolve(this.translations[language] || this.translations.{base});
+      }}
+      this.pendingBundles = this.pendingBundles || {{}};
+      if (!this.pendingBundles[language]) {{
+        const script = document.querySelector('script[src*="i18n-accessibility"]');
+        const url = new URL(`../i18n/${{bundles[language]}}`, script ? script.src : location.href);
+        this.pendingBundles[language] = fetch(url)
+          .then(response => (response.ok ? response.json() : Promise.reject(new Error(response.status))))
+          .then(table => {{
+            this.translations[language] = table;
+            if (language === this.currentLanguage) this.updatePageContent();
+            return table;
+          }})
+          .catch(error => {{
+            console.warn(`Translations for ${{language}} unavailable, using English:`, error);
+            delete this.pendingBundles[language];
+            return this.translations.{base};
+          }});
+      }}
+      return this.pendingBundles[language];
+    }},
+    {end}
+"""
+
+
+def find_loader(source):
+    """(start, end) of the generated loader, or of the original inline loadTranslations() method"""
+    match = GENERATED_RE.search(source)
+    if match:
+        return match.start(), match.end()
+    match = METHOD_START_RE.search(source)
+    if not match:
+        raise JsLiteralError('loadTranslations() not found')
+    _, end = parse_value(source, literal_start(source, match.end()))
+    tail = METHOD_END_RE.match(source, end)
+    if not tail:
+        raise JsLiteralError('loadTranslations() does more than assign the tables')
+    return match.start(), tail.end()
+
+
+def literal_start(source, i):
+    marker = 'this.translations ='
+    start = source.find(marker, i)
+    if start < 0 or source[i:start].strip():
+        raise JsLiteralError('loadTranslations() does not start by assigning this.translations')
+    return start + len(marker)
+
+
+def extract_tables(source):
+    """{locale: {key: text}} of the inline loadTranslations() tables"""
+    if GENERATED_RE.search(source):
+        raise JsLiteralError('the script already has the generated loader; edit config/i18n/*.json instead')
+    start, _ = find_loader(source)
+    return literal_after(source[start:], 'this.translations =')
+
+
+def supported_languages(source):
+    match = SUPPORTED_RE.search(source)
+    return parse_value(match.group(1))[0] if match else []
+
+
+def load_tables():
+    return {path.stem: json.loads(path.read_text(encoding='utf-8')) for path in sorted(CONFIG_DIR.glob('*.json'))}
+
+
+def write_tables(tables):
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    for locale, table in tables.items():
+        (CONFIG_DIR / f'{locale}.json').write_text(json.dumps(table, ensure_ascii=False, indent=2) + '\n',
+                                                   encoding='utf-8')
+
+
+def completeness(tables, base=BASE_LOCALE):
+    """{locale: (missing keys, extra keys)} compared with the base locale"""
+    reference = tables[base]
+    return {locale: ([k for k in reference if k not in table], [k for k in table if k not in reference])
+            for locale, table in tables.items() if locale != base}
+
+
+def bundle_payload(table):
+    return json.dumps(table, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def bundle_names(tables, base=BASE_LOCALE):
+    """{locale: fingerprinted file name} of every locale except the inline base"""
+    return {locale: f"{locale}.{hashlib.sha256(bundle_payload(table)).hexdigest()[:10]}.json"
+            for locale, table in sorted(tables.items()) if locale != base}
+
+
+def js_object(value, indent):
+    """A JS object literal with single-quoted strings, indented to sit inside the script"""
+    lines = json.dumps(value, ensure_ascii=False, indent=2).splitlines()
+    lines = [re.sub(r'^(\s*)"([A-Za-z_$][\w$]*)":', r'\1\2:', line) for line in lines]
+    lines = [re.sub(r'^(\s*[\w$]+: )"([^"\\\']*)"(,?)$', r"\1'\2'\3", line) for line in lines]
+    return ('\n' + ' ' * indent).join(lines)
+
+
+def render_loader(tables, names, base=BASE_LOCALE):
+    return LOADER_TEMPLATE.format(
+        start=START_MARKER, end=END_MARKER, base=base,
+        bundles='{ ' + ', '.join(f"{locale}: '{name}'" for locale, name in names.items()) + ' }',
+        base_table=js_object(tables[base], 8),
+    )
+
+
+def build_script(source, tables, names):
+    start, end = find_loader(source)
+    return source[:start] + render_loader(tables, names) + source[end:]
+
+
+def sizes(data):
+    return len(data), len(gzip.compress(data, mtime=0))
+
+
+def script_pages():
+    """Served pages that load the script"""
+    pages = []
+    for page in sorted(BASE_DIR.rglob('*.html')):
+        rel = page.relative_to(BASE_DIR)
+        if rel.parts[0] in ('node_modules', 'archived_docs', 'functions'):
+            continue
+        if 'assets/js/i18n-accessibility.js' in page.read_text(encoding='utf-8', errors='ignore'):
+            pages.append(page)
+    return pages
+
+
+def main():
+    """Split the translation tables into per-locale bundles and generate the loader"""
+    parser = argparse.ArgumentParser(description='Split i18n-accessibility.js translations into per-locale bundles')
+    parser.add_argument('--extract', action='store_true', help='move the inline tables to config/i18n first')
+    parser.add_argument('--check', action='store_true', help='fail if the bundles or the loader are stale')
+    parser.add_argument('--strict', action='store_true', help='fail when a locale misses English keys')
+    parser.add_argument('--dry-run', action='store_true', help='report without writing')
+    args = parser.parse_args()
+
+    source = SCRIPT_PATH.read_text(encoding='utf-8')
+    before = source.encode('utf-8')
+    try:
+        if args.extract:
+            tables = extract_tables(source)
+            print(f"🌐 Extracted {len(tables)} locale table(s) from {SCRIPT_PATH.name}")
+            if not args.dry_run:
+                write_tables(tables)
+        else:
+            tables = load_tables()
+            if not tables:
+                parser.error('config/i18n is empty; run with --extract')
+        if BASE_LOCALE not in tables:
+            parser.error(f'no {BASE_LOCALE} table to check the other locales against')
+        names = bundle_names(tables)
+        new_source = build_script(source, tables, names)
+    except JsLiteralError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print("\n🔑 Key completeness against English")
+    print("=" * 60)
+    incomplete = 0
+    for locale, (missing, extra) in completeness(tables).items():
+        covered = len(tables[BASE_LOCALE]) - len(missing)
+        status = '✅' if not missing else '⚠️ '
+        print(f"{status} {locale}: {covered}/{len(tables[BASE_LOCALE])} keys"
+              + (f", missing: {', '.join(missing)}" if missing else '')
+              + (f", not in English: {', '.join(extra)}" if extra else ''))
+        incomplete += bool(missing)
+    unsupported = [code for code in supported_languages(source) if code not in tables]
+    if unsupported:
+        print(f"⚠️  supportedLanguages without a table (English is shown): {', '.join(unsupported)}")
+
+    if args.check:
+        stale = new_source != source or any(not (BUNDLE_DIR / name).exists() for name in names.values())
+        print("=" * 60)
+        print(f"❌ {SCRIPT_PATH.name} or assets/i18n is stale" if stale else "✅ Bundles and loader are current")
+        sys.exit(1 if stale or (args.strict and incomplete) else 0)
+
+    if not args.dry_run:
+        BUNDLE_DIR.mkdir(parents=True, exist_ok=True)
+        for old in BUNDLE_DIR.glob('*.json'):
+            if old.name not in names.values():
+                old.unlink()
+        for locale, name in names.items():
+            (BUNDLE_DIR / name).write_bytes(bundle_payload(tables[locale]))
+        SCRIPT_PATH.write_text(new_source, encoding='utf-8')
+
+    after = new_source.encode('utf-8')
+    before_raw, before_gz = sizes(before)
+    after_raw, after_gz = sizes(after)
+    print("\n📏 Size report per page (raw / gzip bytes)")
+    print("=" * 60)
+    for page in script_pages():
+        print(f"   {page.relative_to(BASE_DIR).as_posix()}: {before_raw:,} / {before_gz:,} -> "
+              f"{after_raw:,} / {after_gz:,} (saves {before_raw - after_raw:,} / {before_gz - after_gz:,})")
+    for locale in names:
+        raw, gz = sizes(bundle_payload(tables[locale]))
+        print(f"   + {locale} bundle for {locale} visitors: {raw:,} / {gz:,} "
+              f"(net saving {before_raw - after_raw - raw:,} / {before_gz - after_gz - gz:,})")
+
+    print("=" * 60)
+    print(f"📦 {len(names)} locale bundle(s) in assets/i18n, {SCRIPT_PATH.name} {after_raw:,} bytes"
+          + (' (dry run)' if args.dry_run else ''))
+    if args.strict and incomplete:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
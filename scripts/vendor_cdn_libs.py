@@ -0,0 +1,337 @@
+"""
+Vendor CDN Libraries Into assets/vendor/ With SRI
+- Installs three.js, the firebase compat SDKs and MediaPipe FaceMesh from a
+  local offline cache directory (no network access needed)
+- Copies each library to a content-fingerprinted file name, so every page that
+  loads the same library shares one cached same-origin URL
+- Computes sha384 Subresource Integrity hashes
+- Rewrites every matching <script src="https://..."> tag (and the FaceMesh
+  locateFile base URL) to the vendored copy with an integrity attribute, and
+  likewise the data-<name>-src / data-<name>-integrity pairs of libraries
+  loaded lazily by script (e.g. three.js for the background robot)
+- Re-runs move pages to new fingerprints (script tags and asset bases);
+  --verify also fails on pages that reference missing vendored files
+
+The libraries and the CDN URLs they replace are declared in
+config/vendor-libs.json. The cache directory mirrors each library's "file"
+path, e.g. <cache>/three.js/r128/three.min.js.
+
+Usage:
+    python scripts/vendor_cdn_libs.py --cache /path/to/vendor-cache
+    python scripts/vendor_cdn_libs.py --cache /path/to/vendor-cache --dry-run
+    python scripts/vendor_cdn_libs.py --verify
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+CONFIG_PATH = BASE_DIR / 'config' / 'vendor-libs.json'
+MANIFEST_NAME = 'manifest.json'
+
+# Directories that never contain pages we serve
+SKIP_DIRS = {'.git', 'node_modules', 'archived_docs', 'vendor', '__pycache__'}
+
+SCRIPT_TAG_RE = re.compile(r'<script\b[^>]*>', re.IGNORECASE)
+SRC_ATTR_RE = re.compile(r'\ssrc=(["\'])(.*?)\1', re.IGNORECASE)
+INTEGRITY_ATTR_RE = re.compile(r'\sintegrity=(["\']).*?\1', re.IGNORECASE)
+VENDOR_ATTR_RE = re.compile(r'\sdata-vendor=(["\'])(.*?)\1', re.IGNORECASE)
+LAZY_SRC_RE = re.compile(r'\sdata-([\w-]+)-src=(["\'])(.*?)\2(?:\sdata-\1-integrity=(["\']).*?\4)?')
+
+
+def sri_hash(data):
+    """Return the sha384 Subresource Integrity value for a byte string"""
+    digest = hashlib.sha384(data).digest()
+    return 'sha384-' + base64.b64encode(digest).decode('ascii')
+
+
+def fingerprint(data):
+    """Short content hash used in vendored file names"""
+    return hashlib.sha256(data).hexdigest()[:10]
+
+
+def load_config(path):
+    """Load and sanity-check the vendor library declarations"""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    for lib in config.get('libraries', []):
+        for key in ('name', 'version', 'file', 'urls'):
+            if key not in lib:
+                raise ValueError(f"Library entry {lib!r} is missing '{key}'")
+    return config
+
+
+def load_manifest(vendor_dir):
+    """Load the manifest written by a previous run (empty if none)"""
+    manifest_path = vendor_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {'libraries': []}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def hash_directory(directory):
+    """Fingerprint a directory by its relative file names and contents"""
+    h = hashlib.sha256()
+    for path in sorted(p for p in directory.rglob('*') if p.is_file()):
+        h.update(path.relative_to(directory).as_posix().encode('utf-8'))
+        h.update(b'\0')
+        h.update(path.read_bytes())
+    return h.hexdigest()[:10]
+
+
+def install_library(lib, cache_dir, vendor_dir, installed, dry_run=False):
+    """Copy one library from the cache into the vendor directory.
+
+    Libraries with byte-identical content resolve to the same vendored file,
+    so `installed` maps content fingerprints to already written paths.
+    Returns the manifest entry, or None when the cache lacks the library.
+    """
+    source = cache_dir / lib['file']
+    if not source.is_file():
+        print(f"⚠️  Not in cache, leaving CDN URL: {lib['name']} ({source})")
+        return None
+
+    data = source.read_bytes()
+    digest = fingerprint(data)
+    suffix = '.min.js' if lib['file'].endswith('.min.js') else Path(lib['file']).suffix
+    if digest in installed:
+        target = installed[digest]
+    else:
+        target = vendor_dir / f"{lib['name']}-{lib['version']}.{digest}{suffix}"
+        installed[digest] = target
+        if not dry_run and not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+
+    entry = {
+        'name': lib['name'],
+        'version': lib['version'],
+        'path': target.relative_to(BASE_DIR).as_posix(),
+        'integrity': sri_hash(data),
+        'urls': list(lib['urls']),
+    }
+
+    # Packages such as FaceMesh fetch wasm/data files at runtime via locateFile
+    if lib.get('assetsDir'):
+        assets_source = cache_dir / lib['assetsDir']
+        if not assets_source.is_dir():
+            print(f"⚠️  Runtime assets missing from cache: {assets_source}")
+        else:
+            assets_target = vendor_dir / f"{lib['name']}-{lib['version']}.{hash_directory(assets_source)}"
+            if not dry_run and not assets_target.exists():
+                shutil.copytree(assets_source, assets_target)
+            entry['assetsPath'] = assets_target.relative_to(BASE_DIR).as_posix()
+            entry['assetsBaseUrl'] = lib['assetsBaseUrl']
+
+    return entry
+
+
+def collect_html_files(root):
+    """All HTML pages under the site root, skipping vendored and archived trees"""
+    html_files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            if filename.endswith('.html'):
+                html_files.append(Path(dirpath) / filename)
+    return html_files
+
+
+def relative_url(target, page):
+    """URL of a site-root-relative path as seen from an HTML page"""
+    return Path(os.path.relpath(BASE_DIR / target, page.parent)).as_posix()
+
+
+def rewrite_page(page, by_url, by_path, by_assets, dry_run=False, by_name=None):
+    """Point CDN (or stale vendored) script tags of one page at the vendored copies.
+
+    Rewritten tags carry data-vendor="<name>", so a re-run can tell apart
+    libraries that shared one fingerprinted file and now differ (`by_name`).
+    `by_assets` maps runtime asset directories, current and from earlier
+    runs, to the entry whose assetsPath pages should use now.
+
+    Returns the number of references rewritten.
+    """
+    with open(page, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    replaced = 0
+
+    def lookup(src, name=None):
+        entry = by_url.get(src)
+        if entry is None and name and by_name:
+            entry = by_name.get(name)
+        if entry is None and not re.match(r'^[a-z]+:', src):
+            # Previously vendored file: resolve against the page and look it up
+            resolved = os.path.normpath(os.path.join(os.path.relpath(page.parent, BASE_DIR), src))
+            entry = by_path.get(Path(resolved).as_posix())
+        return entry
+
+    def replace_tag(match):
+        nonlocal replaced
+        tag = match.group(0)
+        src_match = SRC_ATTR_RE.search(tag)
+        if not src_match:
+            return tag
+        src = src_match.group(2)
+        vendor_match = VENDOR_ATTR_RE.search(tag)
+        entry = lookup(src, vendor_match and vendor_match.group(2))
+        if entry is None:
+            return tag
+
+        new_src = relative_url(entry['path'], page)
+        new_tag = VENDOR_ATTR_RE.sub('', INTEGRITY_ATTR_RE.sub('', tag))
+        new_tag = new_tag.replace(src_match.group(0), f' src="{new_src}"', 1)
+        new_tag = new_tag[:-1].rstrip() + f' integrity="{entry["integrity"]}" data-vendor="{entry["name"]}">'
+        if new_tag != tag:
+            replaced += 1
+        return new_tag
+
+    def replace_lazy(match):
+        nonlocal replaced
+        entry = lookup(match.group(3))
+        if entry is None:
+            return match.group(0)
+        name = match.group(1)
+        new_attrs = (f' data-{name}-src="{relative_url(entry["path"], page)}"'
+                     f' data-{name}-integrity="{entry["integrity"]}"')
+        if new_attrs != match.group(0):
+            replaced += 1
+        return new_attrs
+
+    new_content = SCRIPT_TAG_RE.sub(replace_tag, content)
+    new_content = LAZY_SRC_RE.sub(replace_lazy, new_content)
+
+    # Runtime asset base URLs (e.g. FaceMesh locateFile), from the CDN or an earlier fingerprint
+    for assets_path, entry in by_assets.items():
+        new_base = relative_url(entry['assetsPath'], page) + '/'
+        for base in (entry['assetsBaseUrl'], relative_url(assets_path, page) + '/'):
+            if base != new_base and base in new_content:
+                new_content = new_content.replace(base, new_base)
+                replaced += 1
+
+    if new_content != content and not dry_run:
+        with open(page, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+    return replaced
+
+
+def broken_references(page, vendor_dir):
+    """Vendored paths a page refers to that do not exist"""
+    prefix = vendor_dir.relative_to(BASE_DIR).as_posix()
+    content = page.read_text(encoding='utf-8')
+    broken = []
+    for match in re.finditer(r'[\w./-]*' + re.escape(prefix) + r'/[^"\'`\s)?#$]*', content):
+        ref = match.group(0)
+        target = BASE_DIR / ref.lstrip('/') if ref.startswith('/') else page.parent / ref
+        if not target.resolve().exists():
+            broken.append(ref)
+    return broken
+
+
+def verify(vendor_dir):
+    """Check vendored files against the manifest and pages against the vendored files"""
+    manifest = load_manifest(vendor_dir)
+    ok = True
+    for entry in manifest['libraries']:
+        path = BASE_DIR / entry['path']
+        if not path.exists():
+            print(f"❌ Missing: {entry['path']}")
+            ok = False
+        elif sri_hash(path.read_bytes()) != entry['integrity']:
+            print(f"❌ Integrity mismatch: {entry['path']}")
+            ok = False
+        else:
+            print(f"✅ {entry['path']}")
+        if entry.get('assetsPath') and not (BASE_DIR / entry['assetsPath']).is_dir():
+            print(f"❌ Missing runtime assets: {entry['assetsPath']}")
+            ok = False
+    for page in collect_html_files(BASE_DIR):
+        for ref in broken_references(page, vendor_dir):
+            print(f"❌ Broken reference in {page.relative_to(BASE_DIR).as_posix()}: {ref}")
+            ok = False
+    return ok
+
+
+def main():
+    """Install cached libraries into assets/vendor and rewrite all pages"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cache', type=Path, help='offline package cache directory')
+    parser.add_argument('--config', type=Path, default=CONFIG_PATH)
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing')
+    parser.add_argument('--prune', action='store_true', help='delete vendored files no longer referenced')
+    parser.add_argument('--verify', action='store_true', help='only verify vendored files against the manifest')
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    vendor_dir = BASE_DIR / config.get('vendorDir', 'assets/vendor')
+
+    if args.verify:
+        sys.exit(0 if verify(vendor_dir) else 1)
+    if args.cache is None:
+        parser.error('--cache is required unless --verify is given')
+
+    previous = load_manifest(vendor_dir)
+    installed = {}
+    entries = []
+
+    print("📦 Installing libraries from cache...")
+    print("=" * 60)
+    for lib in config['libraries']:
+        entry = install_library(lib, args.cache, vendor_dir, installed, args.dry_run)
+        if entry:
+            entries.append(entry)
+            print(f"✅ {entry['name']} {entry['version']} -> {entry['path']}")
+
+    by_url = {url: entry for entry in entries for url in entry['urls']}
+    by_path = {entry['path']: entry for entry in entries}
+    # Pages vendored by an earlier run are moved to the new fingerprints too
+    current = {entry['name']: entry for entry in entries}
+    by_assets = {entry['assetsPath']: entry for entry in entries if 'assetsPath' in entry}
+    for old in previous['libraries']:
+        if old['name'] in current and old['path'] not in by_path:
+            by_path[old['path']] = current[old['name']]
+        if old.get('assetsPath') and 'assetsPath' in current.get(old['name'], {}):
+            by_assets.setdefault(old['assetsPath'], current[old['name']])
+
+    print("\n✏️  Rewriting script tags...")
+    print("=" * 60)
+    pages_updated = 0
+    for page in collect_html_files(BASE_DIR):
+        count = rewrite_page(page, by_url, by_path, by_assets, args.dry_run, current)
+        if count:
+            pages_updated += 1
+            print(f"✅ {page.relative_to(BASE_DIR).as_posix()} ({count} references)")
+
+    if not args.dry_run:
+        vendor_dir.mkdir(parents=True, exist_ok=True)
+        with open(vendor_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+            json.dump({'libraries': entries}, f, indent=2)
+            f.write('\n')
+
+    if args.prune and not args.dry_run:
+        keep = {entry['path'] for entry in entries} | {entry.get('assetsPath') for entry in entries}
+        for old in previous['libraries']:
+            for key in ('path', 'assetsPath'):
+                stale = old.get(key)
+                if stale and stale not in keep and (BASE_DIR / stale).exists():
+                    target = BASE_DIR / stale
+                    shutil.rmtree(target) if target.is_dir() else target.unlink()
+                    print(f"🗑️  Pruned {stale}")
+
+    print("=" * 60)
+    print(f"📦 Vendored: {len(entries)} of {len(config['libraries'])} libraries")
+    print(f"✅ Updated: {pages_updated} pages{' (dry run)' if args.dry_run else ''}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+Pipeline Idempotency Verifier
+- Copies the site (pages, assets, config and scripts) to a scratch directory
+  and runs the full pipeline there twice, task by task in build order
+- Applies every transform a second time right after the first: a transform
+  that still rewrites files on its own output has not reached a fixpoint
+  and is reported with the files it changed and their byte growth per run
+- Asserts that the second pipeline run leaves every file byte-identical to
+  the first, and lists the files that still changed when it does not
+- Exits non-zero on either, so repeated deploys can not silently bloat the
+  pages
+
+Usage:
+    python scripts/verify_idempotency.py
+    python scripts/verify_idempotency.py --runs 3 --keep     # more runs, keep the scratch copy
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pipeline
+
+# Base directory
+BASE_DIR = Path(__file__).parent.parent
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.pytest_cache', '.build-cache', 'archived_docs'}
+
+
+def copy_site(target):
+    """Copy the working tree (without VCS and cache directories) to target"""
+    shutil.copytree(BASE_DIR, target, ignore=lambda _, names: [n for n in names if n in SKIP_DIRS],
+                    dirs_exist_ok=True)
+    return target
+
+
+def snapshot(root):
+    """Repo-relative path -> (size, sha1) of every file under root"""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for name in filenames:
+            path = Path(dirpath) / name
+            body = path.read_bytes()
+            files[path.relative_to(root).as_posix()] = (len(body), hashlib.sha1(body).hexdigest())
+    return files
+
+
+def changes(before, after):
+    """Path -> byte growth for every file added, removed or rewritten"""
+    return {path: after.get(path, (0, None))[0] - before.get(path, (0, None))[0]
+            for path in sorted(before.keys() | after.keys()) if before.get(path) != after.get(path)}
+
+
+def run_task(root, task):
+    """Run a task's script in the copy, the way it is run by hand from the repo root"""
+    result = subprocess.run([sys.executable, str(root / 'scripts' / task.script)], cwd=root,
+                            capture_output=True, text=True, encoding='utf-8', errors='replace')
+    if result.returncode:
+        raise RuntimeError(f"{task.script} exited with {result.returncode}:\n{result.stderr.strip()}")
+
+
+def verify(root, runs=2, tasks=None):
+    """Run the pipeline `runs` times in root, applying each task twice
+
+    Returns (growth, drift): {task name: {run: {path: growth}}} for tasks whose second application
+    changed files, and {run: {path: growth}} for files a whole run changed after the first one.
+    """
+    tasks = pipeline.order(tasks)
+    growth = {}
+    drift = {}
+    finals = [snapshot(root)]
+    for run in range(1, runs + 1):
+        for task in tasks:
+            run_task(root, task)
+            once = snapshot(root)
+            run_task(root, task)
+            changed = changes(once, snapshot(root))
+            if changed:
+                growth.setdefault(task.name, {})[run] = changed
+        finals.append(snapshot(root))
+        if run > 1:
+            changed = changes(finals[-2], finals[-1])
+            if changed:
+                drift[run] = changed
+    return growth, drift
+
+
+def main():
+    """Run the pipeline twice on a scratch copy and report transforms without a fixpoint"""
+    parser = argparse.ArgumentParser(description='Check that rerunning the pipeline changes nothing')
+    parser.add_argument('--runs', type=int, default=2, help='pipeline runs (the first may change files)')
+    parser.add_argument('--keep', action='store_true', help='keep the scratch copy')
+    args = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix='smartmock-fixpoint-'))
+    print(f"🔁 Running the pipeline {args.runs}x on a copy in {scratch}")
+    print("=" * 60)
+    try:
+        growth, drift = verify(copy_site(scratch), max(args.runs, 2))
+    finally:
+        if not args.keep:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    if not growth and not drift:
+        print("✅ Fixpoint reached: rerunning the pipeline or any transform changes nothing")
+        return
+
+    if growth:
+        print(f"❌ {len(growth)} transform(s) without a fixpoint (applied twice in a row):")
+        for name, runs in growth.items():
+            print(f"   {name}: " + ', '.join(f"run {run}: {len(c)} file(s), {sum(c.values()):+,} bytes"
+                                         for run, c in runs.items()))
+            show(runs[max(runs)])
+    for run, changed in drift.items():
+        print(f"❌ Run {run} changed {len(changed)} file(s) again ({sum(changed.values()):+,} bytes):")
+        show(changed)
+    raise SystemExit(1)
+
+
+def show(changed, limit=5):
+    for path, delta in list(changed.items())[:limit]:
+        print(f"      {path} ({delta:+,} bytes)")
+    if len(changed) > limit:
+        print(f"      ... and {len(changed) - limit} more")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+"""
+Pipeline Watch Mode
+- Watches the pages, templates (e.g. interview/cs/ai-interview.html), the
+  scripts holding DEPARTMENTS configs and injected CSS/JS constants, and the
+  config files the derived assets are built from
+- Uses inotify on Linux (through libc, no extra package) and falls back to
+  polling file stats everywhere else
+- Debounces and coalesces bursts (editors write, rename and touch several
+  times per save) into one batch, then applies only the pipeline steps the
+  batch affects (see scripts/pipeline.py), per page where a transform allows
+- Ignores its own writes, so a rebuilt page does not trigger another rebuild
+
+Usage:
+    python scripts/watch.py
+    python scripts/watch.py --poll --interval 0.5     # force stat polling
+    python scripts/watch.py --debounce 0.2 --verbose  # wait longer, show script output
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+import pipeline
+from pipeline import BASE_DIR, plan, run_step
+
+DEBOUNCE = 0.05          # seconds of quiet that end a burst
+MAX_DELAY = 1.0          # longest a burst may postpone a rebuild
+POLL_INTERVAL = 0.25
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.pytest_cache', 'archived_docs'}
+
+# inotify(7)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct('iIII')
+
+
+def watched(path, tasks=None):
+    """Whether a repo-relative path is read by a task or is a task's script"""
+    tasks = pipeline.TASKS if tasks is None else tasks
+    return any(path == task.script_path or task.reads(path) for task in tasks)
+
+
+def watch_dirs(root=None):
+    root = root or BASE_DIR
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.')]
+        yield Path(dirpath)
+
+
+class InotifyWatcher:
+    """Changed paths from inotify, watching every directory under the root"""
+
+    def __init__(self, root=None):
+        self.root = root or BASE_DIR
+        libc_name = ctypes.util.find_library('c')
+        if not hasattr(os, 'O_NONBLOCK') or libc_name is None:
+            raise OSError('inotify is not available')
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        for path in watch_dirs(self.root):
+            self.add(path)
+
+    def add(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self.dirs[wd] = path
+
+    def changes(self, timeout):
+        """Paths changed within timeout seconds (empty when nothing happened)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length].rstrip(b'\0')
+            offset += EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.add(None)           # events were lost: rescan everything
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and path.name not in SKIP_DIRS:
+                    for sub in watch_dirs(path):
+                        self.add(sub)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Changed paths from comparing file stats every interval"""
+
+    def __init__(self, root=None, interval=POLL_INTERVAL):
+        self.root = root or BASE_DIR
+        self.interval = interval
+        self.stats = self.scan()
+
+    def scan(self):
+        stats = {}
+        for directory in watch_dirs(self.root):
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat()
+                    stats[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def changes(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        stats = self.scan()
+        changed = {path for path, stat in stats.items() if self.stats.get(path) != stat}
+        changed.update(path for path in self.stats if path not in stats)
+        self.stats = stats
+        return changed
+
+    def close(self):
+        pass
+
+
+def digest(path):
+    try:
+        return hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class Watch:
+    """Debounced change batches mapped to pipeline steps"""
+
+    def __init__(self, watcher, debounce=DEBOUNCE, max_delay=MAX_DELAY, verbose=False, tasks=None,
+                 in_process=True):
+        self.watcher = watcher
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.verbose = verbose
+        self.tasks = tasks
+        self.in_process = in_process    # False when other threads share the process (see run_step)
+        self.written = {}       # repo-relative path -> digest of what the pipeline last wrote
+
+    def relevant(self, paths):
+        """Repo-relative watched paths of a batch, without the pipeline's own writes"""
+        changed = set()
+        for path in paths:
+            try:
+                rel = path.resolve().relative_to(BASE_DIR.resolve()).as_posix()
+            except ValueError:
+                continue
+            if not watched(rel, self.tasks):
+                continue
+            if rel in self.written:
+                if self.written[rel] == digest(path):
+                    continue
+                del self.written[rel]
+            changed.add(rel)
+        return changed
+
+    def collect(self):
+        """Block until a burst of changes is over; returns the raw changed paths"""
+        paths = set()
+        while not paths:
+            paths = self.watcher.changes(1.0)
+        deadline = time.monotonic() + self.max_delay
+        while time.monotonic() < deadline:
+            more = self.watcher.changes(self.debounce)
+            if not more:
+                break
+            paths |= more
+        return paths
+
+    def rebuild(self, changed):
+        """Run the steps for a set of changed files; returns the steps"""
+        steps = plan(sorted(changed), self.tasks)
+        for step in steps:
+            before = {path: digest(BASE_DIR / path) for path in self.targets(step)}
+            start = time.perf_counter()
+            try:
+                output = run_step(step, quiet=not self.verbose, in_process=self.in_process)
+            except Exception as e:      # keep watching after a failing transform
+                print(f"   ❌ {step.task.name}: {e}")
+                continue
+            if self.verbose and output:
+                print(output.rstrip())
+            rewritten = 0
+            for path, old in before.items():
+                new = digest(BASE_DIR / path)
+                if new != old:
+                    self.written[path] = new
+                    rewritten += 1
+            print(f"   ✅ {step.describe()}: {rewritten} file(s) rewritten in "
+                  f"{(time.perf_counter() - start) * 1000:.0f} ms")
+        return steps
+
+    def targets(self, step):
+        return step.task.output_files() if step.pages is None else step.pages
+
+    def run(self):
+        while True:
+            paths = self.collect()
+            if None in paths:
+                paths = {BASE_DIR / path for task in pipeline.TASKS for path in task.input_files()}
+            changed = self.relevant(paths)
+            if not changed:
+                continue
+            start = time.perf_counter()
+            print(f"\n✏️  {', '.join(sorted(changed))}")
+            steps = self.rebuild(changed)
+            if not steps:
+                print("   ⏭️  nothing depends on it")
+            else:
+                print(f"⚡ {len(steps)} step(s) in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def main():
+    """Watch the site sources and rerun the affected pipeline steps"""
+    parser = argparse.ArgumentParser(description='Rebuild affected pages when their sources change')
+    parser.add_argument('--poll', action='store_true', help='poll file stats instead of using inotify')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='polling interval in seconds')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE, help='quiet period that ends a burst')
+    parser.add_argument('--verbose', action='store_true', help="show the transforms' own output")
+    args = parser.parse_args()
+
+    watcher = None
+    if not args.poll:
+        try:
+            watcher = InotifyWatcher()
+            mode = f'inotify, {len(watcher.dirs)} directories'
+        except OSError:
+            watcher = None
+    if watcher is None:
+        watcher = PollingWatcher(interval=args.interval)
+        mode = f'polling every {args.interval:g}s, {len(watcher.stats)} files'
+
+    print(f"👀 Watching {BASE_DIR} ({mode})")
+    print(f"   {len(pipeline.TASKS)} pipeline tasks; Ctrl+C to stop")
+    print("=" * 60)
+    try:
+        Watch(watcher, args.debounce, verbose=args.verbose).run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+
+if __name__ == '__main__':
+    main()
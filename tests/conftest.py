@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The Python tooling lives in scripts/ as standalone modules
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
@@ -0,0 +1,68 @@
+"""Helpers for pinning the Python ports to the browser JavaScript via node"""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def extract_function(source, name):
+    """Source text of `[async] function name(...) { ... }`, found by brace matching"""
+    body = source.index(f'function {name}(')
+    start = body - len('async ') if source[:body].endswith('async ') else body
+    depth = 0
+    for i in range(source.index('{', body), len(source)):
+        if source[i] == '{':
+            depth += 1
+        elif source[i] == '}':
+            depth -= 1
+            if depth == 0:
+                return source[start:i + 1]
+    raise ValueError(f'unbalanced braces in {name}')
+
+
+def read_source(relpath):
+    return (BASE_DIR / relpath).read_text(encoding='utf-8')
+
+
+def run_node(script, payload):
+    """Run a node script that reads JSON `input` and prints JSON; skip without node"""
+    node = shutil.which('node')
+    if node is None:
+        pytest.skip('node is not installed')
+    program = (
+        "const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n"
+        + script
+    )
+    proc = subprocess.run(
+        [node, '-e', program], input=json.dumps(payload),
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout)
+
+
+def random_frames(n, seed=7):
+    """Feature frames spread over the ranges the shipped emotion rules split"""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for row in rng.uniform(0.0, 0.6, size=(n, 3)):
+        frames.append({'mouthOpen': row[0], 'eyeOpen': row[1] / 3, 'smileCurve': row[2]})
+    return frames
+
+
+def threshold_frames(rules):
+    """Frames sitting exactly on, and next to, every threshold in the rule file"""
+    values = {feat: {0.0, 1.0} for feat in rules['features']}
+    for rule in rules['rules']:
+        for feat, expr in rule.get('conditions', {}).items():
+            for op, value in expr.items():
+                for v in (value if op == 'between' else [value]):
+                    values[feat].update({v, v - 1e-9, v + 1e-9})
+    feats = rules['features']
+    grids = np.meshgrid(*[sorted(values[f]) for f in feats], indexing='ij')
+    return [dict(zip(feats, map(float, row))) for row in np.stack([g.ravel() for g in grids], axis=1)]
@@ -0,0 +1,117 @@
+import pytest
+
+import analyze_scripts
+from analyze_scripts import analyze, fix_page, scan
+
+
+def test_scan_maps_globals_and_load_time_work():
+    result = scan('''
+        class Tutor { hint(message) { return helper(message); } }
+        const store = { load({ key }) { return key; } };
+        window.Tutor = Tutor;
+        function render(stream) { return Chart.draw(stream); }
+        if (typeof Widget !== 'undefined') { Widget.mount(); }
+        console.log(`ready ${Math.max(1, 2)}`); // Setup() in a comment
+    ''')
+    assert result.defines == {'Tutor', 'store', 'render'}
+    assert {'Tutor', 'helper', 'Chart', 'Widget'} <= set(result.references)
+    assert not {'message', 'key', 'stream', 'hint', 'load', 'Setup'} & set(result.references)
+    assert not result.references['Chart']['eager']
+    assert result.references['Widget'] == {'eager': True, 'guarded': True}
+    assert result.side_effects                          # Widget.mount() runs on load
+
+    assert not scan('(function () { window.Store = { get() { return 1; } }; })();').side_effects
+    assert scan("document.addEventListener('click', () => {});").side_effects
+
+
+def test_unused_scripts_are_removed_and_load_order_flagged(tmp_path, monkeypatch):
+    js = tmp_path / 'assets' / 'js'
+    js.mkdir(parents=True)
+    (js / 'tutor.js').write_text('class AITutor {}\nwindow.AITutor = AITutor;\n', encoding='utf-8')
+    (js / 'charts.js').write_text('const Charts = { draw() {} };\n', encoding='utf-8')
+    (js / 'app.js').write_text("Charts.draw();\ndocument.title = 'x';\n", encoding='utf-8')
+    page = tmp_path / 'index.html'
+    page.write_text('\n'.join([
+        '<button onclick="new AITutor()">Ask</button>',
+        '<script src="assets/js/app.js"></script>',
+        '<script src="assets/js/tutor.js"></script>',
+        '<script src="assets/js/charts.js"></script>',
+        '<script src="assets/js/unused.js?v=2"></script>',
+    ]), encoding='utf-8')
+    (js / 'unused.js').write_text('function neverCalled() {}\n', encoding='utf-8')
+    monkeypatch.setattr(analyze_scripts, 'BASE_DIR', tmp_path)
+
+    report = analyze(page)
+    assert report['unused'] == ['assets/js/unused.js?v=2']
+    assert report['violations'] == [('assets/js/app.js', 'Charts', 'assets/js/charts.js', False)]
+    assert fix_page(page, report['unused'], defer=True)
+    assert '<script src="assets/js/unused.js?v=2" defer></script>' in page.read_text(encoding='utf-8')
+    assert fix_page(page, report['unused'])
+    assert 'unused.js' not in page.read_text(encoding='utf-8')
+    assert not fix_page(page, report['unused'])
+
+    monkeypatch.setattr('sys.argv', ['analyze_scripts.py', str(page)])
+    with pytest.raises(SystemExit):
+        analyze_scripts.main()
+
+
+def make_site(tmp_path, monkeypatch, scripts, markup):
+    js = tmp_path / 'assets' / 'js'
+    js.mkdir(parents=True)
+    for name, source in scripts.items():
+        (js / name).write_text(source, encoding='utf-8')
+    page = tmp_path / 'index.html'
+    page.write_text('\n'.join(markup + [f'<script src="assets/js/{name}"></script>' for name in scripts]),
+                    encoding='utf-8')
+    monkeypatch.setattr(analyze_scripts, 'BASE_DIR', tmp_path)
+    return page
+
+
+def test_inline_handlers_keep_the_globals_they_reference(tmp_path, monkeypatch):
+    page = make_site(tmp_path, monkeypatch, {
+        'a11y.js': '(function () { window.SmartMockA11y = { toggle() {} }; })();\n',
+        'i18n.js': 'window.SmartMockI18n = { t(key) { return key; } };\n',
+        'tour.js': 'const ProductTour = { start() {} };\n',
+    }, [
+        '<button onclick="SmartMockA11y.toggle(); return false;">Contrast</button>',
+        '<a href="javascript:SmartMockI18n.t(\'hi\')">Hindi</a>',
+        '<button onclick="tour.start()">Tour</button>',    # a different name: ProductTour stays unused
+    ])
+    assert analyze(page) == {'unused': ['assets/js/tour.js'], 'violations': [], 'scripts': 3}
+
+
+def test_scripts_needed_only_by_a_kept_script_stay(tmp_path, monkeypatch):
+    page = make_site(tmp_path, monkeypatch, {
+        'advanced-features.js': 'class AdvancedFeatures { static init() {} }\n',
+        'visualizations.js': 'window.SmartMockVisualizations = { createEmotionHeatmap() {} };\n',
+        'dashboard.js': "document.addEventListener('DOMContentLoaded', () => {\n"
+                        '  AdvancedFeatures.init();\n'
+                        '  SmartMockVisualizations.createEmotionHeatmap([]);\n'
+                        '});\n',
+        'chart-theme.js': 'window.ChartTheme = { dark: true };\n',
+        'legacy-charts.js': 'function legacyChart() { return ChartTheme.dark; }\n',
+    }, [])
+    # dashboard.js works on load; chart-theme.js is only wanted by a script nothing wants
+    report = analyze(page)
+    assert report['unused'] == ['assets/js/chart-theme.js', 'assets/js/legacy-charts.js']
+    assert report['violations'] == []
+
+
+def test_fix_is_idempotent_and_rebuilds_the_purged_css(tmp_path, monkeypatch):
+    page = make_site(tmp_path, monkeypatch, {
+        'app.js': "document.title = 'x';\n",
+        'unused.js': 'function neverCalled() {}\n',
+    }, ['<h1>Home</h1>'])
+    rebuilds = []
+    monkeypatch.setattr(analyze_scripts.purge_css, 'rebuild', lambda: rebuilds.append(True))
+    monkeypatch.setattr('sys.argv', ['analyze_scripts.py', '--fix', str(page)])
+
+    analyze_scripts.main()
+    fixed = page.read_text(encoding='utf-8')
+    assert 'unused.js' not in fixed and 'app.js' in fixed
+    assert rebuilds == [True]
+
+    analyze_scripts.main()
+    assert page.read_text(encoding='utf-8') == fixed
+    assert rebuilds == [True]                           # nothing removed, nothing to purge again
+    assert analyze(page)['unused'] == []
@@ -0,0 +1,204 @@
+import re
+
+from apply_dark_theme_particles import (PARTICLES_CANVAS_JS, PARTICLES_JS, ROBOT_LOADER_JS, apply_particles,
+                                        apply_robot, particle_settings, process_html_file, robot_settings)
+from js_harness import run_node
+from page_classes import page_class
+
+OLD_COPY = PARTICLES_JS.replace("      // Create 120 floating purple particles\n",
+                                "      // Create 120 floating purple particles (older copy)\n")
+PAGE = f'''<html><head></head><body>
+    <div class="particles-container" id="particlesContainer"></div>
+    <main>content</main>
+{PARTICLES_JS}
+{OLD_COPY}
+  </body></html>'''
+
+
+def test_modes_replace_every_injected_copy_and_are_idempotent():
+    canvas = apply_particles(PAGE, 'canvas', 40)
+    assert canvas.count('<!-- Particle Canvas Renderer -->') == 1 and 'Particle Generation Script' not in canvas
+    assert '<div class="particles-container" id="particlesContainer" data-particle-budget="40"></div>' in canvas
+    assert apply_particles(canvas, 'canvas', 40) == canvas
+    assert 'data-particle-budget="90"' in apply_particles(canvas, 'canvas', 90)
+
+    dom = apply_particles(canvas, 'dom', 40)
+    assert dom.count(PARTICLES_JS.strip()) == 1 and 'data-particle-budget' not in dom
+    none = apply_particles(dom, 'none', 40)
+    assert 'particle' not in none.lower() and '<main>content</main>' in none
+
+    fresh = apply_particles('<html><body class="x">\n  <main></main>\n</body></html>', 'canvas', 60)
+    assert re.search(r'<body class="x">\s*<!-- Floating Particles \(auto injected\) -->\s*'
+                     r'<div class="particles-container" id="particlesContainer" data-particle-budget="60">', fresh)
+    assert fresh.index('<!-- Particle Canvas Renderer -->') < fresh.index('</body>')
+
+    own = '<body><div class="particles-container" id="particlesContainer"></div><script>mine()</script></body>'
+    assert apply_particles(own, 'canvas', 60) == own       # pages with their own particle code are left alone
+
+
+def test_page_class_decides_the_mode(tmp_path):
+    assert page_class('interview/ee/ai-interview.html')['name'] == 'ai-interview'
+    assert page_class('interview/ee/courses.html')['name'] == 'department'
+    assert page_class('recruiter/login.html')['name'] == 'recruiter'
+    assert page_class('about.html')['name'] == 'site'
+    assert page_class('docs/guide.html') is None
+    assert particle_settings('docs/guide.html') == {'mode': 'dom', 'budget': 120}
+    classes = [{'name': 'quiet', 'pages': ['*.html'], 'particles': {'mode': 'none'}}]
+    assert page_class('about.html', classes)['name'] == 'quiet'
+
+    page = tmp_path / 'page.html'
+    page.write_text(PAGE.replace('<head></head>', '<head><meta id="bg-robot-initialized">'
+                                 '<meta id="hamburger-overlay-initialized"></head>'), encoding='utf-8')
+    assert process_html_file(page, {'mode': 'canvas', 'budget': 30})   # fully processed pages still switch mode
+    assert 'data-particle-budget="30"' in page.read_text(encoding='utf-8')
+    assert not process_html_file(page, {'mode': 'canvas', 'budget': 30})
+
+
+def test_canvas_renderer_scales_to_the_viewport_and_pauses():
+    script = PARTICLES_CANVAS_JS.split('<script>')[1].split('</script>')[0]
+    program = '''
+Math.random = () => 0.5;         // every particle halfway up, so each one is drawn
+const listeners = {};
+let frames = 0, cancelled = 0, drawn = 0, pending = null;
+const context = {
+  setTransform() {}, clearRect() {}, fillRect() {}, drawImage() { drawn++; },
+  createRadialGradient: () => ({addColorStop() {}}),
+};
+const makeCanvas = () => ({style: {}, getContext: () => context});
+const media = {matches: input.reduced, addEventListener: (type, fn) => { listeners.motion = fn; }};
+const canvases = [];
+global.document = {
+  hidden: false,
+  getElementById: () => container,
+  createElement: () => { const c = makeCanvas(); canvases.push(c); return c; },
+  addEventListener: (type, fn) => { listeners[type] = fn; },
+};
+const container = {dataset: {particleBudget: '80'}, querySelector: () => null, appendChild() {}};
+global.window = {
+  innerWidth: 960, innerHeight: 540, devicePixelRatio: 3,
+  matchMedia: () => media, addEventListener: (type, fn) => { listeners[type] = fn; },
+};
+global.requestAnimationFrame = fn => { frames++; pending = fn; return frames; };
+global.cancelAnimationFrame = () => { cancelled++; };
+''' + script + '''
+const running = frames;
+if (pending) { pending(1000); pending(1016); }
+drawn = 0;
+document.hidden = true;
+listeners.visibilitychange();
+const afterHide = frames;
+document.hidden = false;
+listeners.visibilitychange();
+console.log(JSON.stringify({
+  running, cancelled, resumed: frames > afterHide,
+  size: [canvases[0].width, canvases[0].height], staticDraws: drawn,
+}));
+'''
+    moving = run_node(program, {'reduced': False})
+    # a quarter of a 1920x1080 screen gets a quarter of the budget; the canvas is scaled by DPR (capped at 2)
+    assert moving == {'running': 1, 'cancelled': 1, 'resumed': True, 'size': [1920, 1080], 'staticDraws': 20}
+    still = run_node(program, {'reduced': True})
+    assert still['running'] == 0 and still['resumed'] is False
+
+
+EAGER = '''<html><head></head><body>
+    <div id="bg-robot-container"><canvas id="bg-robot-canvas"></canvas></div>
+  <!-- Three.js + Robot Interviewer -->
+  <script src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js"></script>
+  <script src="../../assets/js/robot-interviewer.js"></script>
+  <script>
+    (function initBgRobot(){
+      if (typeof THREE === 'undefined') { return setTimeout(initBgRobot, 100); }
+      window.bgRobot = new window.RobotInterviewer('bg-robot-container', THREE, {});
+    })();
+  </script>
+    <script>
+      // Initialize Background Robot
+      (function initBgRobot(){ window.bgRobot = 1; })();
+      keep();
+    </script>
+  </body></html>'''
+
+
+def test_robot_loader_replaces_eager_initialisers():
+    webgl = {'mode': 'webgl', 'poster': 'assets/images/robot-poster.svg', 'maxFps': 30, 'maxPixelRatio': 1.5}
+    lazy = apply_robot(EAGER, webgl, '../../')
+    assert 'initBgRobot' not in lazy and 'three.min.js"></script>' not in lazy and 'keep();' in lazy
+    assert lazy.count('<!-- Background Robot Loader -->') == 1
+    assert ('<div id="bg-robot-container" data-robot="webgl" data-robot-poster="../../assets/images/robot-poster.svg"'
+            ' data-robot-script="../../assets/js/robot-interviewer.js" data-robot-max-fps="30"'
+            ' data-robot-max-dpr="1.5" data-robot-three-src="https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/'
+            'three.min.js">') in lazy
+    assert apply_robot(lazy, webgl, '../../') == lazy
+    # a vendored three.js is fetched same-origin and checked against its integrity hash
+    vendored = apply_robot(lazy, webgl, '../../', ('assets/vendor/three-r128.0123456789.min.js', 'sha384-abc'))
+    assert (' data-robot-three-src="../../assets/vendor/three-r128.0123456789.min.js"'
+            ' data-robot-three-integrity="sha384-abc">') in vendored
+    poster = apply_robot(lazy, dict(webgl, mode='poster'), '../../')
+    assert poster.count('<!-- Background Robot Loader -->') == 1 and 'data-robot="poster"' in poster
+    assert 'bg-robot' not in apply_robot(lazy, dict(webgl, mode='none'))
+
+    # pages that render their own robot keep the libraries
+    room = EAGER.replace('keep();', "new RobotInterviewer('robot-container', THREE);")
+    assert 'three.min.js"></script>' in apply_robot(room, webgl)
+    assert robot_settings('interview/ee/ai-interview.html')['mode'] == 'poster'
+    assert robot_settings('interview/ee/courses.html')['maxFps'] == 30
+
+
+def test_robot_loader_gates_on_capability_and_visibility():
+    script = ROBOT_LOADER_JS.split('<script>')[1].split('</script>')[0]
+    program = '''
+const listeners = {}, appended = [], calls = [];
+const print = console.log;
+console.log = () => {};
+let observer = null;
+const container = {dataset: {robot: input.mode, robotPoster: 'poster.svg', robotScript: 'robot.js', robotMaxFps: '24',
+                             robotMaxDpr: '1.5', robotThreeSrc: 'three.js', robotThreeIntegrity: 'sha384-abc'},
+                   style: {}};
+const checks = [];
+global.navigator = {hardwareConcurrency: input.cores, deviceMemory: 8};
+global.window = {
+  WebGLRenderingContext: function () {}, matchMedia: () => ({matches: false}),
+  requestIdleCallback: fn => fn(),
+  addEventListener: (type, fn) => { listeners[type] = fn; },
+  IntersectionObserver: true,
+};
+global.requestIdleCallback = window.requestIdleCallback;
+global.IntersectionObserver = function (fn) { this.observe = () => { observer = fn; }; };
+global.document = {
+  hidden: false, readyState: 'loading',
+  getElementById: id => id === 'bg-robot-container' ? container : null,
+  createElement: () => ({}),
+  head: {appendChild: el => {
+    appended.push(el.src || el.id);
+    if (el.src) checks.push([el.integrity || null, el.crossOrigin]);
+    if (el.src) setTimeout(() => { loaded(el.src); el.onload(); }, 0);
+  }},
+  addEventListener: (type, fn) => { listeners[type] = fn; },
+};
+function Robot(id, three, options) {
+  calls.push(['new', options.maxFps, options.maxPixelRatio]);
+  this.setState = () => {}; this.pause = () => calls.push('pause'); this.resume = () => calls.push('resume');
+}
+const loaded = src => { if (src === 'robot.js') window.RobotInterviewer = Robot; else global.THREE = {}; };
+''' + script + '''
+const beforeLoad = appended.slice();
+if (listeners.load) listeners.load();
+setTimeout(() => {
+  if (observer) { observer([{isIntersecting: false}]); observer([{isIntersecting: true}]); }
+  document.hidden = true;
+  if (listeners.visibilitychange) listeners.visibilitychange();
+  print(JSON.stringify({beforeLoad, appended, checks, calls, poster: container.style.background || null}));
+}, 10);
+'''
+    lazy = run_node(program, {'mode': 'webgl', 'cores': 8})
+    # nothing is fetched before the load event, then three.js and the robot in order
+    assert lazy['beforeLoad'] == ['bg-robot-initialized']
+    assert lazy['appended'][1:] == ['three.js', 'robot.js']
+    assert lazy['checks'] == [['sha384-abc', 'anonymous'], [None, 'anonymous']]
+    assert lazy['calls'] == [['new', 24, 1.5], 'pause', 'resume', 'pause'] and lazy['poster'] is None
+
+    for payload in ({'mode': 'webgl', 'cores': 2}, {'mode': 'poster', 'cores': 8}):
+        still = run_node(program, payload)
+        assert still['appended'] == ['bg-robot-initialized'] and still['calls'] == []
+        assert still['poster'].startswith('url("poster.svg")')
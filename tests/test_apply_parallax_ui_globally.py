@@ -0,0 +1,82 @@
+from apply_parallax_ui_globally import PARALLAX_JS, PARALLAX_LOOP, process_html_file, upgrade_parallax_loop
+from js_harness import run_node
+
+LEGACY_LOOP = '''    <script>
+      // Advanced Parallax and Depth Effect
+      let targetX = 0, targetY = 0;
+      let currentX = 0, currentY = 0;
+
+      function animateParallax() {
+        currentX += (targetX - currentX) * 0.1;
+        const main = document.querySelector('main');
+        requestAnimationFrame(animateParallax);
+      }
+      
+      // Start parallax animation
+      animateParallax();
+    </script>
+'''
+
+
+def test_legacy_loop_is_upgraded_once(tmp_path):
+    upgraded = upgrade_parallax_loop(LEGACY_LOOP)
+    assert upgraded == '    <script>\n' + PARALLAX_LOOP.lstrip('\n') + '    </script>\n'
+    assert upgrade_parallax_loop(upgraded) == upgraded
+
+    page = tmp_path / 'page.html'
+    page.write_text(f'<html><head></head><body>\n{LEGACY_LOOP}</body></html>', encoding='utf-8')
+    assert process_html_file(page)
+    assert 'Idle-aware Parallax' in page.read_text(encoding='utf-8')
+    assert not process_html_file(page)
+
+    fresh = tmp_path / 'fresh.html'
+    fresh.write_text('<html><head></head><body>\n</body></html>', encoding='utf-8')
+    assert process_html_file(fresh)
+    assert PARALLAX_JS in fresh.read_text(encoding='utf-8')
+
+
+def test_loop_sleeps_when_settled_and_while_hidden():
+    script = PARALLAX_LOOP
+    program = '''
+const listeners = {};
+const queue = [];
+let requested = 0;
+const robot = {style: {}}, particles = {style: {}};
+global.window = {innerWidth: 1000, innerHeight: 500, matchMedia: () => ({matches: input.reduced})};
+global.document = {
+  hidden: false,
+  getElementById: id => id === 'bg-robot-container' ? robot : particles,
+  addEventListener: (type, fn) => { listeners[type] = fn; },
+};
+global.requestAnimationFrame = fn => { requested++; queue.push(fn); return requested; };
+global.cancelAnimationFrame = () => { queue.length = 0; };
+const fire = (type, event) => listeners[type] && listeners[type](event);
+const drain = () => { let n = 0; while (queue.length && n < 1000) { queue.shift()(); n++; } return n; };
+''' + script + '''
+const initial = drain();
+fire('pointermove', {clientX: 1000, clientY: 250});
+fire('pointermove', {clientX: 1000, clientY: 250});
+const pending = queue.length;
+const settle = drain();
+const idle = queue.length;
+fire('pointermove', {clientX: 0, clientY: 250});
+document.hidden = true;
+fire('visibilitychange');
+const hidden = queue.length;
+fire('pointermove', {clientX: 500, clientY: 250});
+const hiddenMove = queue.length;
+document.hidden = false;
+fire('visibilitychange');
+console.log(JSON.stringify({
+  initial, pending, settle, idle, hidden, hiddenMove, resumed: queue.length,
+  particles: particles.style.transform || null,
+}));
+'''
+    result = run_node(program, {'reduced': False})
+    assert result['initial'] == 1                       # one frame to place the layers, then sleep
+    assert result['pending'] == 1                       # repeated moves share one frame
+    assert 10 < result['settle'] < 200 and result['idle'] == 0
+    assert result['particles'] == 'translate3d(20px, 0px, 50px)'
+    assert (result['hidden'], result['hiddenMove'], result['resumed']) == (0, 0, 1)
+    still = run_node(program, {'reduced': True})
+    assert still['initial'] == 0 and still['particles'] is None
@@ -0,0 +1,69 @@
+import json
+from datetime import datetime, timezone
+
+from archive_interviews import build_archive, rehydrate, session_time
+from export_stream import read_shards
+
+CUTOFF = datetime(2025, 3, 1, tzinfo=timezone.utc)
+
+EXPORT = {
+    'users': {'u1': {'name': 'A'}},
+    'interviews': {
+        'u1': {
+            's1': {'createdAt': '2024-12-05T10:00:00.000Z', 'score': 1},
+            's2': {'timestamp': '2025-01-31T23:59:59Z', 'score': 2},
+            's3': {'timestamp': '2025-04-01T00:00:00Z', 'score': 3},
+        },
+        'u2': {
+            '1733011200000': {'score': 4},                          # Date.now() id, 2024-12-01
+            's5': {'createdAt': 'not a date', 'timestamp': '2020-01-01T00:00:00Z'},
+            's6': 'corrupt',
+        },
+    },
+}
+
+
+def build(tmp_path, export=EXPORT):
+    path = tmp_path / 'export.json'
+    path.write_text(json.dumps(export), encoding='utf-8')
+    return build_archive(path, tmp_path / 'archive', CUTOFF)
+
+
+def test_session_time_follows_report_order():
+    assert session_time('x', {'createdAt': '2024-01-02T00:00:00Z', 'timestamp': 0}).month == 1
+    assert session_time('x', {'createdAt': '', 'timestamp': 1704153600000}).day == 2
+    assert session_time('1704153600000', {}).year == 2024
+    assert session_time('x', {'createdAt': 'garbage', 'timestamp': '2024-01-01'}) is None
+
+
+def test_partitions_hot_set_and_prune_patches(tmp_path):
+    manifest, stats = build(tmp_path)
+    out = tmp_path / 'archive'
+    assert list(manifest['partitions']) == ['2024-12', '2025-01']
+    december = manifest['partitions']['2024-12']
+    assert (december['records'], december['users']) == (2, 2)
+    archived = {r.path for m in manifest['partitions'].values() for r in read_shards(out / s for s in m['shards'])}
+    assert archived == {'interviews/u1/s1', 'interviews/u1/s2', 'interviews/u2/1733011200000'}
+
+    hot = {r.path for r in read_shards(out / s for s in manifest['hot']['shards'])}
+    assert hot == {'interviews/u1/s3', 'interviews/u2/s5'}
+    assert manifest['hot']['undated'] == 1
+    assert manifest['skipped'] == {'str': 1}
+
+    prune = json.loads((out / 'prune' / 'patch-0001.json').read_text(encoding='utf-8'))
+    assert prune == dict.fromkeys(archived)
+
+
+def test_rehydrate_one_user_and_rerun_clears_old_files(tmp_path):
+    build(tmp_path)
+    out = tmp_path / 'archive'
+    assert rehydrate(out, 'u1', tmp_path / 'restore') == 2
+    restore = json.loads((tmp_path / 'restore' / 'patch-0001.json').read_text(encoding='utf-8'))
+    assert restore == {'interviews/u1/s1': EXPORT['interviews']['u1']['s1'],
+                       'interviews/u1/s2': EXPORT['interviews']['u1']['s2']}
+
+    smaller = {'interviews': {'u2': {'1733011200000': {'score': 4}}}}
+    manifest, stats = build(tmp_path, smaller)
+    assert stats['removed'] == 4
+    assert sorted(p.name for p in (out / 'months').iterdir()) == ['archive-2024-12-00001.ndjson.gz']
+    assert rehydrate(out, 'u1', tmp_path / 'restore-2') == 0
@@ -0,0 +1,116 @@
+import json
+import re
+import sys
+from functools import partial
+
+import numpy as np
+
+import ats_batch_score
+from ats_batch_score import KEYWORDS, KeywordAutomaton, ats_score, score_batch
+from export_stream import batched, fan_out
+from js_harness import read_source, run_node
+
+FUNCTIONS = 'functions/advanced-features.js'
+
+
+def js_handler(keywords=None):
+    """The (data, context) => {...} handler of exports.calculateATSScore"""
+    source = read_source(FUNCTIONS)
+    start = source.index('functions.https.onCall(', source.index('exports.calculateATSScore')) + len('functions.https.onCall(')
+    depth = 0
+    for i in range(source.index('{', start), len(source)):
+        depth += {'{': 1, '}': -1}.get(source[i], 0)
+        if depth == 0:
+            handler = source[start:i + 1]
+            break
+    if keywords is not None:
+        handler = re.sub(r"const keywords = \[.*?\];", lambda m: f"const keywords = {json.dumps(keywords)};", handler)
+    return handler
+
+
+def js_scores(resumes, keywords=None):
+    script = '\n'.join([
+        f'const handler = {js_handler(keywords)};',
+        'console.log(JSON.stringify(input.map(r => { try { return handler(r, {}).score; } catch (e) { return null; } })));',
+    ])
+    return run_node(script, resumes)
+
+
+def sample_resumes(n=1500, seed=11):
+    rng = np.random.default_rng(seed)
+    words = ['Led', 'managed', 'DEVELOPED', 'improvedment', 'achieve', 'implemented', 'sled', 'team', 'ünïcode',
+             '😀', 'İstanbul', 'Kelvin']
+
+    def text(low, high):
+        return ' '.join(words[i] for i in rng.integers(len(words), size=int(rng.integers(low, high))))
+
+    names = ['', 'A', 'Ada Lovelace', None, 0, 5, [], ['x'], {}, {'length': 3}, True]
+    skills = ['', 'python, sql', ' , ,x,', 'a,﻿,b', 'a,\x1c,b', 'a,　,b', ', '.join(['s'] * 15), None, 0,
+              ['js'], {'a': 1}, 7]
+    works = [None, [], [{'role': 'Dev', 'desc': 'led the team'}], {'2': 'managed', '1': 'x', 'b': 'y'}, 'built',
+             [['developed'], None], 3.0]
+    resumes = []
+    for _ in range(n):
+        resume = {}
+        for field, options in (('fullName', names), ('profTitle', names), ('skills', skills),
+                               ('workExperience', works), ('education', names)):
+            if rng.random() < 0.85:
+                resume[field] = options[rng.integers(len(options))]
+        if rng.random() < 0.85:
+            resume['summary'] = text(0, 60) if rng.random() < 0.8 else [None, 12, ['led', 'x']][rng.integers(3)]
+        resumes.append(resume)
+    return resumes
+
+
+def python_scores(resumes, keywords=KEYWORDS):
+    rows, _ = score_batch(keywords, list(enumerate(resumes)))
+    return [score for _, _, _, score in rows]
+
+
+def test_parity_with_calculate_ats_score():
+    resumes = sample_resumes()
+    assert python_scores(resumes) == js_scores(resumes)
+
+
+def test_parity_with_a_custom_dictionary(monkeypatch):
+    resumes = sample_resumes(300, seed=2)
+    keywords = ['le', 'led', 'ed', 'team', '"1"', 'ünï', '', 'Team', 'x"', 'k', 'ed the']
+    expected = js_scores(resumes, keywords)
+    assert python_scores(resumes, keywords) == expected
+    monkeypatch.setattr(ats_batch_score, '_AUTOMATA', {})
+    monkeypatch.setattr(ats_batch_score, 'SCAN_LIMIT', 0)
+    assert python_scores(resumes, keywords) == expected
+
+
+def test_automaton_matches_substring_search():
+    rng = np.random.default_rng(4)
+    for _ in range(300):
+        keywords = [''.join(rng.choice(list('abc'), size=rng.integers(1, 5))) for _ in range(8)]
+        text = ''.join(rng.choice(list('abcd'), size=rng.integers(0, 30)))
+        assert KeywordAutomaton(keywords, scan_limit=0).find(text) == {i for i, k in enumerate(keywords) if k in text}
+
+
+def test_fan_out_scores_in_order():
+    items = list(enumerate(sample_resumes(400, seed=8)))
+    serial = [row for rows, _ in fan_out(partial(score_batch, KEYWORDS), batched(items, 50), workers=1) for row in rows]
+    parallel = [row for rows, _ in fan_out(partial(score_batch, KEYWORDS), batched(items, 50), workers=2) for row in rows]
+    assert serial == parallel
+
+
+def test_writes_patches_for_changed_scores(tmp_path, monkeypatch):
+    resumes = {
+        'r1': {'userId': 'u1', 'fullName': 'A', 'atsScore': 65},
+        'r2': {'userId': 'u2', 'fullName': 'B', 'atsScore': 0},
+        'r3': {'userId': 'u3', 'skills': ['js']},
+        'r4': 'corrupt',
+    }
+    export = tmp_path / 'export.json'
+    export.write_text(json.dumps({'resumes': resumes}), encoding='utf-8')
+    monkeypatch.setattr(sys, 'argv', ['ats_batch_score.py', str(export), '--out', str(tmp_path / 'out'),
+                                      '--workers', '1'])
+    ats_batch_score.main()
+    assert ats_score(resumes['r1'], KeywordAutomaton(KEYWORDS))[0] == 65
+    patch = json.loads((tmp_path / 'out' / 'patch-0001.json').read_text(encoding='utf-8'))
+    assert patch == {'users/u2/resumes/r2/atsScore': 65}
+    updates = (tmp_path / 'out' / 'firestore-updates.ndjson').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line) for line in updates] == [{'collection': 'resumes', 'id': 'r2', 'atsScore': 65}]
@@ -0,0 +1,83 @@
+import io
+import json
+
+from audit_db_queries import BASE_DIR, audit, measure_export, blank_comments, collect_sources, scan_sort_keys, scan_source
+
+RULES = {
+    'rules.json': {'rules': {
+        'scores': {
+            '.indexOn': ['best'],
+            '$uid': {'.validate': "newData.hasChildren(['best', 'stars', 'name'])"},
+        },
+        'profiles': {'$uid': {'.read': 'auth != null'}},
+    }},
+}
+
+SOURCE = """
+// db.ref('commented').once('value')
+const board = firebase.database().ref('scores');
+async function load() {
+  const snap = await board.once('value');          /* whole node */
+  rows.sort((a, b) => (b.stars || 0) - (a.stars || 0) || b.name.localeCompare(a.name));
+}
+function top(n) {
+  return db.ref('scores').orderByChild('best').limitToLast(n).get();
+}
+function byStars() {
+  let query = admin.database().ref(`scores`);
+  if (n) { query = query.orderByChild('stars'); }
+  return query.once('value');
+}
+const url = /\\/scores\\//;
+storage.ref(`scores/${uid}`).put(file);
+db.ref('profiles/' + user.uid).once('value');
+db.ref(`drafts/${uid}`).push(draft);
+"""
+
+
+def scan(source=SOURCE):
+    return scan_source(source, 'app.js')
+
+
+def test_extracts_refs_queries_and_variables():
+    found = [(a.path, a.queries, a.conditional, a.operation) for a in scan()]
+    assert found == [
+        ('scores', [], [], 'once'),
+        ('scores', [('orderByChild', "'best'"), ('limitToLast', 'n')], [], 'get'),
+        ('scores', [], [('orderByChild', "'stars'")], 'once'),
+        ('profiles/$uid', [], [], 'once'),
+        ('drafts/$uid', [], [], 'push'),
+    ]
+    assert 'commented' not in blank_comments(SOURCE)
+    assert scan_sort_keys(SOURCE) == {'stars', 'name'}
+
+
+def test_reports_missing_indexes_and_unbounded_reads():
+    report = audit(scan(), {'app.js': scan_sort_keys(SOURCE)}, RULES, users=100)
+    missing = {(e['path'], e['key'], e['reason']) for e in report['missingIndexes']}
+    assert missing == {('scores', 'stars', 'query'), ('scores', 'name', 'client sort')}
+    assert [e['path'] for e in report['unboundedReads']] == ['scores']
+    assert report['unboundedReads'][0]['clientSortKeys'] == ['name', 'stars']
+    assert report['unboundedReads'][0]['estimatedBytes'] == 100 * 3 * 48
+    assert list(report['uncoveredPaths']) == ['drafts']
+
+
+def test_shipped_leaderboard_needs_total_stars_index():
+    accesses, sort_keys = [], {}
+    for path in collect_sources(BASE_DIR):
+        rel = path.relative_to(BASE_DIR).as_posix()
+        text = path.read_text(encoding='utf-8', errors='ignore')
+        accesses.extend(scan_source(text, rel))
+        sort_keys[rel] = scan_sort_keys(text)
+    rules = {name: json.loads((BASE_DIR / name).read_text(encoding='utf-8'))
+             for name in ('config/FIREBASE_RULES.json', 'config/REALTIME_DATABASE_RULES.json')}
+    report = audit(accesses, sort_keys, rules)
+    assert ('leaderboard', 'totalStars') in {(e['path'], e['key']) for e in report['missingIndexes']}
+    assert 'leaderboard' in [e['path'] for e in report['unboundedReads']]
+
+
+def test_measure_export_reads_every_pattern():
+    export = {'scores': {'u1': {'best': 1}, 'u2': {'best': 22}}, 'profiles': {'u1': {'n': 'x'}}}
+    sizes = measure_export(io.StringIO(json.dumps(export)), ['scores', 'scores/*', 'profiles/*', 'drafts/*'])
+    assert sizes == {'scores': len('{"u1":{"best":1},"u2":{"best":22}}'), 'scores/*': 10.5,
+                     'profiles/*': len('{"n":"x"}'), 'drafts/*': 0}
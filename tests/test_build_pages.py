@@ -0,0 +1,102 @@
+import sys
+
+import pytest
+
+import build_pages
+import pipeline
+from build_pages import build, explain
+from pipeline import Task, declared_targets, generator, on_page, plan
+
+GENERATOR = '''
+import sys
+from pathlib import Path
+
+TARGETS = {
+    'pages/me-ai.html': ['pages/ai.html'],
+    'pages/ce-ai.html': ['pages/ai.html'],
+    'pages/me-mcq.html': ['pages/mcq.html'],
+}
+
+
+def main(targets=None):
+    for output in targets or TARGETS:
+        template = Path(TARGETS[output][0]).read_text(encoding='utf-8')
+        Path(output).write_text(template.replace('CS', output[6:8].upper()), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
+'''
+TRANSFORM = '''
+def stamp(path):
+    content = path.read_text(encoding='utf-8')
+    if '<!-- stamped -->' not in content:
+        path.write_text(content.replace('</body>', '<!-- stamped --></body>'), encoding='utf-8')
+'''
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    scripts = tmp_path / 'scripts'
+    scripts.mkdir()
+    (scripts / 'make_pages.py').write_text(GENERATOR, encoding='utf-8')
+    (scripts / 'stamp_pages.py').write_text(TRANSFORM, encoding='utf-8')
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    for name in ('ai', 'mcq'):
+        (pages / f'{name}.html').write_text(f'<body>CS {name}</body>', encoding='utf-8')
+    for module in (pipeline, build_pages):
+        monkeypatch.setattr(module, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(build_pages, 'STATE_FILE', tmp_path / '.build-state.json')
+    monkeypatch.setattr(pipeline, 'SCRIPTS_DIR', scripts)
+    monkeypatch.setattr(pipeline, '_MODULES', {})
+    monkeypatch.syspath_prepend(str(scripts))
+    monkeypatch.delitem(sys.modules, 'stamp_pages', raising=False)
+    tasks = [
+        generator('generate', 'make_pages.py'),
+        Task('stamp', 'stamp_pages.py', ['pages/*-*.html'], requires=['generate'], page=on_page('stamp')),
+    ]
+    return tmp_path, tasks
+
+
+def test_generators_declare_their_targets():
+    for script in ('create_all_ai_interviews.py', 'create_ee_ai.py', 'generate_all_department_files.py'):
+        targets = declared_targets(script)
+        assert targets and all(output.startswith('interview/') for output in targets)
+    assert declared_targets('create_ee_ai.py') == {'interview/ee/ai-interview.html': ['interview/cs/ai-interview.html']}
+    steps = plan(['interview/cs/ai-report.html'])
+    assert steps[0].task.name == 'department-pages'
+    assert steps[0].pages == [f'interview/{d}/ai-report.html' for d in ('ce', 'ec', 'me')]
+
+
+def test_plan_regenerates_only_pages_from_the_changed_template(site):
+    _, tasks = site
+    steps = plan(['pages/ai.html'], tasks)
+    assert [(s.task.name, s.pages) for s in steps] == [
+        ('generate', ['pages/ce-ai.html', 'pages/me-ai.html']),
+        ('stamp', ['pages/ce-ai.html', 'pages/me-ai.html']),
+    ]
+    assert explain(steps, 'pages/me-ai.html') == [
+        'pages/me-ai.html <- generate: pages/ai.html edited',
+        'pages/me-ai.html <- stamp: pages/me-ai.html rebuilt by generate',
+    ]
+    assert [s.pages for s in plan(['scripts/make_pages.py'], tasks)][0] is None
+
+
+def test_build_records_state_and_rebuilds_what_changed(site):
+    root, tasks = site
+    assert build(tasks) == ([], None)
+    assert build_pages.load_state()['pages/ai.html']
+    assert not (root / 'pages' / 'me-ai.html').exists()
+
+    (root / 'pages' / 'mcq.html').write_text('<body>CS quiz</body>', encoding='utf-8')
+    steps, changed = build(tasks)
+    assert changed == ['pages/mcq.html']
+    assert [(s.task.name, s.pages) for s in steps] == [('generate', ['pages/me-mcq.html']),
+                                                     ('stamp', ['pages/me-mcq.html'])]
+    assert (root / 'pages' / 'me-mcq.html').read_text() == '<body>ME quiz<!-- stamped --></body>'
+    assert not (root / 'pages' / 'me-ai.html').exists()
+    assert build(tasks) == ([], [])
+
+    build(tasks, everything=True)
+    assert (root / 'pages' / 'ce-ai.html').read_text() == '<body>CE ai<!-- stamped --></body>'
@@ -0,0 +1,82 @@
+import json
+import sys
+
+import pytest
+
+import build_report_engine
+from build_report_engine import drift, normalize
+from js_harness import run_node
+
+CLONE = """// {label} Report Page - Advanced Comprehensive Report Generation
+document.addEventListener('DOMContentLoaded', async () => {{
+  console.log('{label} Report page initialized');
+  const tutor = AITutor.init('{code}');
+  const pdf = `{label}_Report_${{day}}.pdf`;
+  const emoji = '{emoji}';
+}});
+"""
+
+PAGE = '<html><body>\n  <script src="../../assets/js/{script}"></script>\n</body></html>\n'
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    js = tmp_path / 'assets' / 'js'
+    js.mkdir(parents=True)
+    (js / 'cs-report.js').write_text(CLONE.format(label='CS', code='cs', emoji='📊'), encoding='utf-8')
+    (js / 'ec-report.js').write_text(CLONE.format(label='EC', code='ec', emoji='�첨'), encoding='utf-8')
+    for code, script in (('cs', 'cs-report.js'), ('ec', 'ec-report.js'), ('me', 'cs-report.js')):
+        (tmp_path / 'interview' / code).mkdir(parents=True)
+        (tmp_path / 'interview' / code / 'report.html').write_text(PAGE.format(script=script), encoding='utf-8')
+    monkeypatch.setattr(build_report_engine, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(build_report_engine, 'JS_DIR', js)
+    monkeypatch.setattr(build_report_engine, 'CONFIG_DIR', tmp_path / 'config' / 'reports')
+    return tmp_path
+
+
+def run(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['build_report_engine.py', *args])
+    try:
+        build_report_engine.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def test_normalized_clones_differ_only_in_drift():
+    cs = normalize(CLONE.format(label='CS', code='cs', emoji='📊'), 'cs')
+    ec = normalize(CLONE.format(label='EC', code='ec', emoji='🍊'), 'ec')
+    assert 'REPORT_CONFIG.department' in cs and "'cs'" not in cs and 'CS' not in cs
+    assert drift(cs, ec) == [('symbols', 1, 1)]
+
+
+def test_extracts_engine_and_rewires_pages(site, monkeypatch):
+    assert run(monkeypatch, '--extract', '--remove-clones') == 0
+    js = site / 'assets' / 'js'
+    builds = sorted(p.name for p in js.glob('report-engine.*.js'))
+    assert len(builds) == 1 and not list(js.glob('??-report.js'))
+    assert json.loads((site / 'config/reports/me.json').read_text()) == {'department': 'me', 'label': 'ME'}
+    me = (site / 'interview/me/report.html').read_text(encoding='utf-8')
+    assert '{"department":"me","label":"ME"}</script>' in me
+    assert f'src="../../assets/js/{builds[0]}"' in me
+
+    # Editing the engine moves every page to the new build
+    engine = js / 'report-engine.js'
+    engine.write_text(engine.read_text(encoding='utf-8') + '// edited\n', encoding='utf-8')
+    assert run(monkeypatch, '--check') == 1
+    assert run(monkeypatch) == 0
+    assert run(monkeypatch, '--check') == 0
+    assert len(list(js.glob('report-engine.*.js'))) == 1       # the old build is gone
+    assert (site / 'interview/me/report.html').read_text(encoding='utf-8').count('report-config') == 1
+
+
+def test_engine_reads_page_config(site, monkeypatch):
+    run(monkeypatch, '--extract')
+    engine = (site / 'assets/js/report-engine.js').read_text(encoding='utf-8')
+    header = engine[:engine.index('document.addEventListener')]
+    script = '\n'.join([
+        'const document = {getElementById: () => ({textContent: JSON.stringify(input)})};',
+        header,
+        'console.log(JSON.stringify(REPORT_CONFIG));',
+    ])
+    assert run_node(script, {'department': 'ce', 'label': 'CE'}) == {'department': 'ce', 'label': 'CE'}
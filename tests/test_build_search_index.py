@@ -0,0 +1,127 @@
+import json
+
+import pytest
+
+import build_search_index
+from build_search_index import CACHE_NAME, MANIFEST_NAME, build, tokenize
+from js_harness import read_source, run_node
+from keyword_coverage import Question
+
+PAGES = {
+    'index.html': '<html><head><title>SmartMock Home</title><meta name="description" content="Mock interviews">'
+                  '<script>var hidden = "javascript";</script></head><body><nav>Dashboard Login</nav>'
+                  '<h1>Practice interviews</h1><p>Recursion, graphs &amp; dynamic programming.</p></body></html>',
+    'interview/cs/preparation.html': '<title>CS Preparation</title><h2>Algorithms</h2><p>Sorting algorithms '
+                                     'and recursion trees.</p>',
+    'interview/cs/test-page.html': '<title>Test</title><p>recursion</p>',
+    'archived_docs/old.html': '<title>Old</title><p>recursion</p>',
+}
+QUESTIONS = [
+    Question(0, 'cs', 1, {'id': 'cs_e1', 'text': 'Explain recursion with an example.',
+                          'expectedKeywords': ['base case', 'stack']}),
+    Question(1, 'default', 1, {'id': 'd1', 'text': 'Tell me about recursion.', 'expectedKeywords': []}),
+]
+GENERATOR = '''
+DEPARTMENTS = {
+    'me': {'name': 'Mechanical Engineering',
+           'videos': [('Thermodynamics Basics', 'Laws of thermodynamics', 'abcdefghijk')]},
+}
+'''
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    for name, content in PAGES.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding='utf-8')
+    (tmp_path / 'gen.py').write_text(GENERATOR, encoding='utf-8')
+    monkeypatch.setattr(build_search_index, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(build_search_index, 'DEPARTMENT_SOURCES', ('gen.py', 'missing.py'))
+    monkeypatch.setattr(build_search_index, 'load_questions', lambda: QUESTIONS)
+    return tmp_path
+
+
+def load_index(out):
+    manifest = json.loads((out / MANIFEST_NAME).read_text(encoding='utf-8'))
+    docs = json.loads((out / manifest['docs']).read_text(encoding='utf-8'))
+    terms = {}
+    for name in manifest['shards'].values():
+        terms.update(json.loads((out / name).read_text(encoding='utf-8')))
+    return manifest, docs, terms
+
+
+def test_index_covers_pages_videos_and_questions(site):
+    out = site / 'assets' / 'search'
+    manifest, index, _, _ = build(out)
+    _, docs, terms = load_index(out)
+
+    by_url = {}
+    for doc_id in range(0, len(terms['recursion']), 2):
+        by_url[docs[terms['recursion'][doc_id]][0]] = terms['recursion'][doc_id + 1]
+    # skipped pages and the 'default' pool are not indexed; titles outweigh body text
+    assert by_url == {'index.html': 1, 'interview/cs/preparation.html': 1, 'interview/cs/ai-interview.html': 8}
+    assert 'javascript' not in terms and 'dashboard' not in terms
+    assert terms['interview'] == [0, 6]                        # description 2 + heading 4
+    assert 'algorithm' in terms and 'algorithms' not in terms
+    video = docs[terms['thermodynamic'][0]]
+    assert video == ['interview/me/preparation.html', 'Thermodynamics Basics', 'video', 'Laws of thermodynamics']
+    assert manifest['documents'] == 4 and manifest['shards']['re'].startswith('terms-re.')
+
+
+def test_incremental_build_reparses_changed_pages_only(site):
+    out = site / 'assets' / 'search'
+    build(out)
+    first_manifest, first_docs, _ = load_index(out)
+    _, index, _, removed = build(out)
+    assert index.parsed == 0 and removed == 0
+
+    (site / 'interview' / 'cs' / 'preparation.html').write_text('<title>CS Preparation</title><p>Heaps</p>')
+    (site / 'index.html').unlink()
+    manifest, index, _, removed = build(out)
+    _, docs, terms = load_index(out)
+    assert index.parsed == 1
+    assert docs[0] is None and docs[1][3] == 'Heaps' and docs[2:] == first_docs[2:]
+    assert 'heap' in terms and terms['recursion'] == [3, 8]
+    assert removed and not (out / first_manifest['docs']).exists()
+    assert sorted(p.name for p in out.iterdir()) == sorted(
+        [MANIFEST_NAME, CACHE_NAME, manifest['docs'], *manifest['shards'].values()])
+
+    build(out, full=True)
+    _, docs, _ = load_index(out)
+    assert None not in docs
+
+
+def test_browser_search_matches_prefixes_and_python_tokens(site):
+    build(site / 'assets' / 'search')
+    texts = ['Pages, classes & ＡＰＩs — naïve CAFÉS', 'the 2 it is a x_y recursion-trees']
+    script = read_source('assets/js/site-search.js') + '''
+const search = window.SiteSearch;
+search.root = input.root;
+(async () => {
+  const results = {};
+  for (const query of input.queries) {
+    results[query] = (await search.search(query)).map(r => r.url.slice(input.root.length));
+  }
+  const tokens = input.texts.map(t => search.tokenize(t));
+  console.log(JSON.stringify({results, tokens}));
+})();
+'''
+    stub = ('global.document = {currentScript: null}; global.window = {};\n'
+            'global.fetch = async url => ({ok: require("fs").existsSync(url), status: 404,'
+            ' json: async () => JSON.parse(require("fs").readFileSync(url, "utf8"))});\n')
+    output = run_node(stub + script, {
+        'root': str(site) + '/',
+        'queries': ['recur', 'recursion ', 'recursion algo', 'thermodynamics', 'PRACTICE interviews', 'zz', 'x'],
+        'texts': texts,
+    })
+    assert output['tokens'] == [tokenize(t) for t in texts]
+    assert output['results'] == {
+        'recur': ['interview/cs/ai-interview.html', 'index.html', 'interview/cs/preparation.html'],
+        'recursion ': ['interview/cs/ai-interview.html', 'index.html', 'interview/cs/preparation.html'],
+        'recursion algo': ['interview/cs/preparation.html'],
+        'thermodynamics': ['interview/me/preparation.html'],
+        'PRACTICE interviews': ['index.html'],
+        'zz': [],
+        'x': [],
+    }
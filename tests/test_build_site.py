@@ -0,0 +1,109 @@
+import time
+
+import pytest
+
+import build_site
+import pipeline
+from build_site import TaskCache, critical_path, schedule, waves
+from pipeline import Task, dependencies
+
+SLOW = '''
+import time
+from pathlib import Path
+
+time.sleep(0.3)
+Path('out/{name}.txt').write_text(Path('src/{source}').read_text() + ' {name}')
+'''
+FAIL = '''
+raise SystemExit('broken')
+'''
+HELPER = '''
+from pathlib import Path
+
+SUFFIX = (Path(__file__).parent.parent / 'config' / 'suffix.txt').read_text()
+'''
+TAG = '''
+from pathlib import Path
+
+from suffix import SUFFIX
+
+Path('out/tag.txt').write_text(Path('src/a.txt').read_text() + SUFFIX)
+'''
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    (tmp_path / 'scripts').mkdir()
+    (tmp_path / 'src').mkdir()
+    (tmp_path / 'out').mkdir()
+    (tmp_path / 'src' / 'a.txt').write_text('A')
+    (tmp_path / 'src' / 'b.txt').write_text('B')
+    scripts = {'left': 'a.txt', 'right': 'b.txt', 'join': '../out/left.txt'}
+    for name, source in scripts.items():
+        (tmp_path / 'scripts' / f'{name}.py').write_text(SLOW.format(name=name, source=source))
+    (tmp_path / 'scripts' / 'fail.py').write_text(FAIL)
+    for module in (pipeline, build_site):
+        monkeypatch.setattr(module, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(pipeline, 'SCRIPTS_DIR', tmp_path / 'scripts')
+    tasks = [
+        Task('left', 'left.py', ['src/a.txt'], ['out/left.txt']),
+        Task('right', 'right.py', ['src/b.txt'], ['out/right.txt']),
+        Task('join', 'join.py', ['out/left.txt'], ['out/join.txt']),
+    ]
+    return tmp_path, tasks
+
+
+def test_independent_tasks_overlap_and_dependants_wait(site):
+    root, tasks = site
+    # join reads what left writes, so it waits for left without a declared prerequisite
+    assert dependencies(tasks) == {'left': set(), 'right': set(), 'join': {'left'}}
+    assert waves(tasks) == [['left', 'right'], ['join']]
+
+    start = time.perf_counter()
+    results = schedule(tasks, jobs=2)
+    assert time.perf_counter() - start < 0.85            # 2 x 0.3s chain, not 3 x 0.3s serial
+    assert [r.status for r in results] == ['ran'] * 3 and results[-1].task.name == 'join'
+    assert (root / 'out' / 'join.txt').read_text() == 'A left join'
+
+    total, chain = critical_path(results, dependencies(tasks))
+    assert chain == ['left', 'join'] and total == pytest.approx(results[0].seconds + results[2].seconds, abs=0.4)
+
+
+def test_cache_restores_outputs_for_unchanged_inputs(site):
+    root, tasks = site
+    cache = TaskCache(root / '.build-cache')
+    schedule(tasks, cache=cache)
+    (root / 'out' / 'join.txt').unlink()
+    (root / 'src' / 'b.txt').write_text('B2')
+    results = {r.task.name: r.status for r in schedule(tasks, cache=cache)}
+    assert results == {'left': 'cached', 'right': 'ran', 'join': 'cached'}
+    assert (root / 'out' / 'join.txt').read_text() == 'A left join'
+    assert (root / 'out' / 'right.txt').read_text() == 'B2 right'
+
+
+def test_cache_key_follows_imported_helpers_and_their_config(site):
+    root, _ = site
+    (root / 'config').mkdir()
+    (root / 'config' / 'suffix.txt').write_text('!')
+    (root / 'scripts' / 'suffix.py').write_text(HELPER)
+    (root / 'scripts' / 'tag.py').write_text(TAG)
+    tasks = [Task('tag', 'tag.py', ['src/a.txt'], ['out/tag.txt'])]
+    cache = TaskCache(root / '.build-cache')
+    assert [r.status for r in schedule(tasks, cache=cache)] == ['ran']
+    assert [r.status for r in schedule(tasks, cache=cache)] == ['cached']
+
+    (root / 'config' / 'suffix.txt').write_text('?')
+    assert [r.status for r in schedule(tasks, cache=cache)] == ['ran']
+    assert (root / 'out' / 'tag.txt').read_text() == 'A?'
+    (root / 'scripts' / 'suffix.py').write_text(HELPER + "SUFFIX += '?'\n")
+    assert [r.status for r in schedule(tasks, cache=cache)] == ['ran']
+    assert (root / 'out' / 'tag.txt').read_text() == 'A??'
+
+
+def test_failure_skips_only_dependants(site):
+    root, tasks = site
+    tasks[0] = Task('left', 'fail.py', ['src/a.txt'], ['out/left.txt'])
+    results = {r.task.name: r for r in schedule(tasks)}
+    assert results['left'].status == 'failed' and 'broken' in str(results['left'].error)
+    assert results['join'].status == 'skipped'
+    assert results['right'].status == 'ran'
@@ -0,0 +1,70 @@
+import json
+
+import check_page_budgets
+from check_page_budgets import check, load_config, measure, record
+
+PAGE = '''<!doctype html>
+<html>
+  <head>
+    <link rel="preconnect" href="https://fonts.gstatic.com">
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Poppins">
+    <link rel="stylesheet" href="assets/css/styles.css">
+    <style>.a{color:red}</style>
+    <script type="application/ld+json">{"@type": "WebPage"}</script>
+  </head>
+  <body style="margin:0">
+    <img src="assets/img/logo.png"><img src="assets/img/logo.png"><img src="data:image/png;base64,AAAA">
+    <iframe src="https://www.youtube.com/embed/x"></iframe>
+    <script src="assets/js/app.js"></script>
+    <script>init();</script>
+  </body>
+</html>
+'''
+
+
+def test_measure_counts_inline_bytes_and_distinct_requests(tmp_path):
+    page = tmp_path / 'page.html'
+    page.write_text(PAGE, encoding='utf-8')
+    assert measure(page) == {
+        'htmlBytes': len(PAGE.encode('utf-8')),
+        'inlineCssBytes': len('.a{color:red}') + len('margin:0'),
+        'inlineJsBytes': len('init();'),
+        'requests': 5,
+        'thirdPartyRequests': 2,
+    }
+    assert measure(page, {'www.youtube.com'})['thirdPartyRequests'] == 1
+
+
+def test_first_matching_budget_applies_and_runs_are_recorded(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_page_budgets, 'BASE_DIR', tmp_path)
+    (tmp_path / 'interview' / 'cs').mkdir(parents=True)
+    (tmp_path / 'interview' / 'cs' / 'ai-interview.html').write_text(PAGE, encoding='utf-8')
+    (tmp_path / 'interview' / 'cs' / 'courses.html').write_text(PAGE, encoding='utf-8')
+    (tmp_path / 'index.html').write_text('<p>hi</p>', encoding='utf-8')
+    config = {'history': 'history.jsonl', 'budgets': [
+        {'pages': 'interview/*/ai-interview.html', 'requests': 4},
+        {'pages': 'interview/*/*.html', 'requests': 10, 'thirdPartyRequests': 1},
+        {'pages': '*.html', 'htmlBytes': 5},
+    ]}
+    weights, violations = check(config)
+    assert sorted(weights) == ['index.html', 'interview/cs/ai-interview.html', 'interview/cs/courses.html']
+    assert violations == [
+        ('index.html', '*.html', 'htmlBytes', 9, 5),
+        ('interview/cs/ai-interview.html', 'interview/*/ai-interview.html', 'requests', 5, 4),
+        ('interview/cs/courses.html', 'interview/*/*.html', 'thirdPartyRequests', 2, 1),
+    ]
+
+    history = tmp_path / 'history.jsonl'
+    record(history, weights, violations)
+    record(history, weights, [])
+    runs = [json.loads(line) for line in history.read_text().splitlines()]
+    assert [run['violations'] for run in runs] == [3, 0]
+    assert runs[0]['pages']['index.html'][runs[0]['metrics'].index('htmlBytes')] == 9
+    assert runs[0]['totals']['requests'] == 10
+
+
+def test_shipped_pages_are_within_budget():
+    config = load_config()
+    weights, violations = check(config)
+    assert violations == []
+    assert {'index.html', 'interview/cs/ai-interview.html', 'recruiter/dashboard.html'} <= set(weights)
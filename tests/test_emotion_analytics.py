@@ -0,0 +1,114 @@
+import numpy as np
+
+from emotion_analytics import PALETTE, TimelineBatch, js_to_fixed, normalize_session, safe_name, summarize
+from js_harness import run_node
+
+VISUALIZATIONS = 'assets/js/visualizations.js'
+TYPES = ['Happy', 'Confident', 'Neutral', 'Nervous', 'Confused', 'Bored']
+
+
+def js_visualize(sessions):
+    """identifySpikes, calculateEmotionDistribution and heatmapSegments from visualizations.js"""
+    script = '\n'.join([
+        'global.window = {}; global.document = {}; console.log = () => {};',
+        f"require('./{VISUALIZATIONS}');",
+        'const viz = window.SmartMockVisualizations;',
+        "process.stdout.write(JSON.stringify(input.map(emotions => ({",
+        '  spikes: viz.identifySpikes(emotions),',
+        '  distribution: viz.calculateEmotionDistribution(emotions),',
+        '  segments: viz.heatmapSegments(emotions),',
+        '}))));',
+    ])
+    return run_node(script, sessions)
+
+
+def random_sessions(count, seed=11):
+    rng = np.random.default_rng(seed)
+    sessions = []
+    for s in range(count):
+        emotions = []
+        for i in range(int(rng.integers(1, 60))):
+            sample = {'type': TYPES[int(rng.integers(len(TYPES)))], 'timestamp': i * 5}
+            roll = rng.random()
+            if roll < 0.7:
+                sample['confidence'] = round(float(rng.random()), 2)
+            elif roll < 0.8:
+                sample['confidence'] = 0
+            elif roll < 0.85:
+                del sample['timestamp']
+            emotions.append(sample)
+        sessions.append(emotions)
+    return sessions
+
+
+def python_summaries(sessions, max_bins=800):
+    batch = TimelineBatch([(str(i), 60, emotions) for i, emotions in enumerate(sessions)])
+    return summarize(batch, max_bins)
+
+
+def test_parity_with_visualizations_js():
+    sessions = random_sessions(200) + [
+        [{'type': 'Nervous', 'confidence': 0.7}, {'type': 'Confused', 'confidence': 0.9},
+         {'type': 'Confused', 'confidence': 0.91}, {'confidence': 0.95}],
+        [{'type': 'Happy'}, {'type': 'Neutral'}, {'type': 'Neutral'}, {'type': 'Happy'}],
+        # Array-index keys enumerate first in JS, which also decides the dominant on a tie
+        [{'type': 'Happy'}, {'type': 'Happy'}, {'type': 10}, {'type': 2}, {'type': 2}, {'type': '01'},
+         {'type': 1.5}],
+    ]
+    expected = js_visualize(sessions)
+    for summary, js in zip(python_summaries(sessions), expected):
+        spikes = [{k: v for k, v in spike.items() if k != 'bin'} for spike in summary['spikes']]
+        assert spikes == js['spikes']
+        assert summary['distribution'] == js['distribution']
+        assert list(summary['distribution']['counts']) == list(js['distribution']['counts'])
+        assert list(summary['distribution']['percentages']) == list(js['distribution']['percentages'])
+        palette = summary['bins']['palette']
+        segments = [{'color': palette[c], 'alpha': a}
+                    for c, a in zip(summary['bins']['color'], summary['bins']['alpha'])]
+        assert segments == js['segments']
+
+
+def test_to_fixed_rounds_ties_up_like_js():
+    assert js_to_fixed(49 / 400 * 100, 1) == '12.3'
+    assert js_to_fixed(1 / 3 * 100, 1) == '33.3'
+    assert js_to_fixed(100.0, 1) == '100.0'
+
+
+def test_long_sessions_are_binned():
+    emotions = [{'type': 'Happy', 'confidence': 0.2}] * 300 + \
+               [{'type': 'Nervous', 'confidence': 0.8}] * 100
+    summary = python_summaries([emotions], max_bins=100)[0]
+    assert len(summary['bins']['color']) == 100
+    nervous = [name for name, _ in PALETTE].index('Nervous')
+    assert summary['bins']['color'][-25:] == [nervous] * 25
+    assert summary['bins']['alpha'][0] == 0.2
+    assert summary['spikes'][0]['index'] == 300 and summary['spikes'][0]['bin'] == 75
+
+
+def test_expression_list_is_capitalised():
+    session_id, _, emotions = normalize_session('abc', {'expression_list': ['happy', 'nervous']})
+    assert session_id == 'abc'
+    assert emotions == [{'type': 'Happy'}, {'type': 'Nervous'}]
+
+
+def test_session_file_names_do_not_collide():
+    names = {safe_name(session_id) for session_id in ('a/b', 'a_b', 'a?b', 'a b')}
+    assert len(names) == 4
+    assert all(name.startswith('a_b.') for name in names)
+
+
+def test_heatmap_loader_prefers_the_precomputed_summary():
+    summary = python_summaries([[{'type': 'Nervous', 'confidence': 0.8}, {'type': 'Happy'}]])[0]
+    script = '\n'.join([
+        'const ctx = new Proxy({}, { get: () => () => {} });',
+        "global.document = { createElement: () => ({ getContext: () => ctx, toDataURL: () => 'png' }) };",
+        'global.window = {}; console.log = () => {}; console.warn = () => {};',
+        'global.fetch = async url => ({ ok: url in input.files, json: async () => input.files[url] });',
+        f"require('./{VISUALIZATIONS}');",
+        'const viz = window.SmartMockVisualizations;',
+        "const timeline = [{ type: 'Happy', confidence: 0.9 }];",
+        "Promise.all(['s1', 'missing'].map(id => viz.loadEmotionHeatmap(id, timeline, 10, 'emo')))",
+        '  .then(maps => process.stdout.write(JSON.stringify(maps.map(m => m.emotionDistribution.counts))));',
+    ])
+    files = {'emo/index.json': {'s1': {'file': 's1.json'}}, 'emo/s1.json': summary}
+    assert run_node(script, {'files': files}) == [{'Nervous': 1, 'Happy': 1}, {'Happy': 1}]
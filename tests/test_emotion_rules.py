@@ -0,0 +1,112 @@
+import copy
+import json
+
+import numpy as np
+import pytest
+
+from emotion_rules import RULES_PATH, RuleError, compile_rules, load_rules, validate_rules
+from js_harness import extract_function, random_frames, read_source, run_node, threshold_frames
+
+PAGE = 'interview/cs/ai-interview.html'
+
+
+def js_classify(rules, frames, tree=None):
+    """Run classifyEmotion() from the interview page on feature dicts, optionally with a loaded tree"""
+    source = read_source(PAGE)
+    tree_source = read_source('assets/js/emotion-tree.js')
+    script = '\n'.join([
+        'global.window = {};',
+        extract_function(tree_source, 'classifyEmotionLinear'),
+        extract_function(tree_source, 'classifyEmotionTree'),
+        'window.EmotionTree = {classify: classifyEmotionTree}; const EmotionTree = window.EmotionTree;',
+        'function computeFeatures(features){ return features; }',
+        extract_function(source, 'conditionsPass'),
+        extract_function(source, 'classifyEmotion'),
+        'let emotionRules = input.rules;',
+        'let emotionTree = input.tree;',
+        'console.log(JSON.stringify(input.frames.map(classifyEmotion)));',
+    ])
+    return run_node(script, {'rules': rules, 'frames': frames, 'tree': tree})
+
+
+def test_shipped_rules_are_valid():
+    rules = load_rules(RULES_PATH)
+    assert compile_rules(rules).emotions[-1] == 'neutral'
+
+
+def test_parity_with_js_on_random_frames():
+    rules = load_rules(RULES_PATH)
+    frames = random_frames(2000)
+    assert list(compile_rules(rules).classify(frames)) == js_classify(rules, frames)
+
+
+def test_parity_with_js_on_threshold_boundaries():
+    rules = load_rules(RULES_PATH)
+    frames = threshold_frames(rules)
+    assert list(compile_rules(rules).classify(frames)) == js_classify(rules, frames)
+
+
+def test_parity_with_js_on_missing_features():
+    rules = load_rules(RULES_PATH)
+    frames = [
+        {'mouthOpen': 0.5, 'smileCurve': 0.5},
+        {'eyeOpen': 0.05, 'smileCurve': 0.1},
+        {'smileCurve': 0.1},
+        {},
+    ]
+    assert list(compile_rules(rules).classify(frames)) == js_classify(rules, frames)
+
+
+def test_parity_with_js_on_between_and_inclusive_operators():
+    rules = {
+        'features': ['mouthOpen', 'eyeOpen', 'smileCurve'],
+        'rules': [
+            {'emotion': 'focused', 'conditions': {'eyeOpen': {'between': [0.1, 0.2]}, 'mouthOpen': {'<=': 0.1}}},
+            {'emotion': 'happy', 'conditions': {'smileCurve': {'>=': 0.4, '<': 0.5}}},
+            {'conditions': {'mouthOpen': {'>': 0.3}}},
+        ],
+    }
+    frames = threshold_frames(rules) + random_frames(500, seed=3)
+    assert list(compile_rules(rules).classify(frames)) == js_classify(rules, frames)
+
+
+def test_page_uses_the_compiled_tree_when_loaded():
+    rules = load_rules(RULES_PATH)
+    tree = json.loads(read_source('assets/js/emotion-tree.json'))
+    frames = threshold_frames(rules) + random_frames(500) + [{'mouthOpen': 0.5}]
+    assert js_classify(rules, frames, tree) == list(compile_rules(rules).classify(frames))
+
+
+def test_first_match_wins_in_rule_order():
+    rules = {
+        'features': ['x'],
+        'rules': [
+            {'emotion': 'a', 'conditions': {'x': {'>': 0.5}}},
+            {'emotion': 'b', 'conditions': {'x': {'>': 0.2}}},
+        ],
+    }
+    labels = compile_rules(rules).classify(np.array([[0.9], [0.3], [0.1], [np.nan]]))
+    assert list(labels) == ['a', 'b', 'neutral', 'neutral']
+
+
+def test_counts_merge_duplicate_emotions():
+    rules = json.loads(RULES_PATH.read_text(encoding='utf-8'))
+    classifier = compile_rules(rules)
+    counts = classifier.counts(random_frames(300))
+    assert sum(counts.values()) == 300
+    assert set(counts) <= {'surprised', 'sad', 'happy', 'neutral'}
+
+
+@pytest.mark.parametrize('mutate, message', [
+    (lambda r: r['rules'][0]['conditions'].update({'browRaise': {'>': 1}}), 'unknown feature'),
+    (lambda r: r['rules'][0]['conditions']['mouthOpen'].update({'=>': 1}), 'unknown operator'),
+    (lambda r: r['rules'][0]['conditions'].update({'eyeOpen': {'between': [0.5, 0.1]}}), 'min is greater'),
+    (lambda r: r['rules'][1]['conditions'].update({'eyeOpen': {}}), 'non-empty object'),
+    (lambda r: r['rules'][2]['conditions']['mouthOpen'].update({'>': '0.18'}), 'must be a number'),
+    (lambda r: r['weights'].update({'sad': -1}), 'non-negative'),
+])
+def test_validation_errors(mutate, message):
+    rules = copy.deepcopy(load_rules(RULES_PATH))
+    mutate(rules)
+    with pytest.raises(RuleError, match=message):
+        validate_rules(rules)
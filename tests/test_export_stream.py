@@ -0,0 +1,106 @@
+import gzip
+import io
+import json
+from collections import Counter
+
+from export_stream import (ExportFormatError, Record, ShardWriter, batched, fan_out, iter_matches, iter_records,
+                           iter_typed, read_shards)
+
+EXPORT = {
+    'users': {'u1': {'name': 'A "quoted" {brace} [name]', 'tags': [[1, 2], {'x': '\\\\'}]}},
+    'interviews': {
+        'u1': {'s1': {'overallScore': 0.8, 'note': 'ends with \\\\'}, 's2': {'overallScore': -25000000000.5}},
+        'u2': {'s3': [1, 2, 3], 's4': {'stars': 4}},
+    },
+    'leaderboard': {'u1': {'totalStars': 3}},
+}
+
+
+def square_sums(batch):
+    return [x * x for x in batch]
+
+
+def test_records_survive_any_chunk_boundary():
+    text = json.dumps(EXPORT, indent=1)
+    for chunk_size in (1, 7, 64, 1 << 20):
+        found = list(iter_records(io.StringIO(text), 'interviews/*/*', chunk_size=chunk_size))
+        assert found == [(('u1', 's1'), EXPORT['interviews']['u1']['s1']),
+                         (('u1', 's2'), EXPORT['interviews']['u1']['s2']),
+                         (('u2', 's3'), [1, 2, 3]),
+                         (('u2', 's4'), {'stars': 4})]
+        # users/ holds brackets and quotes inside strings that the skip must not count
+        assert list(iter_records(io.StringIO(text), 'leaderboard/*', chunk_size=chunk_size)) == \
+            [(('u1',), {'totalStars': 3})]
+
+
+def test_truncated_export_raises():
+    text = json.dumps(EXPORT)[:-30]
+    try:
+        list(iter_records(io.StringIO(text), 'leaderboard/*', chunk_size=16))
+    except ExportFormatError:
+        return
+    raise AssertionError('truncated export was accepted')
+
+
+def test_iter_typed_counts_non_object_values():
+    skipped = Counter()
+    records = list(iter_typed(io.StringIO(json.dumps(EXPORT)), 'interviews/*/*', skipped))
+    assert [r.path for r in records] == ['interviews/u1/s1', 'interviews/u1/s2', 'interviews/u2/s4']
+    assert records[0].keys == ('u1', 's1')
+    assert skipped == {'list': 1}
+
+
+def test_batched():
+    assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(batched([], 3)) == []
+
+
+def test_fan_out_keeps_order_and_bounds_pending():
+    pulled = []
+
+    def batches():
+        for i in range(12):
+            pulled.append(i)
+            yield [i, i + 1]
+
+    results = fan_out(square_sums, batches(), workers=2, max_pending=3)
+    assert next(results) == [0, 1]
+    assert len(pulled) == 3
+    assert list(results) == [[i * i, (i + 1) ** 2] for i in range(1, 12)]
+    assert list(fan_out(square_sums, batched(range(5), 2), workers=1)) == [[0, 1], [4, 9], [16]]
+
+
+def test_shards_roll_over_and_round_trip(tmp_path):
+    records = [Record(f'leaderboard/u{i}', (f'u{i}',), {'totalStars': i}) for i in range(25)]
+    for compress in (False, True):
+        out = tmp_path / ('gz' if compress else 'plain')
+        writer = ShardWriter(out, 'leaderboard', shard_size=10, compress=compress)
+        writer.write(records)
+        writer.close()
+        assert [s['records'] for s in writer.shards] == [10, 10, 5]
+        paths = [out / s['file'] for s in writer.shards]
+        if compress:
+            assert all(p.name.endswith('.ndjson.gz') for p in paths)
+            with gzip.open(paths[0], 'rt', encoding='utf-8') as f:
+                assert len(f.readlines()) == 10
+        assert list(read_shards(paths)) == records
+
+
+def test_remove_stale_keeps_other_prefixes(tmp_path):
+    writer = ShardWriter(tmp_path, 'interviews', shard_size=1)
+    writer.write([Record('interviews/a/b', ('a', 'b'), {}), Record('interviews/a/c', ('a', 'c'), {})])
+    writer.close()
+    (tmp_path / 'leaderboard-00001.ndjson').write_text('', encoding='utf-8')
+    assert ShardWriter(tmp_path, 'interviews').remove_stale() == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['leaderboard-00001.ndjson']
+
+
+def test_iter_matches_serves_nested_patterns_in_one_pass():
+    patterns = ['interviews/*', 'interviews/*/s?', 'leaderboard/*', 'missing/*']
+    found = list(iter_matches(io.StringIO(json.dumps(EXPORT)), patterns, chunk_size=16))
+    assert [(p, k) for p, k, _ in found] == [
+        ('interviews/*', ('u1',)), ('interviews/*/s?', ('u1', 's1')), ('interviews/*/s?', ('u1', 's2')),
+        ('interviews/*', ('u2',)), ('interviews/*/s?', ('u2', 's3')), ('interviews/*/s?', ('u2', 's4')),
+        ('leaderboard/*', ('u1',)),
+    ]
+    assert found[2][2] == EXPORT['interviews']['u1']['s2']
@@ -0,0 +1,33 @@
+import pytest
+
+from js_harness import read_source, run_node
+from js_literal import JsLiteralError, literal_after, parse_value
+
+
+def test_parses_js_data_syntax():
+    source = r"""{
+      // comment
+      a: 'it\'s', "b": [1, -2.5, 0x1F, 1e3, true, null, undefined,], /* block */
+      3: `multi
+line`, $c: { 'dé': "\x41\n" },
+    }"""
+    value, end = parse_value(source)
+    assert value == {'a': "it's", 'b': [1, -2.5, 31, 1000.0, True, None, None], '3': 'multi\nline',
+                     '$c': {'dé': 'A\n'}}
+    assert end == len(source)
+
+
+@pytest.mark.parametrize('source', ['{a: f()}', '[`x ${y}`]', "{a: 'open", '{...rest}'])
+def test_rejects_code(source):
+    with pytest.raises(JsLiteralError):
+        literal_after(source, '')
+
+
+def test_matches_node_on_question_pools():
+    source = read_source('assets/js/adaptive-interview.js')
+    script = '\n'.join([
+        'const window = {}; console.log = () => {};',
+        source,
+        'process.stdout.write(JSON.stringify(window.AdaptiveInterview.questionPools));',
+    ])
+    assert literal_after(source, 'questionPools:') == run_node(script, None)
@@ -0,0 +1,93 @@
+import json
+import sys
+
+import numpy as np
+
+import keyword_coverage
+from keyword_coverage import CoverageStats, KeywordIndex, Question, load_questions, normalize_tokens, suggest_tiers
+
+POOL = [
+    ('cs', 1, {'id': 'e1', 'text': 'What is a variable?', 'expectedKeywords': ['store', 'value']}),
+    ('cs', 1, {'id': 'e2', 'text': 'Explain if-else.', 'expectedKeywords': ['condition', 'branch']}),
+    ('cs', 4, {'id': 'x1', 'text': 'Design a cache.', 'expectedKeywords': ['consistent hashing', 'O(log n)',
+                                                                         'Replication', 'eviction']}),
+    ('ee', 4, {'id': 'x2', 'text': 'Design a cache.', 'expectedKeywords': ['power']}),
+    ('default', 1, {'id': 'd1', 'text': 'Tell me about yourself.', 'expectedKeywords': []}),
+]
+
+
+def index():
+    return KeywordIndex([Question(i, d, t, q) for i, (d, t, q) in enumerate(POOL)])
+
+
+def test_normalised_phrases_and_department_lookup():
+    idx = index()
+    assert normalize_tokens('Ｒeplications, O(log n)!') == ['replication', 'o', 'log', 'n']
+    found = {idx.terms[t] for t in idx.find('Consistent  hashing gives O(log n) lookups; replicas? REPLICATION.')}
+    assert found == {('consistent', 'hashing'), ('o', 'log', 'n'), ('replication',)}
+    assert not idx.find('consistent results with hashing')
+    assert idx.question_for('design a  CACHE.', 'EE').id == 'x2'
+    assert idx.question_for('Design a cache.').id == 'x1'
+    assert idx.question_for('Unknown?') is None
+
+
+def test_batch_coverage_matches_per_answer_loop():
+    idx = index()
+    rng = np.random.default_rng(3)
+    words = ['store', 'value', 'condition', 'branch', 'consistent', 'hashing', 'O(log', 'n)', 'replication',
+             'eviction', 'power', 'the', 'and']
+    answers = [(int(rng.integers(5)), ' '.join(rng.choice(words, size=int(rng.integers(0, 12)))), float(rng.random()))
+               for _ in range(500)]
+    stats = CoverageStats(idx)
+    coverage = stats.add_batch(answers[:200])
+    coverage = np.concatenate([coverage, stats.add_batch(answers[200:])])
+
+    for (q, text, _), c in zip(answers, coverage):
+        expected = {k for k in np.flatnonzero(idx.incidence[q])}
+        if not expected:
+            assert np.isnan(c)
+        else:
+            assert c == len(expected & idx.find(text)) / len(expected)
+    for q in range(4):
+        mine = coverage[[a[0] == q for a in answers]]
+        assert stats.answers[q] == len(mine)
+        assert np.isclose(stats.coverage[q] / stats.answers[q], mine.mean())
+
+
+def test_suggested_tiers_follow_coverage_and_keep_tier_sizes():
+    entries = [
+        {'department': 'cs', 'tier': 1, 'answers': 40, 'meanCoverage': 0.2},
+        {'department': 'cs', 'tier': 2, 'answers': 40, 'meanCoverage': 0.9},
+        {'department': 'cs', 'tier': 4, 'answers': 40, 'meanCoverage': 0.5},
+        {'department': 'cs', 'tier': 3, 'answers': 5, 'meanCoverage': 0.0},
+    ]
+    suggest_tiers(entries, min_answers=30)
+    assert [e.get('suggestedTier') for e in entries] == [4, 1, 2, None]
+
+
+def test_report_from_export(tmp_path, monkeypatch):
+    questions = load_questions()
+    by_id = {q.id: q for q in questions}
+    sessions = {'u1': {
+        's1': {'department': 'CS', 'questions': ['Tell me about yourself and your background.', by_id['cs_ex1'].text],
+               'answers': ['I like code', 'Use consistent hashing, sharding and LRU eviction'],
+               'score_list': [0.5, 0.9]},
+        's2': {'department': 'CS', 'questions': [by_id['cs_ex1'].text], 'answers': ['replication'],
+               'score_list': [0.3]},
+        's3': {'questions': 'broken'},
+    }}
+    export = tmp_path / 'export.json'
+    export.write_text(json.dumps({'interviews': sessions}), encoding='utf-8')
+    out = tmp_path / 'report.json'
+    monkeypatch.setattr(sys, 'argv', ['keyword_coverage.py', str(export), '--out', str(out), '--min-answers', '1',
+                                      '--answers-out', str(tmp_path / 'answers.ndjson')])
+    keyword_coverage.main()
+    report = json.loads(out.read_text(encoding='utf-8'))
+    entry = next(e for e in report['questions'] if e['id'] == 'cs_ex1')
+    assert (entry['answers'], entry['meanCoverage']) == (2, 0.5)
+    assert entry['keywordHitRate'] == {'consistent hashing': 0.5, 'replication': 0.5, 'sharding': 0.5,
+                                       'eviction': 0.5}
+    assert entry['coverageScoreCorrelation'] == 1.0
+    assert report['sessions'] == 2
+    lines = (tmp_path / 'answers.ndjson').read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['coverage'] for line in lines] == [None, 0.75, 0.25]
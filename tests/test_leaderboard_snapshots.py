@@ -0,0 +1,90 @@
+import io
+import json
+
+import numpy as np
+
+from export_stream import iter_records
+from js_harness import extract_function, read_source, run_node
+from leaderboard_snapshots import LeaderboardSnapshot, build_snapshot
+
+LEADERBOARD = 'assets/js/leaderboard.js'
+
+
+def js_comparator():
+    """The `(a, b) => {...}` passed to allLeaderboardData.sort() in loadLeaderboardData"""
+    body = extract_function(read_source(LEADERBOARD), 'loadLeaderboardData')
+    start = body.index('allLeaderboardData.sort(') + len('allLeaderboardData.sort(')
+    depth = 0
+    for i in range(body.index('{', start), len(body)):
+        depth += {'{': 1, '}': -1}.get(body[i], 0)
+        if depth == 0:
+            return body[start:i + 1]
+
+
+def sample_leaderboard(n=600, seed=3):
+    rng = np.random.default_rng(seed)
+    departments = ['cs', 'ee', 'me', 'ce', 'ec', '', None]
+    board = {}
+    for i in range(n):
+        record = {'name': f'User {i}', 'email': f'u{i}@example.com'}
+        if rng.random() < 0.9:
+            record['totalStars'] = int(rng.integers(0, 12))       # many ties
+        if rng.random() < 0.9:
+            record['bestScore'] = [0, 55, 70, 70, 85, None, '90'][rng.integers(7)]
+        department = departments[rng.integers(len(departments))]
+        if department is not None:
+            record['department'] = department
+        record['totalInterviews'] = int(rng.integers(0, 20))
+        board[f'uid{i:04d}'] = record
+    return board
+
+
+def snapshot_of(board, tmp_path, top=100, department_top=100):
+    export = io.StringIO(json.dumps({'users': {}, 'leaderboard': board}))
+    snapshot = LeaderboardSnapshot(top, department_top)
+    for (uid,), record in iter_records(export, 'leaderboard/*', chunk_size=256):
+        snapshot.add(uid, record)
+    manifest, _ = build_snapshot(snapshot, tmp_path, page_size=25)
+    return manifest
+
+
+def read(tmp_path, name):
+    return json.loads((tmp_path / name).read_text(encoding='utf-8'))
+
+
+def test_ranks_match_client_sort(tmp_path):
+    board = sample_leaderboard()
+    script = '\n'.join([
+        'const rows = Object.entries(input).map(([userId, data]) => ({userId, ...data}));',
+        f'rows.sort({js_comparator()});',
+        'console.log(JSON.stringify(rows.map(r => r.userId)));',
+    ])
+    expected = run_node(script, board)
+    manifest = snapshot_of(board, tmp_path)
+
+    ranks = {}
+    for name in manifest['ranks']['shards'].values():
+        ranks.update(read(tmp_path, name))
+    assert sorted(ranks, key=lambda uid: ranks[uid][0]) == expected
+
+    top = [e for name in manifest['global']['pages'] for e in read(tmp_path, name)['entries']]
+    assert [e['userId'] for e in top] == expected[:100]
+    assert [e['rank'] for e in top] == list(range(1, 101))
+    assert all('email' not in e for e in top)
+
+    cs = [uid for uid in expected if board[uid].get('department') == 'cs']
+    pages = manifest['departments']['cs']['pages']
+    assert [e['userId'] for name in pages for e in read(tmp_path, name)['entries']] == cs[:100]
+    assert all(ranks[uid][1] == i for i, uid in enumerate(cs, 1))
+    assert '' not in manifest['departments']
+
+
+def test_bounded_pages_and_stable_fingerprints(tmp_path):
+    board = sample_leaderboard(200)
+    first = snapshot_of(board, tmp_path / 'a', top=30, department_top=5)
+    second = snapshot_of(board, tmp_path / 'b', top=30, department_top=5)
+    assert first == second
+    assert len(first['global']['pages']) == 2
+    assert read(tmp_path / 'a', first['global']['pages'][1])['entries'][-1]['rank'] == 30
+    assert first['global']['total'] == 200
+    assert first['stats']['totalInterviews'] == sum(r['totalInterviews'] for r in board.values())
@@ -0,0 +1,98 @@
+import json
+
+import numpy as np
+
+from emotion_rules import RULES_PATH, compile_rules, load_rules
+from js_harness import extract_function, random_frames, read_source, run_node, threshold_frames
+from optimize_emotion_rules import TREE_PATH, RuleSetAnalysis, evaluate_tree, linear_comparisons, rule_source_hash
+
+TREE_JS = 'assets/js/emotion-tree.js'
+
+
+def test_tree_matches_rules_on_every_cell_and_boundary():
+    rules = load_rules(RULES_PATH)
+    analysis = RuleSetAnalysis(rules)
+    tree, _, _ = analysis.build_tree()
+    frames = analysis.classifier.as_matrix(threshold_frames(rules))
+    emotions, depth = evaluate_tree(tree, analysis.features, frames)
+    assert list(emotions) == list(analysis.classifier.classify(frames))
+    assert depth.mean() <= linear_comparisons(analysis.classifier, frames).mean()
+
+
+def test_browser_evaluator_matches_rules():
+    rules = load_rules(RULES_PATH)
+    analysis = RuleSetAnalysis(rules)
+    tree, _, _ = analysis.build_tree()
+    model = {'features': analysis.features, 'fallback': 'neutral', 'tree': tree, 'rules': rules['rules']}
+    frames = threshold_frames(rules) + random_frames(500) + [{'mouthOpen': 0.5, 'smileCurve': 0.5}]
+    source = read_source(TREE_JS)
+    script = '\n'.join([
+        extract_function(source, 'classifyEmotionLinear'),
+        extract_function(source, 'classifyEmotionTree'),
+        'console.log(JSON.stringify(input.frames.map(f => classifyEmotionTree(input.model, f))));',
+    ])
+    assert run_node(script, {'model': model, 'frames': frames}) == list(compile_rules(rules).classify(frames))
+
+
+def test_browser_rejects_a_tree_built_from_other_rules():
+    raw = RULES_PATH.read_bytes()
+    model = json.loads(TREE_PATH.read_text(encoding='utf-8'))
+    assert model['sourceHash'] == rule_source_hash(raw)          # the shipped tree is current
+    source = read_source(TREE_JS)
+    script = '\n'.join([
+        'console.warn = () => {};',
+        'const fetch = async () => ({ ok: true, json: async () => input.model });',
+        extract_function(source, 'emotionRulesHash'),
+        extract_function(source, 'loadEmotionTree'),
+        'Promise.all(input.texts.map(t => loadEmotionTree("tree.json", t)))',
+        '  .then(models => console.log(JSON.stringify(models.map(m => m !== null))));',
+    ])
+    retuned = raw.decode('utf-8').replace('0.38', '0.40', 1)
+    texts = [raw.decode('utf-8'), retuned, None]
+    assert run_node(script, {'model': model, 'texts': texts}) == [True, False, True]
+
+
+def test_unreachable_and_redundant_rules_are_reported():
+    rules = {
+        'features': ['a', 'b'],
+        'rules': [
+            {'emotion': 'x', 'conditions': {'a': {'>': 0.5}}},
+            {'emotion': 'y', 'conditions': {'a': {'>': 0.7}}},
+            {'emotion': 'z', 'conditions': {'a': {'>': 0.7, '<': 0.2}}},
+            {'emotion': 'neutral', 'conditions': {}},
+            {'emotion': 'w', 'conditions': {'b': {'between': [0.1, 0.2]}}},
+        ],
+    }
+    status = {e['rule']: e['status'] for e in RuleSetAnalysis(rules).rule_report()}
+    assert status == {0: 'ok', 1: 'unreachable', 2: 'unreachable', 3: 'ok', 4: 'unreachable'}
+
+    shipped = {e['emotion']: e['status'] for e in RuleSetAnalysis(load_rules(RULES_PATH)).rule_report()}
+    assert shipped['neutral'] == 'redundant'
+
+
+def test_frame_weights_follow_observed_frames():
+    rules = load_rules(RULES_PATH)
+    frames = np.tile([[0.5, 0.2, 0.5]], (100, 1))   # all surprised
+    analysis = RuleSetAnalysis(rules, frames)
+    tree, expected, _ = analysis.build_tree()
+    _, depth = evaluate_tree(tree, analysis.features, frames)
+    assert abs(depth.mean() - expected) < 1e-6
+
+
+
+def test_large_rule_sets_fall_back_to_a_greedy_tree():
+    rng = np.random.default_rng(0)
+    rules = {'features': ['a', 'b', 'c'], 'rules': []}
+    for i in range(30):
+        feats = rng.choice(rules['features'], size=2, replace=False)
+        rules['rules'].append({'emotion': f'e{i % 5}', 'conditions': {
+            str(f): {str(rng.choice(['>', '<', '>=', '<='])): round(float(rng.uniform(0, 1)), 2)} for f in feats}})
+    rules['rules'].append({'emotion': 'neutral', 'conditions': {}})
+    analysis = RuleSetAnalysis(rules)
+    assert analysis.search_states() > 10 ** 6
+    tree, _, _ = analysis.build_tree()
+    frames = np.vstack([analysis.classifier.as_matrix(threshold_frames(rules)),
+                        rng.uniform(-0.5, 1.5, size=(5000, 3))])
+    emotions, depth = evaluate_tree(tree, analysis.features, frames)
+    assert list(emotions) == list(analysis.classifier.classify(frames))
+    assert depth.mean() < linear_comparisons(analysis.classifier, frames).mean()
@@ -0,0 +1,146 @@
+import pytest
+
+import purge_css
+from purge_css import Usage, purge
+
+CSS = '''/* theme */
+@import url("fonts.css");
+body { margin: 0; }
+.card, .unused-card { color: red; }
+.card:hover > .title::after { content: "}"; }
+#main .badge, #nowhere { color: blue; }
+.toast-error, .toast-info { opacity: 0; }
+table td { padding: 0; }
+a[href^="http"] { color: green; }
+@media (max-width: 600px) { .unused-card { display: none; } .card { padding: 0; } }
+@media print { .unused-card { display: none; } }
+@keyframes spin { to { transform: rotate(360deg); } }
+@keyframes fade { to { opacity: 0; } }
+.spinner { animation: spin 1s linear infinite; }
+'''
+LINK = '<link rel="stylesheet" href="{}assets/css/styles.css">'
+
+
+def test_purge_keeps_what_markup_and_scripts_can_match():
+    usage = Usage()
+    usage.tags |= {'a', 'div'}
+    usage.classes |= {'card', 'title'}
+    usage.ids.add('main')
+    usage.add_script("el.classList.add('badge'); box.className = `toast-${kind}`; make('spinner');")
+    assert purge(CSS, usage) == '\n'.join([
+        '@import url("fonts.css");',
+        'body {margin: 0;}',
+        '.card {color: red;}',
+        '.card:hover > .title::after {content: "}";}',
+        '#main .badge {color: blue;}',
+        '.toast-error, .toast-info {opacity: 0;}',
+        'a[href^="http"] {color: green;}',
+        '@media (max-width: 600px) {\n.card {padding: 0;}\n}',
+        '.spinner {animation: spin 1s linear infinite;}',
+        '@keyframes spin {to { transform: rotate(360deg); }}',
+    ])
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    css_dir = tmp_path / 'assets' / 'css'
+    css_dir.mkdir(parents=True)
+    (css_dir / 'styles.css').write_text('.card { color: red; }\n.hero { color: blue; }\n', encoding='utf-8')
+    (tmp_path / 'interview' / 'cs').mkdir(parents=True)
+    (tmp_path / 'index.html').write_text(LINK.format('') + '<div class="hero"></div>', encoding='utf-8')
+    dept = tmp_path / 'interview' / 'cs' / 'courses.html'
+    dept.write_text(LINK.format('../../') + '<div class="card"></div>', encoding='utf-8')
+    for name, value in (('BASE_DIR', tmp_path), ('CSS_DIR', css_dir), ('PURGED_DIR', css_dir / 'purged')):
+        monkeypatch.setattr(purge_css, name, value)
+    monkeypatch.setattr(purge_css, 'page_class', lambda page: {'name': 'landing' if page.name == 'index.html'
+                                                               else 'department'})
+    return css_dir, dept
+
+
+def run(monkeypatch, *args):
+    monkeypatch.setattr('sys.argv', ['purge_css.py', *args])
+    purge_css.main()
+
+
+def test_pages_are_rewired_per_class_and_checked(site, monkeypatch):
+    css_dir, dept = site
+    run(monkeypatch)
+    written = sorted(path.name for path in (css_dir / 'purged').iterdir())
+    assert [name.rsplit('.', 2)[0] for name in written] == ['styles.department', 'styles.landing']
+    department = next(name for name in written if '.department.' in name)
+    assert (css_dir / 'purged' / department).read_text(encoding='utf-8') == '.card {color: red;}\n'
+    assert f'href="../../assets/css/purged/{department}"' in dept.read_text(encoding='utf-8')
+
+    (css_dir / 'styles.css').write_text('.card { color: green; }\n.hero { color: blue; }\n', encoding='utf-8')
+    with pytest.raises(SystemExit):
+        run(monkeypatch, '--check')
+    run(monkeypatch)                                     # rebuilds from the source sheet, old copies go
+    assert len(list((css_dir / 'purged').iterdir())) == 2
+    department = dept.read_text(encoding='utf-8').split('purged/')[1].split('"')[0]
+    assert (css_dir / 'purged' / department).read_text(encoding='utf-8') == '.card {color: green;}\n'
+
+
+def test_check_fails_once_a_page_uses_other_classes(site, monkeypatch, capsys):
+    css_dir, dept = site
+    run(monkeypatch)
+    run(monkeypatch, '--check')
+    assert '✅ 2 stylesheet link(s)' in capsys.readouterr().out
+
+    # The department copy was purged without .hero; now a department page uses it
+    dept.write_text(dept.read_text(encoding='utf-8') + '<section class="hero"></section>', encoding='utf-8')
+    with pytest.raises(SystemExit):
+        run(monkeypatch, '--check')
+    assert 'interview/cs/courses.html does not load styles.department.' in capsys.readouterr().out
+    run(monkeypatch)
+    run(monkeypatch, '--check')
+    department = dept.read_text(encoding='utf-8').split('purged/')[1].split('"')[0]
+    assert (css_dir / 'purged' / department).read_text(encoding='utf-8') == \
+        '.card {color: red;}\n.hero {color: blue;}\n'
+
+
+def test_class_names_built_by_loaded_scripts_are_kept(site, monkeypatch):
+    css_dir, dept = site
+    (css_dir / 'styles.css').write_text('\n'.join([
+        '.card { color: red; }',
+        '.toast-error { color: red; }',
+        '.modal-lg { width: 90vw; }',
+        '.is-open { display: block; }',
+        '.tooltip-dark { color: black; }',
+    ]), encoding='utf-8')
+    js = css_dir.parent / 'js'
+    js.mkdir()
+    (js / 'ui.js').write_text("toast.className = 'toast-' + level;\nmodal.classList.add(`modal-${size}`);\n"
+                              "menu.classList.toggle('is-open');\n", encoding='utf-8')
+    dept.write_text(dept.read_text(encoding='utf-8') + '<script src="../../assets/js/ui.js"></script>',
+                    encoding='utf-8')
+    run(monkeypatch)
+    department = dept.read_text(encoding='utf-8').split('purged/')[1].split('"')[0]
+    assert (css_dir / 'purged' / department).read_text(encoding='utf-8') == '\n'.join([
+        '.card {color: red;}',
+        '.toast-error {color: red;}',
+        '.modal-lg {width: 90vw;}',
+        '.is-open {display: block;}',
+    ]) + '\n'
+
+
+def test_emptied_at_rules_and_unreferenced_keyframes_go():
+    usage = Usage()
+    usage.classes |= {'card', 'loader'}
+    css = '\n'.join([
+        '@media (max-width: 600px) { .sidebar { display: none; } .nav .link { padding: 0; } }',
+        '@media screen { @supports (display: grid) { .sidebar { display: grid; } .card { display: grid; } } }',
+        '.sidebar { animation: slide 1s; }',
+        '.loader { animation: spin-slow 2s; }',
+        '.card { -webkit-animation: pulse 1s; }',
+        '@keyframes slide { to { left: 0; } }',
+        '@keyframes spin { to { transform: rotate(1turn); } }',
+        '@keyframes spin-slow { to { transform: rotate(1turn); } }',
+        '@-webkit-keyframes pulse { 50% { opacity: .5; } }',
+    ])
+    assert purge(css, usage) == '\n'.join([
+        '@media screen {\n@supports (display: grid) {\n.card {display: grid;}\n}\n}',
+        '.loader {animation: spin-slow 2s;}',
+        '.card {-webkit-animation: pulse 1s;}',
+        '@keyframes spin-slow {to { transform: rotate(1turn); }}',
+        '@-webkit-keyframes pulse {50% { opacity: .5; }}',
+    ])
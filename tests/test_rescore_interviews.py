@@ -0,0 +1,78 @@
+import io
+import json
+from collections import Counter
+
+import numpy as np
+
+from export_stream import iter_records
+from js_harness import extract_function, read_source, run_node
+from rescore_interviews import PatchWriter, ScoreBatch, calculate_grades, calculate_stars, rescore
+
+POSTPROCESS = 'assets/js/interview-postprocess.js'
+
+
+def js_scores(records):
+    source = read_source(POSTPROCESS)
+    script = '\n'.join([
+        'console.log = () => {}; console.error = () => {};',
+        extract_function(source, 'calculateStars'),
+        extract_function(source, 'calculateGrade'),
+        'process.stdout.write(JSON.stringify(input.map(r => ['
+        'calculateStars(r), calculateGrade(r.overallScore || 0)])));',
+    ])
+    return run_node(script, records)
+
+
+def sample_records(n=3000, seed=5):
+    rng = np.random.default_rng(seed)
+    emotions = ['confident', 'Happy', 'NEUTRAL', 'surprised', 'nervous', 'sad', 'bored', '', None, 7,
+                'constructor']
+    wpms = [0, 79.99, 80, 99.5, 100, 119, 120, 160, 160.01, 180, 180.5, 200, 200.01, 250, None, '130', 'fast']
+    scores = [0, 0.3, 0.5, 0.6, 0.65, 0.7, 0.8, 0.9, 0.95, 1, None, '0.85', 'n/a', True]
+    records = []
+    for _ in range(n):
+        record = {}
+        if rng.random() < 0.9:
+            record['overallScore'] = scores[rng.integers(len(scores))] if rng.random() < 0.5 \
+                else round(float(rng.random()), 3)
+        if rng.random() < 0.9:
+            record['avgWPM'] = wpms[rng.integers(len(wpms))] if rng.random() < 0.5 \
+                else round(float(rng.uniform(40, 240)), 1)
+        if rng.random() < 0.9:
+            record['dominantEmotion'] = emotions[rng.integers(len(emotions))]
+        record['completed'] = [True, False, 1, 0, 'yes', '', None][rng.integers(7)]
+        records.append(record)
+    return records
+
+
+def test_parity_with_interview_postprocess_js():
+    records = sample_records()
+    batch = ScoreBatch(records)
+    python = list(zip(calculate_stars(batch).tolist(), calculate_grades(batch).tolist()))
+    assert python == [tuple(pair) for pair in js_scores(records)]
+
+
+def test_composite_threshold_ties_match_js():
+    # composite lands on 0.9/0.8/0.65 only through float rounding; both sides must agree
+    records = [{'overallScore': s / 100, 'avgWPM': 140, 'dominantEmotion': e, 'completed': c}
+               for s in range(0, 101) for e in ('happy', 'neutral', 'sad') for c in (True, False)]
+    batch = ScoreBatch(records)
+    python = list(zip(calculate_stars(batch).tolist(), calculate_grades(batch).tolist()))
+    assert python == [tuple(pair) for pair in js_scores(records)]
+
+
+def test_patches_contain_only_changed_fields(tmp_path):
+    export = {'interviews': {
+        'u1': {'100': {'overallScore': 0.96, 'avgWPM': 140, 'dominantEmotion': 'confident',
+                       'completed': True, 'stars': 5, 'grade': 'A+'},
+               '200': {'overallScore': 0.5, 'avgWPM': 140, 'stars': 5, 'grade': 'F'}},
+        'u2': {'300': 'corrupt'},
+    }, 'users': {'u1': {'name': 'x'}}}
+    writer = PatchWriter(tmp_path, limit=10)
+    stats = Counter()
+    records = list(iter_records(io.StringIO(json.dumps(export)), 'interviews/*/*'))
+    rescore(records, 'interviews/*/*', writer, stats)
+    writer.close()
+    patch = json.loads((tmp_path / 'patch-0001.json').read_text())
+    assert patch == {'interviews/u1/200/stars': 2}
+    assert stats['records'] == 2 and stats['changed'] == 1
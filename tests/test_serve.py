@@ -0,0 +1,107 @@
+import gzip
+import http.client
+import os
+import threading
+
+import pytest
+
+import pipeline
+import serve
+from serve import FileCache, make_server
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    monkeypatch.setattr(serve, 'BASE_DIR', tmp_path)
+    (tmp_path / 'index.html').write_text('<h1>home</h1>', encoding='utf-8')
+    (tmp_path / 'interview').mkdir()
+    (tmp_path / 'interview' / 'index.html').write_text('<h1>interview</h1>', encoding='utf-8')
+    (tmp_path / 'app.0123456789.js').write_text('console.log(1);' * 100, encoding='utf-8')
+    (tmp_path / 'app.0123456789.js.gz').write_bytes(gzip.compress(b'console.log(1);' * 100))
+    server = make_server('127.0.0.1', 0, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_address[1], timeout=5)
+
+    def fetch(path, method='GET', **headers):
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        return response, response.read()
+
+    yield tmp_path, fetch, server.RequestHandlerClass.cache
+    conn.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_etags_and_conditional_requests(site):
+    root, fetch, cache = site
+    response, body = fetch('/')
+    assert response.status == 200 and body == b'<h1>home</h1>'
+    assert response.getheader('Content-Type') == 'text/html; charset=utf-8'
+    assert response.getheader('Cache-Control') == 'no-cache'
+    etag = response.getheader('ETag')
+
+    response, body = fetch('/index.html', **{'If-None-Match': etag})
+    assert response.status == 304 and body == b''
+    response, _ = fetch('/index.html', **{'If-Modified-Since': response.getheader('Last-Modified')})
+    assert response.status == 304
+    assert cache.misses == 1 and cache.hits == 2
+
+    (root / 'index.html').write_text('<h1>home v2</h1>', encoding='utf-8')
+    response, body = fetch('/index.html', **{'If-None-Match': etag})
+    assert response.status == 200 and body == b'<h1>home v2</h1>' and response.getheader('ETag') != etag
+
+    response, body = fetch('/interview')
+    assert response.status == 301 and response.getheader('Location') == '/interview/'
+    response, body = fetch('/interview/?x=1')
+    assert body == b'<h1>interview</h1>'
+    assert fetch('/../../etc/passwd')[0].status == 404
+    assert fetch('/missing.html')[0].status == 404
+    response, body = fetch('/index.html', method='HEAD')
+    assert response.status == 200 and body == b'' and response.getheader('Content-Length') == '16'
+
+
+def test_precompressed_sibling_and_immutable_assets(site):
+    _, fetch, _ = site
+    response, body = fetch('/app.0123456789.js', **{'Accept-Encoding': 'br, gzip'})
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert gzip.decompress(body) == b'console.log(1);' * 100
+    assert response.getheader('Content-Type') == 'text/javascript; charset=utf-8'
+    assert response.getheader('Cache-Control') == 'public, max-age=31536000, immutable'
+    assert response.getheader('Vary') == 'Accept-Encoding'
+
+    plain, body = fetch('/app.0123456789.js', **{'Accept-Encoding': 'gzip;q=0'})
+    assert plain.getheader('Content-Encoding') is None and body == b'console.log(1);' * 100
+    assert plain.getheader('ETag') != response.getheader('ETag')
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    files = []
+    for i in range(4):
+        files.append(tmp_path / f'{i}.txt')
+        files[-1].write_bytes(bytes(40))
+    cache = FileCache(max_bytes=100)
+    for path in files[:2]:
+        cache.get(path)
+    cache.get(files[0])
+    cache.get(files[2])                       # evicts 1, the least recently used
+    assert list(cache.entries) == [files[0], files[2]] and cache.bytes == 80
+    assert cache.get(tmp_path / 'missing.txt') is None
+
+
+def test_pipeline_hook_applies_page_steps_in_child_processes(monkeypatch):
+    """Request threads share the process, so the hook never chdirs or redirects stdout in it"""
+    hook = serve.PipelineHook()
+    assert hook.watch.in_process is False
+    monkeypatch.setattr(pipeline, 'load_module', lambda task: pytest.fail('page step ran in-process'))
+    page = serve.BASE_DIR / '_pipeline_probe.html'
+    page.write_text('<html><head></head><body><main></main></body></html>', encoding='utf-8')
+    cwd = os.getcwd()
+    try:
+        step = pipeline.Step({task.name: task for task in pipeline.TASKS}['parallax'], [page.name], ['test'])
+        pipeline.run_step(step, in_process=False)
+        assert 'Idle-aware Parallax' in page.read_text(encoding='utf-8')
+    finally:
+        page.unlink()
+    assert os.getcwd() == cwd
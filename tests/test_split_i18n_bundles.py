@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+import split_i18n_bundles
+from js_harness import read_source, run_node
+from js_literal import JsLiteralError
+from split_i18n_bundles import bundle_names, build_script, completeness, extract_tables
+
+SOURCE = """(function() {
+  const MultilingualSystem = {
+    translations: {},
+
+    /**
+     * Load translations
+     */
+    loadTranslations() {
+      this.translations = {
+        en: {
+          // English (default)
+          dashboard: 'Dashboard',
+          startInterview: 'Start Interview',
+          cancel: 'Cancel'
+        },
+        fr: {
+          dashboard: 'Tableau de Bord',
+          startInterview: 'Commencer l\\'Entretien',
+          legacy: 'Ancien'
+        }
+      };
+    },
+
+    t(key) {}
+  };
+
+  window.SmartMockI18n = MultilingualSystem;
+})();
+"""
+
+
+def test_extract_and_rebuild_is_stable():
+    tables = extract_tables(SOURCE)
+    assert tables['fr']['startInterview'] == "Commencer l'Entretien"
+    assert completeness(tables) == {'fr': (['cancel'], ['legacy'])}
+
+    names = bundle_names(tables)
+    assert list(names) == ['fr'] and names['fr'].startswith('fr.')
+    built = build_script(SOURCE, tables, names)
+    assert "'Tableau de Bord'" not in built and "dashboard: 'Dashboard'" in built
+    assert built.endswith(SOURCE[SOURCE.index('    t(key) {}'):])
+    assert build_script(built, tables, names) == built
+    with pytest.raises(JsLiteralError):
+        extract_tables(built)
+
+    tables['fr']['cancel'] = 'Annuler'
+    rebuilt = build_script(built, tables, bundle_names(tables))
+    assert rebuilt != built and bundle_names(tables)['fr'] in rebuilt
+
+
+def test_loader_fetches_only_the_detected_locale(tmp_path):
+    tables = extract_tables(SOURCE)
+    names = bundle_names(tables)
+    for locale, name in names.items():
+        (tmp_path / name).write_bytes(split_i18n_bundles.bundle_payload(tables[locale]))
+    script = build_script(SOURCE, tables, names)
+    program = '''
+const fs = require('fs');
+const fetched = [];
+global.window = {};
+global.document = {querySelector: () => ({src: 'https://site.test/assets/js/i18n-accessibility.js'})};
+global.fetch = async url => {
+  fetched.push(String(url));
+  const file = input.dir + '/' + String(url).split('/').pop();
+  return {ok: fs.existsSync(file), status: 404, json: async () => JSON.parse(fs.readFileSync(file, 'utf8'))};
+};
+''' + script + '''
+const system = window.SmartMockI18n;
+system.currentLanguage = 'fr';
+system.updatePageContent = () => {};
+system.t = function(key) {
+  return (this.translations[this.currentLanguage] || {})[key] || this.translations.en[key] || key;
+};
+(async () => {
+  const english = await system.loadTranslations('en');
+  await system.loadTranslations();
+  await system.loadTranslations('fr');
+  const missing = await system.loadTranslations('de');
+  console.log(JSON.stringify({
+    fetched, english: english.cancel, missing: missing.dashboard,
+    fr: [system.t('startInterview'), system.t('cancel')],
+  }));
+})();
+'''
+    output = run_node(program, {'dir': str(tmp_path)})
+    assert output == {
+        'fetched': [f'https://site.test/assets/i18n/{names["fr"]}'],
+        'english': 'Cancel',
+        'missing': 'Dashboard',
+        'fr': ["Commencer l'Entretien", 'Cancel'],
+    }
+
+
+def test_shipped_script_matches_config():
+    source = read_source('assets/js/i18n-accessibility.js')
+    tables = {path.stem: json.loads(path.read_text(encoding='utf-8'))
+              for path in sorted((split_i18n_bundles.BASE_DIR / 'config' / 'i18n').glob('*.json'))}
+    names = bundle_names(tables)
+    assert build_script(source, tables, names) == source
+    for name in names.values():
+        assert (split_i18n_bundles.BUNDLE_DIR / name).exists()
@@ -0,0 +1,151 @@
+import json
+import re
+import sys
+
+import pytest
+
+import vendor_cdn_libs
+from vendor_cdn_libs import sri_hash
+
+PAGE = '''<html><head>
+<script src="https://www.gstatic.com/firebasejs/9.23.0/firebase-app-compat.js"></script>
+<script src="https://www.gstatic.com/firebasejs/9.23.0/firebase-auth-compat.js"></script>
+<script src="https://cdn.jsdelivr.net/npm/@mediapipe/face_mesh@0.4/face_mesh.js" crossorigin="anonymous"></script>
+<script src="https://example.com/untouched.js"></script>
+</head><body><script>
+new FaceMesh({ locateFile: (file) => `https://cdn.jsdelivr.net/npm/@mediapipe/face_mesh@0.4/${file}` });
+</script></body></html>
+'''
+
+CONFIG = {
+    'vendorDir': 'assets/vendor',
+    'libraries': [
+        {'name': 'firebase-app-compat', 'version': '9.23.0', 'file': 'firebasejs/app.js',
+         'urls': ['https://www.gstatic.com/firebasejs/9.23.0/firebase-app-compat.js']},
+        {'name': 'firebase-auth-compat', 'version': '9.23.0', 'file': 'firebasejs/auth.js',
+         'urls': ['https://www.gstatic.com/firebasejs/9.23.0/firebase-auth-compat.js']},
+        {'name': 'face_mesh', 'version': '0.4', 'file': 'face_mesh/face_mesh.js', 'assetsDir': 'face_mesh',
+         'assetsBaseUrl': 'https://cdn.jsdelivr.net/npm/@mediapipe/face_mesh@0.4/',
+         'urls': ['https://cdn.jsdelivr.net/npm/@mediapipe/face_mesh@0.4/face_mesh.js']},
+    ],
+}
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    root = tmp_path / 'site'
+    page = root / 'interview' / 'cs' / 'ai-interview.html'
+    page.parent.mkdir(parents=True)
+    page.write_text(PAGE, encoding='utf-8')
+    cache = tmp_path / 'cache'
+    (cache / 'firebasejs').mkdir(parents=True)
+    (cache / 'face_mesh').mkdir()
+    (cache / 'firebasejs' / 'app.js').write_bytes(b'/* compat bundle */')
+    (cache / 'firebasejs' / 'auth.js').write_bytes(b'/* compat bundle */')     # identical content
+    (cache / 'face_mesh' / 'face_mesh.js').write_bytes(b'/* face mesh */')
+    (cache / 'face_mesh' / 'face_mesh.wasm').write_bytes(b'\0asm v1')
+    config = tmp_path / 'vendor-libs.json'
+    config.write_text(json.dumps(CONFIG), encoding='utf-8')
+    monkeypatch.setattr(vendor_cdn_libs, 'BASE_DIR', root)
+    return root, page, cache, config
+
+
+def run(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['vendor_cdn_libs.py', *args])
+    try:
+        vendor_cdn_libs.main()
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+def manifest(root):
+    return {e['name']: e for e in json.loads((root / 'assets/vendor/manifest.json').read_text())['libraries']}
+
+
+def test_vendors_with_sri_and_shared_fingerprints(site, monkeypatch):
+    root, page, cache, config = site
+    assert run(monkeypatch, '--cache', str(cache), '--config', str(config)) == 0
+    entries = manifest(root)
+    app, auth = entries['firebase-app-compat'], entries['firebase-auth-compat']
+    assert app['path'] == auth['path']
+    assert app['integrity'] == sri_hash(b'/* compat bundle */')
+    html = page.read_text(encoding='utf-8')
+    assert f'src="../../{app["path"]}" integrity="{app["integrity"]}" data-vendor="firebase-app-compat"' in html
+    assert f'`../../{entries["face_mesh"]["assetsPath"]}/${{file}}`' in html
+    assert 'https://example.com/untouched.js' in html
+    assert 'gstatic.com' not in html and 'jsdelivr' not in html
+    assert run(monkeypatch, '--verify', '--config', str(config)) == 0
+
+
+def test_rerun_migrates_fingerprints_and_prunes(site, monkeypatch):
+    root, page, cache, config = site
+    run(monkeypatch, '--cache', str(cache), '--config', str(config))
+    first = manifest(root)
+
+    (cache / 'firebasejs' / 'auth.js').write_bytes(b'/* auth 2 */')
+    (cache / 'face_mesh' / 'face_mesh.wasm').write_bytes(b'\0asm v2')
+    assert run(monkeypatch, '--cache', str(cache), '--config', str(config), '--prune') == 0
+    second = manifest(root)
+    html = page.read_text(encoding='utf-8')
+
+    assert second['firebase-auth-compat']['path'] != first['firebase-auth-compat']['path']
+    assert second['face_mesh']['assetsPath'] != first['face_mesh']['assetsPath']
+    assert f'../../{second["firebase-auth-compat"]["path"]}' in html
+    assert f'../../{second["face_mesh"]["assetsPath"]}/' in html
+    assert first['face_mesh']['assetsPath'] not in html
+    assert not (root / first['face_mesh']['assetsPath']).exists()
+    # Still shared with firebase-app-compat, so kept
+    assert (root / first['firebase-auth-compat']['path']).exists()
+    assert run(monkeypatch, '--verify', '--config', str(config)) == 0
+
+
+def test_verify_reports_tampered_files_and_broken_references(site, monkeypatch, capsys):
+    root, page, cache, config = site
+    run(monkeypatch, '--cache', str(cache), '--config', str(config))
+    entries = manifest(root)
+
+    (root / entries['firebase-app-compat']['path']).write_bytes(b'tampered')
+    assert run(monkeypatch, '--verify', '--config', str(config)) == 1
+    assert 'Integrity mismatch' in capsys.readouterr().out
+
+    (root / entries['firebase-app-compat']['path']).write_bytes(b'/* compat bundle */')
+    html = page.read_text(encoding='utf-8')
+    page.write_text(html.replace(entries['face_mesh']['assetsPath'], 'assets/vendor/face_mesh-0.4.0000000000'),
+                    encoding='utf-8')
+    assert run(monkeypatch, '--verify', '--config', str(config)) == 1
+    assert 'Broken reference' in capsys.readouterr().out
+
+
+def test_every_cdn_library_the_site_loads_is_declared():
+    """Pages on an undeclared version would keep fetching it from the CDN, uncached by the others"""
+    config = vendor_cdn_libs.load_config(vendor_cdn_libs.CONFIG_PATH)
+    declared = {url for lib in config['libraries'] for url in lib['urls']}
+    undeclared = set()
+    for page in vendor_cdn_libs.collect_html_files(vendor_cdn_libs.BASE_DIR):
+        for tag in vendor_cdn_libs.SCRIPT_TAG_RE.findall(page.read_text(encoding='utf-8')):
+            src = vendor_cdn_libs.SRC_ATTR_RE.search(tag)
+            if src and re.search(r'gstatic\.com/firebasejs/\d|/three\.js/r\d', src.group(2)):
+                undeclared.add(src.group(2))
+    assert undeclared <= declared
+
+
+def test_lazy_loaded_libraries_are_vendored_with_integrity(site, monkeypatch):
+    root, page, cache, config = site
+    three = 'https://cdnjs.cloudflare.com/ajax/libs/three.js/r128/three.min.js'
+    config.write_text(json.dumps(dict(CONFIG, libraries=CONFIG['libraries'] + [
+        {'name': 'three', 'version': 'r128', 'file': 'three/three.min.js', 'urls': [three]}])), encoding='utf-8')
+    (cache / 'three').mkdir()
+    (cache / 'three' / 'three.min.js').write_bytes(b'/* three */')
+    page.write_text(PAGE.replace('<body>', f'<body><div id="bg-robot-container" data-robot-three-src="{three}">'),
+                    encoding='utf-8')
+
+    assert run(monkeypatch, '--cache', str(cache), '--config', str(config)) == 0
+    entry = manifest(root)['three']
+    attrs = f'data-robot-three-src="../../{entry["path"]}" data-robot-three-integrity="{entry["integrity"]}">'
+    assert attrs in page.read_text(encoding='utf-8')
+
+    (cache / 'three' / 'three.min.js').write_bytes(b'/* three, patched */')
+    assert run(monkeypatch, '--cache', str(cache), '--config', str(config)) == 0
+    html = page.read_text(encoding='utf-8')
+    assert manifest(root)['three']['integrity'] in html and entry['integrity'] not in html
@@ -0,0 +1,63 @@
+import pytest
+
+import pipeline
+import verify_idempotency
+from fix_menu_and_zindex import fix_html_file
+from pipeline import Task
+from verify_idempotency import verify
+
+GUARDED = '''
+from pathlib import Path
+
+page = Path('page.html')
+if 'stamp' not in page.read_text():
+    page.write_text(page.read_text() + 'stamp')
+'''
+APPENDING = '''
+from pathlib import Path
+
+page = Path('page.html')
+page.write_text(page.read_text() + '<p>tip</p>')
+'''
+PAGE = '''<style>
+      .menu-left .dropdown {
+        position: absolute;
+        top: 100%;
+      }
+      .card { left: 0; }
+      .dropdown { display: none; }
+    </style>'''
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    (tmp_path / 'scripts').mkdir()
+    (tmp_path / 'scripts' / 'guarded.py').write_text(GUARDED)
+    (tmp_path / 'scripts' / 'appending.py').write_text(APPENDING)
+    (tmp_path / 'page.html').write_text('<body>')
+    monkeypatch.setattr(pipeline, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(verify_idempotency, 'BASE_DIR', tmp_path)
+    return tmp_path
+
+
+def test_verifier_reports_growth_of_non_idempotent_transforms(site):
+    copy = verify_idempotency.copy_site(site.parent / 'copy')
+    growth, drift = verify(copy, 2, [Task('guarded', 'guarded.py', ['page.html'])])
+    assert growth == {} and drift == {}
+
+    growth, drift = verify(copy, 2, [Task('guarded', 'guarded.py', ['page.html']),
+                                     Task('appending', 'appending.py', ['page.html'])])
+    assert growth == {'appending': {1: {'page.html': 10}, 2: {'page.html': 10}}}
+    assert drift == {2: {'page.html': 20}}      # applied twice per run
+    assert (site / 'page.html').read_text() == '<body>'         # the original is untouched
+
+
+def test_dropdown_left_fix_is_a_fixpoint(tmp_path):
+    page = tmp_path / 'page.html'
+    page.write_text(PAGE, encoding='utf-8')
+    updated, changes = fix_html_file(str(page))
+    assert updated and changes == ['Added left: 0 to dropdown']
+    fixed = page.read_text(encoding='utf-8')
+    assert fixed.count('left: 0;') == 2 and 'position: absolute;\n        left: 0;' in fixed
+    assert fix_html_file(str(page)) == (False, [])
+    assert page.read_text(encoding='utf-8') == fixed
@@ -0,0 +1,106 @@
+import sys
+import time
+
+import pytest
+
+import pipeline
+import watch
+from pipeline import Task, on_page, plan
+from watch import InotifyWatcher, PollingWatcher, Watch
+
+TRANSFORM = '''
+STAMP = '<!-- stamped -->'
+
+
+def stamp(path):
+    content = path.read_text(encoding='utf-8')
+    if STAMP not in content:
+        path.write_text(content.replace('</body>', STAMP + '</body>'), encoding='utf-8')
+'''
+GENERATOR = '''
+from pathlib import Path
+
+template = Path('pages/template.html').read_text(encoding='utf-8')
+for dept in ('me', 'ce'):
+    Path(f'pages/{dept}.html').write_text(template.replace('CS', dept.upper()), encoding='utf-8')
+'''
+
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    scripts = tmp_path / 'scripts'
+    scripts.mkdir()
+    (scripts / 'stamp_pages.py').write_text(TRANSFORM, encoding='utf-8')
+    (scripts / 'make_pages.py').write_text(GENERATOR, encoding='utf-8')
+    pages = tmp_path / 'pages'
+    pages.mkdir()
+    for name in ('template', 'about'):
+        (pages / f'{name}.html').write_text('<body>CS</body>', encoding='utf-8')
+    for module in (pipeline, watch):
+        monkeypatch.setattr(module, 'BASE_DIR', tmp_path)
+    monkeypatch.setattr(pipeline, 'SCRIPTS_DIR', scripts)
+    monkeypatch.setattr(pipeline, '_MODULES', {})
+    monkeypatch.syspath_prepend(str(scripts))
+    monkeypatch.delitem(sys.modules, 'stamp_pages', raising=False)
+    tasks = [
+        Task('generate', 'make_pages.py', ['pages/template.html'], ['pages/me.html', 'pages/ce.html']),
+        Task('stamp', 'stamp_pages.py', ['pages/*.html'], requires=['generate'], page=on_page('stamp')),
+    ]
+    return tmp_path, tasks
+
+
+def test_plan_follows_outputs_and_scripts(site):
+    _, tasks = site
+    assert [s.describe() for s in plan(['pages/about.html'], tasks)] == [
+        'stamp: pages/about.html (because of pages/about.html)']
+    assert [(s.task.name, s.pages, s.because) for s in plan(['pages/template.html'], tasks)] == [
+        ('generate', None, ['pages/template.html']),
+        ('stamp', ['pages/ce.html', 'pages/me.html', 'pages/template.html'], ['generate', 'pages/template.html']),
+    ]
+    assert [(s.task.name, s.pages) for s in plan(['scripts/stamp_pages.py'], tasks)] == [('stamp', None)]
+    assert plan(['notes.txt'], tasks) == []
+    with pytest.raises(ValueError, match='cycle'):
+        pipeline.order([Task('a', 'a.py', [], requires=['b']), Task('b', 'b.py', [], requires=['a'])])
+
+
+def test_rebuild_runs_affected_steps_and_ignores_its_own_writes(site):
+    root, tasks = site
+    w = Watch(PollingWatcher(root), tasks=tasks)
+    (root / 'pages' / 'template.html').write_text('<body>CS v2</body>', encoding='utf-8')
+    changed = w.relevant(w.watcher.changes(0))
+    assert changed == {'pages/template.html'}
+
+    steps = w.rebuild(changed)
+    assert [s.task.name for s in steps] == ['generate', 'stamp']
+    assert (root / 'pages' / 'me.html').read_text() == '<body>ME v2<!-- stamped --></body>'
+    assert (root / 'pages' / 'template.html').read_text() == '<body>CS v2<!-- stamped --></body>'
+    assert (root / 'pages' / 'about.html').read_text() == '<body>CS</body>'
+    # the rebuild's own writes are not changes
+    time.sleep(0.01)
+    assert w.relevant(w.watcher.changes(0)) == set()
+
+    (root / 'pages' / 'me.html').write_text('<body>edited</body>', encoding='utf-8')
+    assert w.relevant(w.watcher.changes(0)) == {'pages/me.html'}
+
+
+def test_inotify_coalesces_a_burst(site):
+    root, tasks = site
+    try:
+        watcher = InotifyWatcher(root)
+    except OSError:
+        pytest.skip('inotify is not available')
+    try:
+        w = Watch(watcher, debounce=0.05, tasks=tasks)
+        (root / 'pages' / 'new').mkdir()
+        page = root / 'pages' / 'about.html'
+        for i in range(5):                       # an editor saving in several writes
+            page.write_text(f'<body>about {i}</body>', encoding='utf-8')
+        tmp = root / 'pages' / 'about.html.swp'
+        tmp.write_text('x')
+        tmp.rename(root / 'pages' / 'other.html')
+        changed = w.relevant(w.collect())
+        assert changed == {'pages/about.html', 'pages/other.html'}
+        (root / 'pages' / 'new' / 'deep.html').write_text('<body></body>')
+        assert root / 'pages' / 'new' / 'deep.html' in w.collect()
+    finally:
+        watcher.close()